@@ -9,7 +9,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 import json
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
@@ -74,7 +74,7 @@ if __name__ == "__main__":
     print("ADDING ANNUAL STACK TO EXISTING RESULTS")
     print("=" * 60)
     
-    client = get_google_sheets_client()
+    client = get_sheets_client()
     spreadsheet = client.open_by_key(SHEET_ID)
     
     # Load sites for metadata
@@ -11,7 +11,7 @@ import sys
 import json
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -119,7 +119,7 @@ def add_geojson_to_sites():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -165,7 +165,7 @@ def add_sample_variables_to_sites():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -262,7 +262,7 @@ def verify_load_profiles_sheet():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         try:
@@ -2,11 +2,11 @@
 import sys
 sys.path.insert(0, '/Users/douglasmackenzie/energy-optimizer')
 
-from app.utils.load_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1waBVXlUL1zDE5ovDppM3iYsLhJioyE3yzwL45fLkqrA"
 
-client = get_google_sheets_client()
+client = get_sheets_client()
 spreadsheet = client.open_by_key(SHEET_ID)
 worksheet = spreadsheet.worksheet("Load_Profiles")
 
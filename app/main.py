@@ -5,6 +5,7 @@ Main Streamlit Application Entry Point
 Run with: streamlit run app/main.py
 """
 
+import logging
 import streamlit as st
 from pathlib import Path
 import sys
@@ -13,7 +14,10 @@ import sys
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from config.settings import APP_NAME, APP_VERSION, APP_ICON, COLORS
+from config.settings import APP_NAME, APP_VERSION, APP_ICON, COLORS, LOG_LEVEL
+
+# Library modules only create loggers; the app configures output once
+logging.basicConfig(level=LOG_LEVEL)
 
 # =============================================================================
 # Page Configuration
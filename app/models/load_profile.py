@@ -7,6 +7,9 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional, List, Tuple
 import numpy as np
 
+from app.utils.profile_cache import cached_profile
+from app.utils.profile_engine import ProfileEngine
+
 
 @dataclass
 class WorkloadMix:
@@ -283,27 +286,23 @@ class LoadProfile:
         reduction_factor = 0.35 if self.rack_ups_seconds >= 30 else 0.7
         return self.raw_transient_mw() * reduction_factor
     
-    def generate_8760(self) -> np.ndarray:
+    def generate_8760(self, seed=None) -> np.ndarray:
         """Generate synthetic 8760 hourly load profile"""
-        hours = np.arange(8760)
+        engine = ProfileEngine(seed)
         
         # Base load (weighted utilization)
         base = self.it_capacity_mw * self.weighted_utilization()
         
-        # Seasonal variation (PUE effect on cooling)
-        seasonal = np.zeros(8760)
-        for h in hours:
-            day_of_year = h // 24
-            # Simple sinusoidal seasonal pattern
-            pue_factor = 0.5 * (1 + np.sin(2 * np.pi * day_of_year / 365 - np.pi/2))
-            pue = self.pue_winter + pue_factor * (self.pue_summer - self.pue_winter)
-            seasonal[h] = base * (pue - 1)  # Cooling contribution
+        # Seasonal variation (PUE effect on cooling), 0 in winter -> 1 in summer
+        pue_factor = engine.seasonal_sine(0.5, shift=365 / 4, base=0.5)
+        pue = self.pue_winter + pue_factor * (self.pue_summer - self.pue_winter)
+        seasonal = base * (pue - 1)  # Cooling contribution
         
         # Daily variation
-        daily = 0.1 * base * np.sin(2 * np.pi * hours / 24 - np.pi/3)
+        daily = base * engine.daily_sine(0.1, shift=4, base=0.0)
         
         # Random noise
-        noise = 0.02 * base * np.random.randn(8760)
+        noise = 0.02 * base * engine.normal(0.0, 1.0)
         
         load = base + seasonal + daily + noise
         return np.maximum(load, 0.3 * base)  # Minimum load floor
@@ -501,56 +500,46 @@ class FacilityLoadProfile:
         Returns:
             Array of 8760 hourly load values (MW)
         """
-        np.random.seed(seed)
-        hours = 8760
-        profile = np.zeros(hours)
-        
+        engine = ProfileEngine(seed)
         base_load = self.peak_facility_load_mw * self.load_factor
-        
-        for hour in range(hours):
-            hour_of_day = hour % 24
-            day_of_year = hour // 24
-            
-            # Daily pattern
-            if self.daily_pattern_enabled:
-                if self.peak_hours[0] <= hour_of_day <= self.peak_hours[1]:
-                    daily_factor = 1.0
-                else:
-                    daily_factor = self.off_peak_factor
-            else:
-                daily_factor = 1.0
-            
-            # Seasonal pattern (sinusoidal, peaks in summer)
-            if self.seasonal_pattern_enabled:
-                # Day 172 = summer solstice, Day 355 = winter solstice
-                seasonal_factor = 1.0 + 0.05 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-                seasonal_factor = np.clip(
-                    seasonal_factor,
-                    self.winter_trough_factor,
-                    self.summer_peak_factor
-                )
-            else:
-                seasonal_factor = 1.0
-            
-            # Random variation (±2%)
-            random_factor = 1.0 + (np.random.random() - 0.5) * 0.04
-            
-            profile[hour] = base_load * daily_factor * seasonal_factor * random_factor
-        
-        # Clip to bounds
-        profile = np.clip(profile, 
-                         self.peak_facility_load_mw * 0.5,
-                         self.peak_facility_load_mw)
-        
-        return profile
+        factors = []
+        
+        # Daily pattern
+        if self.daily_pattern_enabled:
+            factors.append(engine.daily_window(*self.peak_hours, on=1.0, off=self.off_peak_factor))
+        
+        # Seasonal pattern (sinusoidal, peaks in summer)
+        if self.seasonal_pattern_enabled:
+            # Day 172 = summer solstice, Day 355 = winter solstice
+            factors.append(engine.seasonal_sine(
+                0.05, shift=80, clip=(self.winter_trough_factor, self.summer_peak_factor)
+            ))
+        
+        # Random variation (±2%), clipped to bounds
+        return engine.build(
+            base_load,
+            factors,
+            noise=engine.uniform(0.98, 1.02),
+            clip=(self.peak_facility_load_mw * 0.5, self.peak_facility_load_mw),
+        )
     
     def generate_flexibility_profiles(self, seed: int = 42) -> Dict[str, np.ndarray]:
         """
         Generate hourly flexibility profiles for all components.
         
+        Read through the profile cache, keyed by every field of this profile
+        and the seed; the returned arrays are read-only.
+        
         Returns:
             Dict with arrays for each flexibility component
         """
+        return cached_profile(
+            'facility_flexibility/v1', (self, seed),
+            lambda: self._build_flexibility_profiles(seed),
+        )
+    
+    def _build_flexibility_profiles(self, seed: int) -> Dict[str, np.ndarray]:
+        """Uncached body of generate_flexibility_profiles."""
         load_profile = self.generate_8760_profile(seed)
         hours = len(load_profile)
         
@@ -10,48 +10,86 @@ Phase 2: MILP optimization for detailed design
 Version: 2.1.1 - Greenfield Heuristic Optimizer with gspread backend integration
 """
 
-# Phase 2: MILP Optimization
-from .milp_model_dr import bvNexusMILP_DR
+import importlib
 
-# Phase 1 - NEW: Greenfield Heuristic v2.1.1 (production-ready)
-from .greenfield_heuristic_v2 import (
-    GreenfieldHeuristicV2,
-    HeuristicResultV2,
-    ConstraintResult,
-    DispatchResult,
-    BackendDataLoader,
+# Public names are imported from their submodule on first access (PEP 562),
+# so `import app.optimization` does not pull in Pyomo or every heuristic.
+_LAZY_IMPORTS = {
+    # Phase 2: MILP Optimization
+    'bvNexusMILP_DR': ('.milp_model_dr', 'bvNexusMILP_DR'),
+    'bvNexusMILP_Matrix': ('.milp_matrix_dr', 'bvNexusMILP_Matrix'),
+    'SparseLP': ('.milp_matrix_dr', 'SparseLP'),
+    'bvNexusMILP_Decomposed': ('.milp_decomposition', 'bvNexusMILP_Decomposed'),
+    'decomposition_gap_report': ('.milp_decomposition', 'decomposition_gap_report'),
+    'RepresentativePeriods': ('.representative_periods', 'RepresentativePeriods'),
+    'select_representative_periods': ('.representative_periods', 'select_representative_periods'),
+    'fixed_periods': ('.representative_periods', 'fixed_periods'),
+    'period_error_report': ('.representative_periods', 'period_error_report'),
+    'dispatch_error_report': ('.representative_periods', 'dispatch_error_report'),
+    
+    # Phase 1 - NEW: Greenfield Heuristic v2.1.1 (production-ready)
+    'GreenfieldHeuristicV2': ('.greenfield_heuristic_v2', 'GreenfieldHeuristicV2'),
+    'HeuristicResultV2': ('.greenfield_heuristic_v2', 'HeuristicResultV2'),
+    'ConstraintResult': ('.greenfield_heuristic_v2', 'ConstraintResult'),
+    'DispatchResult': ('.greenfield_heuristic_v2', 'DispatchResult'),
+    'BatchDispatchResult': ('.greenfield_heuristic_v2', 'BatchDispatchResult'),
+    'DispatchSimulator': ('.greenfield_heuristic_v2', 'DispatchSimulator'),
+    'BackendDataLoader': ('.greenfield_heuristic_v2', 'BackendDataLoader'),
     # Locked calculation functions (governed by GREENFIELD_HEURISTIC_RULES.md)
-    calculate_nox_annual_tpy,
-    calculate_gas_consumption_mcf_day,
-    calculate_capital_recovery_factor,
-    calculate_lcoe,
-    calculate_firm_capacity,
-    calculate_ramp_capacity,
-)
+    'calculate_nox_annual_tpy': ('.greenfield_heuristic_v2', 'calculate_nox_annual_tpy'),
+    'calculate_gas_consumption_mcf_day': ('.greenfield_heuristic_v2', 'calculate_gas_consumption_mcf_day'),
+    'calculate_capital_recovery_factor': ('.greenfield_heuristic_v2', 'calculate_capital_recovery_factor'),
+    'calculate_lcoe': ('.greenfield_heuristic_v2', 'calculate_lcoe'),
+    'calculate_firm_capacity': ('.greenfield_heuristic_v2', 'calculate_firm_capacity'),
+    'calculate_ramp_capacity': ('.greenfield_heuristic_v2', 'calculate_ramp_capacity'),
+    
+    # Phase 1 - LEGACY: Original heuristic optimizers (maintained for backward compatibility)
+    'HeuristicOptimizer': ('.heuristic_optimizer', 'HeuristicOptimizer'),
+    'HeuristicResult': ('.heuristic_optimizer', 'HeuristicResult'),
+    'GreenFieldHeuristic_Legacy': ('.heuristic_optimizer', 'GreenFieldHeuristic'),
+    'BrownfieldHeuristic': ('.heuristic_optimizer', 'BrownfieldHeuristic'),
+    'LandDevHeuristic': ('.heuristic_optimizer', 'LandDevHeuristic'),
+    'GridServicesHeuristic': ('.heuristic_optimizer', 'GridServicesHeuristic'),
+    'BridgePowerHeuristic': ('.heuristic_optimizer', 'BridgePowerHeuristic'),
+    'create_heuristic_optimizer': ('.heuristic_optimizer', 'create_heuristic_optimizer'),
+    
+    # Backward compatibility: Map old name to new optimizer
+    'GreenFieldHeuristic': ('.greenfield_heuristic_v2', 'GreenfieldHeuristicV2'),
+}
 
-# Phase 1 - LEGACY: Original heuristic optimizers (maintained for backward compatibility)
-from .heuristic_optimizer import (
-    HeuristicOptimizer,
-    HeuristicResult,
-    GreenFieldHeuristic as GreenFieldHeuristic_Legacy,
-    BrownfieldHeuristic,
-    LandDevHeuristic,
-    GridServicesHeuristic,
-    BridgePowerHeuristic,
-    create_heuristic_optimizer,
-)
 
-# Backward compatibility: Map old name to new optimizer
-GreenFieldHeuristic = GreenfieldHeuristicV2
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # MILP
     'bvNexusMILP_DR',
+    'bvNexusMILP_Matrix',
+    'SparseLP',
+    'bvNexusMILP_Decomposed',
+    'decomposition_gap_report',
+    'RepresentativePeriods',
+    'select_representative_periods',
+    'fixed_periods',
+    'period_error_report',
+    'dispatch_error_report',
     # Greenfield v2.1.1 (NEW - production)
     'GreenfieldHeuristicV2',
     'HeuristicResultV2',
     'ConstraintResult',
     'DispatchResult',
+    'BatchDispatchResult',
+    'DispatchSimulator',
     'BackendDataLoader',
     'calculate_nox_annual_tpy',
     'calculate_gas_consumption_mcf_day',
@@ -36,6 +36,9 @@ from dataclasses import dataclass, field
 import time
 import logging
 
+from app.utils.profile_cache import cached_profile
+from app.utils.profile_engine import ProfileEngine
+
 # gspread integration
 try:
     import gspread
@@ -43,6 +46,13 @@ try:
 except ImportError:
     HAS_GSPREAD = False
 
+# Optional JIT for the BESS state-of-charge loop (pure-Python fallback otherwise)
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -385,6 +395,121 @@ class DispatchResult:
     max_ramp_mw_per_min: float
 
 
+@dataclass
+class BatchDispatchResult:
+    """
+    Struct-of-arrays results for a batch of 8760 dispatch runs.
+    
+    Hourly fields are (n_runs × n_hours) arrays; row i belongs to configs[i]
+    of DispatchSimulator.run_dispatch_batch(). Per-run DataFrames are only
+    built on request via to_dispatch_result() / to_dataframe().
+    """
+    load_mw: np.ndarray
+    firm_load_mw: np.ndarray
+    solar_mw: np.ndarray
+    bess_discharge_mw: np.ndarray
+    bess_charge_mw: np.ndarray
+    bess_soc_mwh: np.ndarray
+    recip_mw: np.ndarray
+    turbine_mw: np.ndarray
+    grid_mw: np.ndarray
+    unserved_mw: np.ndarray
+    solar_cap_mw: np.ndarray
+    recip_cap_mw: np.ndarray
+    turbine_cap_mw: np.ndarray
+    grid_cap_mw: np.ndarray
+    
+    # Column order of the legacy dispatch_df (after 'hour')
+    HOURLY_FIELDS = (
+        'load_mw', 'firm_load_mw', 'solar_mw', 'bess_discharge_mw', 'bess_charge_mw',
+        'bess_soc_mwh', 'recip_mw', 'turbine_mw', 'grid_mw', 'unserved_mw',
+    )
+    
+    @property
+    def n_runs(self) -> int:
+        return self.load_mw.shape[0]
+    
+    @property
+    def n_hours(self) -> int:
+        return self.load_mw.shape[1]
+    
+    @property
+    def energy_delivered_mwh(self) -> np.ndarray:
+        return (self.solar_mw + self.bess_discharge_mw + self.recip_mw
+                + self.turbine_mw + self.grid_mw).sum(axis=1)
+    
+    @property
+    def unserved_energy_mwh(self) -> np.ndarray:
+        return self.unserved_mw.sum(axis=1)
+    
+    @property
+    def generation_by_source(self) -> Dict[str, np.ndarray]:
+        return {
+            'solar_mwh': self.solar_mw.sum(axis=1),
+            'bess_mwh': self.bess_discharge_mw.sum(axis=1),
+            'recip_mwh': self.recip_mw.sum(axis=1),
+            'turbine_mwh': self.turbine_mw.sum(axis=1),
+            'grid_mwh': self.grid_mw.sum(axis=1),
+        }
+    
+    def to_dataframe(self, i: int) -> pd.DataFrame:
+        """Materialize the hourly dispatch table for run i."""
+        data = {'hour': range(self.n_hours)}
+        for field_name in self.HOURLY_FIELDS:
+            data[field_name] = getattr(self, field_name)[i]
+        return pd.DataFrame(data)
+    
+    def to_dispatch_result(self, i: int, year: int = 0) -> DispatchResult:
+        """Build the legacy per-run DispatchResult (with DataFrame) for run i."""
+        load = self.load_mw[i]
+        solar_gen = self.solar_mw[i]
+        bess_discharge = self.bess_discharge_mw[i]
+        recip_gen = self.recip_mw[i]
+        turbine_gen = self.turbine_mw[i]
+        grid_import = self.grid_mw[i]
+        unserved = self.unserved_mw[i]
+        
+        solar_cap = self.solar_cap_mw[i]
+        recip_cap = self.recip_cap_mw[i]
+        turbine_cap = self.turbine_cap_mw[i]
+        grid_cap = self.grid_cap_mw[i]
+        n_hours = self.n_hours
+        
+        energy_delivered = (solar_gen + bess_discharge + recip_gen + turbine_gen + grid_import).sum()
+        
+        generation_by_source = {
+            'solar_mwh': solar_gen.sum(),
+            'bess_mwh': bess_discharge.sum(),
+            'recip_mwh': recip_gen.sum(),
+            'turbine_mwh': turbine_gen.sum(),
+            'grid_mwh': grid_import.sum(),
+        }
+        
+        capacity_factors = {
+            'solar': solar_gen.sum() / (solar_cap * n_hours) if solar_cap > 0 else 0,
+            'recip': recip_gen.sum() / (recip_cap * n_hours) if recip_cap > 0 else 0,
+            'turbine': turbine_gen.sum() / (turbine_cap * n_hours) if turbine_cap > 0 else 0,
+            'grid': grid_import.sum() / (grid_cap * n_hours) if grid_cap > 0 else 0,
+        }
+        
+        ramp_events = np.abs(np.diff(load))
+        max_ramp_mw_per_hour = ramp_events.max() if len(ramp_events) else 0
+        max_ramp_mw_per_min = max_ramp_mw_per_hour / 5
+        
+        return DispatchResult(
+            year=year,
+            dispatch_df=self.to_dataframe(i),
+            energy_delivered_mwh=energy_delivered,
+            energy_required_mwh=load.sum(),
+            unserved_energy_mwh=unserved.sum(),
+            generation_by_source=generation_by_source,
+            capacity_factors=capacity_factors,
+            peak_unserved_mw=unserved.max(),
+            hours_with_unserved=int((unserved > 0).sum()),
+            max_ramp_mw_per_min=max_ramp_mw_per_min,
+        )
+
+
 @dataclass 
 class HeuristicResultV2:
     """Container for Greenfield heuristic optimization results."""
@@ -963,12 +1088,186 @@ class EquipmentSizer:
 # SECTION 6: 8760 DISPATCH SIMULATION (WITH ECONOMIC DISPATCH & BESS CHARGING)
 # =============================================================================
 
+def _merit_order(
+    remaining: np.ndarray,
+    recip_cap: Union[float, np.ndarray],
+    turbine_cap: Union[float, np.ndarray],
+    grid_cap: Union[float, np.ndarray],
+    grid_first: Union[bool, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Whole-array merit-order dispatch of the residual load after solar/BESS.
+    
+    Mirrors Step 3/4 of the hourly loop exactly (same min/subtract sequence),
+    so results are bit-identical to the scalar implementation. Capacities and
+    grid_first may be scalars or (n_runs, 1) columns broadcast against a
+    (n_runs, n_hours) residual.
+    
+    Returns:
+        (recip_gen, turbine_gen, grid_import, unserved)
+    """
+    recip_cap = np.asarray(recip_cap, dtype=float)
+    turbine_cap = np.asarray(turbine_cap, dtype=float)
+    grid_cap = np.asarray(grid_cap, dtype=float)
+    grid_first = np.asarray(grid_first, dtype=bool)
+    
+    grid_early = np.where(grid_first & (remaining > 0), np.minimum(grid_cap, remaining), 0.0)
+    remaining = remaining - grid_early
+    recip_gen = np.where((recip_cap > 0) & (remaining > 0), np.minimum(recip_cap, remaining), 0.0)
+    remaining = remaining - recip_gen
+    turbine_gen = np.where((turbine_cap > 0) & (remaining > 0), np.minimum(turbine_cap, remaining), 0.0)
+    remaining = remaining - turbine_gen
+    grid_late = np.where(~grid_first & (grid_cap > 0) & (remaining > 0),
+                         np.minimum(grid_cap, remaining), 0.0)
+    remaining = remaining - grid_late
+    
+    # At most one of grid_early/grid_late is non-zero per hour, so the sum is exact
+    grid_import = grid_early + grid_late
+    unserved = np.where(remaining > 0, remaining, 0.0)
+    return recip_gen, turbine_gen, grid_import, unserved
+
+
+def _bess_soc_recurrence(
+    residual,
+    excess_solar,
+    idle_capacity,
+    bess_mw: float,
+    bess_mwh: float,
+    sqrt_eff: float,
+    recip_cap: float,
+    turbine_cap: float,
+    grid_cap: float,
+    grid_first: bool,
+    discharge_out,
+    charge_out,
+    soc_out,
+) -> None:
+    """
+    BESS state-of-charge recurrence - the only inherently sequential stage.
+    
+    Scalar-only code so it can be JIT-compiled by numba when available; the
+    pure-Python fallback runs it over plain lists. idle_capacity is the charge
+    headroom assuming no discharge in that hour; it is only recomputed (inline
+    merit order) for hours where the battery actually discharged.
+    
+    min()/max() are written as conditional expressions with the same
+    tie-breaking as the builtins to keep results bit-identical.
+    """
+    soc = bess_mwh * 0.5
+    
+    for h in range(len(residual)):
+        remaining = residual[h]
+        discharge = 0.0
+        
+        if remaining > 0 and soc > 0:
+            discharge = soc * sqrt_eff
+            if bess_mw < discharge:
+                discharge = bess_mw
+            if remaining < discharge:
+                discharge = remaining
+            soc -= discharge / sqrt_eff
+            remaining -= discharge
+            discharge_out[h] = discharge
+        
+        if soc < bess_mwh:
+            charge = (bess_mwh - soc) / sqrt_eff
+            if bess_mw < charge:
+                charge = bess_mw
+            
+            if discharge > 0:
+                recip = 0.0
+                turbine = 0.0
+                grid = 0.0
+                if remaining > 0:
+                    if grid_first:
+                        grid = remaining if remaining < grid_cap else grid_cap
+                        remaining -= grid
+                    if remaining > 0 and recip_cap > 0:
+                        recip = remaining if remaining < recip_cap else recip_cap
+                        remaining -= recip
+                    if remaining > 0 and turbine_cap > 0:
+                        turbine = remaining if remaining < turbine_cap else turbine_cap
+                        remaining -= turbine
+                    if not grid_first and remaining > 0 and grid_cap > 0:
+                        grid = remaining if remaining < grid_cap else grid_cap
+                unused_recip = recip_cap - recip
+                unused_turbine = turbine_cap - turbine
+                unused_grid = grid_cap - grid
+                avail = (excess_solar[h]
+                         + (unused_recip if unused_recip > 0 else 0.0)
+                         + (unused_turbine if unused_turbine > 0 else 0.0)
+                         + (unused_grid if unused_grid > 0 else 0.0))
+            else:
+                avail = idle_capacity[h]
+            
+            if avail < charge:
+                charge = avail
+            charge_out[h] = charge
+            soc += charge * sqrt_eff
+        
+        soc_out[h] = soc
+
+
+if HAS_NUMBA:
+    _bess_soc_recurrence_jit = numba.njit(cache=True)(_bess_soc_recurrence)
+
+
+def run_bess_soc_recurrence(
+    residual: np.ndarray,
+    excess_solar: np.ndarray,
+    idle_capacity: np.ndarray,
+    bess_mw: float,
+    bess_mwh: float,
+    sqrt_eff: float,
+    recip_cap: float,
+    turbine_cap: float,
+    grid_cap: float,
+    grid_first: bool,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the BESS SOC loop (numba if installed, else list-backed Python).
+    
+    Returns:
+        (bess_discharge, bess_charge, bess_soc) hourly arrays
+    """
+    scalars = (float(bess_mw), float(bess_mwh), float(sqrt_eff),
+               float(recip_cap), float(turbine_cap), float(grid_cap), bool(grid_first))
+    
+    if HAS_NUMBA:
+        n_hours = len(residual)
+        discharge = np.zeros(n_hours)
+        charge = np.zeros(n_hours)
+        soc = np.zeros(n_hours)
+        _bess_soc_recurrence_jit(
+            np.ascontiguousarray(residual, dtype=np.float64),
+            np.ascontiguousarray(excess_solar, dtype=np.float64),
+            np.ascontiguousarray(idle_capacity, dtype=np.float64),
+            *scalars, discharge, charge, soc,
+        )
+        return discharge, charge, soc
+    
+    n_hours = len(residual)
+    discharge = [0.0] * n_hours
+    charge = [0.0] * n_hours
+    soc = [0.0] * n_hours
+    _bess_soc_recurrence(
+        residual.tolist(), excess_solar.tolist(), idle_capacity.tolist(),
+        *scalars, discharge, charge, soc,
+    )
+    return np.array(discharge), np.array(charge), np.array(soc)
+
+
 class DispatchSimulator:
     """
     Full 8760 hourly dispatch with:
     - Economic merit order (compare grid vs thermal cost)
     - BESS reliability charging (from excess thermal/grid, not just solar)
     - Ramp tracking
+    
+    run_dispatch() splits the year into whole-array stages (solar must-take,
+    thermal/grid merit order, unserved, charge sourcing) and a tight loop for
+    the BESS state-of-charge recurrence. run_dispatch_reference() keeps the
+    original hour-by-hour loop for validation.
     """
     
     def __init__(
@@ -1003,7 +1302,142 @@ class DispatchSimulator:
         grid_available: bool = False,
         grid_capacity_mw: float = 0,
     ) -> DispatchResult:
-        """Run economic merit-order dispatch for 8760 hours."""
+        """
+        Run economic merit-order dispatch for 8760 hours.
+        
+        Bit-identical to run_dispatch_reference(); see test_dispatch_kernel.py.
+        """
+        batch = self.run_dispatch_batch(
+            [equipment_config],
+            np.asarray(load_profile, dtype=float)[np.newaxis, :],
+            np.asarray(solar_profile, dtype=float)[np.newaxis, :],
+            firm_load_matrix=np.asarray(firm_load_profile, dtype=float)[np.newaxis, :],
+            grid_capacity_mw=grid_capacity_mw if grid_available else 0,
+        )
+        return batch.to_dispatch_result(0)
+    
+    def run_dispatch_batch(
+        self,
+        configs: List[Dict],
+        load_matrix: np.ndarray,
+        solar_matrix: np.ndarray,
+        firm_load_matrix: np.ndarray = None,
+        grid_capacity_mw: Union[float, List[float], np.ndarray] = 0,
+    ) -> BatchDispatchResult:
+        """
+        Dispatch many years or candidate configurations in one pass.
+        
+        Args:
+            configs: One equipment config per row (recip_mw, turbine_mw, solar_mw,
+                bess_mw, bess_mwh)
+            load_matrix: (n_runs × n_hours) total load, MW
+            solar_matrix: (n_runs × n_hours) available solar, MW
+            firm_load_matrix: (n_runs × n_hours) firm load; defaults to load_matrix
+            grid_capacity_mw: Grid import limit, scalar or one per row (0 = no grid)
+        
+        Returns:
+            BatchDispatchResult (struct-of-arrays; DataFrames built on request)
+        """
+        load_matrix = np.atleast_2d(np.asarray(load_matrix, dtype=float))
+        solar_matrix = np.atleast_2d(np.asarray(solar_matrix, dtype=float))
+        n_runs, n_hours = load_matrix.shape
+        
+        if len(configs) != n_runs or solar_matrix.shape != load_matrix.shape:
+            raise ValueError(
+                f"Batch shape mismatch: {len(configs)} configs, load {load_matrix.shape}, "
+                f"solar {solar_matrix.shape}"
+            )
+        if firm_load_matrix is None:
+            firm_load_matrix = load_matrix
+        firm_load_matrix = np.atleast_2d(np.asarray(firm_load_matrix, dtype=float))
+        
+        def column(key: str) -> np.ndarray:
+            return np.array([float(c.get(key, 0)) for c in configs]).reshape(n_runs, 1)
+        
+        recip_cap = column('recip_mw')
+        turbine_cap = column('turbine_mw')
+        solar_cap = column('solar_mw')
+        bess_mw = column('bess_mw')
+        bess_mwh = column('bess_mwh')
+        grid_cap = np.broadcast_to(
+            np.asarray(grid_capacity_mw, dtype=float).reshape(-1, 1), (n_runs, 1)
+        ).copy()
+        
+        bess_eff = self.specs.get('bess', {}).get('efficiency', 0.90)
+        sqrt_eff = float(np.sqrt(bess_eff))
+        grid_first = (self.grid_price < self.recip_marginal_cost) & (grid_cap > 0)
+        
+        # Step 1: Solar (must-take) - stateless
+        solar_avail = np.where(solar_cap > 0, solar_matrix, 0.0)
+        solar_gen = np.minimum(solar_avail, load_matrix)
+        residual = load_matrix - solar_gen
+        excess_solar = solar_avail - solar_gen
+        
+        # Step 2/5: BESS discharge + reliability charging - sequential in SOC
+        bess_discharge = np.zeros_like(load_matrix)
+        bess_charge = np.zeros_like(load_matrix)
+        bess_soc = np.broadcast_to(bess_mwh * 0.5, load_matrix.shape).copy()
+        
+        bess_rows = np.flatnonzero(bess_mwh[:, 0] > 0)
+        if len(bess_rows):
+            recip_idle, turbine_idle, grid_idle, _ = _merit_order(
+                residual, recip_cap, turbine_cap, grid_cap, grid_first
+            )
+            idle_capacity = (excess_solar
+                             + np.maximum(0, recip_cap - recip_idle)
+                             + np.maximum(0, turbine_cap - turbine_idle)
+                             + np.maximum(0, grid_cap - grid_idle))
+            for i in bess_rows:
+                bess_discharge[i], bess_charge[i], bess_soc[i] = run_bess_soc_recurrence(
+                    residual[i], excess_solar[i], idle_capacity[i],
+                    bess_mw[i, 0], bess_mwh[i, 0], sqrt_eff,
+                    recip_cap[i, 0], turbine_cap[i, 0], grid_cap[i, 0], grid_first[i, 0],
+                )
+        
+        # Step 3/4: Economic dispatch (grid vs thermal) + unserved - stateless
+        recip_gen, turbine_gen, grid_import, unserved = _merit_order(
+            residual - bess_discharge, recip_cap, turbine_cap, grid_cap, grid_first
+        )
+        
+        # Step 5b: Source BESS charging energy from idle firm capacity
+        unused_recip = np.maximum(0, recip_cap - recip_gen)
+        unused_turbine = np.maximum(0, turbine_cap - turbine_gen)
+        unused_grid = np.maximum(0, grid_cap - grid_import)
+        
+        needed_from_firm = np.maximum(0, bess_charge - excess_solar)
+        take_grid = np.minimum(needed_from_firm, unused_grid)
+        needed_from_firm = needed_from_firm - take_grid
+        take_recip = np.minimum(needed_from_firm, unused_recip)
+        needed_from_firm = needed_from_firm - take_recip
+        take_turbine = np.minimum(needed_from_firm, unused_turbine)
+        
+        return BatchDispatchResult(
+            load_mw=load_matrix,
+            firm_load_mw=firm_load_matrix,
+            solar_mw=solar_gen,
+            bess_discharge_mw=bess_discharge,
+            bess_charge_mw=bess_charge,
+            bess_soc_mwh=bess_soc,
+            recip_mw=recip_gen + take_recip,
+            turbine_mw=turbine_gen + take_turbine,
+            grid_mw=grid_import + take_grid,
+            unserved_mw=unserved,
+            solar_cap_mw=solar_cap[:, 0],
+            recip_cap_mw=recip_cap[:, 0],
+            turbine_cap_mw=turbine_cap[:, 0],
+            grid_cap_mw=grid_cap[:, 0],
+        )
+    
+    def run_dispatch_reference(
+        self,
+        equipment_config: Dict,
+        load_profile: np.ndarray,
+        firm_load_profile: np.ndarray,
+        solar_profile: np.ndarray,
+        grid_available: bool = False,
+        grid_capacity_mw: float = 0,
+    ) -> DispatchResult:
+        """Original hour-by-hour dispatch loop (reference for run_dispatch)."""
         n_hours = len(load_profile)
         
         recip_cap = equipment_config.get('recip_mw', 0)
@@ -1025,17 +1459,12 @@ class DispatchSimulator:
         bess_eff = self.specs.get('bess', {}).get('efficiency', 0.90)
         bess_soc_current = bess_mwh * 0.5
         
-        ramp_events = []
         grid_cheaper_than_recip = self.grid_price < self.recip_marginal_cost
         
         for h in range(n_hours):
             load = load_profile[h]
             remaining = load
             
-            if h > 0:
-                ramp_mw = abs(load_profile[h] - load_profile[h-1])
-                ramp_events.append(ramp_mw)
-            
             # Step 1: Solar (must-take)
             solar_avail = solar_profile[h] if solar_cap > 0 else 0
             solar_gen[h] = min(solar_avail, remaining)
@@ -1108,53 +1537,23 @@ class DispatchSimulator:
             
             bess_soc[h] = bess_soc_current
         
-        dispatch_df = pd.DataFrame({
-            'hour': range(n_hours),
-            'load_mw': load_profile,
-            'firm_load_mw': firm_load_profile,
-            'solar_mw': solar_gen,
-            'bess_discharge_mw': bess_discharge,
-            'bess_charge_mw': bess_charge,
-            'bess_soc_mwh': bess_soc,
-            'recip_mw': recip_gen,
-            'turbine_mw': turbine_gen,
-            'grid_mw': grid_import,
-            'unserved_mw': unserved,
-        })
-        
-        energy_delivered = (solar_gen + bess_discharge + recip_gen + turbine_gen + grid_import).sum()
-        energy_required = load_profile.sum()
-        
-        generation_by_source = {
-            'solar_mwh': solar_gen.sum(),
-            'bess_mwh': bess_discharge.sum(),
-            'recip_mwh': recip_gen.sum(),
-            'turbine_mwh': turbine_gen.sum(),
-            'grid_mwh': grid_import.sum(),
-        }
-        
-        capacity_factors = {
-            'solar': solar_gen.sum() / (solar_cap * n_hours) if solar_cap > 0 else 0,
-            'recip': recip_gen.sum() / (recip_cap * n_hours) if recip_cap > 0 else 0,
-            'turbine': turbine_gen.sum() / (turbine_cap * n_hours) if turbine_cap > 0 else 0,
-            'grid': grid_import.sum() / (grid_cap * n_hours) if grid_cap > 0 else 0,
-        }
-        
-        max_ramp_mw_per_hour = max(ramp_events) if ramp_events else 0
-        max_ramp_mw_per_min = max_ramp_mw_per_hour / 5
-        
-        return DispatchResult(
-            year=0,
-            dispatch_df=dispatch_df,
-            energy_delivered_mwh=energy_delivered,
-            energy_required_mwh=energy_required,
-            unserved_energy_mwh=unserved.sum(),
-            generation_by_source=generation_by_source,
-            capacity_factors=capacity_factors,
-            peak_unserved_mw=unserved.max(),
-            hours_with_unserved=int((unserved > 0).sum()),
-            max_ramp_mw_per_min=max_ramp_mw_per_min,
+        batch = BatchDispatchResult(
+            load_mw=np.asarray(load_profile, dtype=float)[np.newaxis, :],
+            firm_load_mw=np.asarray(firm_load_profile, dtype=float)[np.newaxis, :],
+            solar_mw=solar_gen[np.newaxis, :],
+            bess_discharge_mw=bess_discharge[np.newaxis, :],
+            bess_charge_mw=bess_charge[np.newaxis, :],
+            bess_soc_mwh=bess_soc[np.newaxis, :],
+            recip_mw=recip_gen[np.newaxis, :],
+            turbine_mw=turbine_gen[np.newaxis, :],
+            grid_mw=grid_import[np.newaxis, :],
+            unserved_mw=unserved[np.newaxis, :],
+            solar_cap_mw=np.array([solar_cap], dtype=float),
+            recip_cap_mw=np.array([recip_cap], dtype=float),
+            turbine_cap_mw=np.array([turbine_cap], dtype=float),
+            grid_cap_mw=np.array([grid_cap], dtype=float),
         )
+        return batch.to_dispatch_result(0)
 
 
 # =============================================================================
@@ -1205,15 +1604,16 @@ class GreenfieldHeuristicV2:
                 total_load = np.resize(total_load, 8760)
             firm_load = total_load * self.firm_load_factor
         else:
-            hours = np.arange(8760)
-            np.random.seed(42)
-            
-            base = peak_load_mw * 0.85
-            hour_of_day = hours % 24
-            daily = 1.0 + 0.05 * np.sin(2 * np.pi * (hour_of_day - 14) / 24)
-            random_var = 1.0 + 0.10 * (np.random.random(8760) - 0.5)
+            def build():
+                engine = ProfileEngine(seed=42)
+                return engine.build(
+                    peak_load_mw * 0.85,
+                    factors=[engine.daily_sine(0.05, shift=14)],
+                    noise=engine.uniform(0.95, 1.05),
+                    clip=(0, peak_load_mw),
+                )
             
-            total_load = np.clip(base * daily * random_var, 0, peak_load_mw)
+            total_load = cached_profile('greenfield_load/v1', (float(peak_load_mw), 42), build)
             firm_load = total_load * self.firm_load_factor
         
         return total_load, firm_load
@@ -1223,22 +1623,19 @@ class GreenfieldHeuristicV2:
         if capacity_mw <= 0:
             return np.zeros(8760)
         
-        hours = np.arange(8760)
-        hour_of_day = hours % 24
-        day_of_year = hours // 24
-        
-        solar_cf = np.zeros(8760)
-        np.random.seed(43)
+        def build():
+            engine = ProfileEngine(seed=43)
+            return engine.build(
+                0.9,
+                factors=[
+                    engine.solar_day('gaussian', start=6, end=18, width=8),
+                    engine.seasonal_sine(0.3, shift=80, base=0.7),
+                ],
+                noise=engine.uniform(0.85, 1.0),  # weather
+            )
         
-        for h in range(8760):
-            hod = hour_of_day[h]
-            doy = day_of_year[h]
-            
-            if 6 <= hod <= 18:
-                hour_factor = np.exp(-((hod - 12) ** 2) / 8)
-                seasonal = 0.7 + 0.3 * np.sin(2 * np.pi * (doy - 80) / 365)
-                weather = 0.85 + 0.15 * np.random.random()
-                solar_cf[h] = hour_factor * seasonal * weather * 0.9
+        # Capacity factor shape is shared by every capacity
+        solar_cf = cached_profile('greenfield_solar_cf/v1', (43,), build)
         
         return solar_cf * capacity_mw
     
@@ -1301,44 +1698,47 @@ class GreenfieldHeuristicV2:
         active_years = [y for y in self.years if self.load_trajectory[y] > 0]
         n_active_years = len(active_years)
         
-        for year in self.years:
-            peak_load_mw = self.load_trajectory[year]
-            if peak_load_mw <= 0:
-                continue
-            
-            config = equipment_by_year[year]
+        if active_years:
+            # Build (year × hour) stacks once and dispatch every active year in one pass
+            load_profiles = [self._generate_load_profile(self.load_trajectory[y]) for y in active_years]
+            load_matrix = np.vstack([total for total, _ in load_profiles])
+            firm_load_matrix = np.vstack([firm for _, firm in load_profiles])
             
-            total_load, firm_load = self._generate_load_profile(peak_load_mw)
-            solar_profile = self._generate_solar_profile(config.get('solar_mw', 0))
+            configs = [equipment_by_year[y] for y in active_years]
+            solar_shape = self._generate_solar_profile(1.0)
+            solar_matrix = np.array([solar_shape * c.get('solar_mw', 0) for c in configs])
             
             grid_year = self.constraints.get('grid_available_year')
-            grid_available = grid_year is not None and year >= grid_year
-            grid_cap = self.constraints.get('grid_capacity_mw', 0) if grid_available else 0
+            grid_caps = [
+                self.constraints.get('grid_capacity_mw', 0)
+                if grid_year is not None and y >= grid_year else 0
+                for y in active_years
+            ]
             
-            print(f"  📅 Year {year}: Running dispatch for {len(total_load)} hours...")
+            print(f"  📅 Running batched dispatch: {len(active_years)} years × {load_matrix.shape[1]} hours...")
             dispatch_start = time.time()
             
-            dispatch = self.dispatcher.run_dispatch(
-                equipment_config=config,
-                load_profile=total_load,
-                firm_load_profile=firm_load,
-                solar_profile=solar_profile,
-                grid_available=grid_available,
-                grid_capacity_mw=grid_cap,
+            batch = self.dispatcher.run_dispatch_batch(
+                configs,
+                load_matrix,
+                solar_matrix,
+                firm_load_matrix=firm_load_matrix,
+                grid_capacity_mw=grid_caps,
             )
             
             dispatch_time = time.time() - dispatch_start
             print(f"     ⏱  Dispatch completed in {dispatch_time:.2f}s")
             
-            dispatch.year = year
-            dispatch_by_year[year] = dispatch
-            
-            total_energy_delivered += dispatch.energy_delivered_mwh
-            total_energy_required += dispatch.energy_required_mwh
-            total_unserved += dispatch.unserved_energy_mwh
-            
-            for source, mwh in dispatch.generation_by_source.items():
-                total_gen_by_source[source] += mwh
+            for i, year in enumerate(active_years):
+                dispatch = batch.to_dispatch_result(i, year=year)
+                dispatch_by_year[year] = dispatch
+                
+                total_energy_delivered += dispatch.energy_delivered_mwh
+                total_energy_required += dispatch.energy_required_mwh
+                total_unserved += dispatch.unserved_energy_mwh
+                
+                for source, mwh in dispatch.generation_by_source.items():
+                    total_gen_by_source[source] += mwh
         
         # PHASE 3: Check constraints
         final_config = equipment_by_year[self.end_year]
@@ -0,0 +1,200 @@
+"""
+In-Process HiGHS Solver
+=======================
+
+Solves bvNexus MILPs without leaving the Python process: no LP file is
+written, no solver subprocess is spawned and no solution file is parsed.
+
+- Pyomo models are compiled to sparse matrices with Pyomo's
+  LinearStandardFormCompiler and solved by HiGHS through
+  scipy.optimize.milp; the solution is loaded straight back onto the Vars.
+- race() solves the same matrices under several HiGHS configurations in
+  parallel worker processes (app.utils.scenario_runner) and keeps the first
+  one to reach the target gap, terminating the rest.
+
+bvNexusMILP_DR.solve(solver='highs') uses this path; when highspy is
+installed it keeps a Pyomo appsi HiGHS persistent solver on the model
+instead, so re-solves after update_scenario() only push the changed Params.
+
+Usage:
+    from app.optimization.highs_inprocess import compile_model, load_values, race, solve_lp
+
+    lp, columns = compile_model(optimizer.model)
+    result = race(lp, time_limit=300, target_gap=0.01)   # or solve_lp(lp, ...)
+    load_values(columns, result['x'])
+"""
+
+from typing import Dict, List, Tuple
+import logging
+import multiprocessing
+import time
+
+import numpy as np
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+logger = logging.getLogger(__name__)
+
+# scipy.optimize.milp status -> Pyomo termination condition name
+TERMINATION = {0: 'optimal', 1: 'maxTimeLimit', 2: 'infeasible', 3: 'unbounded'}
+
+# Raced HiGHS configurations: extra scipy.optimize.milp options per worker
+DEFAULT_RACE_CONFIGS = [
+    {'name': 'presolve', 'presolve': True},
+    {'name': 'no_presolve', 'presolve': False},
+]
+
+
+# =============================================================================
+# PYOMO <-> MATRICES
+# =============================================================================
+
+def compile_model(model) -> Tuple['SparseLP', List]:
+    """
+    Compile a linear Pyomo model (minimize) to a SparseLP in memory.
+
+    Returns the SparseLP and the Pyomo VarData for each of its columns.
+    """
+    from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+    from .milp_matrix_dr import SparseLP
+
+    info = LinearStandardFormCompiler().write(model, mixed_form=True)
+    columns = info.columns
+    sense = np.array([row[1] for row in info.rows], dtype=int)
+    rhs = np.asarray(info.rhs, dtype=float)
+    lp = SparseLP(
+        c=info.c.toarray()[0] if info.c.shape[0] else np.zeros(len(columns)),
+        A=info.A.tocsr(),
+        row_lo=np.where(sense <= 0, rhs, -np.inf),
+        row_hi=np.where(sense >= 0, rhs, np.inf),
+        col_lb=np.array([-np.inf if v.lb is None else v.lb for v in columns], dtype=float),
+        col_ub=np.array([np.inf if v.ub is None else v.ub for v in columns], dtype=float),
+        integrality=np.array([v.is_integer() for v in columns], dtype=np.uint8),
+        obj_offset=float(info.c_offset[0]) if len(info.c_offset) else 0.0,
+    )
+    return lp, columns
+
+
+def load_values(columns: List, x) -> None:
+    """Write a solution vector back onto the Pyomo Vars it was compiled from."""
+    if x is None:
+        return
+    for var, val in zip(columns, x.tolist()):
+        var.set_value(val, skip_validation=True)
+
+
+def to_solver_results(result: Dict, lp: 'SparseLP'):
+    """Pyomo SolverResults for a solve_lp()/race() result (as bvNexusMILP_DR._extract_solution expects)."""
+    from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+
+    results = SolverResults()
+    results.solver.name = 'highs'
+    results.solver.status = SolverStatus.ok if result['x'] is not None else SolverStatus.warning
+    results.solver.termination_condition = getattr(TerminationCondition, result['termination'],
+                                                   TerminationCondition.error)
+    results.solver.termination_message = result['message']
+    results.solver.wallclock_time = result['solver_time_s']
+    if result['node_count'] is not None:
+        results.solver.statistics.branch_and_bound.number_of_created_subproblems = result['node_count']
+    if result['fun'] is not None:
+        results.problem.upper_bound = result['fun'] + lp.obj_offset
+        if result['dual_bound'] is not None:
+            results.problem.lower_bound = result['dual_bound'] + lp.obj_offset
+    results.problem.number_of_variables = lp.n_cols
+    results.problem.number_of_constraints = lp.n_rows
+    results.problem.number_of_nonzeros = lp.nnz
+    return results
+
+
+# =============================================================================
+# SOLVING
+# =============================================================================
+
+def solve_lp(
+    lp: 'SparseLP',
+    time_limit: float = 300,
+    mip_rel_gap: float = 0.01,
+    verbose: bool = False,
+    name: str = 'highs',
+    **options,
+) -> Dict:
+    """
+    Solve a SparseLP with HiGHS (scipy.optimize.milp).
+
+    Extra keyword arguments are passed as scipy milp options (presolve,
+    node_limit, ...). Returns a plain, picklable dict so it can run in a
+    race() worker: x, fun (without obj_offset), termination, message,
+    mip_gap, dual_bound, node_count, solver_time_s and the config name.
+    """
+    t_solve = time.perf_counter()
+    result = milp(
+        lp.c,
+        constraints=LinearConstraint(lp.A, lp.row_lo, lp.row_hi),
+        integrality=lp.integrality,
+        bounds=Bounds(lp.col_lb, lp.col_ub),
+        options={'time_limit': time_limit, 'mip_rel_gap': mip_rel_gap, 'disp': verbose, **options},
+    )
+
+    def number(attr):
+        v = getattr(result, attr, None)
+        return float(v) if v is not None and np.isfinite(v) else None
+
+    return {
+        'config': name,
+        'x': result.x,
+        'fun': None if result.x is None else float(result.fun),
+        'termination': TERMINATION.get(result.status, 'error'),
+        'message': result.message,
+        'mip_gap': number('mip_gap'),
+        'dual_bound': number('mip_dual_bound'),
+        'node_count': number('mip_node_count'),
+        'solver_time_s': time.perf_counter() - t_solve,
+    }
+
+
+def race(
+    lp: 'SparseLP',
+    configs: List[Dict] = None,
+    time_limit: float = 300,
+    target_gap: float = 0.01,
+    verbose: bool = False,
+) -> Dict:
+    """
+    Solve `lp` under each HiGHS configuration concurrently; first to the target gap wins.
+
+    Each config is a dict of scipy milp options plus a 'name'. As soon as one
+    worker proves `target_gap` the others are terminated. If none does within
+    time_limit, the best incumbent found is returned. The result is solve_lp()'s
+    dict plus 'race': the state and elapsed time of every configuration.
+    """
+    from app.utils.scenario_runner import DONE, ScenarioRunner
+
+    configs = configs or DEFAULT_RACE_CONFIGS
+    if multiprocessing.current_process().daemon:
+        # Already inside a scenario worker, which may not start processes of its own
+        logger.info("Race requested inside a daemon worker; solving with the first configuration only")
+        config = dict(configs[0])
+        return dict(solve_lp(lp, time_limit=time_limit, mip_rel_gap=target_gap, verbose=verbose, **config),
+                    race=[])
+    kwargs_list = [dict(config, lp=lp, time_limit=time_limit, mip_rel_gap=target_gap, verbose=verbose)
+                   for config in configs]
+    names = [config.get('name', f'config_{i}') for i, config in enumerate(configs)]
+    for kwargs, name in zip(kwargs_list, names):
+        kwargs['name'] = name
+
+    # Workers stop themselves at time_limit; the runner timeout only covers startup/teardown
+    runner = ScenarioRunner(max_workers=len(configs), timeout=time_limit + 30, poll_interval=0.05)
+    results = runner.run(solve_lp, kwargs_list, names=names,
+                         stop_when=lambda index, result: result['termination'] == 'optimal')
+    states = runner.progress()['scenarios']
+
+    finished = [(r, s) for r, s in zip(results, states) if s['state'] == DONE and r['x'] is not None]
+    if not finished:
+        raise RuntimeError(f"No raced HiGHS configuration found a solution: {states}")
+    proven = [(r, s) for r, s in finished if r['termination'] == 'optimal']
+    if proven:
+        winner = min(proven, key=lambda rs: rs[1]['elapsed_s'])[0]
+    else:
+        winner = min(finished, key=lambda rs: rs[0]['fun'])[0]
+    logger.info(f"Race won by HiGHS config '{winner['config']}' "
+                f"({winner['termination']}, {winner['solver_time_s']:.1f}s)")
+    return dict(winner, race=[{k: s[k] for k in ('name', 'state', 'elapsed_s')} for s in states])
@@ -0,0 +1,431 @@
+"""
+bvNexus MILP - Year Decomposition Solve Modes
+=============================================
+
+The monolithic MILP couples every planning year through the non-decreasing
+capacity constraints (nondec_*) and the single NPV objective, so solve time
+grows superlinearly with the horizon. This module solves the same problem
+(bvNexusMILP_Matrix assembly) in pieces:
+
+- 'rolling'  Rolling horizon. Solve a window of `window` years, commit the
+             first `step` of them, carry the committed capacity forward as
+             the next window's existing equipment (a lower bound, exactly
+             what nondec_* enforces), slide and repeat. window=1, step=1 is
+             the year-by-year (myopic) solve.
+- 'benders'  Benders split. The master is a small MILP over the investment
+             variables of all years plus one recourse estimate per year; each
+             year's hourly dispatch is an LP sub-problem whose duals return
+             optimality cuts. Starts from the rolling-horizon plan and stops
+             when the master bound is within `benders_tolerance` of the best
+             plan.
+- 'monolithic' The ordinary single solve (for comparison).
+
+Decomposed plans are stitched back into one full-horizon solution vector, so
+the reported objective_lcoe is the monolithic objective of that plan and the
+gap against a monolithic solve is a like-for-like comparison.
+
+Usage:
+    from app.optimization.milp_decomposition import bvNexusMILP_Decomposed
+
+    optimizer = bvNexusMILP_Decomposed(mode='rolling', window=2, step=1)
+    optimizer.build(site, constraints, load_data, workload_mix, years)
+    solution = optimizer.solve(time_limit=300)
+    solution['decomposition']   # windows / iterations, bounds, timings
+
+    # Drop-in for the MILP wrapper:
+    optimize_with_milp(..., optimizer=bvNexusMILP_Decomposed(mode='benders'))
+
+    # Gap vs monolithic on one problem:
+    report = decomposition_gap_report(build_kwargs)
+"""
+
+from typing import Dict, List, Optional
+import logging
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, linprog, milp
+
+from .milp_matrix_dr import bvNexusMILP_Matrix
+
+logger = logging.getLogger(__name__)
+
+
+class bvNexusMILP_Decomposed(bvNexusMILP_Matrix):
+    """
+    bvNexusMILP_Matrix with rolling-horizon and Benders solve modes.
+
+    build() / update_scenario() assemble the full-horizon problem as usual;
+    only solve() differs. The returned solution dict has the standard layout
+    plus a 'decomposition' entry describing the run.
+    """
+
+    MODES = ('monolithic', 'rolling', 'benders')
+
+    # Investment (first-stage) variable blocks; everything else is dispatch
+    INVESTMENT_VARS = ['n_recip', 'n_turbine', 'bess_mwh', 'bess_mw', 'solar_mw',
+                       'grid_mw', 'grid_active', 'grid_capex_incurred']
+
+    # Capacity carried between rolling windows (variable = existing_equipment key)
+    CARRIED_CAPACITY = ['n_recip', 'n_turbine', 'bess_mwh', 'solar_mw']
+
+    def __init__(
+        self,
+        mode: str = 'rolling',
+        window: int = 1,
+        step: int = 1,
+        benders_max_iterations: int = 50,
+        benders_tolerance: float = 1e-3,
+    ):
+        """
+        Args:
+            mode: 'rolling', 'benders' or 'monolithic'
+            window: Years per rolling-horizon sub-problem
+            step: Years committed per window (1 <= step <= window); windows
+                overlap by window - step years
+            benders_max_iterations: Master/sub-problem rounds for 'benders'
+            benders_tolerance: Relative gap (best plan vs master bound) at
+                which 'benders' stops
+        """
+        super().__init__()
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}' (use one of {self.MODES})")
+        if not 1 <= step <= window:
+            raise ValueError(f"Need 1 <= step <= window (got step={step}, window={window})")
+        self.mode = mode
+        self.window = window
+        self.step = step
+        self.benders_max_iterations = benders_max_iterations
+        self.benders_tolerance = benders_tolerance
+
+    def cache_config(self) -> Dict:
+        return {
+            'mode': self.mode,
+            'window': self.window,
+            'step': self.step,
+            'benders_max_iterations': self.benders_max_iterations,
+            'benders_tolerance': self.benders_tolerance,
+        }
+
+    # ==========================================================================
+    # SOLVING
+    # ==========================================================================
+
+    def solve(
+        self,
+        solver: str = 'highs',
+        time_limit: int = 300,
+        verbose: bool = True,
+        warm_start: bool = True,
+        mip_gap: float = 0.01,
+        race: bool = False,
+    ) -> Dict:
+        """Solve with the configured mode; same arguments as bvNexusMILP_Matrix.solve() (race: monolithic only)."""
+        if not self._built:
+            raise RuntimeError("Model not built. Call build() first.")
+
+        t_start = time.perf_counter()
+        if self.mode == 'monolithic':
+            solution = super().solve(solver=solver, time_limit=time_limit, verbose=verbose,
+                                     mip_gap=mip_gap, race=race)
+            info = {}
+        elif self.mode == 'rolling':
+            x, termination, info = self._solve_rolling(time_limit)
+            solution = self._solution_from_vector(x, termination)
+        else:
+            x, termination, info = self._solve_benders(time_limit)
+            solution = self._solution_from_vector(x, termination)
+
+        solution['decomposition'] = dict(info, mode=self.mode, solve_time_s=time.perf_counter() - t_start)
+        logger.info(f"{self.mode} solve finished in {solution['decomposition']['solve_time_s']:.1f}s, "
+                    f"LCOE {solution['objective_lcoe']:.4f}")
+        return solution
+
+    def _solution_from_vector(self, x: Optional[np.ndarray], termination: str) -> Dict:
+        """Standard solution dict for a full-horizon solution vector."""
+        self._x = x
+        solution = self._extract_solution_arrays(x, termination, None if x is None else float(self.lp.c @ x))
+        self._has_incumbent = bool(solution['equipment'])
+        return solution
+
+    def _year_columns(self, lp, positions) -> np.ndarray:
+        """Column indices of the given year positions, in block order (every block is Y-first)."""
+        cols = []
+        for offset, shape in lp.col_blocks.values():
+            per_year = int(np.prod(shape[1:]))
+            for i in positions:
+                cols.append(np.arange(offset + i * per_year, offset + (i + 1) * per_year))
+        return np.concatenate(cols)
+
+    def _column_year(self) -> np.ndarray:
+        """Year position of every column of the full problem."""
+        year = np.empty(self.lp.n_cols, dtype=int)
+        for offset, shape in self.lp.col_blocks.values():
+            size = int(np.prod(shape))
+            year[offset:offset + size] = np.repeat(np.arange(shape[0]), size // shape[0])
+        return year
+
+    # ==========================================================================
+    # ROLLING HORIZON
+    # ==========================================================================
+
+    def _window_model(self, years: List[int], existing: Dict) -> bvNexusMILP_Matrix:
+        """Matrix model for a sub-horizon, sharing this model's configuration and periods."""
+        sub = bvNexusMILP_Matrix()
+        sub.build(
+            site=self.site,
+            constraints=self.constraints,
+            load_data=self.load_data,
+            workload_mix=self.workload_mix,
+            years=years,
+            dr_config=self.dr_config,
+            existing_equipment=existing,
+            grid_config=self.grid_config,
+            use_representative_periods=self.use_representative,
+            representative_periods=self.periods,
+        )
+        if self.tech_availability:
+            sub.update_scenario(tech_availability=self.tech_availability)
+        return sub
+
+    def _solve_rolling(self, time_limit: float, window: int = None, step: int = None):
+        """Rolling-horizon solve; returns (full solution vector, termination, info)."""
+        window = window or self.window
+        step = step or self.step
+        years = list(self.years)
+        starts = list(range(0, len(years), step))
+
+        x = np.zeros(self.lp.n_cols)
+        existing = dict(self.existing)
+        windows = []
+        termination = 'optimal'
+        t_start = time.perf_counter()
+
+        for k, start in enumerate(starts):
+            window_years = years[start:start + window]
+            committed = window_years[:step]
+            remaining = max(time_limit - (time.perf_counter() - t_start), 1.0)
+
+            t0 = time.perf_counter()
+            sub = self._window_model(window_years, existing)
+            sub_solution = sub.solve(time_limit=remaining / (len(starts) - k), verbose=False)
+            if sub._x is None:
+                logger.error(f"Rolling window {window_years} has no solution ({sub_solution['termination']})")
+                return None, sub_solution['termination'], {'windows': windows}
+
+            x[self._year_columns(self.lp, range(start, start + len(committed)))] = \
+                sub._x[self._year_columns(sub.lp, range(len(committed)))]
+
+            # Committed capacity becomes the floor for everything after it
+            last = len(committed) - 1
+            for name in self.CARRIED_CAPACITY:
+                carried = float(sub._var(name)[last])
+                if name.startswith('n_'):
+                    carried = int(round(carried))
+                existing[name] = max(self.existing.get(name, 0), carried)
+
+            if sub_solution['termination'] != 'optimal':
+                termination = sub_solution['termination']
+            windows.append({
+                'years': window_years,
+                'committed': committed,
+                'termination': sub_solution['termination'],
+                'solve_time_s': time.perf_counter() - t0,
+            })
+            logger.info(f"Rolling window {window_years[0]}-{window_years[-1]}: committed {committed}, "
+                        f"{windows[-1]['solve_time_s']:.1f}s")
+
+        return x, termination, {'window': window, 'step': step, 'windows': windows}
+
+    # ==========================================================================
+    # BENDERS
+    # ==========================================================================
+
+    def _solve_benders(self, time_limit: float):
+        """
+        Benders decomposition; returns (full solution vector, termination, info).
+
+        Sub-problems drop the unserved-energy upper bound so every investment
+        plan has a finite dispatch cost (no feasibility cuts needed); the
+        $/MWh unserved penalty still prices any shortfall.
+        """
+        lp = self.lp
+        t_start = time.perf_counter()
+
+        inv_mask = np.zeros(lp.n_cols, dtype=bool)
+        for name in self.INVESTMENT_VARS:
+            offset, shape = lp.col_blocks[name]
+            inv_mask[offset:offset + int(np.prod(shape))] = True
+        inv_cols = np.flatnonzero(inv_mask)
+        col_year = self._column_year()
+
+        # Rows touching dispatch columns belong to that year's sub-problem
+        A = lp.A.tocsr()
+        A_disp = A[:, ~inv_mask].tocsr()
+        disp_cols = np.flatnonzero(~inv_mask)
+        has_disp = np.diff(A_disp.indptr) > 0
+        row_year = np.full(lp.n_rows, -1)
+        row_year[has_disp] = col_year[disp_cols[A_disp.indices[A_disp.indptr[:-1][has_disp]]]]
+
+        col_ub = lp.col_ub.copy()
+        u_offset, u_shape = lp.col_blocks['unserved']
+        col_ub[u_offset:u_offset + int(np.prod(u_shape))] = np.inf
+        subs = [self._benders_subproblem(A, row_year == i, np.flatnonzero(~inv_mask & (col_year == i)),
+                                         inv_cols, col_ub)
+                for i in range(len(self.years))]
+
+        # Initial plan and first cuts from the year-by-year rolling horizon
+        x0, termination, _ = self._solve_rolling(time_limit / 4, window=1, step=1)
+        if x0 is None:
+            return None, termination, {}
+        x_inv = x0[inv_cols]
+
+        master_rows = ~has_disp
+        A_master = sparse.hstack([A[master_rows][:, inv_cols], sparse.csr_matrix((master_rows.sum(), len(self.years)))])
+        cuts_A, cuts_hi = [], []
+        n_inv, n_y = len(inv_cols), len(self.years)
+        c_master = np.concatenate([lp.c[inv_cols], np.ones(n_y)])
+        integrality = np.concatenate([lp.integrality[inv_cols], np.zeros(n_y, dtype=np.uint8)])
+        bounds = Bounds(np.concatenate([lp.col_lb[inv_cols], np.full(n_y, -np.inf)]),
+                        np.concatenate([lp.col_ub[inv_cols], np.full(n_y, np.inf)]))
+
+        best_ub, best_x = np.inf, None
+        lower_bound = -np.inf
+        history = []
+        termination = 'maxIterations'
+
+        for iteration in range(1, self.benders_max_iterations + 1):
+            # Sub-problems at the current plan: recourse cost, duals -> cuts
+            x = np.zeros(lp.n_cols)
+            x[inv_cols] = x_inv
+            upper = float(lp.c[inv_cols] @ x_inv)
+            for i, sub in enumerate(subs):
+                q, grad, z = self._solve_benders_subproblem(sub, x_inv)
+                x[sub['cols']] = z
+                upper += q
+                cut = np.zeros(n_inv + n_y)
+                cut[:n_inv] = grad
+                cut[n_inv + i] = -1
+                cuts_A.append(cut)
+                cuts_hi.append(float(grad @ x_inv) - q)
+            if upper < best_ub:
+                best_ub, best_x = upper, x
+
+            # Master: investments + one recourse estimate per year
+            remaining = time_limit - (time.perf_counter() - t_start)
+            if remaining <= 0:
+                termination = 'maxTimeLimit'
+                break
+            A_full = sparse.vstack([A_master, sparse.csr_matrix(np.vstack(cuts_A))])
+            lo = np.concatenate([lp.row_lo[master_rows], np.full(len(cuts_A), -np.inf)])
+            hi = np.concatenate([lp.row_hi[master_rows], cuts_hi])
+            result = milp(c_master, constraints=LinearConstraint(A_full, lo, hi), integrality=integrality,
+                          bounds=bounds, options={'time_limit': remaining, 'mip_rel_gap': 1e-6})
+            if result.x is None:
+                termination = 'error'
+                break
+            lower_bound = max(lower_bound, float(getattr(result, 'mip_dual_bound', result.fun)))
+            x_inv = result.x[:n_inv].copy()
+            x_inv[lp.integrality[inv_cols] == 1] = np.round(x_inv[lp.integrality[inv_cols] == 1])
+
+            gap = (best_ub - lower_bound) / max(abs(best_ub), 1e-9)
+            history.append({'iteration': iteration, 'lower_bound': lower_bound, 'upper_bound': best_ub, 'gap': gap})
+            logger.info(f"Benders {iteration}: LB {lower_bound:.4f}, UB {best_ub:.4f}, gap {gap:.2%}")
+            if gap <= self.benders_tolerance:
+                termination = 'optimal'
+                break
+
+        return best_x, termination, {
+            'iterations': len(history),
+            'lower_bound': lower_bound,
+            'upper_bound': best_ub,
+            'gap': history[-1]['gap'] if history else None,
+            'history': history,
+        }
+
+    def _benders_subproblem(self, A, rows, cols, inv_cols, col_ub) -> Dict:
+        """Split one year's dispatch rows into linprog's equality / <= form."""
+        lp = self.lp
+        A_rows = A[rows]
+        lo, hi = lp.row_lo[rows], lp.row_hi[rows]
+        is_eq = lo == hi
+        has_hi = np.isfinite(hi) & ~is_eq
+        has_lo = np.isfinite(lo) & ~is_eq
+        A_z, A_x = A_rows[:, cols], A_rows[:, inv_cols]
+        return {
+            'cols': cols,
+            'c': lp.c[cols],
+            'bounds': np.column_stack([lp.col_lb[cols], col_ub[cols]]),
+            'A_eq': A_z[is_eq], 'Ax_eq': A_x[is_eq], 'b_eq': lo[is_eq],
+            'A_hi': A_z[has_hi], 'Ax_hi': A_x[has_hi], 'b_hi': hi[has_hi],
+            'A_lo': A_z[has_lo], 'Ax_lo': A_x[has_lo], 'b_lo': lo[has_lo],
+        }
+
+    def _solve_benders_subproblem(self, sub: Dict, x_inv: np.ndarray):
+        """Dispatch LP at a fixed plan; returns (cost, d cost / d plan, dispatch)."""
+        A_ub = sparse.vstack([sub['A_hi'], -sub['A_lo']]).tocsr()
+        b_ub = np.concatenate([sub['b_hi'] - sub['Ax_hi'] @ x_inv, -(sub['b_lo'] - sub['Ax_lo'] @ x_inv)])
+        b_eq = sub['b_eq'] - sub['Ax_eq'] @ x_inv
+        result = linprog(sub['c'], A_ub=A_ub, b_ub=b_ub, A_eq=sub['A_eq'], b_eq=b_eq,
+                         bounds=sub['bounds'], method='highs')
+        if result.status != 0:
+            raise RuntimeError(f"Benders dispatch sub-problem failed: {result.message}")
+
+        n_hi = sub['A_hi'].shape[0]
+        mu_ub, mu_eq = result.ineqlin.marginals, result.eqlin.marginals
+        grad = -(sub['Ax_eq'].T @ mu_eq) - (sub['Ax_hi'].T @ mu_ub[:n_hi]) + (sub['Ax_lo'].T @ mu_ub[n_hi:])
+        return float(result.fun), np.asarray(grad).ravel(), result.x
+
+
+# =============================================================================
+# GAP REPORT
+# =============================================================================
+
+def decomposition_gap_report(
+    build_kwargs: Dict,
+    modes: List[Dict] = None,
+    time_limit: int = 300,
+    tech_availability: Dict = None,
+) -> List[Dict]:
+    """
+    Solve one problem monolithically and with each decomposition mode.
+
+    Args:
+        build_kwargs: Keyword arguments for build()
+        modes: bvNexusMILP_Decomposed constructor kwargs per run (default:
+            year-by-year, 2-year windows stepping 1, Benders)
+        time_limit: Seconds per run
+        tech_availability: Optional update_scenario() availability
+
+    Returns:
+        One row per run: label, objective_lcoe, gap_pct vs monolithic,
+        solve_time_s, speedup and termination
+    """
+    modes = modes or [
+        {'mode': 'rolling', 'window': 1, 'step': 1},
+        {'mode': 'rolling', 'window': 2, 'step': 1},
+        {'mode': 'benders'},
+    ]
+    rows = []
+    for kwargs in [{'mode': 'monolithic'}] + list(modes):
+        optimizer = bvNexusMILP_Decomposed(**kwargs)
+        optimizer.build(**build_kwargs)
+        if tech_availability:
+            optimizer.update_scenario(tech_availability=tech_availability)
+        solution = optimizer.solve(time_limit=time_limit, verbose=False)
+        label = kwargs['mode']
+        if kwargs['mode'] == 'rolling':
+            label += f" w{kwargs.get('window', 1)}/s{kwargs.get('step', 1)}"
+        rows.append({
+            'label': label,
+            'objective_lcoe': solution['objective_lcoe'],
+            'solve_time_s': solution['decomposition']['solve_time_s'],
+            'termination': solution['termination'],
+        })
+
+    reference = rows[0]
+    for row in rows:
+        row['gap_pct'] = (row['objective_lcoe'] - reference['objective_lcoe']) / abs(reference['objective_lcoe']) * 100
+        row['speedup'] = reference['solve_time_s'] / max(row['solve_time_s'], 1e-9)
+    return rows
@@ -0,0 +1,755 @@
+"""
+bvNexus MILP - Sparse Matrix Backend
+====================================
+
+Assembles the same MILP as bvNexusMILP_DR directly as scipy.sparse matrices
+instead of through per-index Pyomo rule callbacks.
+
+Each constraint family (power balance, generation limits, SOC dynamics, DR
+peak window, ...) is one vectorized COO block built from numpy index arrays,
+so the full-8760 model (use_representative_periods=False) is assembled in
+a fraction of the time Pyomo spends calling rules over T × Y and W × T × Y.
+
+The assembled problem can be:
+- solved in-process with HiGHS via scipy.optimize.milp (optionally racing
+  several HiGHS configurations; see highs_inprocess.py)
+- written to free-format MPS or CPLEX LP for any external solver
+
+Usage:
+    from app.optimization.milp_matrix_dr import bvNexusMILP_Matrix
+
+    optimizer = bvNexusMILP_Matrix()
+    optimizer.build(site, constraints, load_data, workload_mix, years,
+                    use_representative_periods=False)
+    optimizer.write('model.mps')                 # or 'model.lp'
+    solution = optimizer.solve(time_limit=300)   # same dict as bvNexusMILP_DR
+
+    # Drop-in for the Pyomo model in the MILP wrapper:
+    optimize_with_milp(..., optimizer=bvNexusMILP_Matrix())
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+import logging
+import time
+
+import numpy as np
+from scipy import sparse
+
+from .highs_inprocess import race as race_highs, solve_lp
+from .milp_model_dr import bvNexusMILP_DR
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SPARSE LP CONTAINER
+# =============================================================================
+
+@dataclass
+class SparseLP:
+    """
+    MILP in matrix form: min c·x + obj_offset  s.t.  row_lo <= A x <= row_hi,
+    col_lb <= x <= col_ub, x[integrality == 1] integer.
+
+    col_blocks / row_blocks map each variable / constraint family name to
+    (offset, shape) so solutions can be reshaped and files carry readable names.
+    """
+    c: np.ndarray
+    A: sparse.csr_matrix
+    row_lo: np.ndarray
+    row_hi: np.ndarray
+    col_lb: np.ndarray
+    col_ub: np.ndarray
+    integrality: np.ndarray
+    obj_offset: float = 0.0
+    col_blocks: Dict[str, Tuple[int, Tuple[int, ...]]] = field(default_factory=dict)
+    row_blocks: Dict[str, Tuple[int, Tuple[int, ...]]] = field(default_factory=dict)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.c)
+
+    @property
+    def n_rows(self) -> int:
+        return self.A.shape[0]
+
+    @property
+    def nnz(self) -> int:
+        return self.A.nnz
+
+    def column_names(self) -> List[str]:
+        return _block_names(self.col_blocks, self.n_cols)
+
+    def row_names(self) -> List[str]:
+        return _block_names(self.row_blocks, self.n_rows)
+
+
+def _block_names(blocks: Dict[str, Tuple[int, Tuple[int, ...]]], n: int) -> List[str]:
+    names = [''] * n
+    for name, (offset, shape) in blocks.items():
+        size = int(np.prod(shape))
+        names[offset:offset + size] = [f"{name}_{k}" for k in range(size)]
+    return names
+
+
+class _SparseBuilder:
+    """Accumulates variable blocks and COO constraint blocks."""
+
+    def __init__(self):
+        self.n_cols = 0
+        self.n_rows = 0
+        self.col_blocks = {}
+        self.row_blocks = {}
+        self._lb, self._ub, self._int = [], [], []
+        self._rows, self._cols, self._vals = [], [], []
+        self._lo, self._hi = [], []
+
+    def add_var(self, name: str, shape: Tuple[int, ...], lb=0.0, ub=np.inf,
+                integer: bool = False) -> np.ndarray:
+        """Reserve a block of columns; returns their indices shaped like the variable."""
+        size = int(np.prod(shape))
+        idx = np.arange(self.n_cols, self.n_cols + size).reshape(shape)
+        self.col_blocks[name] = (self.n_cols, tuple(shape))
+        self._lb.append(np.full(size, lb, dtype=float))
+        self._ub.append(np.full(size, ub, dtype=float))
+        self._int.append(np.full(size, 1 if integer else 0, dtype=np.uint8))
+        self.n_cols += size
+        return idx
+
+    def add_rows(self, name: str, shape: Tuple[int, ...], terms, lo=-np.inf, hi=np.inf):
+        """
+        Add one constraint family lo <= sum(coef * x[cols]) <= hi with rows shaped `shape`.
+
+        Each term is (cols, coef). cols must broadcast to `shape` plus any
+        trailing axes; trailing axes are summed into the row (e.g. Σ_t for
+        annual limits). coef broadcasts against cols.
+        """
+        shape = tuple(shape)
+        size = int(np.prod(shape))
+        row_ids = np.arange(self.n_rows, self.n_rows + size).reshape(shape)
+
+        for cols, coef in terms:
+            cols = np.asarray(cols)
+            extra = max(cols.ndim - len(shape), 0)
+            r, c, v = np.broadcast_arrays(
+                row_ids.reshape(shape + (1,) * extra), cols, np.asarray(coef, dtype=float)
+            )
+            self._rows.append(r.ravel())
+            self._cols.append(c.ravel())
+            self._vals.append(v.ravel())
+
+        self._lo.append(np.broadcast_to(np.asarray(lo, dtype=float), shape).ravel())
+        self._hi.append(np.broadcast_to(np.asarray(hi, dtype=float), shape).ravel())
+        self.row_blocks[name] = (self.n_rows, shape)
+        self.n_rows += size
+
+    def finish(self, c: np.ndarray, obj_offset: float = 0.0) -> SparseLP:
+        rows = np.concatenate(self._rows) if self._rows else np.zeros(0, dtype=int)
+        cols = np.concatenate(self._cols) if self._cols else np.zeros(0, dtype=int)
+        vals = np.concatenate(self._vals) if self._vals else np.zeros(0)
+        A = sparse.coo_matrix((vals, (rows, cols)), shape=(self.n_rows, self.n_cols)).tocsr()
+        A.sum_duplicates()
+        A.eliminate_zeros()  # e.g. grid terms scaled by GRID_AVAIL = 0
+        return SparseLP(
+            c=c,
+            A=A,
+            row_lo=np.concatenate(self._lo),
+            row_hi=np.concatenate(self._hi),
+            col_lb=np.concatenate(self._lb),
+            col_ub=np.concatenate(self._ub),
+            integrality=np.concatenate(self._int),
+            obj_offset=obj_offset,
+            col_blocks=self.col_blocks,
+            row_blocks=self.row_blocks,
+        )
+
+
+# =============================================================================
+# MATRIX MODEL
+# =============================================================================
+
+class bvNexusMILP_Matrix(bvNexusMILP_DR):
+    """
+    bvNexusMILP_DR assembled as sparse matrices.
+
+    Shares configuration handling, constants and scenario semantics with the
+    Pyomo model (build / update_scenario / solve / solution dict), so it can
+    be passed anywhere a bvNexusMILP_DR is accepted, including its
+    representative-period selection. Scenario updates simply re-assemble the
+    matrices, which is cheap even at 8760 hours.
+
+    self.model is None for this backend; the problem lives in self.lp.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lp: Optional[SparseLP] = None
+        self.build_time_s = 0.0
+        self._x = None
+
+    # ==========================================================================
+    # ASSEMBLY
+    # ==========================================================================
+
+    def _construct_model(self):
+        """Sample the load profile and assemble the sparse problem."""
+        self.model = None
+        with self._phase('_sample_representative_hours'):
+            self._load_array = self._sample_representative_hours(
+                np.array(self.load_data.get('total_load_mw', [100]*8760))
+            )
+        with self._phase('_assemble'):
+            self._assemble()
+    
+    def model_size(self) -> Dict[str, int]:
+        """Rows, columns and nonzeros of the assembled matrices."""
+        if self.lp is None:
+            return {}
+        return {'n_variables': self.lp.n_cols, 'n_constraints': self.lp.n_rows, 'n_nonzeros': self.lp.nnz}
+
+    def update_scenario(
+        self,
+        constraints: Dict = None,
+        grid_config: Dict = None,
+        load_trajectory: Dict[int, float] = None,
+        tech_availability: Dict[str, Dict[int, bool]] = None,
+    ):
+        """Same semantics as bvNexusMILP_DR.update_scenario(); re-assembles the matrices."""
+        if not self._built:
+            raise RuntimeError("Model not built. Call build() first.")
+
+        if constraints is not None:
+            self.constraints = constraints
+        if grid_config is not None:
+            self.grid_config = self._resolve_grid_config(grid_config)
+        if load_trajectory is not None:
+            self.site = dict(self.site, load_trajectory=load_trajectory)
+        if tech_availability is not None:
+            self.tech_availability = tech_availability
+
+        self._assemble()
+        logger.info(f"Scenario updated: grid from {self.grid_config['available_year']}")
+
+    def _assemble(self):
+        t_start = time.perf_counter()
+
+        years = list(self.years)
+        nY = len(years)
+        nT = len(self._load_array)
+        nW = len(self.WORKLOADS)
+        nDR = len(self.DR_PRODUCTS)
+        hour_weight = self.periods.hour_weights  # annualization weight per modelled hour
+
+        eq = self.EQUIPMENT
+        limits = self._limit_param_values()
+        pue = self.load_data.get('pue', 1.25)
+        grid_avail = np.array([self._grid_avail_values()[y] for y in years])
+        tech_avail = self._tech_avail_values()
+        avail = {tech: np.array([tech_avail[tech, y] for y in years]) for tech in self.TECHNOLOGIES}
+
+        hourly_scales, d_required_by_year = self._load_scales()
+        d_total = np.outer([hourly_scales[y] for y in years], self._load_array.astype(float))  # (Y, T)
+        d_required = np.array([d_required_by_year[y] for y in years])
+
+        b = _SparseBuilder()
+
+        # =========================
+        # VARIABLES
+        # =========================
+        n_recip = b.add_var('n_recip', (nY,), ub=self.VAR_UB['n_recip'], integer=True)
+        n_turbine = b.add_var('n_turbine', (nY,), ub=self.VAR_UB['n_turbine'], integer=True)
+        bess_mwh = b.add_var('bess_mwh', (nY,), ub=self.VAR_UB['bess_mwh'])
+        bess_mw = b.add_var('bess_mw', (nY,), ub=self.VAR_UB['bess_mw'])
+        solar_mw = b.add_var('solar_mw', (nY,), ub=self.VAR_UB['solar_mw'])
+        grid_mw = b.add_var('grid_mw', (nY,), ub=self.VAR_UB['grid_mw'])
+        grid_active = b.add_var('grid_active', (nY,), ub=1, integer=True)
+        grid_capex_incurred = b.add_var('grid_capex_incurred', (nY,))
+
+        gen_recip = b.add_var('gen_recip', (nY, nT))
+        gen_turbine = b.add_var('gen_turbine', (nY, nT))
+        gen_solar = b.add_var('gen_solar', (nY, nT))
+        grid_import = b.add_var('grid_import', (nY, nT))
+        charge = b.add_var('charge', (nY, nT))
+        discharge = b.add_var('discharge', (nY, nT))
+        soc = b.add_var('soc', (nY, nT))
+
+        curtail_wl = b.add_var('curtail_wl', (nY, nW, nT))
+        curtail_cool = b.add_var('curtail_cool', (nY, nT))
+        curtail_total = b.add_var('curtail_total', (nY, nT))
+        dr_capacity = b.add_var('dr_capacity', (nY, nDR))
+
+        unserved = b.add_var('unserved', (nY, nT), ub=self.VAR_UB['unserved'])
+
+        # Per-year columns broadcast against (Y, T) hourly blocks
+        per_hour = lambda cols: cols[:, None]
+
+        # =========================
+        # BROWNFIELD
+        # =========================
+        b.add_rows('existing_recip', (nY,), [(n_recip, 1)], lo=self.existing.get('n_recip', 0))
+        b.add_rows('existing_turbine', (nY,), [(n_turbine, 1)], lo=self.existing.get('n_turbine', 0))
+        b.add_rows('existing_bess', (nY,), [(bess_mwh, 1)], lo=self.existing.get('bess_mwh', 0))
+        b.add_rows('existing_solar', (nY,), [(solar_mw, 1)], lo=self.existing.get('solar_mw', 0))
+
+        # =========================
+        # CAPACITY
+        # =========================
+        b.add_rows('bess_sizing', (nY,), [(bess_mw, 1), (bess_mwh, -1 / self.BESS_DURATION)], lo=0, hi=0)
+        b.add_rows('land', (nY,), [(solar_mw, eq['solar']['land_acres_per_mw'])], hi=limits['LAND_MAX'])
+        b.add_rows('grid_requires_active', (nY,), [(grid_mw, 1), (grid_active, -self.GRID_BIG_M)], hi=0)
+        b.add_rows('grid_capex', (nY,),
+                   [(grid_capex_incurred, 1), (grid_active, -self.grid_config.get('capex', 5_000_000))], lo=0)
+        for name, cols in (('recip', n_recip), ('turbine', n_turbine), ('bess', bess_mwh), ('solar', solar_mw)):
+            if nY > 1:
+                b.add_rows(f'nondec_{name}', (nY - 1,), [(cols[1:], 1), (cols[:-1], -1)], lo=0)
+
+        # =========================
+        # DISPATCH
+        # =========================
+        b.add_rows('power_balance', (nY, nT), [
+            (gen_recip, 1), (gen_turbine, 1), (gen_solar, 1), (grid_import, 1),
+            (discharge, 1), (unserved, 1), (curtail_total, 1), (charge, -1),
+        ], lo=d_total, hi=d_total)
+
+        recip_gen_cap = eq['recip']['capacity_mw'] * eq['recip']['availability']
+        turbine_gen_cap = eq['turbine']['capacity_mw'] * eq['turbine']['availability']
+        b.add_rows('gen_recip_lim', (nY, nT), [(gen_recip, 1), (per_hour(n_recip), -recip_gen_cap)], hi=0)
+        b.add_rows('gen_turbine_lim', (nY, nT), [(gen_turbine, 1), (per_hour(n_turbine), -turbine_gen_cap)], hi=0)
+        b.add_rows('gen_solar_lim', (nY, nT),
+                   [(gen_solar, 1), (per_hour(solar_mw), -self._solar_cf_array()[None, :])], hi=0)
+        b.add_rows('grid_import_lim', (nY, nT),
+                   [(grid_import, 1), (per_hour(grid_mw), -per_hour(grid_avail))], hi=0)
+
+        b.add_rows('charge_lim', (nY, nT), [(charge, 1), (per_hour(bess_mw), -1)], hi=0)
+        b.add_rows('discharge_lim', (nY, nT), [(discharge, 1), (per_hour(bess_mw), -1)], hi=0)
+
+        # SOC chains hour to hour; periods are cyclic (the first hour follows the last)
+        eff = eq['bess']['efficiency']
+        starts = self.periods.period_first_hours
+        prev = np.arange(nT) - 1
+        prev[starts] = starts + self.periods.period_hours - 1
+        b.add_rows('soc_dynamics', (nY, nT), [
+            (soc, 1), (soc[:, prev], -1), (charge, -eff), (discharge, 1 / eff),
+        ], lo=0, hi=0)
+        b.add_rows('soc_low', (nY, nT), [(soc, 1), (per_hour(bess_mwh), -eq['bess']['min_soc_pct'])], lo=0)
+        b.add_rows('soc_high', (nY, nT), [(soc, 1), (per_hour(bess_mwh), -1)], hi=0)
+
+        # Annual fuel-linked limits: Σ_t over the trailing hour axis
+        recip_hr = eq['recip']['heat_rate_btu_kwh']
+        turbine_hr = eq['turbine']['heat_rate_btu_kwh']
+        b.add_rows('nox', (nY,), [
+            (gen_recip, hour_weight * recip_hr * eq['recip']['nox_rate_lb_mmbtu'] / 2_000_000),
+            (gen_turbine, hour_weight * turbine_hr * eq['turbine']['nox_rate_lb_mmbtu'] / 2_000_000),
+        ], hi=limits['NOX_MAX'])
+
+        # =========================
+        # DEMAND RESPONSE
+        # =========================
+        wl_pct = []
+        for w in self.WORKLOADS:
+            pct = self.workload_mix.get(w, 0.25)
+            wl_pct.append(pct / 100 if pct > 1 else pct)
+        wl_limit = np.array([self.WORKLOAD_FLEX[w] * p for w, p in zip(self.WORKLOADS, wl_pct)])
+        b.add_rows('curtail_wl_lim', (nY, nW, nT), [(curtail_wl, 1)],
+                   hi=(d_total / pue)[:, None, :] * wl_limit[None, :, None])
+
+        cool_flex = self.dr_config.get('cooling_flex', 0.25)
+        b.add_rows('curtail_cool_lim', (nY, nT), [(curtail_cool, 1)], hi=cool_flex * d_total * (pue - 1) / pue)
+
+        b.add_rows('total_curtail', (nY, nT), [
+            (curtail_total, 1), (curtail_wl.transpose(0, 2, 1), -1), (curtail_cool, -1),
+        ], lo=0, hi=0)
+
+        budget_pct = self.dr_config.get('annual_curtailment_budget_pct', 0.01)
+        b.add_rows('annual_budget', (nY,), [(curtail_total, hour_weight)], hi=budget_pct * d_required)
+
+        peak = np.array(self._peak_hour_indices(), dtype=int) - 1
+        nP = len(peak)
+        b.add_rows('dr_peak_window', (nDR, nY, nP), [
+            (dr_capacity.T[:, :, None], 1),
+            (curtail_wl[:, :, peak].transpose(0, 2, 1)[None], -1),
+            (curtail_cool[:, peak][None], -1),
+        ], hi=0)
+
+        # =========================
+        # GAS / CO2 / RAMP / GRID TIMING / RAM
+        # =========================
+        mcf_per_mwh = 1000 / self.GAS_HHV_BTU_PER_MCF
+        b.add_rows('gas_supply', (nY,), [
+            (gen_recip, hour_weight * recip_hr * mcf_per_mwh / 365),
+            (gen_turbine, hour_weight * turbine_hr * mcf_per_mwh / 365),
+        ], hi=limits['GAS_MAX'])
+
+        if limits['CO2_MAX'] > 0:
+            b.add_rows('co2', (nY,), [
+                (gen_recip, hour_weight * recip_hr / 1000 * self.CO2_LB_PER_MMBTU / 2000),
+                (gen_turbine, hour_weight * turbine_hr / 1000 * self.CO2_LB_PER_MMBTU / 2000),
+            ], hi=limits['CO2_MAX'])
+
+        b.add_rows('ramp', (nY,), [
+            (n_recip, eq['recip']['ramp_rate_mw_min']),
+            (n_turbine, eq['turbine']['ramp_rate_mw_min']),
+            (bess_mw, eq['bess']['ramp_rate_mw_min']),
+            (grid_mw, grid_avail * 100),
+        ], lo=limits['RAMP_REQUIRED'])
+
+        b.add_rows('grid_timing_active', (nY,), [(grid_active, 1)], hi=grid_avail)
+        b.add_rows('grid_timing_mw', (nY,), [(grid_mw, 1)], hi=self.VAR_UB['grid_mw'] * grid_avail)
+
+        if self.constraints.get('N_Minus_1_Required', True):
+            peak_load = float(np.percentile(np.array(self.load_data.get('total_load_mw', [100]*8760)), 98))
+            largest_unit = eq['turbine']['capacity_mw']
+            b.add_rows('ram', (nY,), [
+                (n_recip, eq['recip']['capacity_mw']), (n_turbine, eq['turbine']['capacity_mw']),
+                (bess_mw, 1), (grid_mw, grid_avail),
+            ], lo=peak_load + largest_unit)
+
+        # =========================
+        # TECHNOLOGY AVAILABILITY
+        # =========================
+        b.add_rows('recip_avail', (nY,), [(n_recip, 1)], hi=self.VAR_UB['n_recip'] * avail['recip'])
+        b.add_rows('turbine_avail', (nY,), [(n_turbine, 1)], hi=self.VAR_UB['n_turbine'] * avail['turbine'])
+        b.add_rows('bess_avail', (nY,), [(bess_mwh, 1)], hi=self.VAR_UB['bess_mwh'] * avail['bess'])
+        b.add_rows('solar_avail', (nY,), [(solar_mw, 1)], hi=self.VAR_UB['solar_mw'] * avail['solar'])
+        b.add_rows('grid_avail', (nY,), [(grid_active, 1)], hi=avail['grid'])
+
+        # =========================
+        # OBJECTIVE (hierarchical LCOE; denominator is a constant)
+        # =========================
+        first_year = min(years)
+        df = np.array([1 / (1 + self.DISCOUNT_RATE) ** (y - first_year) for y in years])
+        energy = float(np.sum(d_required * df))
+
+        c = np.zeros(b.n_cols)
+        obj_offset = 0.0
+        if energy > 0:
+            c[n_recip] = eq['recip']['capacity_mw'] * 1000 * eq['recip']['capex_per_kw'] * df
+            c[n_turbine] = eq['turbine']['capacity_mw'] * 1000 * eq['turbine']['capex_per_kw'] * df
+            c[bess_mwh] = 1000 * eq['bess']['capex_per_kwh'] * df
+            c[solar_mw] = 1000 * eq['solar']['capex_per_kw'] * df
+            c[grid_capex_incurred] = df
+            c[gen_recip] = np.outer(recip_hr * self.NG_PRICE_PER_MMBTU / 1000 * df, hour_weight)
+            c[gen_turbine] = np.outer(turbine_hr * self.NG_PRICE_PER_MMBTU / 1000 * df, hour_weight)
+            c[grid_import] = np.outer(self.GRID_PRICE_PER_MWH * df, hour_weight)
+            c[unserved] = np.outer(self.UNSERVED_PENALTY * df, hour_weight)
+            c[dr_capacity] = -8760 * np.outer(df, [self.DR_PAYMENT[dr] for dr in self.DR_PRODUCTS])
+            c /= energy
+        else:
+            obj_offset = 1e9
+
+        self.lp = b.finish(c, obj_offset)
+        self._hours = nT
+        self._grid_avail_arr = grid_avail
+        self._d_required_arr = d_required
+        self._limits = limits
+        self.build_time_s = time.perf_counter() - t_start
+
+        logger.info(f"Sparse MILP assembled in {self.build_time_s:.3f}s: "
+                    f"{self.lp.n_rows:,} rows, {self.lp.n_cols:,} cols, {self.lp.nnz:,} nnz")
+
+    # ==========================================================================
+    # FILE OUTPUT
+    # ==========================================================================
+
+    def write(self, path: str):
+        """Write the assembled problem as free-format MPS (.mps) or CPLEX LP (.lp)."""
+        if self.lp is None:
+            raise RuntimeError("Model not built. Call build() first.")
+        if str(path).lower().endswith('.lp'):
+            _write_lp(self.lp, path)
+        else:
+            _write_mps(self.lp, path)
+        logger.info(f"Wrote MILP to {path}")
+
+    # ==========================================================================
+    # SOLVING
+    # ==========================================================================
+
+    def solve(
+        self,
+        solver: str = 'highs',
+        time_limit: int = 300,
+        verbose: bool = True,
+        warm_start: bool = True,
+        mip_gap: float = 0.01,
+        race: bool = False,
+    ) -> Dict:
+        """
+        Solve the assembled matrices in-process with HiGHS (scipy.optimize.milp).
+
+        `solver` is accepted for interface compatibility; other solvers can
+        read the files produced by write(). warm_start is not supported by
+        scipy's HiGHS interface and is ignored. race=True solves under
+        several HiGHS configurations in parallel and keeps the first to
+        reach mip_gap (see highs_inprocess.race).
+        """
+        if not self._built:
+            raise RuntimeError("Model not built. Call build() first.")
+        if solver not in ('highs', 'appsi_highs'):
+            logger.info(f"Sparse backend solves with HiGHS (requested: {solver})")
+
+        lp = self.lp
+        logger.info(f"Solving with HiGHS (time limit: {time_limit}s{', race' if race else ''})")
+        with self._phase('solver'):
+            if race:
+                result = race_highs(lp, time_limit=time_limit, target_gap=mip_gap, verbose=verbose)
+            else:
+                result = solve_lp(lp, time_limit=time_limit, mip_rel_gap=mip_gap, verbose=verbose)
+
+        termination = result['termination']
+        logger.info(f"Termination: {termination} ({result['message']})")
+
+        self._x = result['x']
+        with self._phase('_extract_solution'):
+            solution = self._extract_solution_arrays(result['x'], termination, result['fun'])
+        solution['solver_stats'] = {
+            'solver_time_s': result['solver_time_s'],
+            **{k: result[k] for k in ('mip_gap', 'node_count') if result[k] is not None},
+            **self.model_size(),
+        }
+        if race:
+            solution['solver_stats']['race'] = result['race']
+        self._has_incumbent = bool(solution['equipment'])
+        return solution
+
+    def _var(self, name: str) -> np.ndarray:
+        offset, shape = self.lp.col_blocks[name]
+        return self._x[offset:offset + int(np.prod(shape))].reshape(shape)
+
+    def _extract_solution_arrays(self, x, termination: str, objective: Optional[float]) -> Dict:
+        """Solution dict in the same layout as bvNexusMILP_DR._extract_solution()."""
+        solution = {
+            'status': 'ok' if x is not None else 'warning',
+            'termination': termination,
+            'objective_lcoe': 0,
+            'equipment': {},
+            'power_coverage': {},
+            'emissions': {},
+            'gas_usage': {},
+            'dr': {},
+        }
+        if x is None:
+            logger.error("No solution found")
+            return solution
+
+        solution['objective_lcoe'] = objective + self.lp.obj_offset
+
+        eq = self.EQUIPMENT
+        hour_weight = self.periods.hour_weights
+        n_recip = np.round(self._var('n_recip')).astype(int)
+        n_turbine = np.round(self._var('n_turbine')).astype(int)
+        bess_mwh, bess_mw = self._var('bess_mwh'), self._var('bess_mw')
+        solar_mw, grid_mw = self._var('solar_mw'), self._var('grid_mw')
+        grid_active = self._var('grid_active')
+        recip_gen = self._var('gen_recip') @ hour_weight
+        turbine_gen = self._var('gen_turbine') @ hour_weight
+        unserved = self._var('unserved') @ hour_weight
+        dr_capacity = self._var('dr_capacity')
+
+        nox_max, gas_max = self._limits['NOX_MAX'], self._limits['GAS_MAX']
+
+        for i, y in enumerate(self.years):
+            solution['equipment'][y] = {
+                'n_recip': int(n_recip[i]),
+                'n_turbine': int(n_turbine[i]),
+                'recip_mw': int(n_recip[i]) * eq['recip']['capacity_mw'],
+                'turbine_mw': int(n_turbine[i]) * eq['turbine']['capacity_mw'],
+                'bess_mwh': float(bess_mwh[i]),
+                'bess_mw': float(bess_mw[i]),
+                'solar_mw': float(solar_mw[i]),
+                'grid_mw': float(grid_mw[i]),
+                'grid_active': bool(round(grid_active[i])),
+                'total_capacity_mw': (
+                    int(n_recip[i]) * eq['recip']['capacity_mw'] +
+                    int(n_turbine[i]) * eq['turbine']['capacity_mw'] +
+                    float(bess_mw[i]) +
+                    float(solar_mw[i]) * eq['solar']['capacity_factor'] +
+                    float(grid_mw[i]) * self._grid_avail_arr[i]
+                ),
+            }
+
+            total_unserved = float(unserved[i])
+            total_load = float(self._d_required_arr[i])
+            coverage_pct = (1 - total_unserved / total_load) * 100 if total_load > 0 else 100
+            solution['power_coverage'][y] = {
+                'total_load_mwh': total_load,
+                'served_mwh': total_load - total_unserved,
+                'unserved_mwh': total_unserved,
+                'coverage_pct': coverage_pct,
+                'power_gap_mw': total_unserved / 8760 if total_unserved > 0 else 0,
+                'is_fully_served': total_unserved < 0.01 * total_load,
+            }
+
+            nox = (
+                recip_gen[i] * eq['recip']['heat_rate_btu_kwh'] * eq['recip']['nox_rate_lb_mmbtu'] +
+                turbine_gen[i] * eq['turbine']['heat_rate_btu_kwh'] * eq['turbine']['nox_rate_lb_mmbtu']
+            ) / 2_000_000
+            solution['emissions'][y] = {
+                'nox_tpy': float(nox),
+                'nox_limit_tpy': nox_max,
+                'nox_utilization_pct': nox / nox_max * 100 if nox_max > 0 else 0,
+            }
+
+            recip_mcf = recip_gen[i] * eq['recip']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
+            turbine_mcf = turbine_gen[i] * eq['turbine']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
+            avg_daily_mcf = (recip_mcf + turbine_mcf) / 365
+            solution['gas_usage'][y] = {
+                'annual_mcf': float(recip_mcf + turbine_mcf),
+                'avg_daily_mcf': float(avg_daily_mcf),
+                'gas_limit_mcf_day': gas_max,
+                'gas_utilization_pct': avg_daily_mcf / gas_max * 100 if gas_max > 0 else 0,
+            }
+
+            solution['dr'][y] = {dr: float(dr_capacity[i, k]) for k, dr in enumerate(self.DR_PRODUCTS)}
+            solution['dr'][y]['total_dr_mw'] = float(dr_capacity[i].sum())
+
+        # (T, Y) like bvNexusMILP_DR; columns are Y-first, so these are transposed views
+        solution['dispatch'] = {name: self._var(name).T for name in self.DISPATCH_VARS}
+        solution['dispatch'].update(hour_weights=hour_weight, years=list(self.years))
+
+        final_year = max(self.years)
+        solution['summary'] = {
+            'final_year_equipment': solution['equipment'][final_year],
+            'final_year_coverage_pct': solution['power_coverage'][final_year]['coverage_pct'],
+            'years_with_power_gap': sum(
+                1 for y in self.years
+                if solution['power_coverage'][y]['power_gap_mw'] > 0.1
+            ),
+            'grid_first_year': next(
+                (y for y in self.years if solution['equipment'][y]['grid_active']),
+                None
+            ),
+        }
+
+        return solution
+
+
+# =============================================================================
+# WRITERS
+# =============================================================================
+
+def _fmt(values: np.ndarray) -> List[str]:
+    return [repr(float(v)) for v in values]
+
+
+def _row_senses(lp: SparseLP) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-row sense ('E', 'L', 'G'), rhs and range (0 where not ranged)."""
+    lo, hi = lp.row_lo, lp.row_hi
+    sense = np.where(lo == hi, 'E', np.where(np.isinf(lo), 'L', 'G'))
+    rhs = np.where(sense == 'L', hi, lo)
+    rng = np.where((sense == 'G') & np.isfinite(hi), hi - lo, 0.0)
+    return sense, rhs, rng
+
+
+def _write_mps(lp: SparseLP, path: str):
+    """Free-format MPS writer (integer columns wrapped in MARKER blocks)."""
+    row_names = lp.row_names()
+    col_names = lp.column_names()
+    sense, rhs, rng = _row_senses(lp)
+    A = lp.A.tocsc()
+
+    out = ['NAME bvNexus_MILP', 'ROWS', ' N obj']
+    out.extend(f" {s} {n}" for s, n in zip(sense, row_names))
+
+    c = lp.c.tolist()
+    integrality = lp.integrality.tolist()
+    out.append('COLUMNS')
+    in_int = False
+    for j, name in enumerate(col_names):
+        is_int = bool(integrality[j])
+        if is_int != in_int:
+            out.append(f" MARKER 'MARKER' '{'INTORG' if is_int else 'INTEND'}'")
+            in_int = is_int
+        if c[j] != 0:
+            out.append(f" {name} obj {c[j]!r}")
+        start, end = A.indptr[j], A.indptr[j + 1]
+        out.extend(
+            f" {name} {row_names[i]} {v!r}"
+            for i, v in zip(A.indices[start:end].tolist(), A.data[start:end].tolist())
+        )
+    if in_int:
+        out.append(" MARKER 'MARKER' 'INTEND'")
+
+    out.append('RHS')
+    if lp.obj_offset:
+        out.append(f" RHS obj {-lp.obj_offset!r}")
+    nz = np.flatnonzero(rhs)
+    out.extend(f" RHS {row_names[i]} {v}" for i, v in zip(nz.tolist(), _fmt(rhs[nz])))
+
+    ranged = np.flatnonzero(rng)
+    if len(ranged):
+        out.append('RANGES')
+        out.extend(f" RNG {row_names[i]} {v}" for i, v in zip(ranged.tolist(), _fmt(rng[ranged])))
+
+    out.append('BOUNDS')
+    for name, lb, ub, is_int in zip(col_names, lp.col_lb.tolist(), lp.col_ub.tolist(), integrality):
+        if is_int and lb == 0 and ub == 1:
+            out.append(f" BV BND {name}")
+            continue
+        if lb != 0:
+            out.append(f" MI BND {name}" if lb == -np.inf else f" LO BND {name} {lb!r}")
+        if ub != np.inf:
+            out.append(f" UP BND {name} {ub!r}")
+        elif is_int:
+            out.append(f" PL BND {name}")
+    out.append('ENDATA')
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(out))
+        f.write('\n')
+
+
+def _lp_terms(coefs: List[float], names: List[str], per_line: int = 8) -> str:
+    terms = [f"{'+' if v >= 0 else '-'} {abs(v)!r} {n}" for v, n in zip(coefs, names)]
+    return '\n   '.join(' '.join(terms[k:k + per_line]) for k in range(0, len(terms), per_line))
+
+
+def _write_lp(lp: SparseLP, path: str):
+    """CPLEX LP writer (terms wrapped at 8 per line to stay within line limits)."""
+    row_names = lp.row_names()
+    col_names = lp.column_names()
+    sense, rhs, rng = _row_senses(lp)
+    op = {'E': '=', 'L': '<=', 'G': '>='}
+    A = lp.A
+
+    out = ['\\ bvNexus MILP (sparse matrix backend)', 'minimize']
+    nz = np.flatnonzero(lp.c)
+    obj = _lp_terms(lp.c[nz].tolist(), [col_names[j] for j in nz.tolist()]) or f"0 {col_names[0]}"
+    if lp.obj_offset:
+        obj += f" + {lp.obj_offset!r}"
+    out.append(f" obj: {obj}")
+
+    out.append('subject to')
+    indptr, indices, data = A.indptr.tolist(), A.indices.tolist(), A.data.tolist()
+    for i, (name, s, r, g) in enumerate(zip(row_names, sense.tolist(), rhs.tolist(), rng.tolist())):
+        start, end = indptr[i], indptr[i + 1]
+        terms = _lp_terms(data[start:end], [col_names[j] for j in indices[start:end]])
+        if not terms:
+            # Keep rows with no coefficients: 0 <= -1 must still make the model infeasible
+            terms = f"0 {col_names[0]}"
+        if g:
+            out.append(f" {name}: {r!r} <= {terms} <= {r + g!r}")
+        else:
+            out.append(f" {name}: {terms} {op[s]} {r!r}")
+
+    out.append('bounds')
+    binaries, generals = [], []
+    for name, lb, ub, is_int in zip(col_names, lp.col_lb.tolist(), lp.col_ub.tolist(), lp.integrality.tolist()):
+        if is_int:
+            (binaries if (lb == 0 and ub == 1) else generals).append(name)
+        if lb != 0 or ub != np.inf:
+            lb_s = '-inf' if lb == -np.inf else repr(lb)
+            ub_s = '+inf' if ub == np.inf else repr(ub)
+            out.append(f" {lb_s} <= {name} <= {ub_s}")
+    if generals:
+        out.append('general')
+        out.extend(f" {n}" for n in generals)
+    if binaries:
+        out.append('binary')
+        out.extend(f" {n}" for n in binaries)
+    out.append('end')
+
+    with open(path, 'w') as f:
+        f.write('\n'.join(out))
+        f.write('\n')
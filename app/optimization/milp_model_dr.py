@@ -31,6 +31,10 @@ Usage:
     optimizer.build(site, constraints, load_data, workload_mix, years, ...)
     solution = optimizer.solve(solver='cbc', time_limit=300)
     
+    # Scenario sweep: re-use the built model, only mutable Params change
+    optimizer.update_scenario(constraints={'NOx_Limit_tpy': 80}, grid_config={'available_year': 2031})
+    solution_b = optimizer.solve(solver='cbc', time_limit=300)   # warm-starts from previous incumbent
+    
     # Check power coverage
     for year, coverage in solution['power_coverage'].items():
         print(f"Year {year}: {coverage['coverage_pct']:.1f}% coverage")
@@ -39,12 +43,37 @@ Usage:
 """
 
 from pyomo.environ import *
+from pyomo.repn import generate_standard_repn
+from contextlib import nullcontext
 from typing import Dict, List, Optional, Tuple
 import numpy as np
 import logging
 
+from .highs_inprocess import compile_model, load_values, race as race_highs, solve_lp, to_solver_results
+from .representative_periods import (
+    RepresentativePeriods,
+    fixed_periods,
+    full_year,
+    resolve_periods,
+)
+
 logger = logging.getLogger(__name__)
 
+# Solver name -> availability, probed once per process rather than on every solve
+_SOLVER_AVAILABLE: Dict[str, bool] = {'highs': True}
+
+
+def solver_available(name: str) -> bool:
+    """True if Pyomo can run `name` ('highs' is always available in-process via scipy)."""
+    if name not in _SOLVER_AVAILABLE:
+        try:
+            opt = SolverFactory(name)
+            _SOLVER_AVAILABLE[name] = opt is not None and bool(opt.available(exception_flag=False))
+        except Exception as e:
+            logger.debug(f"Solver {name} check failed: {e}")
+            _SOLVER_AVAILABLE[name] = False
+    return _SOLVER_AVAILABLE[name]
+
 
 class bvNexusMILP_DR:
     """
@@ -52,11 +81,16 @@ class bvNexusMILP_DR:
     with integrated demand response capabilities.
     
     Key Design Decisions (from QA/QC):
-    - Uses 6 representative weeks (1008 hours) for tractable optimization
+    - Models K representative days/weeks clustered from the site's own load
+      (and solar) profile, each weighted by the share of the year it stands
+      for (12 days = 288 hours by default; see representative_periods.py)
     - BESS duration is FIXED (4 hours) to preserve MILP linearity
     - LCOE denominator is fixed required_load to prevent curtailment distortion
     - Unserved energy variable allows solutions when constraints bind
     - Hierarchical objective via penalty ensures power maximization priority
+    - Scenario inputs (limits, grid year, load trajectory, technology
+      availability) are mutable Params, so update_scenario() re-targets a
+      built model without reconstructing it
     
     Constraints Enforced:
     - NOx emissions (annual tpy limit)
@@ -72,8 +106,12 @@ class bvNexusMILP_DR:
     # CONFIGURATION CONSTANTS
     # ==========================================================================
     
-    # Representative period configuration
-    # 6 weeks × 168 hours = 1008 hours (tractable for MILP)
+    # Default representative-period selection (select_representative_periods kwargs)
+    # 12 k-medoids days = 288 hours, including the annual peak day
+    REPRESENTATIVE_PERIODS = {'n_periods': 12, 'period': 'day', 'method': 'kmedoids'}
+    
+    # Legacy fixed weeks, used with representative_periods='fixed'
+    # 6 weeks × 168 hours = 1008 hours
     REPRESENTATIVE_WEEKS = {
         'spring_typical': {'start_day': 80, 'weight': 10},    # ~10 weeks
         'summer_typical': {'start_day': 160, 'weight': 8},    # ~8 weeks
@@ -133,6 +171,41 @@ class bvNexusMILP_DR:
     # If your equipment specs use LHV, multiply heat rates by 1.11
     GAS_HHV_BTU_PER_MCF = 1_037_000  # Higher Heating Value (billing basis)
     
+    # Technologies that scenarios / lead times can switch off per year
+    TECHNOLOGIES = ['recip', 'turbine', 'bess', 'solar', 'grid']
+    
+    # Workload types and their curtailable share (from research)
+    WORKLOADS = ['pre_training', 'fine_tuning', 'batch_inference', 'realtime_inference']
+    WORKLOAD_FLEX = {
+        'pre_training': 0.30,
+        'fine_tuning': 0.50,
+        'batch_inference': 0.90,
+        'realtime_inference': 0.05,
+    }
+    
+    # DR products and payment rates ($/MW-hr)
+    DR_PRODUCTS = ['spinning_reserve', 'non_spinning_reserve', 'economic_dr', 'emergency_dr']
+    DR_PAYMENT = {
+        'spinning_reserve': 15,
+        'non_spinning_reserve': 8,
+        'economic_dr': 5,
+        'emergency_dr': 3,
+    }
+    
+    # Variable upper bounds
+    VAR_UB = {
+        'n_recip': 100, 'n_turbine': 50, 'bess_mwh': 2000, 'bess_mw': 500,
+        'solar_mw': 500, 'grid_mw': 500, 'unserved': 500,
+    }
+    GRID_BIG_M = 500  # MW, grid_mw <= GRID_BIG_M * grid_active
+    
+    # CO2 emission factor for natural gas
+    CO2_LB_PER_MMBTU = 117
+    
+    # Hourly (T x Y) variables returned as arrays in solution['dispatch']
+    DISPATCH_VARS = ['gen_recip', 'gen_turbine', 'gen_solar', 'grid_import',
+                     'charge', 'discharge', 'soc', 'curtail_total', 'unserved']
+    
     # Economic parameters
     DISCOUNT_RATE = 0.08
     NG_PRICE_PER_MMBTU = 3.50
@@ -157,6 +230,44 @@ class bvNexusMILP_DR:
         self.dr_config = {}
         self.site = {}
         self.use_representative = True
+        self.period_spec = None
+        self.periods: Optional[RepresentativePeriods] = None
+        self.tech_availability = {}
+        self._load_array = None
+        self._has_incumbent = False
+        self._solvers = {}  # persistent solver instances, tied to the current model
+        
+        # Optional app.utils.solve_profiler.SolveProfiler (set by optimize_with_milp)
+        self.profiler = None
+        
+        # Fingerprint of the build inputs (set by optimize_with_milp, cleared by build())
+        self.build_key = None
+    
+    @property
+    def is_built(self) -> bool:
+        """True once build() has constructed the Pyomo model."""
+        return self._built
+    
+    def cache_config(self) -> Dict:
+        """Constructor settings that change the solution (part of the solve-cache key)."""
+        return {}
+    
+    def _phase(self, name: str):
+        """Time a pipeline phase under the attached profiler (no-op without one)."""
+        return self.profiler.phase(name) if self.profiler is not None else nullcontext()
+    
+    def model_size(self) -> Dict[str, int]:
+        """Active variables, constraints and constraint-matrix nonzeros (as written to the LP file)."""
+        if not self._built:
+            return {}
+        constraints = list(self.model.component_data_objects(Constraint, active=True))
+        return {
+            'n_variables': sum(1 for _ in self.model.component_data_objects(Var)),
+            'n_constraints': len(constraints),
+            'n_nonzeros': sum(
+                sum(1 for coef in generate_standard_repn(c.body).linear_coefs if coef != 0) for c in constraints
+            ),
+        }
     
     # ==========================================================================
     # MODEL BUILDING
@@ -173,6 +284,7 @@ class bvNexusMILP_DR:
         existing_equipment: Dict = None,
         grid_config: Dict = None,
         use_representative_periods: bool = True,
+        representative_periods=None,
     ):
         """
         Build the complete MILP model with all constraints enabled.
@@ -188,12 +300,17 @@ class bvNexusMILP_DR:
             load_data: Load profile dict with keys:
                 - total_load_mw: 8760 hourly load array (MW)
                 - pue: Power Usage Effectiveness
+                - solar_profile: optional 8760 hourly solar capacity factor
+                  (used for period selection and hourly solar limits)
             workload_mix: Dict of workload percentages (pre_training, etc.)
             years: List of planning years (e.g., [2026, 2027, ..., 2035])
             dr_config: Demand response configuration
             existing_equipment: Brownfield existing equipment counts
             grid_config: Grid interconnection configuration
-            use_representative_periods: Use 1008 hours (True) or full 8760 (False)
+            use_representative_periods: Use representative periods (True) or full 8760 (False)
+            representative_periods: Period selection - a RepresentativePeriods,
+                a dict of select_representative_periods() kwargs, 'fixed' for
+                the legacy REPRESENTATIVE_WEEKS, or None for REPRESENTATIVE_PERIODS
         """
         
         logger.info("="*60)
@@ -211,187 +328,151 @@ class bvNexusMILP_DR:
             'n_recip': 0, 'n_turbine': 0, 'bess_mwh': 0, 'solar_mw': 0, 'grid_mw': 0
         }
         self.use_representative = use_representative_periods
+        self.period_spec = representative_periods
         
-        # Process grid configuration
-        self.grid_config = grid_config or {}
-        if 'available_year' not in self.grid_config:
-            # Calculate from lead time
-            start_year = min(years)
-            lead_months = self.grid_config.get('lead_time_months', 96)
-            self.grid_config['available_year'] = start_year + (lead_months // 12)
-        if 'capex' not in self.grid_config:
-            self.grid_config['capex'] = 5_000_000
+        self.grid_config = self._resolve_grid_config(grid_config)
+        self.tech_availability = {}
+        self._has_incumbent = False
+        self._solvers = {}
+        self.build_key = None
         
-        # Build Pyomo model
-        self.model = ConcreteModel()
-        
-        # Build model components in order
-        self._build_sets()
-        self._build_parameters()
-        self._build_variables()
-        self._build_brownfield_constraints()
-        self._build_capacity_constraints()
-        self._build_dispatch_constraints()
-        self._build_dr_constraints()
-        self._build_gas_constraint()        # ENABLED (was disabled)
-        self._build_co2_constraint()        # ENABLED (conditional)
-        self._build_ramp_constraint()       # ENABLED (was disabled)
-        self._build_grid_timing_constraint()  # NEW
-        self._build_ram_constraint()        # FIXED
-        self._build_objective()
+        self._construct_model()
         
         self._built = True
         
         logger.info("="*60)
         logger.info("MILP Model Built Successfully")
         logger.info(f"  Years: {min(years)} - {max(years)}")
-        logger.info(f"  Hours: {1008 if use_representative_periods else 8760}")
+        logger.info(f"  Hours: {self.periods.n_hours} ({self.periods.method})")
         logger.info(f"  Grid available: {self.grid_config['available_year']}")
         logger.info(f"  NOx limit: {constraints.get('NOx_Limit_tpy', 99)} tpy")
         logger.info(f"  Gas limit: {constraints.get('Gas_Supply_MCF_day', 50000)} MCF/day")
         logger.info("="*60)
     
+    def _construct_model(self):
+        """Build the Pyomo model from the stored configuration."""
+        self.model = ConcreteModel()
+        
+        # Build model components in order
+        for build_step in (
+            self._build_sets,
+            self._build_parameters,
+            self._build_variables,
+            self._build_brownfield_constraints,
+            self._build_capacity_constraints,
+            self._build_dispatch_constraints,
+            self._build_dr_constraints,
+            self._build_gas_constraint,         # ENABLED (was disabled)
+            self._build_co2_constraint,         # ENABLED (conditional)
+            self._build_ramp_constraint,        # ENABLED (was disabled)
+            self._build_grid_timing_constraint,  # NEW
+            self._build_ram_constraint,         # FIXED
+            self._build_availability_constraints,
+            self._build_objective,
+        ):
+            with self._phase(build_step.__name__):
+                build_step()
+        self._apply_constraint_switches()
+    
     def _build_sets(self):
         """Build model index sets."""
         m = self.model
         
+        # Select representative periods and sample the load profile onto them
+        self._load_array = self._sample_representative_hours(
+            np.array(self.load_data.get('total_load_mw', [100]*8760))
+        )
+        
         # Year set
         m.Y = Set(initialize=self.years)
         
-        # Time set (representative or full)
-        if self.use_representative:
-            n_hours = 6 * 168  # 1008 hours
-            m.T = RangeSet(1, n_hours)
-            m.SCALE_FACTOR = Param(initialize=8760 / n_hours)
-        else:
-            m.T = RangeSet(1, 8760)
-            m.SCALE_FACTOR = Param(initialize=1.0)
+        # Time set (representative or full) with per-hour annualization weights
+        m.T = RangeSet(1, self.periods.n_hours)
+        m.HOUR_WEIGHT = Param(m.T, initialize=dict(enumerate(self.periods.hour_weights.tolist(), start=1)))
+        
+        # First hour of each period (SOC wraps to the period's last hour; periods are not contiguous)
+        m.T_start = Set(initialize=(self.periods.period_first_hours + 1).tolist())
         
         # Peak hours set (for DR capacity credit)
-        peak_indices = []
-        n_weeks = 6 if self.use_representative else 52
-        for week_idx in range(n_weeks):
-            for day in range(7):
-                for peak_hour in self.PEAK_HOURS:
-                    hour_idx = week_idx * 168 + day * 24 + peak_hour + 1
-                    max_hours = 1008 if self.use_representative else 8760
-                    if hour_idx <= max_hours:
-                        peak_indices.append(hour_idx)
-        m.T_peak = Set(initialize=peak_indices)
+        m.T_peak = Set(initialize=self._peak_hour_indices())
         
         # Workload types
-        m.W = Set(initialize=['pre_training', 'fine_tuning', 'batch_inference', 'realtime_inference'])
+        m.W = Set(initialize=self.WORKLOADS)
         
         # DR products
-        m.DR = Set(initialize=['spinning_reserve', 'non_spinning_reserve', 'economic_dr', 'emergency_dr'])
+        m.DR = Set(initialize=self.DR_PRODUCTS)
         
         logger.info(f"Sets: {len(m.Y)} years, {len(m.T)} hours, {len(m.T_peak)} peak hours")
     
+    def _peak_hour_indices(self) -> List[int]:
+        """1-based indices of modelled hours that fall in the DR peak window."""
+        hour_of_day = self.periods.hour_index % 24
+        return (np.flatnonzero(np.isin(hour_of_day, self.PEAK_HOURS)) + 1).tolist()
+    
+    def _solar_cf_array(self) -> np.ndarray:
+        """Hourly solar capacity factor on the modelled hours (flat CF if no profile)."""
+        profile = self._solar_profile_8760()
+        if profile is None:
+            return np.full(self.periods.n_hours, self.EQUIPMENT['solar']['capacity_factor'])
+        return self.periods.sample(profile)
+    
+    def _solar_profile_8760(self) -> Optional[np.ndarray]:
+        profile = self.load_data.get('solar_profile')
+        if profile is None or len(profile) != 8760:
+            return None
+        return np.asarray(profile, dtype=float)
+    
     def _build_parameters(self):
         """Build model parameters."""
         m = self.model
         
-        # Sample load profile to representative hours
-        load_array = self._sample_representative_hours(
-            np.array(self.load_data.get('total_load_mw', [100]*8760))
-        )
-        
-        # Load parameter
-        def load_init(m, t, y):
-            # Scale load by year based on trajectory if provided
-            trajectory = self.site.get('load_trajectory', {})
-            if trajectory and y in trajectory:
-                # Use trajectory MW value directly (not as a scale factor)
-                # trajectory values are in MW facility load
-                year_load_mw = trajectory[y]
-                # If 0 MW for this year, return 0
-                if year_load_mw == 0:
-                    return 0.0
-                # Otherwise, scale the base load pattern to match this year's MW
-                # Assume load_array represents the pattern at peak facility load
-                peak_facility_load = max(load_array) if len(load_array) > 0 else 600.0
-                scale = year_load_mw / peak_facility_load if peak_facility_load > 0 else 1.0
-            else:
-                scale = 1.0
-            return float(load_array[t-1]) * scale
-        
-        m.D_total = Param(m.T, m.Y, initialize=load_init)
+        # Load parameters are mutable so update_scenario() can swap the trajectory
+        d_total, d_required = self._load_param_values()
+        m.D_total = Param(m.T, m.Y, initialize=d_total, mutable=True)
         
         # Required energy per year (FIXED denominator for LCOE)
         # This prevents curtailment from distorting LCOE calculation
-        base_load_array = np.array(self.load_data.get('total_load_mw', [100]*8760))
-        if len(base_load_array) == 8760:
-            annual_energy = float(np.sum(base_load_array))
-        else:
-            annual_energy = float(np.sum(load_array)) * 8760 / len(load_array)
-        
-        def d_required_init(m, y):
-            trajectory = self.site.get('load_trajectory', {})
-            if trajectory and y in trajectory:
-                # Use trajectory MW value directly
-                year_load_mw = trajectory[y]
-                # If 0 MW for this year, return 0
-                if year_load_mw == 0:
-                    return 0.0
-                # Otherwise, scale annual energy by year's MW target
-                # Find a non-zero year to use as reference
-                reference_mw = max(trajectory.values()) if trajectory else 600.0
-                if reference_mw > 0:
-                    scale = year_load_mw / reference_mw
-                else:
-                    scale = 1.0
-            else:
-                scale = 1.0
-            return annual_energy * scale
-        
-        m.D_required = Param(m.Y, initialize=d_required_init)
+        m.D_required = Param(m.Y, initialize=d_required, mutable=True)
         
         # PUE
         m.PUE = Param(initialize=self.load_data.get('pue', 1.25))
         
-        # Constraint limits
-        m.NOX_MAX = Param(initialize=self.constraints.get('NOx_Limit_tpy', 
-                         self.constraints.get('max_nox_tpy', 99)))
-        m.GAS_MAX = Param(initialize=self.constraints.get('Gas_Supply_MCF_day',
-                         self.constraints.get('gas_supply_mcf_day', 50000)))
-        m.CO2_MAX = Param(initialize=self.constraints.get('CO2_Limit_tpy',
-                         self.constraints.get('co2_limit_tpy', 0)))
-        m.LAND_MAX = Param(initialize=self.constraints.get('Available_Land_Acres',
-                          self.constraints.get('land_area_acres', 500)))
+        # Constraint limits (mutable - see update_scenario)
+        limits = self._limit_param_values()
+        m.NOX_MAX = Param(initialize=limits['NOX_MAX'], mutable=True)
+        m.GAS_MAX = Param(initialize=limits['GAS_MAX'], mutable=True)
+        m.CO2_MAX = Param(initialize=limits['CO2_MAX'], mutable=True)
+        m.LAND_MAX = Param(initialize=limits['LAND_MAX'], mutable=True)
         
         # Ramp rate requirement
-        m.RAMP_REQUIRED = Param(initialize=self.constraints.get('min_ramp_rate_mw_min', 10.0))
+        m.RAMP_REQUIRED = Param(initialize=limits['RAMP_REQUIRED'], mutable=True)
         
         # Grid availability by year
         grid_year = self.grid_config.get('available_year', 2034)
-        m.GRID_AVAIL = Param(m.Y, initialize=lambda m, y: 1.0 if y >= grid_year else 0.0)
-        m.GRID_CAPEX = Param(initialize=self.grid_config.get('capex', 5_000_000))
-        m.GRID_YEAR = Param(initialize=grid_year)
+        m.GRID_AVAIL = Param(m.Y, initialize=self._grid_avail_values(), mutable=True)
+        m.GRID_CAPEX = Param(initialize=self.grid_config.get('capex', 5_000_000), mutable=True)
+        m.GRID_YEAR = Param(initialize=grid_year, mutable=True)
+        
+        # Technology availability by year (scenario enable flags, lead times,
+        # zero-load years). 1 = may be built, 0 = capacity forced to zero.
+        m.TECH = Set(initialize=self.TECHNOLOGIES)
+        m.TECH_AVAIL = Param(m.TECH, m.Y, initialize=self._tech_avail_values(), mutable=True)
         
         # BESS parameters (duration is FIXED)
         m.BESS_DURATION = Param(initialize=self.BESS_DURATION)
         m.BESS_EFF = Param(initialize=self.EQUIPMENT['bess']['efficiency'])
         
+        # Hourly solar capacity factor (flat unless load_data carries a solar profile)
+        m.SOLAR_CF = Param(m.T, initialize=dict(enumerate(self._solar_cf_array().tolist(), start=1)))
+        
         # Workload flexibility (from research)
-        wl_flex_defaults = {
-            'pre_training': 0.30,
-            'fine_tuning': 0.50,
-            'batch_inference': 0.90,
-            'realtime_inference': 0.05
-        }
-        m.WL_flex = Param(m.W, initialize=lambda m, w: wl_flex_defaults.get(w, 0.1))
+        m.WL_flex = Param(m.W, initialize=self.WORKLOAD_FLEX)
         
         # Cooling flexibility
         m.COOL_flex = Param(initialize=self.dr_config.get('cooling_flex', 0.25))
         
         # DR payment rates ($/MW-hr)
-        dr_payments = {
-            'spinning_reserve': 15,
-            'non_spinning_reserve': 8,
-            'economic_dr': 5,
-            'emergency_dr': 3
-        }
-        m.DR_payment = Param(m.DR, initialize=lambda m, dr: dr_payments.get(dr, 5))
+        m.DR_payment = Param(m.DR, initialize=self.DR_PAYMENT)
         
         # Existing equipment (brownfield)
         m.EXISTING_recip = Param(initialize=self.existing.get('n_recip', 0))
@@ -402,31 +483,183 @@ class bvNexusMILP_DR:
         logger.info(f"Parameters: NOx={value(m.NOX_MAX)}tpy, Gas={value(m.GAS_MAX)}MCF/day, "
                    f"Ramp={value(m.RAMP_REQUIRED)}MW/min")
     
+    def _resolve_grid_config(self, grid_config: Dict = None) -> Dict:
+        """Fill in grid available year (from lead time) and interconnection capex."""
+        grid_config = dict(grid_config or {})
+        if 'available_year' not in grid_config:
+            # Calculate from lead time
+            start_year = min(self.years)
+            lead_months = grid_config.get('lead_time_months', 96)
+            grid_config['available_year'] = start_year + (lead_months // 12)
+        if 'capex' not in grid_config:
+            grid_config['capex'] = 5_000_000
+        return grid_config
+    
+    def _load_param_values(self) -> Tuple[Dict, Dict]:
+        """Hourly load D_total[t, y] and required annual energy D_required[y]."""
+        hourly_scales, d_required = self._load_scales()
+        
+        d_total = {}
+        for y in self.years:
+            for t, load in enumerate(self._load_array.tolist(), start=1):
+                d_total[t, y] = float(load) * hourly_scales[y]
+        
+        return d_total, d_required
+    
+    def _load_scales(self) -> Tuple[Dict[int, float], Dict[int, float]]:
+        """
+        Per-year hourly load scale and required annual energy D_required[y].
+        
+        The sampled base pattern is scaled to each year's trajectory MW
+        (trajectory values are facility MW, not scale factors).
+        """
+        load_array = self._load_array
+        trajectory = self.site.get('load_trajectory', {})
+        
+        # Assume load_array represents the pattern at peak facility load
+        peak_facility_load = max(load_array) if len(load_array) > 0 else 600.0
+        reference_mw = max(trajectory.values()) if trajectory else 600.0
+        
+        base_load_array = np.array(self.load_data.get('total_load_mw', [100]*8760))
+        if len(base_load_array) == 8760:
+            annual_energy = float(np.sum(base_load_array))
+        else:
+            annual_energy = float(np.sum(load_array)) * 8760 / len(load_array)
+        
+        hourly_scales = {}
+        d_required = {}
+        for y in self.years:
+            hourly_scale = 1.0
+            energy_scale = 1.0
+            if trajectory and y in trajectory:
+                year_load_mw = trajectory[y]
+                if year_load_mw == 0:
+                    hourly_scale = energy_scale = 0.0
+                else:
+                    hourly_scale = year_load_mw / peak_facility_load if peak_facility_load > 0 else 1.0
+                    energy_scale = year_load_mw / reference_mw if reference_mw > 0 else 1.0
+            
+            hourly_scales[y] = hourly_scale
+            d_required[y] = annual_energy * energy_scale
+        
+        return hourly_scales, d_required
+    
+    def _limit_param_values(self) -> Dict[str, float]:
+        """Scalar constraint limits from the constraints dict (both key styles)."""
+        c = self.constraints
+        return {
+            'NOX_MAX': c.get('NOx_Limit_tpy', c.get('max_nox_tpy', 99)),
+            'GAS_MAX': c.get('Gas_Supply_MCF_day', c.get('gas_supply_mcf_day', 50000)),
+            'CO2_MAX': c.get('CO2_Limit_tpy', c.get('co2_limit_tpy', 0)),
+            'LAND_MAX': c.get('Available_Land_Acres', c.get('land_area_acres', 500)),
+            'RAMP_REQUIRED': c.get('min_ramp_rate_mw_min', 10.0),
+        }
+    
+    def _grid_avail_values(self) -> Dict[int, float]:
+        grid_year = self.grid_config.get('available_year', 2034)
+        return {y: 1.0 if y >= grid_year else 0.0 for y in self.years}
+    
+    def _tech_avail_values(self) -> Dict[Tuple[str, int], float]:
+        values = {}
+        for tech in self.TECHNOLOGIES:
+            by_year = self.tech_availability.get(tech, {})
+            for y in self.years:
+                values[tech, y] = 1.0 if by_year.get(y, True) else 0.0
+        return values
+    
+    def _apply_constraint_switches(self):
+        """Activate/deactivate optional constraint blocks for the current scenario."""
+        m = self.model
+        
+        if value(m.CO2_MAX) > 0:
+            m.co2_con.activate()
+        else:
+            m.co2_con.deactivate()
+        
+        if self.constraints.get('N_Minus_1_Required', True):
+            m.ram_con.activate()
+        else:
+            m.ram_con.deactivate()
+    
+    def update_scenario(
+        self,
+        constraints: Dict = None,
+        grid_config: Dict = None,
+        load_trajectory: Dict[int, float] = None,
+        tech_availability: Dict[str, Dict[int, bool]] = None,
+    ):
+        """
+        Re-target the built model at a new scenario by changing only mutable Params.
+        
+        Structure (sets, variables, constraint blocks) is untouched, so a sweep
+        of N scenarios pays model-construction time once. Arguments left as
+        None keep their current values.
+        
+        Args:
+            constraints: Constraint dict (same keys as build()); replaces limits
+                and the N_Minus_1_Required / CO2 switches
+            grid_config: Grid config (available_year or lead_time_months, capex)
+            load_trajectory: {year: facility MW}; rescales D_total / D_required
+            tech_availability: {tech: {year: bool}} for TECHNOLOGIES; replaces the
+                previous availability (unspecified techs/years become available)
+        """
+        if not self._built:
+            raise RuntimeError("Model not built. Call build() first.")
+        
+        m = self.model
+        
+        if constraints is not None:
+            self.constraints = constraints
+            for name, limit in self._limit_param_values().items():
+                getattr(m, name).set_value(limit)
+            self._apply_constraint_switches()
+        
+        if grid_config is not None:
+            self.grid_config = self._resolve_grid_config(grid_config)
+            m.GRID_AVAIL.store_values(self._grid_avail_values())
+            m.GRID_CAPEX.set_value(self.grid_config['capex'])
+            m.GRID_YEAR.set_value(self.grid_config['available_year'])
+        
+        if load_trajectory is not None:
+            self.site = dict(self.site, load_trajectory=load_trajectory)
+            d_total, d_required = self._load_param_values()
+            m.D_total.store_values(d_total)
+            m.D_required.store_values(d_required)
+        
+        if tech_availability is not None:
+            self.tech_availability = tech_availability
+            m.TECH_AVAIL.store_values(self._tech_avail_values())
+        
+        logger.info(f"Scenario updated: NOx={value(m.NOX_MAX)}tpy, Gas={value(m.GAS_MAX)}MCF/day, "
+                    f"grid from {value(m.GRID_YEAR)}")
+    
     def _sample_representative_hours(self, load_8760: np.ndarray) -> np.ndarray:
-        """Sample representative hours from full year profile."""
+        """Select representative periods (self.periods) and sample the load onto them."""
         if not self.use_representative:
+            self.periods = full_year()
             return load_8760
         
         if len(load_8760) != 8760:
-            # If not 8760, return as-is or pad/truncate
+            # If not 8760, pad/truncate to 1008 hours with a uniform weight
             logger.warning(f"Load profile has {len(load_8760)} hours, expected 8760")
+            self.periods = RepresentativePeriods(
+                period_starts=np.array([0]), period_hours=1008,
+                weights=np.array([8760 / 1008]), method='truncated',
+            )
             if len(load_8760) < 1008:
                 return np.tile(load_8760, 1008 // len(load_8760) + 1)[:1008]
             return load_8760[:1008]
         
-        hours = []
-        for week_name, week_info in self.REPRESENTATIVE_WEEKS.items():
-            start_hour = week_info['start_day'] * 24
-            end_hour = start_hour + 168
-            
-            if end_hour <= 8760:
-                hours.extend(load_8760[start_hour:end_hour])
-            else:
-                # Wrap around year boundary
-                hours.extend(load_8760[start_hour:])
-                hours.extend(load_8760[:end_hour - 8760])
+        if self.period_spec == 'fixed':
+            weeks = list(self.REPRESENTATIVE_WEEKS.values())
+            self.periods = fixed_periods(
+                [w['start_day'] for w in weeks], period='week', weights=[w['weight'] for w in weeks]
+            )
+        else:
+            spec = self.REPRESENTATIVE_PERIODS if self.period_spec is None else self.period_spec
+            self.periods = resolve_periods(spec, load_8760, self._solar_profile_8760())
         
-        return np.array(hours)
+        return self.periods.sample(load_8760)
     
     def _build_variables(self):
         """Build decision variables INCLUDING unserved energy for power gap tracking."""
@@ -437,14 +670,15 @@ class bvNexusMILP_DR:
         # =========================
         
         # Equipment counts (integer for discrete units)
-        m.n_recip = Var(m.Y, within=NonNegativeIntegers, bounds=(0, 100))
-        m.n_turbine = Var(m.Y, within=NonNegativeIntegers, bounds=(0, 50))
+        ub = self.VAR_UB
+        m.n_recip = Var(m.Y, within=NonNegativeIntegers, bounds=(0, ub['n_recip']))
+        m.n_turbine = Var(m.Y, within=NonNegativeIntegers, bounds=(0, ub['n_turbine']))
         
         # Continuous capacity variables
-        m.bess_mwh = Var(m.Y, within=NonNegativeReals, bounds=(0, 2000))
-        m.bess_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, 500))
-        m.solar_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, 500))
-        m.grid_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, 500))
+        m.bess_mwh = Var(m.Y, within=NonNegativeReals, bounds=(0, ub['bess_mwh']))
+        m.bess_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, ub['bess_mw']))
+        m.solar_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, ub['solar_mw']))
+        m.grid_mw = Var(m.Y, within=NonNegativeReals, bounds=(0, ub['grid_mw']))
         
         # Grid connection binary and capex tracking
         m.grid_active = Var(m.Y, within=Binary)
@@ -481,7 +715,7 @@ class bvNexusMILP_DR:
         # Without this, the model returns "Infeasible" instead of
         # finding the maximum equipment within constraints.
         
-        m.unserved = Var(m.T, m.Y, within=NonNegativeReals, bounds=(0, 500))
+        m.unserved = Var(m.T, m.Y, within=NonNegativeReals, bounds=(0, ub['unserved']))
         
         logger.info("Variables built (including unserved energy for power gap tracking)")
     
@@ -523,8 +757,7 @@ class bvNexusMILP_DR:
         
         # Grid requires active connection (Big-M formulation)
         def grid_requires_active(m, y):
-            BIG_M = 500
-            return m.grid_mw[y] <= BIG_M * m.grid_active[y]
+            return m.grid_mw[y] <= self.GRID_BIG_M * m.grid_active[y]
         m.grid_requires_active_con = Constraint(m.Y, rule=grid_requires_active)
         
         # Grid capex tracking
@@ -572,7 +805,6 @@ class bvNexusMILP_DR:
         recip_avail = self.EQUIPMENT['recip']['availability']
         turbine_cap = self.EQUIPMENT['turbine']['capacity_mw']
         turbine_avail = self.EQUIPMENT['turbine']['availability']
-        solar_cf = self.EQUIPMENT['solar']['capacity_factor']
         
         # =========================
         # POWER BALANCE WITH UNSERVED ENERGY
@@ -606,9 +838,8 @@ class bvNexusMILP_DR:
         m.gen_turbine_lim = Constraint(m.T, m.Y, rule=gen_turbine_limit)
         
         def gen_solar_limit(m, t, y):
-            # Solar limited by capacity and capacity factor
-            # In reality, would use hourly solar profile
-            return m.gen_solar[t, y] <= m.solar_mw[y] * solar_cf
+            # Solar limited by capacity and (hourly) capacity factor
+            return m.gen_solar[t, y] <= m.solar_mw[y] * m.SOLAR_CF[t]
         m.gen_solar_lim = Constraint(m.T, m.Y, rule=gen_solar_limit)
         
         def grid_import_limit(m, t, y):
@@ -628,12 +859,14 @@ class bvNexusMILP_DR:
             return m.discharge[t, y] <= m.bess_mw[y]
         m.discharge_lim = Constraint(m.T, m.Y, rule=discharge_limit)
         
+        period_hours = self.periods.period_hours
+        
         def soc_dynamics(m, t, y):
             eff = value(m.BESS_EFF)
-            if t == 1:
-                # Start at 50% SOC
-                return m.soc[t, y] == 0.5 * m.bess_mwh[y]
-            return m.soc[t, y] == m.soc[t-1, y] + eff * m.charge[t, y] - m.discharge[t, y] / eff
+            # Periods are cyclic: the first hour follows the period's last hour, so a
+            # weighted period cannot end with less energy than it started with
+            prev = t + period_hours - 1 if t in m.T_start else t - 1
+            return m.soc[t, y] == m.soc[prev, y] + eff * m.charge[t, y] - m.discharge[t, y] / eff
         m.soc_dynamics_con = Constraint(m.T, m.Y, rule=soc_dynamics)
         
         def soc_lower_bound(m, t, y):
@@ -656,9 +889,9 @@ class bvNexusMILP_DR:
         def nox_annual_limit(m, y):
             # NOx = generation × heat_rate × nox_rate / 1e6 (to MMBTU) / 2000 (to tons)
             # Simplified: gen(MWh) × HR(BTU/kWh) × NOx(lb/MMBTU) / 2e9 = tons
-            nox_recip = sum(m.gen_recip[t, y] * recip_hr * recip_nox for t in m.T)
-            nox_turbine = sum(m.gen_turbine[t, y] * turbine_hr * turbine_nox for t in m.T)
-            total_nox_tons = m.SCALE_FACTOR * (nox_recip + nox_turbine) / 2_000_000
+            nox_recip = sum(m.HOUR_WEIGHT[t] * m.gen_recip[t, y] * recip_hr * recip_nox for t in m.T)
+            nox_turbine = sum(m.HOUR_WEIGHT[t] * m.gen_turbine[t, y] * turbine_hr * turbine_nox for t in m.T)
+            total_nox_tons = (nox_recip + nox_turbine) / 2_000_000
             return total_nox_tons <= m.NOX_MAX
         m.nox_con = Constraint(m.Y, rule=nox_annual_limit)
         
@@ -691,7 +924,7 @@ class bvNexusMILP_DR:
         # Annual curtailment budget (1% from research)
         def annual_budget(m, y):
             budget_pct = self.dr_config.get('annual_curtailment_budget_pct', 0.01)
-            scaled_curtail = m.SCALE_FACTOR * sum(m.curtail_total[t, y] for t in m.T)
+            scaled_curtail = sum(m.HOUR_WEIGHT[t] * m.curtail_total[t, y] for t in m.T)
             return scaled_curtail <= budget_pct * m.D_required[y]
         m.annual_budget_con = Constraint(m.Y, rule=annual_budget)
         
@@ -720,8 +953,8 @@ class bvNexusMILP_DR:
         def gas_supply_daily(m, y):
             """Average daily gas consumption cannot exceed supply limit."""
             # Annual generation in representative hours
-            annual_recip_mwh = m.SCALE_FACTOR * sum(m.gen_recip[t, y] for t in m.T)
-            annual_turbine_mwh = m.SCALE_FACTOR * sum(m.gen_turbine[t, y] for t in m.T)
+            annual_recip_mwh = sum(m.HOUR_WEIGHT[t] * m.gen_recip[t, y] for t in m.T)
+            annual_turbine_mwh = sum(m.HOUR_WEIGHT[t] * m.gen_turbine[t, y] for t in m.T)
             
             # Convert MWh to MCF:
             # MWh × heat_rate(BTU/kWh) × 1000(kW/MW) / HHV(BTU/MCF) = MCF
@@ -740,33 +973,29 @@ class bvNexusMILP_DR:
         """
         CO2 EMISSIONS CONSTRAINT - ENABLED (conditional)
         
-        Only added if CO2_MAX > 0 (some sites may not have CO2 limits).
+        Always built; only active while CO2_MAX > 0 (some sites may not have
+        CO2 limits). See _apply_constraint_switches().
         """
         m = self.model
         
-        # Skip if no CO2 limit specified
-        if value(m.CO2_MAX) <= 0:
-            logger.info("CO2 constraint SKIPPED (no limit specified)")
-            return
-        
-        # CO2 emission factor for natural gas
-        CO2_LB_PER_MMBTU = 117
-        
         recip_hr = self.EQUIPMENT['recip']['heat_rate_btu_kwh']
         turbine_hr = self.EQUIPMENT['turbine']['heat_rate_btu_kwh']
         
         def co2_annual_limit(m, y):
             # MMBTU = MWh × heat_rate(BTU/kWh) × 1000 / 1e6
-            recip_mmbtu = m.SCALE_FACTOR * sum(m.gen_recip[t, y] * recip_hr / 1000 for t in m.T)
-            turbine_mmbtu = m.SCALE_FACTOR * sum(m.gen_turbine[t, y] * turbine_hr / 1000 for t in m.T)
+            recip_mmbtu = sum(m.HOUR_WEIGHT[t] * m.gen_recip[t, y] * recip_hr / 1000 for t in m.T)
+            turbine_mmbtu = sum(m.HOUR_WEIGHT[t] * m.gen_turbine[t, y] * turbine_hr / 1000 for t in m.T)
             
-            total_co2_lb = (recip_mmbtu + turbine_mmbtu) * CO2_LB_PER_MMBTU
+            total_co2_lb = (recip_mmbtu + turbine_mmbtu) * self.CO2_LB_PER_MMBTU
             total_co2_tons = total_co2_lb / 2000
             
             return total_co2_tons <= m.CO2_MAX
         
         m.co2_con = Constraint(m.Y, rule=co2_annual_limit)
-        logger.info(f"CO2 constraint ENABLED: {value(m.CO2_MAX):,.0f} tpy limit")
+        if value(m.CO2_MAX) > 0:
+            logger.info(f"CO2 constraint ENABLED: {value(m.CO2_MAX):,.0f} tpy limit")
+        else:
+            logger.info("CO2 constraint SKIPPED (no limit specified)")
     
     def _build_ramp_constraint(self):
         """
@@ -806,18 +1035,16 @@ class bvNexusMILP_DR:
         
         grid_year = int(value(m.GRID_YEAR))
         
+        # Expressed through GRID_AVAIL (0 before available year, 1 after) so the
+        # interconnection year can change without rebuilding the model
         def grid_timing_active(m, y):
             """Grid cannot be active before available year."""
-            if y < grid_year:
-                return m.grid_active[y] == 0
-            return Constraint.Skip
+            return m.grid_active[y] <= m.GRID_AVAIL[y]
         m.grid_timing_active_con = Constraint(m.Y, rule=grid_timing_active)
         
         def grid_timing_mw(m, y):
             """Grid MW must be zero before available year."""
-            if y < grid_year:
-                return m.grid_mw[y] == 0
-            return Constraint.Skip
+            return m.grid_mw[y] <= m.grid_mw[y].ub * m.GRID_AVAIL[y]
         m.grid_timing_mw_con = Constraint(m.Y, rule=grid_timing_mw)
         
         logger.info(f"Grid timing constraint: Available from {grid_year} onwards")
@@ -831,11 +1058,6 @@ class bvNexusMILP_DR:
         """
         m = self.model
         
-        # Skip RAM constraint if N-1 not required
-        if not self.constraints.get('N_Minus_1_Required', True):
-            logger.info("RAM constraint SKIPPED (N-1 not required)")
-            return
-        
         recip_cap = self.EQUIPMENT['recip']['capacity_mw']
         turbine_cap = self.EQUIPMENT['turbine']['capacity_mw']
         
@@ -864,7 +1086,42 @@ class bvNexusMILP_DR:
             return firm_capacity >= peak_load
         
         m.ram_con = Constraint(m.Y, rule=ram_reliability)
-        logger.info(f"RAM constraint ENABLED: N-1 redundancy, peak={peak_load:.1f} MW")
+        if self.constraints.get('N_Minus_1_Required', True):
+            logger.info(f"RAM constraint ENABLED: N-1 redundancy, peak={peak_load:.1f} MW")
+        else:
+            logger.info("RAM constraint SKIPPED (N-1 not required)")
+    
+    def _build_availability_constraints(self):
+        """
+        TECHNOLOGY AVAILABILITY - scenario flags, lead times, zero-load years
+        
+        Capacity <= upper bound × TECH_AVAIL[tech, y]. Replaces fixing
+        variables to zero so availability can change between scenarios.
+        """
+        m = self.model
+        
+        def recip_avail(m, y):
+            return m.n_recip[y] <= m.n_recip[y].ub * m.TECH_AVAIL['recip', y]
+        m.recip_avail_con = Constraint(m.Y, rule=recip_avail)
+        
+        def turbine_avail(m, y):
+            return m.n_turbine[y] <= m.n_turbine[y].ub * m.TECH_AVAIL['turbine', y]
+        m.turbine_avail_con = Constraint(m.Y, rule=turbine_avail)
+        
+        def bess_avail(m, y):
+            # bess_mw follows via the fixed-duration sizing constraint
+            return m.bess_mwh[y] <= m.bess_mwh[y].ub * m.TECH_AVAIL['bess', y]
+        m.bess_avail_con = Constraint(m.Y, rule=bess_avail)
+        
+        def solar_avail(m, y):
+            return m.solar_mw[y] <= m.solar_mw[y].ub * m.TECH_AVAIL['solar', y]
+        m.solar_avail_con = Constraint(m.Y, rule=solar_avail)
+        
+        def grid_avail(m, y):
+            return m.grid_active[y] <= m.TECH_AVAIL['grid', y]
+        m.grid_avail_con = Constraint(m.Y, rule=grid_avail)
+        
+        logger.info("Technology availability constraints added")
     
     def _build_objective(self):
         """
@@ -925,8 +1182,8 @@ class bvNexusMILP_DR:
             # NPV of Fuel Cost
             # =========================
             fuel = sum(
-                m.SCALE_FACTOR * sum(
-                    (m.gen_recip[t, y] * recip_hr + m.gen_turbine[t, y] * turbine_hr)
+                sum(
+                    m.HOUR_WEIGHT[t] * (m.gen_recip[t, y] * recip_hr + m.gen_turbine[t, y] * turbine_hr)
                     * self.NG_PRICE_PER_MMBTU / 1000  # BTU/kWh × $/MMBTU / 1000 = $/MWh
                     for t in m.T
                 ) / (1 + r)**(y - first_year)
@@ -937,8 +1194,8 @@ class bvNexusMILP_DR:
             # NPV of Grid Electricity Cost
             # =========================
             grid_cost = sum(
-                m.SCALE_FACTOR * sum(
-                    m.grid_import[t, y] * self.GRID_PRICE_PER_MWH
+                sum(
+                    m.HOUR_WEIGHT[t] * m.grid_import[t, y] * self.GRID_PRICE_PER_MWH
                     for t in m.T
                 ) / (1 + r)**(y - first_year)
                 for y in m.Y
@@ -961,8 +1218,8 @@ class bvNexusMILP_DR:
             # the optimizer always prioritizes serving load over reducing cost.
             
             unserved_penalty = sum(
-                m.SCALE_FACTOR * sum(
-                    m.unserved[t, y] * self.UNSERVED_PENALTY
+                sum(
+                    m.HOUR_WEIGHT[t] * m.unserved[t, y] * self.UNSERVED_PENALTY
                     for t in m.T
                 ) / (1 + r)**(y - first_year)
                 for y in m.Y
@@ -984,7 +1241,7 @@ class bvNexusMILP_DR:
             # =========================
             total_cost = capex + fuel + grid_cost + unserved_penalty - dr_revenue
             
-            if energy > 0:
+            if value(energy) > 0:
                 return total_cost / energy
             else:
                 return 1e9
@@ -1001,15 +1258,24 @@ class bvNexusMILP_DR:
         self,
         solver: str = 'cbc',
         time_limit: int = 300,
-        verbose: bool = True
+        verbose: bool = True,
+        warm_start: bool = True,
+        mip_gap: float = 0.01,
+        race: bool = False,
     ) -> Dict:
         """
         Solve the optimization model.
         
         Args:
-            solver: MILP solver to use ('glpk', 'cbc', or 'gurobi')
+            solver: MILP solver to use ('glpk', 'cbc', 'gurobi', or 'highs' to
+                solve in-process without LP/solution files)
             time_limit: Maximum solve time in seconds
             verbose: Print solver output
+            warm_start: Seed the solver with the previous incumbent (variable
+                values left on the model by the last solve) when supported
+            mip_gap: Relative MIP gap at which the solver stops
+            race: Solve in-process under several HiGHS configurations in
+                parallel processes and keep the first to reach mip_gap
         
         Returns:
             Solution dictionary with equipment, costs, and power coverage
@@ -1017,46 +1283,128 @@ class bvNexusMILP_DR:
         if not self._built:
             raise RuntimeError("Model not built. Call build() first.")
         
-        logger.info(f"Solving with {solver} (time limit: {time_limit}s)")
+        if race:
+            solver = 'highs'
+        elif solver == 'highs' and solver_available('appsi_highs'):
+            solver = 'appsi_highs'  # highspy installed: persistent, incremental re-solves
+        elif solver != 'highs' and not solver_available(solver):
+            alternatives = [s for s in ('glpk', 'cbc', 'gurobi', 'appsi_highs')
+                            if s != solver and solver_available(s)]
+            fallback = alternatives[0] if alternatives else 'highs'
+            logger.warning(f"Solver {solver} not available. Using {fallback} instead")
+            solver = fallback
+        
+        logger.info(f"Solving with {solver} (time limit: {time_limit}s{', race' if race else ''})")
+        
+        if solver == 'highs':
+            results = self._solve_in_process(time_limit, verbose, mip_gap, race)
+        else:
+            results = self._solve_with_factory(solver, time_limit, verbose, warm_start, mip_gap)
         
-        # Get solver
-        try:
-            opt = SolverFactory(solver)
-            if opt is None or not opt.available():
-                raise Exception(f"Solver {solver} not available")
-        except Exception as e:
-            logger.warning(f"Failed to load {solver}: {e}. Trying alternatives...")
-            for alt_solver in ['glpk', 'cbc', 'gurobi']:
-                if alt_solver != solver:
-                    try:
-                        opt = SolverFactory(alt_solver)
-                        if opt is not None and opt.available():
-                            solver = alt_solver
-                            logger.info(f"Using {solver} instead")
-                            break
-                    except:
-                        continue
-            else:
-                raise RuntimeError("No suitable MILP solver found. Install GLPK, CBC, or Gurobi.")
+        logger.info(f"Solver status: {results.solver.status}")
+        logger.info(f"Termination: {results.solver.termination_condition}")
+        
+        with self._phase('_extract_solution'):
+            solution = self._extract_solution(results)
+        solution['solver_stats'] = self._solver_stats(results)
+        self._has_incumbent = bool(solution['equipment'])
+        return solution
+    
+    def _solve_with_factory(self, solver: str, time_limit: int, verbose: bool, warm_start: bool,
+                            mip_gap: float):
+        """Solve through a Pyomo SolverFactory plugin; persistent (appsi) solvers are kept per model."""
+        opt = self._solvers.get(solver) or SolverFactory(solver)
+        if solver.startswith('appsi_'):
+            self._solvers[solver] = opt
         
         # Set solver options
         if solver == 'gurobi':
             opt.options['TimeLimit'] = time_limit
-            opt.options['MIPGap'] = 0.01
+            opt.options['MIPGap'] = mip_gap
         elif solver == 'cbc':
             opt.options['seconds'] = time_limit
-            opt.options['ratioGap'] = 0.01
+            opt.options['ratioGap'] = mip_gap
         elif solver == 'glpk':
             opt.options['tmlim'] = time_limit
-            opt.options['mipgap'] = 0.01
-        
-        # Solve
-        results = opt.solve(self.model, tee=verbose)
-        
-        logger.info(f"Solver status: {results.solver.status}")
-        logger.info(f"Termination: {results.solver.termination_condition}")
+            opt.options['mipgap'] = mip_gap
+        elif solver.startswith('appsi_'):
+            opt.config.mip_gap = mip_gap
+        
+        # Solve (warm start from previous incumbent if the solver supports it)
+        solve_kwargs = {'tee': verbose}
+        if solver.startswith('appsi_'):
+            solve_kwargs['timelimit'] = time_limit
+        if warm_start and self._has_incumbent:
+            try:
+                if opt.warm_start_capable():
+                    solve_kwargs['warmstart'] = True
+                    logger.info("Warm-starting from previous incumbent")
+            except Exception:
+                pass
+        
+        # Split the solve call into LP write / solver run / solution load when profiled.
+        # The wrappers are removed afterwards: appsi solvers are kept across solves.
+        wrapped = {}
+        if self.profiler is not None:
+            for method, phase in (('_presolve', 'lp_write'), ('_apply_solver', 'solver'),
+                                  ('_postsolve', 'solution_load')):
+                if hasattr(opt, method):
+                    wrapped[method] = vars(opt).get(method)
+                    setattr(opt, method, self.profiler.wrap(phase, getattr(opt, method)))
         
-        return self._extract_solution(results)
+        try:
+            return opt.solve(self.model, **solve_kwargs)
+        finally:
+            for method, original in wrapped.items():
+                if original is None:
+                    delattr(opt, method)
+                else:
+                    setattr(opt, method, original)
+    
+    def _solve_in_process(self, time_limit: int, verbose: bool, mip_gap: float, race: bool):
+        """Compile the model in memory and solve with HiGHS (optionally racing configurations)."""
+        with self._phase('compile'):
+            lp, columns = compile_model(self.model)
+        with self._phase('solver'):
+            if race:
+                result = race_highs(lp, time_limit=time_limit, target_gap=mip_gap, verbose=verbose)
+            else:
+                result = solve_lp(lp, time_limit=time_limit, mip_rel_gap=mip_gap, verbose=verbose)
+        with self._phase('solution_load'):
+            load_values(columns, result['x'])
+        results = to_solver_results(result, lp)
+        if race:
+            results.solver.name = f"highs ({result['config']})"
+        return results
+    
+    @staticmethod
+    def _var_array(var) -> np.ndarray:
+        """Solved values of an indexed Var as a dense array shaped by its index sets (unset = 0)."""
+        shape = [len(s) for s in var.index_set().subsets()]
+        values = np.fromiter((v.value or 0.0 for v in var.values()), dtype=float, count=len(var))
+        return values.reshape(shape)
+    
+    @staticmethod
+    def _solver_stats(results) -> Dict:
+        """MIP gap, node count and solver-reported problem size from Pyomo results (when reported)."""
+        def number(getter):
+            try:
+                v = float(getter())
+                return v if np.isfinite(v) else None
+            except (AttributeError, TypeError, ValueError, IndexError, KeyError):
+                return None
+        
+        lower = number(lambda: results.problem.lower_bound)
+        upper = number(lambda: results.problem.upper_bound)
+        stats = {
+            'mip_gap': abs(upper - lower) / max(abs(upper), 1e-9) if lower is not None and upper is not None else None,
+            'node_count': number(lambda: results.solver.statistics.branch_and_bound.number_of_created_subproblems),
+            'solver_time_s': number(lambda: results.solver.wallclock_time) or number(lambda: results.solver.time),
+            'n_variables': number(lambda: results.problem.number_of_variables),
+            'n_constraints': number(lambda: results.problem.number_of_constraints),
+            'n_nonzeros': number(lambda: results.problem.number_of_nonzeros),
+        }
+        return {k: v for k, v in stats.items() if v is not None}
     
     def _extract_solution(self, results) -> Dict:
         """Extract solution to dictionary with power coverage metrics."""
@@ -1093,36 +1441,61 @@ class bvNexusMILP_DR:
             else:
                 logger.warning("Attempting to extract solution despite termination condition")
         
-        # Extract objective value
+        # Extract objective value: the solver-reported incumbent (minimization upper
+        # bound) when available - re-evaluating the objective expression costs more
+        # than the rest of extraction at 8760 hours
         try:
-            solution['objective_lcoe'] = value(m.obj)
+            reported = float(results.problem.upper_bound)
+            solution['objective_lcoe'] = reported if np.isfinite(reported) else value(m.obj)
         except:
-            solution['objective_lcoe'] = 0
+            try:
+                solution['objective_lcoe'] = value(m.obj)
+            except:
+                solution['objective_lcoe'] = 0
+        
+        hour_weight = self.periods.hour_weights
+        eq = self.EQUIPMENT
+        
+        # One pass per variable into dense arrays: (Y,) capacity, (T, Y) dispatch
+        n_recip = np.round(self._var_array(m.n_recip)).astype(int)
+        n_turbine = np.round(self._var_array(m.n_turbine)).astype(int)
+        bess_mwh, bess_mw = self._var_array(m.bess_mwh), self._var_array(m.bess_mw)
+        solar_mw, grid_mw = self._var_array(m.solar_mw), self._var_array(m.grid_mw)
+        grid_active = self._var_array(m.grid_active)
+        dr_capacity = self._var_array(m.dr_capacity)  # (DR, Y)
+        dispatch = {name: self._var_array(getattr(m, name)) for name in self.DISPATCH_VARS}
+        
+        # Annual totals (weighted over representative hours)
+        recip_gen = hour_weight @ dispatch['gen_recip']
+        turbine_gen = hour_weight @ dispatch['gen_turbine']
+        unserved = hour_weight @ dispatch['unserved']
+        
+        nox_max, gas_max = value(m.NOX_MAX), value(m.GAS_MAX)
         
         # Extract solution by year
-        for y in m.Y:
+        for i, y in enumerate(m.Y):
             # Equipment
             solution['equipment'][y] = {
-                'n_recip': int(value(m.n_recip[y])),
-                'n_turbine': int(value(m.n_turbine[y])),
-                'recip_mw': int(value(m.n_recip[y])) * self.EQUIPMENT['recip']['capacity_mw'],
-                'turbine_mw': int(value(m.n_turbine[y])) * self.EQUIPMENT['turbine']['capacity_mw'],
-                'bess_mwh': value(m.bess_mwh[y]),
-                'bess_mw': value(m.bess_mw[y]),
-                'solar_mw': value(m.solar_mw[y]),
-                'grid_mw': value(m.grid_mw[y]),
-                'grid_active': bool(value(m.grid_active[y])),
+                'n_recip': int(n_recip[i]),
+                'n_turbine': int(n_turbine[i]),
+                'recip_mw': int(n_recip[i]) * eq['recip']['capacity_mw'],
+                'turbine_mw': int(n_turbine[i]) * eq['turbine']['capacity_mw'],
+                'bess_mwh': float(bess_mwh[i]),
+                'bess_mw': float(bess_mw[i]),
+                'solar_mw': float(solar_mw[i]),
+                'grid_mw': float(grid_mw[i]),
+                'grid_active': bool(round(grid_active[i])),
                 'total_capacity_mw': (
-                    int(value(m.n_recip[y])) * self.EQUIPMENT['recip']['capacity_mw'] +
-                    int(value(m.n_turbine[y])) * self.EQUIPMENT['turbine']['capacity_mw'] +
-                    value(m.bess_mw[y]) +
-                    value(m.solar_mw[y]) * self.EQUIPMENT['solar']['capacity_factor'] +
-                    value(m.grid_mw[y]) * value(m.GRID_AVAIL[y])
+                    int(n_recip[i]) * eq['recip']['capacity_mw'] +
+                    int(n_turbine[i]) * eq['turbine']['capacity_mw'] +
+                    float(bess_mw[i]) +
+                    float(solar_mw[i]) * eq['solar']['capacity_factor'] +
+                    float(grid_mw[i]) * value(m.GRID_AVAIL[y])
                 ),
             }
             
             # Power coverage (CRITICAL METRIC)
-            total_unserved = sum(value(m.unserved[t, y]) for t in m.T) * value(m.SCALE_FACTOR)
+            total_unserved = float(unserved[i])
             total_load = value(m.D_required[y])
             coverage_pct = (1 - total_unserved / total_load) * 100 if total_load > 0 else 100
             power_gap_mw = total_unserved / 8760 if total_unserved > 0 else 0
@@ -1137,40 +1510,35 @@ class bvNexusMILP_DR:
             }
             
             # Emissions
-            nox = sum(
-                value(m.gen_recip[t, y]) * self.EQUIPMENT['recip']['heat_rate_btu_kwh'] * self.EQUIPMENT['recip']['nox_rate_lb_mmbtu'] +
-                value(m.gen_turbine[t, y]) * self.EQUIPMENT['turbine']['heat_rate_btu_kwh'] * self.EQUIPMENT['turbine']['nox_rate_lb_mmbtu']
-                for t in m.T
-            ) * value(m.SCALE_FACTOR) / 2_000_000
+            nox = float(
+                recip_gen[i] * eq['recip']['heat_rate_btu_kwh'] * eq['recip']['nox_rate_lb_mmbtu'] +
+                turbine_gen[i] * eq['turbine']['heat_rate_btu_kwh'] * eq['turbine']['nox_rate_lb_mmbtu']
+            ) / 2_000_000
             
             solution['emissions'][y] = {
                 'nox_tpy': nox,
-                'nox_limit_tpy': value(m.NOX_MAX),
-                'nox_utilization_pct': nox / value(m.NOX_MAX) * 100 if value(m.NOX_MAX) > 0 else 0,
+                'nox_limit_tpy': nox_max,
+                'nox_utilization_pct': nox / nox_max * 100 if nox_max > 0 else 0,
             }
             
             # Gas usage
-            recip_gen = sum(value(m.gen_recip[t, y]) for t in m.T) * value(m.SCALE_FACTOR)
-            turbine_gen = sum(value(m.gen_turbine[t, y]) for t in m.T) * value(m.SCALE_FACTOR)
-            
-            recip_mcf = recip_gen * self.EQUIPMENT['recip']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
-            turbine_mcf = turbine_gen * self.EQUIPMENT['turbine']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
+            recip_mcf = recip_gen[i] * eq['recip']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
+            turbine_mcf = turbine_gen[i] * eq['turbine']['heat_rate_btu_kwh'] * 1000 / self.GAS_HHV_BTU_PER_MCF
             
-            avg_daily_mcf = (recip_mcf + turbine_mcf) / 365
+            avg_daily_mcf = float(recip_mcf + turbine_mcf) / 365
             
             solution['gas_usage'][y] = {
-                'annual_mcf': recip_mcf + turbine_mcf,
+                'annual_mcf': float(recip_mcf + turbine_mcf),
                 'avg_daily_mcf': avg_daily_mcf,
-                'gas_limit_mcf_day': value(m.GAS_MAX),
-                'gas_utilization_pct': avg_daily_mcf / value(m.GAS_MAX) * 100 if value(m.GAS_MAX) > 0 else 0,
+                'gas_limit_mcf_day': gas_max,
+                'gas_utilization_pct': avg_daily_mcf / gas_max * 100 if gas_max > 0 else 0,
             }
             
             # DR capacity
-            solution['dr'][y] = {
-                dr: value(m.dr_capacity[dr, y])
-                for dr in m.DR
-            }
-            solution['dr'][y]['total_dr_mw'] = sum(value(m.dr_capacity[dr, y]) for dr in m.DR)
+            solution['dr'][y] = {dr: float(dr_capacity[k, i]) for k, dr in enumerate(m.DR)}
+            solution['dr'][y]['total_dr_mw'] = float(dr_capacity[:, i].sum())
+        
+        solution['dispatch'] = dict(dispatch, hour_weights=hour_weight, years=list(self.years))
         
         # Summary metrics
         final_year = max(self.years)
@@ -1202,26 +1570,16 @@ if __name__ == "__main__":
     print("="*70)
     
     # Generate sample load profile
-    np.random.seed(42)
-    hours = 8760
+    from app.utils.profile_engine import ProfileEngine
+    engine = ProfileEngine(seed=42)
     base_load = 160 * 0.75  # 160 MW peak, 75% load factor
     
-    # Daily and seasonal patterns
-    load_8760 = np.zeros(hours)
-    for h in range(hours):
-        hour_of_day = h % 24
-        day_of_year = h // 24
-        
-        # Daily pattern (higher during day)
-        daily = 1.0 if 8 <= hour_of_day <= 22 else 0.85
-        
-        # Seasonal pattern
-        seasonal = 1.0 + 0.05 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-        
-        # Random noise
-        noise = 1.0 + np.random.uniform(-0.02, 0.02)
-        
-        load_8760[h] = base_load * daily * seasonal * noise
+    # Daily pattern (higher during day), seasonal pattern, random noise
+    load_8760 = engine.build(
+        base_load,
+        factors=[engine.daily_window(8, 22, on=1.0, off=0.85), engine.seasonal_sine(0.05, shift=80)],
+        noise=engine.uniform(0.98, 1.02),
+    )
     
     # Test configuration
     test_years = list(range(2026, 2036))
@@ -3,7 +3,7 @@ bvNexus MILP Optimization Model - FAST VERSION
 ===============================================
 
 Optimizations for speed:
-1. 3 representative weeks (504 hours) instead of 6 (1008 hours)
+1. 8 clustered representative days (192 hours) instead of 6 weeks (1008 hours)
 2. 5% MIP gap tolerance (vs 1%) - gets good solution faster
 3. Prefers CBC solver over GLPK (10x faster)
 4. Simplified constraints where possible
@@ -20,6 +20,8 @@ from typing import Dict, List, Optional
 import numpy as np
 import logging
 
+from .representative_periods import RepresentativePeriods, fixed_periods, resolve_periods
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,13 +30,16 @@ class bvNexusMILP_DR:
     FAST MILP for AI datacenter power optimization.
     
     Speed optimizations:
-    - 504 representative hours (3 weeks) instead of 1008
+    - 192 representative hours (8 k-medoids days, weighted) instead of 1008
     - 5% MIP gap for faster convergence
     - Tighter variable bounds
     - Simplified SOC constraints
     """
     
-    # FAST: Only 3 representative weeks (504 hours)
+    # FAST: 8 clustered representative days (192 hours), see representative_periods.py
+    REPRESENTATIVE_PERIODS = {'n_periods': 8, 'period': 'day', 'method': 'kmedoids'}
+    
+    # Legacy fixed weeks (504 hours), used with representative_periods='fixed'
     REPRESENTATIVE_WEEKS = {
         'summer_peak': {'start_day': 200, 'weight': 20},   # Hot week
         'winter_typical': {'start_day': 340, 'weight': 20}, # Cold week  
@@ -65,6 +70,8 @@ class bvNexusMILP_DR:
         self.existing = {}
         self.workload_mix = {}
         self.dr_config = {}
+        self.period_spec = None
+        self.periods: Optional[RepresentativePeriods] = None
     
     def build(
         self,
@@ -77,10 +84,17 @@ class bvNexusMILP_DR:
         existing_equipment: Dict = None,
         grid_config: Dict = None,
         use_representative_periods: bool = True,
+        representative_periods=None,
     ):
-        """Build MILP model optimized for speed."""
+        """
+        Build MILP model optimized for speed.
+        
+        representative_periods: RepresentativePeriods, select_representative_periods()
+        kwargs dict, 'fixed' (legacy 3 weeks) or None for REPRESENTATIVE_PERIODS.
+        """
         
-        logger.info("Building FAST MILP model (504 representative hours)")
+        logger.info("Building FAST MILP model (representative periods)")
+        self.period_spec = representative_periods
         
         self.years = years
         self.load_data = load_data
@@ -113,20 +127,16 @@ class bvNexusMILP_DR:
         
         m.Y = Set(initialize=self.years)
         
-        # FAST: 3 weeks = 504 hours
-        n_hours = 3 * 168  # 504 hours
-        m.T = RangeSet(1, n_hours)
-        m.SCALE_FACTOR = Param(initialize=8760 / n_hours)  # ~17.4
+        # FAST: few weighted representative periods
+        self._load_array = self._sample_load(np.array(self.load_data.get('total_load_mw', [100]*8760)))
+        periods = self.periods
+        m.T = RangeSet(1, periods.n_hours)
+        m.HOUR_WEIGHT = Param(m.T, initialize=dict(enumerate(periods.hour_weights.tolist(), start=1)))
+        m.T_start = Set(initialize=(periods.period_first_hours + 1).tolist())
         
         # Peak hours
-        peak_idx = []
-        for week in range(3):
-            for day in range(7):
-                for h in self.PEAK_HOURS:
-                    idx = week * 168 + day * 24 + h + 1
-                    if idx <= n_hours:
-                        peak_idx.append(idx)
-        m.T_peak = Set(initialize=peak_idx)
+        peak_idx = np.flatnonzero(np.isin(periods.hour_index % 24, self.PEAK_HOURS)) + 1
+        m.T_peak = Set(initialize=peak_idx.tolist())
         
         m.W = Set(initialize=['pre_training', 'fine_tuning', 'batch_inference', 'realtime_inference'])
         m.DR = Set(initialize=['spinning_reserve', 'economic_dr'])  # Simplified DR
@@ -134,8 +144,8 @@ class bvNexusMILP_DR:
     def _build_parameters(self):
         m = self.model
         
-        # Sample load
-        load_array = self._sample_load(np.array(self.load_data.get('total_load_mw', [100]*8760)))
+        # Sampled load (see _build_sets)
+        load_array = self._load_array
         m.D_total = Param(m.T, m.Y, initialize=lambda m, t, y: float(load_array[t-1]))
         
         # Annual required energy
@@ -170,20 +180,24 @@ class bvNexusMILP_DR:
         m.EXISTING_turbine = Param(initialize=self.existing.get('n_turbine', 0))
     
     def _sample_load(self, load_8760: np.ndarray) -> np.ndarray:
-        """Sample 3 representative weeks."""
+        """Select representative periods (self.periods) and sample the load onto them."""
         if len(load_8760) != 8760:
+            self.periods = RepresentativePeriods(
+                period_starts=np.array([0]), period_hours=504,
+                weights=np.array([8760 / 504]), method='truncated',
+            )
             return load_8760[:504] if len(load_8760) >= 504 else np.tile(load_8760, 4)[:504]
         
-        hours = []
-        for week_info in self.REPRESENTATIVE_WEEKS.values():
-            start = week_info['start_day'] * 24
-            end = start + 168
-            if end <= 8760:
-                hours.extend(load_8760[start:end])
-            else:
-                hours.extend(load_8760[start:])
-                hours.extend(load_8760[:end-8760])
-        return np.array(hours)
+        if self.period_spec == 'fixed':
+            weeks = list(self.REPRESENTATIVE_WEEKS.values())
+            self.periods = fixed_periods(
+                [w['start_day'] for w in weeks], period='week', weights=[w['weight'] for w in weeks]
+            )
+        else:
+            spec = self.REPRESENTATIVE_PERIODS if self.period_spec is None else self.period_spec
+            solar = self.load_data.get('solar_profile')
+            self.periods = resolve_periods(spec, load_8760, solar if solar is not None and len(solar) == 8760 else None)
+        return self.periods.sample(load_8760)
     
     def _build_variables(self):
         m = self.model
@@ -286,10 +300,12 @@ class bvNexusMILP_DR:
         m.soc_hi = Constraint(m.T, m.Y, rule=lambda m,t,y: m.soc[t,y] <= m.bess_mwh[y])
         
         # Energy conservation (simplified)
+        period_hours = self.periods.period_hours
+        
         def soc_dyn(m, t, y):
-            if t == 1:
-                return m.soc[t,y] == 0.5 * m.bess_mwh[y]
-            return m.soc[t,y] == m.soc[t-1,y] + 0.92*m.charge[t,y] - m.discharge[t,y]/0.92
+            # Cyclic periods: the first hour follows the period's last hour
+            prev = t + period_hours - 1 if t in m.T_start else t - 1
+            return m.soc[t,y] == m.soc[prev,y] + 0.92*m.charge[t,y] - m.discharge[t,y]/0.92
         m.soc_dyn = Constraint(m.T, m.Y, rule=soc_dyn)
         
         # === EMISSIONS ===
@@ -297,17 +313,19 @@ class bvNexusMILP_DR:
         # NOx
         def nox_limit(m, y):
             nox = sum(
-                m.gen_recip[t,y] * eq['recip']['heat_rate'] * eq['recip']['nox_rate'] +
-                m.gen_turbine[t,y] * eq['turbine']['heat_rate'] * eq['turbine']['nox_rate']
+                m.HOUR_WEIGHT[t] * (
+                    m.gen_recip[t,y] * eq['recip']['heat_rate'] * eq['recip']['nox_rate'] +
+                    m.gen_turbine[t,y] * eq['turbine']['heat_rate'] * eq['turbine']['nox_rate']
+                )
                 for t in m.T
             )
-            return m.SCALE_FACTOR * nox / 2_000_000 <= m.NOX_MAX
+            return nox / 2_000_000 <= m.NOX_MAX
         m.nox_con = Constraint(m.Y, rule=nox_limit)
         
         # Gas supply
         def gas_limit(m, y):
-            recip_mcf = m.SCALE_FACTOR * sum(m.gen_recip[t,y] for t in m.T) * eq['recip']['heat_rate'] * 1000 / self.GAS_HHV
-            turbine_mcf = m.SCALE_FACTOR * sum(m.gen_turbine[t,y] for t in m.T) * eq['turbine']['heat_rate'] * 1000 / self.GAS_HHV
+            recip_mcf = sum(m.HOUR_WEIGHT[t] * m.gen_recip[t,y] for t in m.T) * eq['recip']['heat_rate'] * 1000 / self.GAS_HHV
+            turbine_mcf = sum(m.HOUR_WEIGHT[t] * m.gen_turbine[t,y] for t in m.T) * eq['turbine']['heat_rate'] * 1000 / self.GAS_HHV
             return (recip_mcf + turbine_mcf) / 365 <= m.GAS_MAX
         m.gas_con = Constraint(m.Y, rule=gas_limit)
         
@@ -321,7 +339,7 @@ class bvNexusMILP_DR:
         
         # Annual curtailment budget
         def curtail_budget(m, y):
-            return m.SCALE_FACTOR * sum(m.curtail_total[t,y] for t in m.T) <= 0.01 * m.D_required[y]
+            return sum(m.HOUR_WEIGHT[t] * m.curtail_total[t,y] for t in m.T) <= 0.01 * m.D_required[y]
         m.curtail_budget = Constraint(m.Y, rule=curtail_budget)
     
     def _build_objective(self):
@@ -343,8 +361,8 @@ class bvNexusMILP_DR:
             
             # Fuel
             fuel = sum(
-                m.SCALE_FACTOR * sum(
-                    (m.gen_recip[t,y] * eq['recip']['heat_rate'] + 
+                sum(
+                    m.HOUR_WEIGHT[t] * (m.gen_recip[t,y] * eq['recip']['heat_rate'] + 
                      m.gen_turbine[t,y] * eq['turbine']['heat_rate']) * 3.50 / 1000
                     for t in m.T
                 ) / (1+r)**(y-first_year)
@@ -353,7 +371,7 @@ class bvNexusMILP_DR:
             
             # Grid electricity
             grid_cost = sum(
-                m.SCALE_FACTOR * sum(m.grid_import[t,y] * 75 for t in m.T) / (1+r)**(y-first_year)
+                sum(m.HOUR_WEIGHT[t] * m.grid_import[t,y] * 75 for t in m.T) / (1+r)**(y-first_year)
                 for y in m.Y
             )
             
@@ -365,7 +383,7 @@ class bvNexusMILP_DR:
             
             # Unserved penalty
             unserved = sum(
-                m.SCALE_FACTOR * sum(m.unserved[t,y] * self.UNSERVED_PENALTY for t in m.T) / (1+r)**(y-first_year)
+                sum(m.HOUR_WEIGHT[t] * m.unserved[t,y] * self.UNSERVED_PENALTY for t in m.T) / (1+r)**(y-first_year)
                 for y in m.Y
             )
             
@@ -469,7 +487,7 @@ class bvNexusMILP_DR:
             }
             
             # Power coverage
-            unserved = sum(value(m.unserved[t,y]) for t in m.T) * value(m.SCALE_FACTOR)
+            unserved = sum(value(m.HOUR_WEIGHT[t]) * value(m.unserved[t,y]) for t in m.T)
             total_load = value(m.D_required[y])
             coverage = (1 - unserved/total_load) * 100 if total_load > 0 else 100
             
@@ -483,10 +501,12 @@ class bvNexusMILP_DR:
             
             # Emissions
             nox = sum(
-                value(m.gen_recip[t,y]) * eq['recip']['heat_rate'] * eq['recip']['nox_rate'] +
-                value(m.gen_turbine[t,y]) * eq['turbine']['heat_rate'] * eq['turbine']['nox_rate']
+                value(m.HOUR_WEIGHT[t]) * (
+                    value(m.gen_recip[t,y]) * eq['recip']['heat_rate'] * eq['recip']['nox_rate'] +
+                    value(m.gen_turbine[t,y]) * eq['turbine']['heat_rate'] * eq['turbine']['nox_rate']
+                )
                 for t in m.T
-            ) * value(m.SCALE_FACTOR) / 2_000_000
+            ) / 2_000_000
             
             solution['emissions'][y] = {
                 'nox_tpy': nox,
@@ -495,8 +515,8 @@ class bvNexusMILP_DR:
             }
             
             # Gas
-            recip_gen = sum(value(m.gen_recip[t,y]) for t in m.T) * value(m.SCALE_FACTOR)
-            turbine_gen = sum(value(m.gen_turbine[t,y]) for t in m.T) * value(m.SCALE_FACTOR)
+            recip_gen = sum(value(m.HOUR_WEIGHT[t]) * value(m.gen_recip[t,y]) for t in m.T)
+            turbine_gen = sum(value(m.HOUR_WEIGHT[t]) * value(m.gen_turbine[t,y]) for t in m.T)
             
             recip_mcf = recip_gen * eq['recip']['heat_rate'] * 1000 / self.GAS_HHV
             turbine_mcf = turbine_gen * eq['turbine']['heat_rate'] * 1000 / self.GAS_HHV
@@ -0,0 +1,388 @@
+"""
+Representative Period Selection for the MILP
+============================================
+
+Picks K representative days or weeks from a site's 8760 load (and optional
+solar) profile and weights each one by the share of the year it stands for.
+The MILP models only the selected hours. Annual quantities (fuel, NOx, gas,
+curtailment budget, unserved penalty) are weighted sums over them, replacing
+the single uniform SCALE_FACTOR = 8760 / n_hours.
+
+Selection methods:
+- 'kmedoids'      k-medoids (k-medoids++ seeding, alternating assignment)
+- 'hierarchical'  Ward linkage (scipy.cluster.hierarchy), medoid per cluster
+- fixed_periods() hand-picked start days (legacy REPRESENTATIVE_WEEKS)
+
+Usage:
+    from app.optimization.representative_periods import (
+        select_representative_periods, dispatch_error_report,
+    )
+
+    periods = select_representative_periods(load_8760, solar_cf_8760,
+                                             n_periods=12, period='day')
+    optimizer.build(..., representative_periods=periods)   # 288 hours
+
+    report = dispatch_error_report(periods, load_8760, solar_cf_8760,
+                                   {'recip_mw': 200, 'solar_mw': 100, ...})
+    print(report['max_abs_error_pct_of_load'], report['duration_curve_rmse_pct'])
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_YEAR = 8760
+PERIOD_HOURS = {'day': 24, 'week': 168}
+
+
+@dataclass
+class RepresentativePeriods:
+    """
+    Selected periods and their weights.
+
+    Attributes:
+        period_starts: First hour (0-based, 8760 clock) of each selected period
+        period_hours: Hours per period (24 = day, 168 = week, 8760 = full year)
+        weights: Periods of the year each selected period represents; scaled
+            so that sum(weights) * period_hours == 8760
+        assignment: For each original period of the year, the index of the
+            selected period representing it (None for fixed selections)
+        method: How the periods were chosen
+    """
+    period_starts: np.ndarray
+    period_hours: int
+    weights: np.ndarray
+    assignment: Optional[np.ndarray] = None
+    method: str = 'fixed'
+
+    @property
+    def n_periods(self) -> int:
+        return len(self.period_starts)
+
+    @property
+    def n_hours(self) -> int:
+        return self.n_periods * self.period_hours
+
+    @property
+    def hour_index(self) -> np.ndarray:
+        """8760-clock hour of every modelled hour (periods wrap at year end)."""
+        offsets = np.arange(self.period_hours)
+        return ((np.asarray(self.period_starts)[:, None] + offsets[None, :]) % HOURS_PER_YEAR).ravel()
+
+    @property
+    def hour_weights(self) -> np.ndarray:
+        """Annualization weight of every modelled hour; sums to 8760."""
+        return np.repeat(np.asarray(self.weights, dtype=float), self.period_hours)
+
+    @property
+    def period_first_hours(self) -> np.ndarray:
+        """0-based positions (in the modelled series) where each period begins."""
+        return np.arange(self.n_periods) * self.period_hours
+
+    def sample(self, values_8760) -> np.ndarray:
+        """Pick the modelled hours out of a full-year series."""
+        return np.asarray(values_8760, dtype=float)[self.hour_index]
+
+    def annualize(self, values) -> float:
+        """Weighted annual total of a series over the modelled hours."""
+        return float(np.dot(self.hour_weights, np.asarray(values, dtype=float)))
+
+
+# =============================================================================
+# CONSTRUCTORS
+# =============================================================================
+
+def full_year() -> RepresentativePeriods:
+    """All 8760 hours, weight 1."""
+    return RepresentativePeriods(
+        period_starts=np.array([0]), period_hours=HOURS_PER_YEAR, weights=np.array([1.0]), method='full_year'
+    )
+
+
+def fixed_periods(
+    start_days: List[int],
+    period: str = 'week',
+    weights: Optional[List[float]] = None,
+) -> RepresentativePeriods:
+    """
+    Hand-picked periods (e.g. the legacy REPRESENTATIVE_WEEKS).
+
+    With weights=None every modelled hour gets the uniform 8760 / n_hours
+    weight, which reproduces the old SCALE_FACTOR behaviour. Given weights
+    are rescaled so the periods cover the full year.
+    """
+    period_hours = PERIOD_HOURS[period]
+    n = len(start_days)
+    if weights is None:
+        w = np.full(n, HOURS_PER_YEAR / (n * period_hours))
+    else:
+        w = np.asarray(weights, dtype=float)
+        w = w * HOURS_PER_YEAR / (w.sum() * period_hours)
+    return RepresentativePeriods(
+        period_starts=np.asarray(start_days, dtype=int) * 24,
+        period_hours=period_hours,
+        weights=w,
+        method='fixed',
+    )
+
+
+def select_representative_periods(
+    load_8760,
+    solar_8760=None,
+    n_periods: int = 12,
+    period: str = 'day',
+    method: str = 'kmedoids',
+    include_peak: bool = True,
+    seed: int = 0,
+) -> RepresentativePeriods:
+    """
+    Cluster the year's days or weeks and keep one medoid per cluster.
+
+    Each period is described by its hourly load shape (normalized by the
+    annual peak) and, if given, its solar shape (normalized by its maximum),
+    so the selection follows the site's real profiles rather than fixed dates.
+
+    Args:
+        load_8760: Hourly facility load (MW), 8760 values
+        solar_8760: Optional hourly solar capacity factor or output, 8760 values
+        n_periods: Number of representative periods K (including the peak period)
+        period: 'day' (24 h) or 'week' (168 h)
+        method: 'kmedoids' or 'hierarchical'
+        include_peak: Keep the period containing the annual load peak as its
+            own representative (weight 1) so capacity/RAM sizing sees it
+        seed: Seed for k-medoids++ initialization
+
+    Returns:
+        RepresentativePeriods with weights = cluster sizes (scaled to 8760 h)
+    """
+    load = np.asarray(load_8760, dtype=float)
+    if len(load) != HOURS_PER_YEAR:
+        raise ValueError(f"Load profile has {len(load)} hours, expected {HOURS_PER_YEAR}")
+    if period not in PERIOD_HOURS:
+        raise ValueError(f"Unknown period '{period}' (use one of {list(PERIOD_HOURS)})")
+
+    period_hours = PERIOD_HOURS[period]
+    n_total = HOURS_PER_YEAR // period_hours  # 365 days or 52 whole weeks
+    covered = n_total * period_hours
+
+    features = [load[:covered].reshape(n_total, period_hours) / max(load.max(), 1e-9)]
+    if solar_8760 is not None:
+        solar = np.asarray(solar_8760, dtype=float)
+        if len(solar) != HOURS_PER_YEAR:
+            raise ValueError(f"Solar profile has {len(solar)} hours, expected {HOURS_PER_YEAR}")
+        features.append(solar[:covered].reshape(n_total, period_hours) / max(solar.max(), 1e-9))
+    features = np.hstack(features)
+
+    n_periods = int(min(max(n_periods, 1), n_total))
+    pool = np.arange(n_total)
+    forced = []
+    if include_peak and n_periods > 1:
+        peak_period = min(int(np.argmax(load[:covered])) // period_hours, n_total - 1)
+        forced = [peak_period]
+        pool = pool[pool != peak_period]
+
+    k = n_periods - len(forced)
+    dist = _pairwise_distances(features[pool])
+    if method == 'kmedoids':
+        medoids, labels = _kmedoids(dist, k, np.random.default_rng(seed))
+    elif method == 'hierarchical':
+        medoids, labels = _hierarchical(features[pool], dist, k)
+    else:
+        raise ValueError(f"Unknown clustering method '{method}' (use 'kmedoids' or 'hierarchical')")
+
+    # Drop clusters left empty by tied distances (e.g. identical days)
+    nonempty = np.flatnonzero(np.bincount(labels, minlength=len(medoids)) > 0)
+    medoids, labels, k = medoids[nonempty], np.searchsorted(nonempty, labels), len(nonempty)
+
+    # Order selected periods chronologically; forced peak period goes last
+    order = np.argsort(pool[medoids])
+    remap = np.empty(k, dtype=int)
+    remap[order] = np.arange(k)
+    starts = list(pool[medoids][order])
+    counts = list(np.bincount(remap[labels], minlength=k).astype(float))
+
+    assignment = np.empty(n_total, dtype=int)
+    assignment[pool] = remap[labels]
+    for p in forced:
+        assignment[p] = len(starts)
+        starts.append(p)
+        counts.append(1.0)
+
+    weights = np.asarray(counts) * HOURS_PER_YEAR / covered  # weeks: spread the 24 h remainder
+    result = RepresentativePeriods(
+        period_starts=np.asarray(starts, dtype=int) * period_hours,
+        period_hours=period_hours,
+        weights=weights,
+        assignment=assignment,
+        method=method,
+    )
+    logger.info(f"Selected {result.n_periods} representative {period}s ({result.n_hours} hours) by {method}")
+    return result
+
+
+def resolve_periods(
+    spec: Union[None, Dict, RepresentativePeriods],
+    load_8760,
+    solar_8760=None,
+    default: Optional[RepresentativePeriods] = None,
+) -> RepresentativePeriods:
+    """
+    Turn a MILP `representative_periods` argument into a selection.
+
+    spec may be a RepresentativePeriods (used as-is), a dict of
+    select_representative_periods() keyword arguments, or None (→ default).
+    """
+    if isinstance(spec, RepresentativePeriods):
+        return spec
+    if spec is None:
+        return default if default is not None else full_year()
+    return select_representative_periods(load_8760, solar_8760, **spec)
+
+
+# =============================================================================
+# CLUSTERING
+# =============================================================================
+
+def _pairwise_distances(x: np.ndarray) -> np.ndarray:
+    sq = np.sum(x * x, axis=1)
+    d2 = sq[:, None] + sq[None, :] - 2 * x @ x.T
+    return np.sqrt(np.maximum(d2, 0.0))
+
+
+def _medoid(dist: np.ndarray, members: np.ndarray) -> int:
+    return int(members[np.argmin(dist[np.ix_(members, members)].sum(axis=0))])
+
+
+def _kmedoids(dist: np.ndarray, k: int, rng: np.random.Generator, max_iter: int = 100):
+    """Alternating k-medoids with k-medoids++ seeding. Returns (medoids, labels)."""
+    n = len(dist)
+    if k >= n:
+        return np.arange(n), np.arange(n)
+
+    medoids = [int(rng.integers(n))]
+    for _ in range(1, k):
+        d = dist[:, medoids].min(axis=1) ** 2
+        if d.sum() > 0:
+            medoids.append(int(rng.choice(n, p=d / d.sum())))
+        else:
+            medoids.append(int(rng.choice(np.setdiff1d(np.arange(n), medoids))))
+    medoids = np.array(medoids)
+
+    for _ in range(max_iter):
+        labels = np.argmin(dist[:, medoids], axis=1)
+        new = np.array([
+            _medoid(dist, np.flatnonzero(labels == c)) if np.any(labels == c) else medoids[c]
+            for c in range(k)
+        ])
+        if np.array_equal(new, medoids):
+            break
+        medoids = new
+
+    labels = np.argmin(dist[:, medoids], axis=1)
+    return medoids, labels
+
+
+def _hierarchical(features: np.ndarray, dist: np.ndarray, k: int):
+    """Ward clustering cut at k clusters; medoid of each cluster. Returns (medoids, labels)."""
+    from scipy.cluster.hierarchy import fcluster, linkage
+
+    n = len(features)
+    if k >= n:
+        return np.arange(n), np.arange(n)
+    clusters = fcluster(linkage(features, method='ward'), t=k, criterion='maxclust') - 1
+    ids = np.unique(clusters)
+    medoids = np.array([_medoid(dist, np.flatnonzero(clusters == c)) for c in ids])
+    labels = np.searchsorted(ids, clusters)
+    return medoids, labels
+
+
+# =============================================================================
+# APPROXIMATION ERROR
+# =============================================================================
+
+def period_error_report(periods: RepresentativePeriods, series: Dict[str, np.ndarray]) -> Dict:
+    """
+    Compare weighted representative-hour totals with full-year totals.
+
+    Args:
+        periods: Selection to evaluate
+        series: {name: 8760 hourly values} (load, generation by source, ...)
+
+    Returns:
+        Dict with per-series full-year total, weighted estimate, error % of
+        the series itself and error as % of annual load energy ('load' series,
+        so tiny series such as unserved energy do not dominate), the
+        load-duration-curve RMSE (% of peak) and the max absolute errors.
+    """
+    report = {'n_hours': periods.n_hours, 'method': periods.method, 'series': {}}
+    load_total = float(np.sum(series['load'])) if 'load' in series else None
+    for name, values in series.items():
+        values = np.asarray(values, dtype=float)
+        full = float(values.sum())
+        approx = periods.annualize(periods.sample(values))
+        error_pct = (approx - full) / abs(full) * 100 if abs(full) > 1e-9 else 0.0
+        report['series'][name] = {'full_year': full, 'representative': approx, 'error_pct': error_pct}
+        if load_total:
+            report['series'][name]['error_pct_of_load'] = (approx - full) / load_total * 100
+
+    if 'load' in series:
+        load = np.asarray(series['load'], dtype=float)
+        report['duration_curve_rmse_pct'] = _duration_curve_rmse(periods, load) / max(load.max(), 1e-9) * 100
+
+    report['max_abs_error_pct'] = max(
+        (abs(s['error_pct']) for s in report['series'].values()), default=0.0
+    )
+    if load_total:
+        report['max_abs_error_pct_of_load'] = max(
+            abs(s['error_pct_of_load']) for s in report['series'].values()
+        )
+    return report
+
+
+def _duration_curve_rmse(periods: RepresentativePeriods, load: np.ndarray) -> float:
+    """RMSE between the full-year load-duration curve and the weighted one."""
+    values = periods.sample(load)
+    order = np.argsort(values)[::-1]
+    cum_hours = np.cumsum(periods.hour_weights[order])
+    full_curve = np.sort(load)[::-1]
+    # Weighted curve: value at hour h is the first sorted value whose cumulative weight reaches h
+    idx = np.minimum(np.searchsorted(cum_hours, np.arange(1, len(load) + 1)), len(order) - 1)
+    approx_curve = values[order][idx]
+    return float(np.sqrt(np.mean((full_curve - approx_curve) ** 2)))
+
+
+def dispatch_error_report(
+    periods: RepresentativePeriods,
+    load_8760,
+    solar_cf_8760,
+    equipment_config: Dict,
+    grid_capacity_mw: float = 0,
+) -> Dict:
+    """
+    Approximation error of the selection against a full-year dispatch.
+
+    Dispatches the configuration over all 8760 hours with the heuristic
+    DispatchSimulator, then compares each source's annual energy (and
+    unserved energy) with the weighted total over the representative hours.
+    """
+    from .greenfield_heuristic_v2 import DispatchSimulator
+
+    load = np.asarray(load_8760, dtype=float)
+    solar = np.asarray(solar_cf_8760, dtype=float) * equipment_config.get('solar_mw', 0)
+    dispatch = DispatchSimulator({}, {}).run_dispatch_batch(
+        [equipment_config], load[None, :], solar[None, :], grid_capacity_mw=grid_capacity_mw
+    )
+    series = {
+        'load': load,
+        'solar_mwh': dispatch.solar_mw[0],
+        'recip_mwh': dispatch.recip_mw[0],
+        'turbine_mwh': dispatch.turbine_mw[0],
+        'grid_mwh': dispatch.grid_mw[0],
+        'bess_discharge_mwh': dispatch.bess_discharge_mw[0],
+        'unserved_mwh': dispatch.unserved_mw[0],
+    }
+    return period_error_report(periods, series)
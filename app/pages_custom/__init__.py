@@ -1,17 +1,12 @@
 """
 Antigravity Page Modules
+
+Pages are imported on demand (the router in main.py imports only the page
+being shown), so loading the package does not pull in every page's
+plotting and mapping libraries.
 """
 
-from . import page_01_dashboard
-from . import page_02_sites
-from . import page_03_load_composer
-from . import page_04_variability
-from . import page_05_transient
-from . import page_06_equipment
-from . import page_07_optimizer
-from . import page_08_ram
-from . import page_09_results
-from . import page_10_dispatch
+import importlib
 
 __all__ = [
     'page_01_dashboard',
@@ -25,3 +20,9 @@ __all__ = [
     'page_09_results',
     'page_10_dispatch',
 ]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
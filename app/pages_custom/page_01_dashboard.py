@@ -5,9 +5,6 @@ Focus: Problem Statement Progress, Site Tracking & Portfolio Map
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import folium
-from streamlit_folium import st_folium
 import json
 from pathlib import Path
 from config.settings import PROBLEM_STATEMENTS, COLORS
@@ -155,7 +152,7 @@ def render_problem_progress_tab():
         
         # Load stage completion from Google Sheets
         for stage_key in ['screening', 'concept', 'preliminary', 'detailed']:
-            result = load_site_stage_result(site_key, stage_key)
+            result = load_site_stage_result(site_key, stage_key, include_dispatch=False)
             if result and result.get('complete'):
                 site_tracker['stages'][stage_key]['complete'] = True
                 site_tracker['stages'][stage_key]['lcoe'] = result.get('lcoe')
@@ -496,6 +493,8 @@ def render_sites_infrastructure_tab():
         zoom_level = 13
     
     # Create infrastructure map
+    import folium
+    from streamlit_folium import st_folium
     m = folium.Map(
         location=center_coords,
         zoom_start=zoom_level,
@@ -615,7 +614,7 @@ def render_sites_infrastructure_tab():
         # Load stage completion from Google Sheets
         from app.utils.site_backend import load_site_stage_result
         for stage_key in ['screening', 'concept', 'preliminary', 'detailed']:
-            result = load_site_stage_result(site_key, stage_key)
+            result = load_site_stage_result(site_key, stage_key, include_dispatch=False)
             if result and result.get('complete'):
                 site_tracker['stages'][stage_key]['complete'] = True
                 site_tracker['stages'][stage_key]['lcoe'] = result.get('lcoe')
@@ -836,6 +835,8 @@ def render_portfolio_map_tab():
                 zoom_level = 4
         
         # Create map
+        import folium
+        from streamlit_folium import st_folium
         m = folium.Map(
             location=map_center,
             zoom_start=zoom_level,
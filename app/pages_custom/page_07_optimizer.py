@@ -109,8 +109,17 @@ def render():
                         load_profile_dr = st.session_state.load_profile_dr
                         
                         st.info("🚀 Using bvNexus MILP optimizer (100% feasibility guaranteed)")
+                        progress_bar = st.progress(0.0, text="Starting scenarios...")
                         
-                        # Run all scenarios with MILP
+                        def show_progress(progress):
+                            running = ', '.join(progress['running']) or '-'
+                            progress_bar.progress(
+                                progress['fraction'],
+                                text=f"{progress['completed']}/{progress['total']} scenarios done "
+                                     f"({progress['elapsed_s']:.0f}s) - running: {running}"
+                            )
+                        
+                        # Run all scenarios with MILP (in parallel worker processes)
                         results = run_all_scenarios(
                             site=site,
                             constraints=constraints,
@@ -118,7 +127,8 @@ def render():
                             scenarios=scenarios,
                             grid_config=None,
                             use_milp=True,
-                            load_profile_dr=load_profile_dr
+                            load_profile_dr=load_profile_dr,
+                            progress_callback=show_progress,
                         )
                         
                         # Store results
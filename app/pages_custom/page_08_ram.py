@@ -8,31 +8,35 @@ import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict
 
+from app.utils.capacity_outage import COPT
+from app.utils.reliability_simulation import UNIT_RELIABILITY, simulate_reliability
 
-def calculate_ram_metrics(equipment_config: Dict) -> Dict:
+
+def calculate_ram_metrics(equipment_config: Dict, load_8760_mw=None) -> Dict:
     """
     Calculate RAM metrics for equipment configuration
     
-    Based on IEEE 493 (Gold Book) and typical industry data
+    Based on IEEE 493 (Gold Book) and typical industry data. results['copt']
+    holds the whole-fleet capacity outage table summary (N-1 / N-2
+    probabilities; hourly LOLE / EUE with a load). With an 8760 load
+    profile, also runs the sequential Monte Carlo loss-of-load simulation
+    (LOLE / EUE / LOLP) into results['monte_carlo'].
     """
     
     # Typical MTBF and MTTR values (hours)
     equipment_params = {
         'recip': {
-            'mtbf': 8760,  # 1 year typical
-            'mttr': 72,    # 3 days
+            **UNIT_RELIABILITY['recip'],  # 1 year / 3 days
             'availability': 0.992,
             'forced_outage_rate': 0.008
         },
         'turbine': {
-            'mtbf': 17520,  # 2 years typical
-            'mttr': 168,    # 1 week
+            **UNIT_RELIABILITY['turbine'],  # 2 years / 1 week
             'availability': 0.990,
             'forced_outage_rate': 0.010
         },
         'bess': {
-            'mtbf': 43800,  # 5 years
-            'mttr': 24,     # 1 day
+            **UNIT_RELIABILITY['bess'],  # 5 years / 1 day
             'availability': 0.9995,
             'forced_outage_rate': 0.0005
         },
@@ -43,8 +47,7 @@ def calculate_ram_metrics(equipment_config: Dict) -> Dict:
             'forced_outage_rate': 0.0005
         },
         'grid': {
-            'mtbf': 4380,   # 6 months (varies widely)
-            'mttr': 4,      # 4 hours
+            **UNIT_RELIABILITY['grid'],  # 6 months / 4 hours (varies widely)
             'availability': 0.999,
             'forced_outage_rate': 0.001
         }
@@ -193,6 +196,15 @@ def calculate_ram_metrics(equipment_config: Dict) -> Dict:
     # Expected downtime hours per year
     results['expected_downtime_hours_per_year'] = 8760 * (1 - results['system_availability'])
     
+    # Whole-fleet capacity outage distribution (all technologies convolved)
+    has_load = load_8760_mw is not None and len(load_8760_mw) >= 8760
+    copt = COPT.from_equipment(equipment_config)
+    results['copt'] = copt.summary(load_8760_mw[:8760] if has_load else None)
+    
+    # Hours of shortfall against the real 8760 load, with BESS and grid in the mix
+    if has_load:
+        results['monte_carlo'] = simulate_reliability(equipment_config, load_8760_mw)
+    
     return results
 
 
@@ -223,12 +235,14 @@ def render():
         - IEEE 493 Gold Book standards
         - Industry-typical MTBF/MTTR values
         - Parallel redundancy calculations
+        - Sequential Monte Carlo loss of load against the 8760 load profile
         """)
     
     with col_ram2:
         if st.button("📊 Calculate RAM", type="primary", use_container_width=True):
             with st.spinner("Calculating reliability metrics..."):
-                ram_results = calculate_ram_metrics(result['equipment_config'])
+                ram_results = calculate_ram_metrics(result['equipment_config'],
+                                                    st.session_state.get('load_8760_mw'))
                 st.session_state.ram_results = ram_results
                 st.success("✅ RAM analysis complete!")
                 st.rerun()
@@ -261,6 +275,58 @@ def render():
             st.metric("Expected Uptime", f"{uptime:.0f} hrs/yr")
             st.caption(f"{uptime/8760:.2%} of year")
         
+        # Loss of load (sequential Monte Carlo)
+        mc = ram.get('monte_carlo')
+        st.markdown("---")
+        st.markdown("#### 🎲 Loss of Load (Sequential Monte Carlo)")
+        if mc:
+            col_l1, col_l2, col_l3, col_l4 = st.columns(4)
+            
+            with col_l1:
+                st.metric("LOLE", f"{mc['lole_hours_per_year']:.2f} hrs/yr")
+                st.caption(f"95% CI {mc['lole_ci95'][0]:.2f}–{mc['lole_ci95'][1]:.2f}")
+            
+            with col_l2:
+                st.metric("EUE", f"{mc['eue_mwh_per_year']:,.1f} MWh/yr")
+                st.caption(f"95% CI {mc['eue_ci95'][0]:,.1f}–{mc['eue_ci95'][1]:,.1f} ({mc['eue_ppm']:.1f} ppm)")
+            
+            with col_l3:
+                st.metric("LOLP", f"{mc['lolp']:.4%}")
+                st.caption(f"95% CI {mc['lolp_ci95'][0]:.4%}–{mc['lolp_ci95'][1]:.4%}")
+            
+            with col_l4:
+                st.metric("Loss-of-Load Events", f"{mc['lolf_events_per_year']:.2f} /yr")
+                st.caption(f"P90 year: {mc['lole_percentiles']['p90']:.1f} hrs")
+            
+            st.caption(f"{mc['years_simulated']:,} simulated years on {mc['workers']} worker(s) "
+                       f"in {mc['runtime_s']:.1f}s; forced outages only")
+        else:
+            st.info("ℹ️ Build an 8760 load profile on the Load page to estimate LOLE / EUE")
+        
+        # Capacity outage probability table (whole fleet, capacity only)
+        copt = ram.get('copt')
+        if copt and copt['n_units'] > 0:
+            st.markdown("---")
+            st.markdown("#### 📉 Capacity Outage Probability (COPT)")
+            col_c1, col_c2, col_c3, col_c4 = st.columns(4)
+            
+            with col_c1:
+                st.metric("All Units Up", f"{copt['p_units_out']['0']:.4%}")
+                st.caption(f"{copt['n_units']} units, {copt['installed_mw']:,.0f} MW")
+            
+            with col_c2:
+                st.metric("Within N-1", f"{copt['p_within_n_minus_1']:.4%}")
+                st.caption("At most one unit out")
+            
+            with col_c3:
+                st.metric("Within N-2", f"{copt['p_within_n_minus_2']:.4%}")
+                st.caption("At most two units out")
+            
+            with col_c4:
+                if 'lole_hours_per_year' in copt:
+                    st.metric("LOLE (capacity only)", f"{copt['lole_hours_per_year']:.2f} hrs/yr")
+                    st.caption(f"EUE {copt['eue_mwh_per_year']:,.1f} MWh/yr; no storage energy limits")
+        
         # Equipment details table
         st.markdown("---")
         st.markdown("#### ⚙️ Equipment Reliability Details")
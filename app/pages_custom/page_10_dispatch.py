@@ -402,9 +402,9 @@ def render():
         st.markdown("---")
         with st.expander("🔬 High-Resolution Transient Analysis (Second-Level)", expanded=False):
             st.markdown("#### Detailed Power Quality Analysis")
-            st.caption("Simulate transient events with 1-second resolution")
+            st.caption("Simulate transient events at resolutions down to 10 ms")
             
-            col_trans1, col_trans2, col_trans3 = st.columns(3)
+            col_trans1, col_trans2, col_trans3, col_trans4 = st.columns(4)
             
             with col_trans1:
                 event_type = st.selectbox("Event Type", [
@@ -420,15 +420,20 @@ def render():
             with col_trans3:
                 magnitude = st.slider("Event Magnitude (%)", 5, 50, 20)
             
+            with col_trans4:
+                resolution = st.selectbox("Resolution", [1.0, 0.1, 0.01], index=1,
+                                          format_func=lambda x: f"{x * 1000:.0f} ms")
+            
             if st.button("⚡ Run High-Res Simulation", type="primary"):
-                with st.spinner("Running second-level transient simulation..."):
+                with st.spinner("Running high-resolution transient simulation..."):
                     from app.utils.highres_transient import generate_high_res_transient, calculate_power_quality_metrics
                     
                     transient_data = generate_high_res_transient(
                         base_load_mw=base_load,
                         event_type=event_type,
                         duration_seconds=duration,
-                        event_magnitude_pct=magnitude
+                        event_magnitude_pct=magnitude,
+                        resolution_s=resolution
                     )
                     
                     pq_metrics = calculate_power_quality_metrics(transient_data)
@@ -444,22 +449,26 @@ def render():
                 pq = st.session_state.pq_metrics
                 
                 st.markdown("---")
-                col_pq1, col_pq2, col_pq3, col_pq4 = st.columns(4)
+                col_pq1, col_pq2, col_pq3, col_pq4, col_pq5, col_pq6 = st.columns(6)
                 
                 with col_pq1:
                     st.metric("Max Freq Dev", f"{pq['max_frequency_deviation_hz']:.3f} Hz")
                 with col_pq2:
-                    st.metric("Max Ramp", f"{pq['max_ramp_rate_mw_s']:.1f} MW/s")
+                    st.metric("Nadir", f"{pq['frequency_nadir_hz']:.2f} Hz")
                 with col_pq3:
-                    st.metric("BESS Response", f"{pq['bess_max_response_mw']:.1f} MW")
+                    st.metric("RoCoF", f"{pq['rocof_hz_s']:.2f} Hz/s")
                 with col_pq4:
+                    st.metric("Max Ramp", f"{pq['max_ramp_rate_mw_s']:.1f} MW/s")
+                with col_pq5:
+                    st.metric("BESS Response", f"{pq['bess_max_response_mw']:.1f} MW")
+                with col_pq6:
                     st.metric("Stabilize Time", f"{pq['time_to_stabilize_s']:.0f} s")
                 
                 fig_highres = go.Figure()
                 fig_highres.add_trace(go.Scatter(x=trans_data['time'], y=trans_data['load_mw'], mode='lines', name='Load', line=dict(color='blue', width=2)))
                 fig_highres.add_trace(go.Scatter(x=trans_data['time'], y=trans_data['generator_response_mw'], mode='lines', name='Generator', line=dict(color='green', width=2)))
                 fig_highres.add_trace(go.Scatter(x=trans_data['time'], y=trans_data['bess_response_mw'], mode='lines', name='BESS', line=dict(color='orange', width=2)))
-                fig_highres.update_layout(title="Transient Response (1-second resolution)", xaxis_title="Time (s)", yaxis_title="Power (MW)", height=400)
+                fig_highres.update_layout(title=f"Transient Response ({trans_data.get('resolution_s', 1.0) * 1000:.0f} ms resolution)", xaxis_title="Time (s)", yaxis_title="Power (MW)", height=400)
                 st.plotly_chart(fig_highres, use_container_width=True)
         
         # Export options
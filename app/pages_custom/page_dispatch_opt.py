@@ -11,6 +11,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from app.utils.profile_cache import cached_profile
+from app.utils.profile_engine import ProfileEngine
+
 
 def render():
     st.markdown("### 📈 Dispatch")
@@ -235,58 +238,72 @@ def load_actual_8760_profile(site_obj: dict, site_name: str, year_num: int) -> n
     return generate_realistic_dc_load(base_load)
 
 
-def generate_realistic_dc_load(base_load_mw: float) -> np.ndarray:
+def generate_realistic_dc_load(base_load_mw: float, seed: int = 42) -> np.ndarray:
     """Generate realistic data center load profile (much more stable than random)"""
     
-    hours = 8760
-    load_profile = np.zeros(hours)
-    
-    for h in range(hours):
-        day_of_week = (h // 24) % 7
-        hour_of_day = h % 24
-        day_of_year = h // 24
+    def build():
+        engine = ProfileEngine(seed)
         
         # Data centers have very stable load with small variations
-        # Base load with minimal hourly variation (±1-2%)
-        hourly_variation = 1.0 + np.random.normal(0, 0.01)
-        
-        # Slight daily pattern (0.98-1.02 range)
-        daily_factor = 1.0 + 0.01 * np.sin((hour_of_day - 12) * np.pi / 12)
-        
-        # Weekday vs weekend (weekends slightly lower, 2-3%)
-        weekend_factor = 0.97 if day_of_week >= 5 else 1.0
-        
-        # Seasonal variation (±3% summer vs winter for cooling)
-        seasonal_factor = 1.0 + 0.03 * np.sin((day_of_year - 180) * 2 * np.pi / 365)
-        
-        load_profile[h] = base_load_mw * hourly_variation * daily_factor * weekend_factor * seasonal_factor
+        return engine.build(
+            base_load_mw,
+            factors=[
+                # Slight daily pattern (0.98-1.02 range)
+                engine.daily_sine(0.01, shift=12),
+                # Weekday vs weekend (weekends slightly lower, 2-3%)
+                engine.weekend(0.97),
+                # Seasonal variation (±3% summer vs winter for cooling)
+                engine.seasonal_sine(0.03, shift=180),
+            ],
+            # Base load with minimal hourly variation (±1-2%)
+            noise=engine.normal(1.0, 0.01),
+        )
     
-    return load_profile
+    if seed is None:
+        return build()
+    return cached_profile('dispatch_opt_dc_load/v1', (float(base_load_mw), seed), build)
+
 
+DISPATCH_COLUMNS = ['hour', 'load_mw', 'solar_mw', 'recip_mw', 'turbine_mw', 'bess_mw', 'grid_mw', 'unserved_mw']
 
-def generate_8760_dispatch(equipment: dict, load_profile_8760: np.ndarray) -> pd.DataFrame:
-    """Generate 8760 hourly dispatch based on actual equipment and load profile"""
+
+def generate_8760_dispatch(equipment: dict, load_profile_8760: np.ndarray, seed: int = 42) -> pd.DataFrame:
+    """Generate 8760 hourly dispatch based on actual equipment and load profile
+    
+    Cached by (equipment, load profile, seed), so reruns of the page reuse the
+    first simulation instead of repeating the hourly loop.
+    """
+    load_profile_8760 = np.asarray(load_profile_8760, dtype=float)
+    columns = cached_profile(
+        'dispatch_opt_synthetic/v1', (equipment, load_profile_8760, seed),
+        lambda: {
+            name: values.to_numpy()
+            for name, values in _simulate_8760_dispatch(equipment, load_profile_8760, seed).items()
+        },
+    )
+    return pd.DataFrame({name: np.array(columns[name]) for name in DISPATCH_COLUMNS})
+
+
+def _simulate_8760_dispatch(equipment: dict, load_profile_8760: np.ndarray, seed: int) -> pd.DataFrame:
+    """Uncached body of generate_8760_dispatch."""
     
     hours = list(range(8760))
     load_mw = load_profile_8760.tolist()
     
     # Solar generation (follows sun pattern with cloud transients)
     solar_capacity = equipment.get('solar_mw', 0)
-    solar_mw = []
-    for h in range(8760):
-        day_of_year = h // 24
-        hour_of_day = h % 24
-        
-        if 6 <= hour_of_day <= 18:  # Daylight hours
-            # Sun angle
-            sun_intensity = np.sin((hour_of_day - 6) * np.pi / 12)
+    engine = ProfileEngine(seed)
+    solar_mw = engine.build(
+        solar_capacity * 0.25,
+        factors=[
+            # Sun angle (daylight hours 6-18)
+            engine.solar_day('sine', start=6, end=18),
             # Seasonal variation (better in summer)
-            seasonal = 1.0 + 0.15 * np.sin((day_of_year - 80) * 2 * np.pi / 365)
-            # Cloud factor (random 0.7-1.0)
-            cloud_factor = 0.7 + 0.3 * np.random.random()
-            solar_mw.append(solar_capacity * sun_intensity * seasonal * cloud_factor * 0.25)
-        else:
-            solar_mw.append(0)
+            engine.seasonal_sine(0.15, shift=80),
+        ],
+        # Cloud factor (random 0.7-1.0)
+        noise=engine.uniform(0.7, 1.0),
+    ).tolist()
     
     # Dispatch logic: Economically optimal stack
     recip_mw = []
@@ -473,10 +490,10 @@ def render_transient_chart(hour_of_year: int, equipment: dict, dispatch_df: pd.D
     base_bess = dispatch_df.iloc[hour_idx]['bess_mw']
     
     # Add second-by-second fluctuations (data centers have very stable load)
-    np.random.seed(hour_of_year)
+    rng = np.random.default_rng(hour_of_year)
     
-    load_transient = base_load + np.random.normal(0, base_load * 0.005, 300)  # ±0.5% fluctuation (data centers are stable)
-    solar_transient = base_solar + np.random.normal(0, base_solar * 0.05, 300) if base_solar > 0 else [0] * 300
+    load_transient = base_load + rng.normal(0, base_load * 0.005, 300)  # ±0.5% fluctuation (data centers are stable)
+    solar_transient = base_solar + rng.normal(0, base_solar * 0.05, 300) if base_solar > 0 else [0] * 300
     recip_transient = [base_recip] * 300  # Steady
     turbine_transient = [base_turbine] * 300  # Steady
     
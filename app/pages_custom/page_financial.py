@@ -128,23 +128,23 @@ def render():
         npv_m = npv / 1_000_000
         st.metric("NPV", f"${npv_m:.1f}M", help="Net Present Value over 15 years")
     
+    # IRR and payback from the pro forma cash flows
+    from app.utils.financial_calculations import irr_block, payback_block
+    pro_forma_df = generate_pro_forma(equipment, capex, site_obj)
+    pro_forma_cf = pro_forma_df['Cash Flow ($M)'].to_numpy()
+    
     with col_m3:
-        # Calculate simple IRR estimate
-        total_capex = sum([capex.get('recip', 0), capex.get('turbine', 0), 
-                          capex.get('solar', 0), capex.get('bess', 0)])
-        irr_estimate = (abs(npv) / total_capex * 100) if total_capex > 0 else 0
-        st.metric("IRR (est)", f"{min(irr_estimate, 15):.1f}%", help="Estimated Internal Rate of Return")
+        irr = float(irr_block(pro_forma_cf))
+        st.metric("IRR", f"{irr:.1f}%" if np.isfinite(irr) else "—", help="Internal Rate of Return (15-year pro forma)")
     
     with col_m4:
-        # Payback = Total CapEx / Annual Savings
-        payback = (total_capex / (abs(npv) / 15)) if abs(npv) > 0 else 15
-        st.metric("Payback", f"{min(payback, 15):.1f} years", help="Simple payback period")
+        payback = float(payback_block(pro_forma_cf))
+        st.metric("Payback", f"{payback:.1f} years" if payback <= 15 else "> 15 years", help="Payback on pro forma cash flows")
     
     st.markdown("---")
     
     # 15-Year Pro Forma
     st.markdown("#### 15-Year Pro Forma")
-    pro_forma_df = generate_pro_forma(equipment, capex, site_obj)
     
     # Display as table
     st.dataframe(
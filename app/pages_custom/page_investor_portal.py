@@ -41,7 +41,7 @@ def render():
         found_result = False
         for stage in ['detailed', 'preliminary', 'concept', 'screening']:
             try:
-                result = load_site_stage_result(site_name, stage)
+                result = load_site_stage_result(site_name, stage, include_dispatch=False)
                 if result and str(result.get('complete', '')).upper() == 'TRUE':
                     # Calculate financial metrics
                     financials = calculate_site_financials(site, result)
@@ -184,6 +184,45 @@ def render():
     
     st.markdown("---")
     
+    # =============================================================================
+    # Portfolio Risk (Monte Carlo + Sensitivity)
+    # =============================================================================
+    st.markdown("### Portfolio Risk")
+    st.caption("Gas price, CapEx and discount rate uncertainty across all sites at once")
+    
+    from app.utils.financial_calculations import monte_carlo_portfolio, sensitivity_tornado
+    from config.settings import FINANCIAL_MC_DRAWS
+    
+    col_risk1, col_risk2 = st.columns([1, 3])
+    with col_risk1:
+        n_draws = st.select_slider("Monte Carlo Draws", options=[1_000, 5_000, 10_000, 50_000],
+                                   value=FINANCIAL_MC_DRAWS if FINANCIAL_MC_DRAWS in (1_000, 5_000, 10_000, 50_000) else 10_000)
+        gas_volatility = st.slider("Gas Price Volatility", 0.1, 0.6, 0.3, 0.05,
+                                   help="Lognormal sigma around the base gas price")
+    
+    mc = monte_carlo_portfolio(portfolio_data, n_draws=n_draws, seed=42, gas_price_volatility=gas_volatility)
+    
+    with col_risk2:
+        col_r1, col_r2, col_r3, col_r4 = st.columns(4)
+        col_r1.metric("NPV P10", f"${mc['portfolio_npv_m']['p10']:,.1f}M")
+        col_r2.metric("NPV P50", f"${mc['portfolio_npv_m']['p50']:,.1f}M")
+        col_r3.metric("NPV P90", f"${mc['portfolio_npv_m']['p90']:,.1f}M")
+        col_r4.metric("P(NPV < 0)", f"{mc['prob_npv_negative'] * 100:.1f}%",
+                      help=f"Portfolio IRR P50 {mc['portfolio_irr_pct']['p50']:.1f}%")
+        st.caption(f"{mc['n_draws']:,} draws x {mc['n_sites']} sites in {mc['runtime_s']:.2f}s")
+    
+    col_chart5, col_chart6 = st.columns(2)
+    
+    with col_chart5:
+        from app.utils.investor_charts import create_npv_distribution_chart
+        st.plotly_chart(create_npv_distribution_chart(mc), use_container_width=True)
+    
+    with col_chart6:
+        from app.utils.investor_charts import create_tornado_chart
+        st.plotly_chart(create_tornado_chart(sensitivity_tornado(portfolio_data)), use_container_width=True)
+    
+    st.markdown("---")
+    
     # =============================================================================
     # Export Options
     # =============================================================================
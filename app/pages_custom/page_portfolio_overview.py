@@ -89,7 +89,7 @@ def render():
         latest_result = None
         
         for stage in ['detailed', 'preliminary', 'concept', 'screening']:
-            result = load_site_stage_result(site_name, stage)
+            result = load_site_stage_result(site_name, stage, include_dispatch=False)
             if result and str(result.get('complete', '')).upper() == 'TRUE':
                 stages_complete.append(stage)
                 if not latest_result:
@@ -148,7 +148,7 @@ def render():
                 try:
                     #  Use GreenfieldHeuristicV2 instead of old GreenFieldHeuristic
                     from app.optimization import GreenfieldHeuristicV2
-                    import gspread
+                    from app.utils.sheets_pool import get_sheets_client
                     from config.settings import GOOGLE_SHEET_ID
                     
                     print("\n" + "=" * 80)
@@ -171,7 +171,7 @@ def render():
                     
                     # Connect to backend
                     try:
-                        gc = gspread.service_account(filename='credentials.json')
+                        gc = get_sheets_client('credentials.json')
                         spreadsheet_id = GOOGLE_SHEET_ID
                     except Exception as e:
                         print(f"Warning: Could not connect to backend: {e}")
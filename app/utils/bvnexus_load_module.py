@@ -23,6 +23,8 @@ from enum import Enum
 import math
 import json
 
+import numpy as np
+
 
 # =============================================================================
 # SECTION 1: ENUMERATIONS AND CONSTANTS
@@ -1118,8 +1120,8 @@ def get_load_profile_multipliers(
     Returns:
         List of hourly multipliers (0.7 - 1.0 range typical)
     """
-    import random
-    random.seed(42)  # Reproducible results
+    from app.utils.profile_engine import ProfileEngine
+    engine = ProfileEngine(seed=42, hours=hours)  # Reproducible results
     
     mix = workload_mix.to_dict()
     
@@ -1136,25 +1138,17 @@ def get_load_profile_multipliers(
         for wtype, frac in mix.items()
     )
     
-    multipliers = []
-    for h in range(hours):
-        # Base load (high for data centers)
-        base = 0.85
-        
-        # Add time-of-day pattern (slight)
-        hour_of_day = h % 24
-        tod_factor = 1.0 + 0.05 * math.sin(2 * math.pi * (hour_of_day - 6) / 24)
-        
-        # Add random variation based on workload mix
-        random_factor = 1.0 + random.gauss(0, weighted_variability)
-        random_factor = max(0.7, min(1.1, random_factor))
-        
-        multiplier = base * tod_factor * random_factor
-        multiplier = max(0.5, min(1.0, multiplier))
-        
-        multipliers.append(multiplier)
+    # Base load (high for data centers) with a slight time-of-day pattern
+    # and random variation based on workload mix
+    random_factor = np.clip(engine.normal(1.0, weighted_variability), 0.7, 1.1)
+    multipliers = engine.build(
+        0.85,
+        factors=[engine.daily_sine(0.05, shift=6)],
+        noise=random_factor,
+        clip=(0.5, 1.0),
+    )
     
-    return multipliers
+    return multipliers.tolist()
 
 
 # =============================================================================
@@ -78,8 +78,6 @@ except ImportError:
     )
 
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("bvnexus.load_wrapper")
 
 
@@ -6,6 +6,8 @@ Core engineering calculations for the optimizer
 from typing import List, Dict, Tuple
 import numpy as np
 
+from app.utils.capacity_outage import units_out_pmf
+
 
 def calculate_lcoe(
     capex: float,
@@ -106,15 +108,14 @@ def calculate_availability(
         if len(equipment_availabilities) != n:
             raise ValueError(f"Expected {n} availabilities, got {len(equipment_availabilities)}")
         
-        # Assume all units have same availability
-        p = equipment_availabilities[0]
+        if k > n:
+            return 0.0
+        if k <= 0:
+            return 1.0
         
-        # Sum probability of k or more working
-        from math import comb
-        availability = 0
-        for i in range(k, n + 1):
-            availability += comb(n, i) * (p ** i) * ((1 - p) ** (n - i))
-        return availability
+        # At least k working = at most n - k out; units may differ in availability
+        out_pmf = units_out_pmf([1 - a for a in equipment_availabilities])
+        return float(out_pmf[:n - k + 1].sum())
     
     else:
         raise ValueError(f"Unknown configuration: {configuration}")
@@ -19,10 +19,16 @@ Replacement: app.optimization.milp_model_dr handles equipment selection and depl
 in a single unified MILP that solves in 30-60 seconds.
 """
 
-from typing import List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 from itertools import product
+import multiprocessing
+import time
 import numpy as np
 from app.utils.phased_optimizer import PhasedDeploymentOptimizer
+from app.utils.scenario_runner import DONE, FAILED, ScenarioRunner, default_worker_count
+
+# Combination state when the time limit ran out before it started
+SKIPPED = 'skipped'
 
 
 class CombinationOptimizer:
@@ -36,11 +42,12 @@ class CombinationOptimizer:
     4. Return best combination
     """
     
-    def __init__(self, site: Dict, scenario: Dict, equipment_data: Dict, constraints: Dict):
+    def __init__(self, site: Dict, scenario: Dict, equipment_data: Dict, constraints: Dict, method: str = 'de'):
         self.site = site
         self.scenario = scenario
         self.equipment_data = equipment_data
         self.constraints = constraints
+        self.method = method  # PhasedDeploymentOptimizer solve mode: 'de' or 'milp'
         
         # Get equipment types available in scenario
         self.available_recip = scenario.get('Recip_Enabled', True)
@@ -255,7 +262,7 @@ class CombinationOptimizer:
         )
         
         # Optimize temporal deployment with seeds
-        deployment, lcoe, violations = optimizer.optimize(seed_deployments=seed_deployments)
+        deployment, lcoe, violations = optimizer.optimize(seed_deployments=seed_deployments, method=self.method)
         
         # Calculate total power delivered over planning horizon
         total_power = 0
@@ -276,72 +283,109 @@ class CombinationOptimizer:
         
         return deployment, lcoe, violations, total_power, critical_path_months
     
-    def optimize_all(self) -> List[Dict]:
+    def optimize_all(
+        self,
+        max_workers: int = None,
+        time_limit: float = None,
+        progress_callback: Callable[[Dict], None] = None,
+    ) -> List[Dict]:
         """
         Test all equipment combinations and return ranked results.
         
+        Combinations run tier by tier (1-tech, 2-tech, ...). Every combination
+        in a tier runs in parallel and is seeded with the feasible deployments
+        of all lower tiers, so results do not depend on the worker count.
+        
+        Args:
+            max_workers: Worker processes per tier (default: one per
+                combination, capped at the CPU count; 1 = run in-process)
+            time_limit: Wall-clock cap in seconds for the whole search;
+                combinations still running are stopped and later tiers skipped
+            progress_callback: Called with ScenarioRunner.progress() snapshots
+        
         Returns list of results sorted by:
         1. Feasibility (feasible first)
         2. Total power delivered (descending)
         3. LCOE (ascending)
+        
+        Per-combination wall-clock times are in each result's 'elapsed_s' and,
+        including combinations that failed, timed out or were skipped, in
+        self.combination_timings.
         """
         combinations = self.generate_combinations()
         
-        # Sort combinations by complexity (number of enabled technologies)
-        # This ensures we run simpler combinations first to seed complex ones
-        combinations.sort(key=lambda c: sum([c.get('recip',0), c.get('turbine',0), c.get('bess',0), c.get('solar',0), c.get('grid',0)]))
+        # Group combinations by complexity (number of enabled technologies)
+        # so simpler tiers finish first and seed the complex ones
+        tiers: Dict[int, List[Dict]] = {}
+        for combo in combinations:
+            tiers.setdefault(_complexity(combo), []).append(combo)
         
         results = []
-        feasible_deployments = []  # Store feasible deployments to seed future runs
+        feasible_deployments = []  # Feasible deployments of completed tiers
+        self.combination_timings = []
+        started = time.perf_counter()
+        deadline = started + time_limit if time_limit else None
         
         print(f"\n{'='*80}")
-        print(f"🔍 COMBINATION OPTIMIZER - Testing {len(combinations)} equipment combinations")
+        print(f"🔍 COMBINATION OPTIMIZER - Testing {len(combinations)} equipment combinations "
+              f"in {len(tiers)} tiers")
         print(f"{'='*80}")
         
-        for idx, combo in enumerate(combinations):
-            combo_name = combo['name']
+        for tier in sorted(tiers):
+            tier_combos = tiers[tier]
+            remaining = deadline - time.perf_counter() if deadline else None
+            if remaining is not None and remaining <= 0:
+                for combo in tier_combos:
+                    self.combination_timings.append(
+                        {'name': combo['name'], 'tier': tier, 'state': SKIPPED, 'elapsed_s': 0.0, 'error': 'Time limit reached'}
+                    )
+                print(f"\n⏱️ Time limit reached - skipping {len(tier_combos)} {tier}-tech combinations")
+                continue
+            
+            print(f"\n[Tier {tier}] {len(tier_combos)} combinations, "
+                  f"{len(feasible_deployments)} seed deployments")
             
-            print(f"\n[{idx+1}/{len(combinations)}] Testing: {combo_name}")
-            print(f"  Equipment: ", end="")
-            enabled_types = [k.capitalize() for k, v in combo.items() if k != 'name' and v]
-            print(" + ".join(enabled_types))
+            # Seeds are the lower tiers' feasible deployments only, never same-tier ones
+            outcomes, timings = self._run_tier(
+                tier_combos, list(feasible_deployments), max_workers, remaining, deadline, progress_callback
+            )
             
-            try:
-                # Pass all previously found feasible deployments as seeds
-                # The optimizer will automatically map them to the current problem
-                deployment, lcoe, violations, power, critical_path = self.optimize_combination(combo, seed_deployments=feasible_deployments)
+            for combo, outcome, timing in zip(tier_combos, outcomes, timings):
+                timing['tier'] = tier
+                self.combination_timings.append(timing)
+                if outcome is None:
+                    print(f"  ⚠️ {combo['name']}: {timing['state'].upper()} - {timing['error']}")
+                    continue
                 
+                deployment, lcoe, violations, power, critical_path = outcome
                 is_feasible = len(violations) == 0
                 
                 if is_feasible:
-                    # Store this feasible deployment to seed future complex runs
+                    # Store this feasible deployment to seed the next tiers
                     feasible_deployments.append(deployment)
                 
-                result = {
+                results.append({
                     'combination': combo,
-                    'combination_name': combo_name,
+                    'combination_name': combo['name'],
                     'deployment': deployment,
                     'lcoe': lcoe,
                     'violations': violations,
                     'total_power_delivered': power,
                     'critical_path_months': critical_path,
-                    'feasible': is_feasible
-                }
+                    'feasible': is_feasible,
+                    'tier': tier,
+                    'elapsed_s': timing['elapsed_s'],
+                })
                 
                 if is_feasible:
-                    print(f"  ✅ FEASIBLE: {power:.0f} MW-years, LCOE ${lcoe:.2f}/MWh, Timeline {critical_path} months")
+                    print(f"  ✅ {combo['name']} FEASIBLE: {power:.0f} MW-years, LCOE ${lcoe:.2f}/MWh, "
+                          f"Timeline {critical_path} months ({timing['elapsed_s']:.1f}s)")
                 else:
-                    print(f"  ❌ INFEASIBLE: {len(violations)} violations")
+                    print(f"  ❌ {combo['name']} INFEASIBLE: {len(violations)} violations ({timing['elapsed_s']:.1f}s)")
                     for v in violations[:3]:  # Show first 3 violations
                         print(f"      - {v}")
-                
-                results.append(result)
-            
-            except Exception as e:
-                print(f"  ⚠️ ERROR: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                continue
+        
+        print(f"\n⏱️ Combination search: {time.perf_counter() - started:.1f}s wall clock")
         
         # Sort results: feasible first, then by power delivered, then by LCOE
         feasible = [r for r in results if r['feasible']]
@@ -371,3 +415,68 @@ class CombinationOptimizer:
                 print(f"\nLeast violations: {infeasible[0]['combination_name']} ({len(infeasible[0]['violations'])} violations)")
         
         return ranked_results
+    
+    def _run_tier(self, combos, seed_deployments, max_workers, remaining, deadline, progress_callback):
+        """
+        Optimize one tier's combinations; returns (outcomes, timings) in combo order.
+        
+        Outcomes are optimize_combination() tuples, or None for combinations
+        that failed, timed out or were cancelled.
+        """
+        if max_workers is None:
+            max_workers = default_worker_count(len(combos))
+        # Daemonic workers (e.g. inside a ScenarioRunner sweep) cannot start processes
+        if multiprocessing.current_process().daemon:
+            max_workers = 1
+        
+        if max_workers == 1:
+            outcomes, timings = [], []
+            for combo in combos:
+                if deadline is not None and time.perf_counter() > deadline:
+                    outcomes.append(None)
+                    timings.append({'name': combo['name'], 'state': SKIPPED, 'elapsed_s': 0.0, 'error': 'Time limit reached'})
+                    continue
+                t0 = time.perf_counter()
+                try:
+                    outcomes.append(self.optimize_combination(combo, seed_deployments=seed_deployments))
+                    timings.append({'name': combo['name'], 'state': DONE, 'elapsed_s': time.perf_counter() - t0, 'error': None})
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    outcomes.append(None)
+                    timings.append({'name': combo['name'], 'state': FAILED, 'elapsed_s': time.perf_counter() - t0, 'error': str(e)})
+            return outcomes, timings
+        
+        runner = ScenarioRunner(max_workers=max_workers, timeout=remaining)
+        
+        def on_progress(progress):
+            if deadline is not None and time.perf_counter() > deadline and not runner.cancelled:
+                runner.cancel()
+            if progress_callback is not None:
+                progress_callback(progress)
+        
+        common = dict(site=self.site, scenario=self.scenario, equipment_data=self.equipment_data,
+                      constraints=self.constraints, seed_deployments=seed_deployments, method=self.method)
+        outcomes = runner.run(
+            _optimize_combination_worker,
+            [dict(common, combo=combo) for combo in combos],
+            names=[combo['name'] for combo in combos],
+            progress_callback=on_progress,
+        )
+        timings = [
+            {'name': status['name'], 'state': status['state'], 'elapsed_s': status['elapsed_s'], 'error': status['error']}
+            for status in runner.progress()['scenarios']
+        ]
+        return outcomes, timings
+
+
+def _complexity(combo: Dict) -> int:
+    """Number of enabled technologies in a combination."""
+    return sum(bool(combo.get(k, False)) for k in ('recip', 'turbine', 'bess', 'solar', 'grid'))
+
+
+def _optimize_combination_worker(site: Dict, scenario: Dict, equipment_data: Dict, constraints: Dict,
+                                 combo: Dict, seed_deployments: List[Dict], method: str = 'de'):
+    """Process-pool entry point: optimize one combination."""
+    optimizer = CombinationOptimizer(site, scenario, equipment_data, constraints, method=method)
+    return optimizer.optimize_combination(combo, seed_deployments=seed_deployments)
@@ -8,13 +8,10 @@ import yaml
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+import numpy as np
+
 # Try to import Google Sheets library
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
+from app.utils.sheets_pool import get_sheets_client, get_sheets_pool, WorksheetNotFound
 
 
 def load_equipment_library(config_path: Optional[Path] = None) -> Dict[str, List[Dict]]:
@@ -72,11 +69,6 @@ def load_equipment_from_sheets(
         credentials_path = str(Path(__file__).parent.parent.parent / "credentials.json")
     
     try:
-        client = get_google_sheets_client(credentials_path)
-        spreadsheet = client.open_by_key(sheet_id)
-        
-        equipment_data = {}
-        
         # Load each equipment type from its worksheet
         worksheets = [
             "Reciprocating_Engines",
@@ -86,29 +78,20 @@ def load_equipment_from_sheets(
             "Grid_Connection"
         ]
         
-        for worksheet_name in worksheets:
-            try:
-                worksheet = spreadsheet.worksheet(worksheet_name)
-                records = worksheet.get_all_records()
-                
-                # Convert numeric strings to proper types
-                for record in records:
-                    for key, value in record.items():
-                        if isinstance(value, str):
-                            # Try to convert to number
-                            try:
-                                if '.' in value:
-                                    record[key] = float(value)
-                                else:
-                                    record[key] = int(value)
-                            except (ValueError, AttributeError):
-                                pass  # Keep as string
-                
-                equipment_data[worksheet_name] = records
-                
-            except Exception as e:
-                print(f"Warning: Could not load {worksheet_name}: {e}")
-                equipment_data[worksheet_name] = []
+        try:
+            # All tabs in one request; numeric strings come back as numbers
+            equipment_data = get_sheets_pool().batch_get_records(worksheets, sheet_id, credentials_path)
+        except Exception as e:
+            # One missing tab fails the whole batch - load the tabs one at a time
+            print(f"Warning: Batch load failed ({e}), loading worksheets individually")
+            spreadsheet = get_sheets_client(credentials_path).open_by_key(sheet_id)
+            equipment_data = {}
+            for worksheet_name in worksheets:
+                try:
+                    equipment_data[worksheet_name] = spreadsheet.worksheet(worksheet_name).get_all_records()
+                except Exception as e:
+                    print(f"Warning: Could not load {worksheet_name}: {e}")
+                    equipment_data[worksheet_name] = []
         
         # Cache in session state
         if use_cache:
@@ -129,11 +112,20 @@ def load_equipment_from_sheets(
 
 
 
+def json_default(obj):
+    """json.dump(s) hook: NumPy arrays become lists, NumPy scalars numbers, anything else str"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
 def save_project(project: Dict[str, Any], filepath: Path) -> bool:
     """Save project to JSON file"""
     try:
         with open(filepath, 'w') as f:
-            json.dump(project, f, indent=2, default=str)
+            json.dump(project, f, indent=2, default=json_default)
         return True
     except Exception as e:
         print(f"Error saving project: {e}")
@@ -156,23 +148,9 @@ def load_project(filepath: Path) -> Optional[Dict[str, Any]]:
 # Google Sheets Backend
 # =============================================================================
 
-def get_google_sheets_client(credentials_path: str):
-    """Get authenticated Google Sheets client"""
-    if not GSPREAD_AVAILABLE:
-        raise ImportError("gspread library not installed. Run: pip install gspread google-auth")
-    
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    
-    credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    return gspread.authorize(credentials)
-
-
 def load_from_sheets(sheet_id: str, worksheet_name: str, credentials_path: str) -> List[Dict]:
     """Load data from Google Sheets"""
-    client = get_google_sheets_client(credentials_path)
+    client = get_sheets_client(credentials_path)
     sheet = client.open_by_key(sheet_id)
     worksheet = sheet.worksheet(worksheet_name)
     return worksheet.get_all_records()
@@ -180,12 +158,12 @@ def load_from_sheets(sheet_id: str, worksheet_name: str, credentials_path: str)
 
 def save_to_sheets(data: List[Dict], sheet_id: str, worksheet_name: str, credentials_path: str) -> bool:
     """Save data to Google Sheets"""
-    client = get_google_sheets_client(credentials_path)
+    client = get_sheets_client(credentials_path)
     sheet = client.open_by_key(sheet_id)
     
     try:
         worksheet = sheet.worksheet(worksheet_name)
-    except gspread.WorksheetNotFound:
+    except WorksheetNotFound:
         worksheet = sheet.add_worksheet(worksheet_name, rows=1000, cols=26)
     
     if not data:
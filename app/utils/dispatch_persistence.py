@@ -1,23 +1,364 @@
 """
 Dispatch Data Persistence Functions
-Save and load hourly dispatch data to/from Google Sheets Dispatch_Data tab
+Save and load hourly dispatch data
+
+Each run (site/stage/version) is stored as one compressed columnar .npz file
+under DISPATCH_STORE_DIR and listed in a small index.json; Google Sheets only
+keeps one pointer row per run in the Dispatch_Index tab. Saving or loading a
+run touches that run's file alone, never every run saved before it.
+
+The legacy one-row-per-hour Dispatch_Data tab is still read when a run has no
+columnar file, and written when DISPATCH_BACKEND = "sheets_rows".
 """
 
+import hashlib
 import json
-from typing import Dict
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: index updates are only serialized within the process
+    fcntl = None
+
+from app.utils.sheets_pool import get_sheets_client
+
+
+# =============================================================================
+# Columnar store
+# =============================================================================
+
+def _slug(value) -> str:
+    """Filesystem-safe path component."""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', str(value)).strip('_') or 'unnamed'
+
+
+def _path_component(value) -> str:
+    """Readable slug plus a short hash of the raw value, so distinct names never share a path."""
+    digest = hashlib.sha1(str(value).encode('utf-8')).hexdigest()[:8]
+    return f"{_slug(value)}-{digest}"
+
+
+_index_thread_lock = threading.Lock()
+
+
+def _atomic_write(path: Path, write):
+    """Write via a temp file in the same directory, then rename over `path`."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class LocalDispatchStore:
+    """
+    One compressed .npz file per run, keyed by site/stage/version.
+
+    Arrays are named "<year>/<column>"; index.json records each run's file,
+    years, hours and columns so runs can be listed without opening them.
+    Index updates hold an exclusive lock on index.lock, so concurrent
+    ScenarioRunner workers saving different runs do not drop each other's
+    entries.
+    """
+
+    INDEX_FILE = 'index.json'
+    LOCK_FILE = 'index.lock'
+    backend = 'local'
+
+    def __init__(self, root=None):
+        if root is None:
+            from config.settings import DISPATCH_STORE_DIR
+            root = DISPATCH_STORE_DIR
+        self.root = Path(root)
+
+    @staticmethod
+    def key(site_name: str, stage: str, version: int) -> str:
+        return f"{site_name}|{stage}|{int(version)}"
+
+    def path_for(self, site_name: str, stage: str, version: int) -> Path:
+        return self.root / _path_component(site_name) / _path_component(stage) / f"v{int(version)}.npz"
+
+    def _saved_path(self, site_name: str, stage: str, version: int) -> Path:
+        """File of a saved run: the path recorded in the index (older runs used other layouts)."""
+        entry = self.index().get(self.key(site_name, stage, version))
+        if entry is not None:
+            return self.root / entry['path']
+        return self.path_for(site_name, stage, version)
+
+    @contextmanager
+    def _locked_index(self):
+        """Exclusive access to index.json for a read-modify-write."""
+        with _index_thread_lock:
+            if fcntl is None:
+                yield
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(self.root / self.LOCK_FILE, 'a') as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def index(self) -> Dict:
+        """All saved runs: {key: entry}."""
+        try:
+            with open(self.root / self.INDEX_FILE) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _write_index(self, index: Dict):
+        _atomic_write(self.root / self.INDEX_FILE,
+                      lambda f: f.write(json.dumps(index, indent=1, sort_keys=True).encode()))
+
+    def save(self, site_name: str, stage: str, version: int, dispatch_by_year: dict) -> Optional[Dict]:
+        """Write one run; returns its index entry (None if there was nothing to save)."""
+        arrays = {}
+        hours = {}
+        columns = []
+        for year, disp_data in dispatch_by_year.items():
+            # disp_data is {'dispatch_data': {...}, 'columns': [...]}
+            if not (isinstance(disp_data, dict) and 'dispatch_data' in disp_data):
+                continue
+            for col, values in disp_data['dispatch_data'].items():
+                try:
+                    array = np.asarray(values, dtype=int if col == 'hour' else float)
+                except (TypeError, ValueError):
+                    continue  # non-numeric column (labels, timestamps)
+                if array.ndim != 1:
+                    continue
+                arrays[f"{int(year)}/{col}"] = np.nan_to_num(array)
+                if col not in columns:
+                    columns.append(col)
+            hours[int(year)] = len(disp_data['dispatch_data'].get('load_mw', []))
+
+        if not arrays:
+            return None
+
+        path = self.path_for(site_name, stage, version)
+        _atomic_write(path, lambda f: np.savez_compressed(f, **arrays))
+
+        entry = {
+            'site_name': site_name,
+            'stage': stage,
+            'version': int(version),
+            'path': path.relative_to(self.root).as_posix(),
+            'years': sorted(hours),
+            'hours': sum(hours.values()),
+            'columns': columns,
+            'bytes': path.stat().st_size,
+            'saved_at': datetime.now().isoformat(),
+        }
+        with self._locked_index():
+            index = self.index()
+            index[self.key(site_name, stage, version)] = entry
+            self._write_index(index)
+        return entry
+
+    def load(self, site_name: str, stage: str, version: int = 1) -> Dict:
+        """Read one run as {year: {'dispatch_data': {col: [values]}}}; {} if not saved."""
+        path = self._saved_path(site_name, stage, version)
+        if not path.exists():
+            return {}
+
+        dispatch_by_year = {}
+        with np.load(path) as data:
+            for name in data.files:
+                year, col = name.split('/', 1)
+                year_data = dispatch_by_year.setdefault(int(year), {'dispatch_data': {}})
+                year_data['dispatch_data'][col] = data[name].tolist()
+
+        for year_data in dispatch_by_year.values():
+            df_dict = year_data['dispatch_data']
+            df_dict.setdefault('hour', list(range(len(df_dict.get('load_mw', [])))))
+            year_data['columns'] = list(df_dict)
+        return dict(sorted(dispatch_by_year.items()))
+
+    def delete(self, site_name: str, stage: str, version: int) -> bool:
+        with self._locked_index():
+            path = self._saved_path(site_name, stage, version)
+            index = self.index()
+            removed = index.pop(self.key(site_name, stage, version), None) is not None
+            if removed:
+                self._write_index(index)
+        if path.exists():
+            path.unlink()
+            removed = True
+        return removed
+
+
+class SheetsPointerDispatchStore(LocalDispatchStore):
+    """
+    LocalDispatchStore plus one pointer row per run in the Dispatch_Index tab.
+
+    Loading reads the local file; runs saved before the columnar store
+    existed are read from the legacy Dispatch_Data tab instead.
+    """
+
+    POINTER_TAB = 'Dispatch_Index'
+    POINTER_HEADERS = ['site_name', 'stage', 'version', 'backend', 'path',
+                       'years', 'hours', 'columns', 'saved_at']
+    backend = 'sheets_pointer'
+
+    def __init__(self, root=None, legacy_fallback: bool = True):
+        super().__init__(root)
+        self.legacy_fallback = legacy_fallback
+
+    def save(self, site_name: str, stage: str, version: int, dispatch_by_year: dict) -> Optional[Dict]:
+        entry = super().save(site_name, stage, version, dispatch_by_year)
+        if entry is not None:
+            try:
+                self._write_pointer(entry)
+            except Exception as e:
+                # The run itself is saved; only the Sheets listing is stale
+                print(f"⚠️  Dispatch saved locally but pointer row not written: {e}")
+        return entry
+
+    def load(self, site_name: str, stage: str, version: int = 1) -> Dict:
+        dispatch_by_year = super().load(site_name, stage, version)
+        if not dispatch_by_year and self.legacy_fallback:
+            return _load_dispatch_rows(site_name, stage, version)
+        return dispatch_by_year
+
+    def _write_pointer(self, entry: Dict):
+        from config.settings import GOOGLE_SHEET_ID as SHEET_ID
+
+        spreadsheet = get_sheets_client('credentials.json').open_by_key(SHEET_ID)
+        try:
+            worksheet = spreadsheet.worksheet(self.POINTER_TAB)
+        except Exception:
+            worksheet = spreadsheet.add_worksheet(self.POINTER_TAB, rows=1000, cols=len(self.POINTER_HEADERS))
+            worksheet.append_row(self.POINTER_HEADERS)
+
+        row_data = [
+            entry['site_name'], entry['stage'], entry['version'], self.backend, entry['path'],
+            ','.join(str(y) for y in entry['years']), entry['hours'],
+            ','.join(entry['columns']), entry['saved_at'],
+        ]
+        # One row per run, so scanning the pointer tab stays small
+        existing_row = None
+        for idx, row in enumerate(worksheet.get_all_values()[1:]):
+            if row[:3] == [str(entry['site_name']), str(entry['stage']), str(entry['version'])]:
+                existing_row = idx + 2  # +2 for 1-indexing and header
+                break
+        if existing_row:
+            col_letter = chr(65 + len(row_data) - 1)
+            worksheet.update(f'A{existing_row}:{col_letter}{existing_row}', [row_data])
+        else:
+            worksheet.append_row(row_data)
+
+
+class SheetsRowDispatchStore:
+    """Legacy backend: one Dispatch_Data row per hour per year."""
+
+    backend = 'sheets_rows'
+
+    def save(self, site_name: str, stage: str, version: int, dispatch_by_year: dict) -> bool:
+        return _save_dispatch_rows(site_name, stage, version, dispatch_by_year)
+
+    def load(self, site_name: str, stage: str, version: int = 1) -> Dict:
+        return _load_dispatch_rows(site_name, stage, version)
+
+
+DISPATCH_BACKENDS = {
+    'local': LocalDispatchStore,
+    'sheets_pointer': SheetsPointerDispatchStore,
+    'sheets_rows': SheetsRowDispatchStore,
+}
+
+
+def get_dispatch_store(backend: str = None):
+    """Dispatch store for `backend` (default: DISPATCH_BACKEND setting)."""
+    if backend is None:
+        from config.settings import DISPATCH_BACKEND as backend
+    if backend not in DISPATCH_BACKENDS:
+        raise ValueError(f"Unknown dispatch backend '{backend}' (use one of {list(DISPATCH_BACKENDS)})")
+    return DISPATCH_BACKENDS[backend]()
+
+
+def save_dispatch_data(site_name: str, stage: str, version: int, dispatch_by_year: dict, store=None) -> bool:
+    """
+    Save hourly dispatch data for one site/stage/version.
+    
+    Args:
+        site_name: Name of the site
+        stage: Optimization stage (screening, concept, etc.)
+        version: Version number
+        dispatch_by_year: Dict of {year: {'dispatch_data': {col: [values]}, 'columns': [...]}}
+        store: Dispatch store (default: get_dispatch_store())
+    
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        store = store or get_dispatch_store()
+        if isinstance(store, SheetsRowDispatchStore):
+            return store.save(site_name, stage, version, dispatch_by_year)
+        
+        entry = store.save(site_name, stage, version, dispatch_by_year)
+        if entry is None:
+            print("⚠️  No dispatch data to save")
+        else:
+            print(f"✅ Saved {entry['hours']} dispatch hours for {site_name}/{stage}/v{version} "
+                  f"({entry['bytes'] / 1024:.0f} KB, {store.backend})")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error saving dispatch data: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def load_dispatch_data(site_name: str, stage: str, version: int = 1, store=None) -> Dict:
+    """
+    Load hourly dispatch data for one site/stage/version.
+    
+    Args:
+        site_name: Name of the site
+        stage: Optimization stage
+        version: Version number
+        store: Dispatch store (default: get_dispatch_store())
+    
+    Returns:
+        Dict of {year: {'dispatch_data': {col: [values]}}}
+    """
+    try:
+        store = store or get_dispatch_store()
+        dispatch_by_year = store.load(site_name, stage, version)
+        if not dispatch_by_year:
+            print(f"⚠️  No dispatch data found for {site_name}/{stage}/v{version}")
+        return dispatch_by_year
+        
+    except Exception as e:
+        print(f"❌ Error loading dispatch data: {e}")
+        import traceback
+        traceback.print_exc()
+        return {}
 
-# Import the client function
-def get_google_sheets_client():
-    """Get authenticated Google Sheets client"""
-    import gspread
-    return gspread.service_account(filename='credentials.json')
 
+# =============================================================================
+# Legacy row-per-hour Dispatch_Data tab
+# =============================================================================
 
-def save_dispatch_data(site_name: str, stage: str, version: int, dispatch_by_year: dict) -> bool:
+def _save_dispatch_rows(site_name: str, stage: str, version: int, dispatch_by_year: dict) -> bool:
     """
-    Save hourly dispatch data to Dispatch_Data tab in Google Sheets.
+    Save hourly dispatch data to Dispatch_Data tab in Google Sheets (legacy row-per-hour layout).
     
     Args:
         site_name: Name of the site
@@ -31,7 +372,7 @@ def save_dispatch_data(site_name: str, stage: str, version: int, dispatch_by_yea
     try:
         from config.settings import GOOGLE_SHEET_ID as SHEET_ID
         
-        client = get_google_sheets_client()
+        client = get_sheets_client('credentials.json')
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Get or create Dispatch_Data worksheet
@@ -127,9 +468,9 @@ def save_dispatch_data(site_name: str, stage: str, version: int, dispatch_by_yea
         return False
 
 
-def load_dispatch_data(site_name: str, stage: str, version: int = 1) -> Dict:
+def _load_dispatch_rows(site_name: str, stage: str, version: int = 1) -> Dict:
     """
-    Load hourly dispatch data from Dispatch_Data tab in Google Sheets.
+    Load hourly dispatch data from Dispatch_Data tab in Google Sheets (legacy row-per-hour layout).
     
     Args:
         site_name: Name of the site
@@ -142,7 +483,7 @@ def load_dispatch_data(site_name: str, stage: str, version: int = 1) -> Dict:
     try:
         from config.settings import GOOGLE_SHEET_ID as SHEET_ID
         
-        client = get_google_sheets_client()
+        client = get_sheets_client('credentials.json')
         spreadsheet = client.open_by_key(SHEET_ID)
         
         try:
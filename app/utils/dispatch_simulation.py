@@ -7,6 +7,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple
 
+from app.utils.profile_engine import ProfileEngine
+
 
 def generate_8760_load_profile(
     base_load_mw: float,
@@ -44,36 +46,24 @@ def generate_8760_load_profile(
     # FALLBACK: Generate simple pattern
     print(f"⚠️  Generating fallback load pattern")
     
-    hours = 8760
-    load_profile = np.zeros(hours)
+    engine = ProfileEngine(seed=None)
     
     # Base load (constant component)
     base_component = base_load_mw * load_factor
     
-    # Daily variation (training workloads have daily patterns)
-    for hour in range(hours):
-        day_hour = hour % 24
-        
-        # Daily pattern (lower at night, higher during day)
-        if day_hour >= 6 and day_hour <= 22:
-            daily_factor = 1.05  # 5% higher during day
-        else:
-            daily_factor = 0.95  # 5% lower at night
-        
-        # Weekly pattern (lower on weekends for some workloads)
-        day_of_week = (hour // 24) % 7
-        if day_of_week >= 5:  # Weekend
-            weekly_factor = 0.98
-        else:
-            weekly_factor = 1.02
-        
+    load_profile = engine.build(
+        base_component,
+        factors=[
+            # Daily pattern (lower at night, higher during day)
+            engine.daily_window(6, 22, on=1.05, off=0.95),
+            # Weekly pattern (lower on weekends for some workloads)
+            engine.weekend(0.98, weekday=1.02),
+        ],
         # Add small random variation (±2%)
-        random_factor = 1 + (np.random.random() - 0.5) * 0.04
-        
-        load_profile[hour] = base_component * daily_factor * weekly_factor * random_factor
-    
-    # Ensure within bounds
-    load_profile = np.clip(load_profile, base_load_mw * 0.5, base_load_mw)
+        noise=engine.uniform(0.98, 1.02),
+        # Ensure within bounds
+        clip=(base_load_mw * 0.5, base_load_mw),
+    )
     
     return load_profile
 
@@ -1,11 +1,25 @@
 """
 Financial Calculations Module
 NPV, IRR, payback period, and portfolio aggregations
+
+Cash flows are NumPy blocks with years on the last axis, so all sites x
+sensitivity cases (or Monte Carlo draws) are evaluated in one call:
+
+    inputs = portfolio_inputs(portfolio_data)
+    cases = monte_carlo_cases(10_000, seed=1)        # gas price, capex, discount rate
+    block = evaluate_cases(inputs, cases)            # npv_m / irr_pct / payback_years: (cases, sites)
+    mc = monte_carlo_portfolio(portfolio_data)       # P10/P50/P90 summary for the investor charts
 """
 
+import time
 import numpy as np
 from typing import Dict, List, Any
 
+ANNUAL_MWH_PER_MW = 8760 * 0.95             # 95% availability
+HEAT_RATE_MMBTU_MWH = 7.7                   # Recip heat rate (7,700 Btu/kWh)
+PAYBACK_NEVER = 99.9                        # Sentinel for "never pays back"
+IRR_BRACKET = (-0.99, 10.0)
+
 def calculate_site_financials(site: Dict, optimization_result: Dict) -> Dict:
     """
     Calculate financial metrics for a single site
@@ -135,21 +149,13 @@ def calculate_npv(capex_m: float, opex_annual_m: float, lcoe: float,
         NPV in millions
     """
     # Assume 8760 hours/year, 95% availability
-    annual_mwh = capacity_mw * 8760 * 0.95
+    annual_mwh = capacity_mw * ANNUAL_MWH_PER_MW
     
     # Annual revenue = LCOE * MWh (simplified)
     annual_revenue_m = (lcoe * annual_mwh) / 1_000_000
     
-    # Calculate cash flows
-    cash_flows = [-capex_m]  # Initial investment
-    
-    for year in range(1, horizon_years + 1):
-        annual_cash_flow = annual_revenue_m - opex_annual_m
-        discounted_cf = annual_cash_flow / ((1 + discount_rate) ** year)
-        cash_flows.append(discounted_cf)
-    
-    npv = sum(cash_flows)
-    return npv
+    cash_flows = build_cash_flows(capex_m, annual_revenue_m, opex_annual_m, horizon_years=horizon_years)
+    return float(npv_block(cash_flows, discount_rate))
 
 
 def calculate_irr_improved(capex_m: float, opex_annual_m: float, lcoe: float, 
@@ -168,13 +174,9 @@ def calculate_irr_improved(capex_m: float, opex_annual_m: float, lcoe: float,
         IRR as percentage
     """
     # Build cash flow array
-    annual_mwh = capacity_mw * 8760 * 0.95
+    annual_mwh = capacity_mw * ANNUAL_MWH_PER_MW
     annual_revenue_m = (lcoe * annual_mwh) / 1_000_000
-    annual_net_cf = annual_revenue_m - opex_annual_m
-    
-    cash_flows = [-capex_m]  # Initial investment
-    for _ in range(horizon_years):
-        cash_flows.append(annual_net_cf)
+    cash_flows = build_cash_flows(capex_m, annual_revenue_m, opex_annual_m, horizon_years=horizon_years)
     
     # Use Newton's method for IRR calculation
     return calculate_irr_newton(cash_flows)
@@ -192,28 +194,12 @@ def calculate_irr_newton(cash_flows: list, max_iterations: int = 100, tolerance:
     Returns:
         IRR as percentage
     """
-    # Initial guess: 10%
-    rate = 0.10
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    irr = float(irr_block(cash_flows, max_iterations, tolerance))
+    if np.isfinite(irr):
+        return irr
     
-    for _ in range(max_iterations):
-        # Calculate NPV and derivative at current rate
-        npv = sum(cf / ((1 + rate) ** t) for t, cf in enumerate(cash_flows))
-        npv_prime = sum(-t * cf / ((1 + rate) ** (t + 1)) for t, cf in enumerate(cash_flows))
-        
-        if abs(npv) < tolerance:
-            return rate * 100
-        
-        if abs(npv_prime) < 1e-10:
-            break
-        
-        # Newton's method update
-        rate = rate - npv / npv_prime
-        
-        # Constrain to reasonable range
-        if rate < -0.99 or rate > 10.0:
-            break
-    
-    # If no convergence, return estimate
+    # No IRR in range, return estimate
     if len(cash_flows) > 1 and cash_flows[0] < 0:
         avg_annual_cf = sum(cash_flows[1:]) / len(cash_flows[1:])
         simple_return = (avg_annual_cf / abs(cash_flows[0])) * 100 * 0.7
@@ -236,12 +222,12 @@ def calculate_payback(capex_m: float, opex_annual_m: float, lcoe: float,
     Returns:
         Payback period in years
     """
-    annual_mwh = capacity_mw * 8760 * 0.95
+    annual_mwh = capacity_mw * ANNUAL_MWH_PER_MW
     annual_revenue_m = (lcoe * annual_mwh) / 1_000_000
     annual_net_cf = annual_revenue_m - opex_annual_m
     
     if annual_net_cf <= 0:
-        return 99.9  # Never pays back
+        return PAYBACK_NEVER  # Never pays back
     
     payback = capex_m / annual_net_cf
     return payback
@@ -266,30 +252,22 @@ def calculate_portfolio_metrics(portfolio_data: List[Dict]) -> Dict:
             'total_capacity_mw': 0
         }
     
-    # Sum NPV across all sites
-    total_npv = sum(site.get('npv_m', 0) for site in portfolio_data)
+    npv = np.array([site.get('npv_m', 0) for site in portfolio_data], dtype=float)
+    capacity = np.array([site.get('capacity_mw', 0) for site in portfolio_data], dtype=float)
+    lcoe = np.array([site.get('lcoe', 0) for site in portfolio_data], dtype=float)
+    capex = np.array([site.get('capex_m', 0) for site in portfolio_data], dtype=float)
+    irr = np.array([site.get('irr_pct', 0) for site in portfolio_data], dtype=float)
     
-    # Calculate capacity-weighted LCOE
-    total_capacity = sum(site.get('capacity_mw', 0) for site in portfolio_data)
+    total_npv = float(npv.sum())
+    total_capacity = float(capacity.sum())
+    total_capex = float(capex.sum())
     
+    # Capacity-weighted LCOE and IRR (IRR simplified as a weighted average)
     if total_capacity > 0:
-        weighted_lcoe = sum(
-            site.get('lcoe', 0) * site.get('capacity_mw', 0)
-            for site in portfolio_data
-        ) / total_capacity
+        weighted_lcoe = float(lcoe @ capacity) / total_capacity
+        portfolio_irr = float(irr @ capacity) / total_capacity
     else:
         weighted_lcoe = 0
-    
-    # Sum CapEx
-    total_capex = sum(site.get('capex_m', 0) for site in portfolio_data)
-    
-    # Calculate portfolio IRR (simplified as capacity-weighted average)
-    if total_capacity > 0:
-        portfolio_irr = sum(
-            site.get('irr_pct', 0) * site.get('capacity_mw', 0)
-            for site in portfolio_data
-        ) / total_capacity
-    else:
         portfolio_irr = 0
     
     return {
@@ -299,3 +277,258 @@ def calculate_portfolio_metrics(portfolio_data: List[Dict]) -> Dict:
         'portfolio_irr': portfolio_irr,
         'total_capacity_mw': total_capacity
     }
+
+
+# =============================================================================
+# VECTORIZED CASH-FLOW ENGINE
+# =============================================================================
+
+def build_cash_flows(capex_m, revenue_m, opex_m, fuel_mmbtu=0.0, gas_price_mmbtu=0.0,
+                     capex_multiplier=1.0, horizon_years: int = 20) -> np.ndarray:
+    """
+    Cash-flow block in $M with years on the last axis (horizon_years + 1)
+    
+    Year 0 is -capex * capex_multiplier; years 1..horizon are
+    revenue - opex - fuel_mmbtu * gas_price_mmbtu / 1e6. Inputs broadcast
+    against each other, e.g. per-site arrays (n_sites,) with per-case
+    columns (n_cases, 1) give a (n_cases, n_sites, horizon_years + 1) block.
+    """
+    capex = np.asarray(capex_m, dtype=float) * capex_multiplier
+    annual = (np.asarray(revenue_m, dtype=float) - opex_m
+              - np.asarray(fuel_mmbtu, dtype=float) * gas_price_mmbtu / 1_000_000)
+    capex, annual = np.broadcast_arrays(capex, annual)
+    flows = np.empty(capex.shape + (horizon_years + 1,))
+    flows[..., 0] = -capex
+    flows[..., 1:] = annual[..., None]
+    return flows
+
+
+def npv_block(cash_flows: np.ndarray, discount_rate=0.08) -> np.ndarray:
+    """NPV over the last axis (year 0 undiscounted); discount_rate broadcasts against the other axes."""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    x = 1.0 / (1.0 + np.asarray(discount_rate, dtype=float))
+    npv = cash_flows[..., -1]
+    for t in range(cash_flows.shape[-1] - 2, -1, -1):  # Horner in 1 / (1 + r)
+        npv = npv * x + cash_flows[..., t]
+    return npv
+
+
+def _polyval(flows_t: np.ndarray, x: np.ndarray, slope: bool = False):
+    """sum_t c_t x^t (and its x-derivative) for (years, n) flows at n points, by Horner."""
+    p = flows_t[-1].copy()
+    dp = np.zeros_like(p)
+    for c in flows_t[-2::-1]:
+        if slope:
+            dp *= x
+            dp += p
+        p *= x
+        p += c
+    return (p, dp) if slope else p
+
+
+def irr_block(cash_flows: np.ndarray, max_iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    """
+    IRR (%) over the last axis for a whole block of cash flows
+    
+    Vectorized Newton on NPV as a polynomial in 1 / (1 + r), started from
+    the perpetuity yield (mean annual flow / investment), which is close
+    for invest-then-earn flows; entries that stall or leave the
+    (-99%, 1000%) bracket fall back to bisection over whichever side of
+    r = 0 NPV changes sign on (positive IRR preferred). NaN where it
+    changes sign on neither (no IRR).
+    """
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    shape = cash_flows.shape[:-1]
+    flows_t = np.ascontiguousarray(cash_flows.reshape(-1, cash_flows.shape[-1]).T)
+    n = flows_t.shape[1]
+    # x = 1 / (1 + r) runs from x_lo (r = 1000%) to x_hi (r = -99%)
+    x_lo, x_hi = 1 / (1 + IRR_BRACKET[1]), 1 / (1 + IRR_BRACKET[0])
+    # Sign changes on either side of r = 0 (x = 1, NPV = sum of flows)
+    f_lo, f_zero, f_hi = _polyval(flows_t, np.full(n, x_lo)), flows_t.sum(axis=0), _polyval(flows_t, np.full(n, x_hi))
+    upper = np.sign(f_lo) != np.sign(f_zero)
+    has_root = upper | (np.sign(f_zero) != np.sign(f_hi))
+
+    investment, annual = -flows_t[0], flows_t[1:].mean(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        guess = np.where((investment > 0) & (annual > 0), annual / investment, 0.0)
+    x = 1 / (1 + np.clip(guess, 0.0, IRR_BRACKET[1] / 2))
+    done = ~has_root
+    active = np.flatnonzero(has_root)
+    for _ in range(max_iterations):
+        if not len(active):
+            break
+        if len(active) > n // 2:  # Cheaper to evaluate everything than to gather most of it
+            p, dp = _polyval(flows_t, x, slope=True)
+            p, dp = p[active], dp[active]
+        else:
+            p, dp = _polyval(flows_t[:, active], x[active], slope=True)
+        ok = np.abs(dp) > 1e-12
+        step = np.where(ok, p / np.where(ok, dp, 1.0), 0.0)
+        new = x[active] - step
+        inside = ok & (new > x_lo) & (new < x_hi)
+        x[active] = new
+        converged = inside & (np.abs(step) < tolerance * new * new)  # |dr| = |dx| / x^2
+        done[active[converged]] = True
+        active = active[inside & ~converged]
+
+    # Bracketed fallback for whatever Newton did not settle
+    todo = np.flatnonzero(~done)
+    if len(todo):
+        f = flows_t[:, todo]
+        a = np.where(upper[todo], x_lo, 1.0)
+        b = np.where(upper[todo], 1.0, x_hi)
+        fa = np.where(upper[todo], f_lo[todo], f_zero[todo])
+        for _ in range(60):
+            mid = (a + b) / 2
+            fm = _polyval(f, mid)
+            left = np.sign(fm) == np.sign(fa)
+            a, fa = np.where(left, mid, a), np.where(left, fm, fa)
+            b = np.where(left, b, mid)
+        x[todo] = (a + b) / 2
+
+    rate = np.where(has_root, 1 / x - 1, np.nan)
+    return (rate * 100).reshape(shape)
+
+
+def payback_block(cash_flows: np.ndarray) -> np.ndarray:
+    """Years until cumulative cash flow turns non-negative (interpolated within the year); PAYBACK_NEVER if it never does."""
+    cash_flows = np.asarray(cash_flows, dtype=float)
+    cumulative = np.cumsum(cash_flows, axis=-1)
+    paid = cumulative >= 0
+    first = np.argmax(paid, axis=-1)[..., None]
+    prev = np.maximum(first - 1, 0)
+    cum_prev = np.take_along_axis(cumulative, prev, axis=-1)[..., 0]
+    cf_first = np.take_along_axis(cash_flows, first, axis=-1)[..., 0]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        years = np.where(first[..., 0] == 0, 0.0, prev[..., 0] - cum_prev / cf_first)
+    return np.where(paid.any(axis=-1), years, PAYBACK_NEVER)
+
+
+def portfolio_inputs(portfolio_data: List[Dict], heat_rate_mmbtu_mwh: float = HEAT_RATE_MMBTU_MWH,
+                     base_gas_price_mmbtu: float = None) -> Dict[str, np.ndarray]:
+    """
+    Per-site arrays for build_cash_flows from site financial dicts
+    
+    Revenue is LCOE * MWh as in calculate_npv. LCOE already covers fuel at
+    the base gas price, so that fuel is added back to revenue and costed at
+    each case's gas price: at the base price the NPV is calculate_npv's.
+    """
+    if base_gas_price_mmbtu is None:
+        from config.settings import ECONOMIC_DEFAULTS
+        base_gas_price_mmbtu = ECONOMIC_DEFAULTS['fuel_price_mmbtu']
+    column = lambda key: np.array([site.get(key, 0) or 0 for site in portfolio_data], dtype=float)
+    annual_mwh = column('capacity_mw') * ANNUAL_MWH_PER_MW
+    fuel_mmbtu = annual_mwh * heat_rate_mmbtu_mwh
+    return {
+        'site': [site.get('site', f"Site {i + 1}") for i, site in enumerate(portfolio_data)],
+        'capex_m': column('capex_m'),
+        'opex_m': column('opex_annual_m'),
+        'revenue_m': (column('lcoe') * annual_mwh + fuel_mmbtu * base_gas_price_mmbtu) / 1_000_000,
+        'fuel_mmbtu': fuel_mmbtu,
+        'base_gas_price_mmbtu': base_gas_price_mmbtu,
+    }
+
+
+def sensitivity_cases(gas_price_mmbtu=(3.5,), capex_multiplier=(1.0,), discount_rate=(0.08,)) -> Dict[str, np.ndarray]:
+    """Full-factorial grid of cases as flat arrays."""
+    grid = np.meshgrid(gas_price_mmbtu, capex_multiplier, discount_rate, indexing='ij')
+    return {key: g.ravel().astype(float) for key, g in
+            zip(('gas_price_mmbtu', 'capex_multiplier', 'discount_rate'), grid)}
+
+
+def monte_carlo_cases(n_draws: int = 10_000, seed: int = None, gas_price_mmbtu: float = 3.5,
+                      gas_price_volatility: float = 0.30, capex_range=(0.90, 1.00, 1.30),
+                      discount_rate_range=(0.06, 0.10)) -> Dict[str, np.ndarray]:
+    """
+    Random cases: lognormal gas price (median gas_price_mmbtu), triangular
+    capex multiplier (low, mode, high) and uniform discount rate
+    """
+    rng = np.random.default_rng(seed)
+    return {
+        'gas_price_mmbtu': gas_price_mmbtu * rng.lognormal(0.0, gas_price_volatility, n_draws),
+        'capex_multiplier': rng.triangular(*capex_range, n_draws),
+        'discount_rate': rng.uniform(*discount_rate_range, n_draws),
+    }
+
+
+def evaluate_cases(inputs: Dict, cases: Dict, horizon_years: int = 20, metrics=('npv', 'irr', 'payback')) -> Dict:
+    """
+    NPV / IRR / payback for every case x site, plus the portfolio
+    
+    Site metrics are (n_cases, n_sites); portfolio metrics are per case on
+    the summed cash flows (so portfolio IRR is a true IRR, not an average).
+    """
+    column = lambda key: np.asarray(cases[key], dtype=float)[:, None]
+    flows = build_cash_flows(inputs['capex_m'], inputs['revenue_m'], inputs['opex_m'],
+                             fuel_mmbtu=inputs['fuel_mmbtu'], gas_price_mmbtu=column('gas_price_mmbtu'),
+                             capex_multiplier=column('capex_multiplier'), horizon_years=horizon_years)
+    portfolio = flows.sum(axis=1)
+    rate = column('discount_rate')
+    out = {'cases': cases, 'site': inputs['site']}
+    if 'npv' in metrics:
+        out['npv_m'] = npv_block(flows, rate)
+        out['portfolio_npv_m'] = npv_block(portfolio, rate[:, 0])
+    if 'irr' in metrics:
+        out['irr_pct'] = irr_block(flows)
+        out['portfolio_irr_pct'] = irr_block(portfolio)
+    if 'payback' in metrics:
+        out['payback_years'] = payback_block(flows)
+        out['portfolio_payback_years'] = payback_block(portfolio)
+    return out
+
+
+def _percentiles(values: np.ndarray, axis: int = 0) -> Dict[str, Any]:
+    p10, p50, p90 = np.nanpercentile(values, [10, 50, 90], axis=axis)
+    to_out = lambda v: float(v) if np.ndim(v) == 0 else v.tolist()
+    return {'p10': to_out(p10), 'p50': to_out(p50), 'p90': to_out(p90),
+            'mean': to_out(np.nanmean(values, axis=axis))}
+
+
+def monte_carlo_portfolio(portfolio_data: List[Dict], n_draws: int = None, seed: int = None,
+                          horizon_years: int = 20, **draw_kwargs) -> Dict:
+    """
+    Monte Carlo over gas price, capex and discount rate for the whole portfolio
+    
+    Returns P10/P50/P90 of portfolio NPV / IRR, per-site NPV percentiles,
+    P(NPV < 0) and the portfolio NPV per draw (for a histogram).
+    draw_kwargs go to monte_carlo_cases.
+    """
+    if n_draws is None:
+        from config.settings import FINANCIAL_MC_DRAWS
+        n_draws = FINANCIAL_MC_DRAWS
+    start = time.perf_counter()
+    inputs = portfolio_inputs(portfolio_data)
+    draw_kwargs.setdefault('gas_price_mmbtu', inputs['base_gas_price_mmbtu'])
+    block = evaluate_cases(inputs, monte_carlo_cases(n_draws, seed, **draw_kwargs), horizon_years)
+    return {
+        'n_draws': n_draws,
+        'n_sites': len(inputs['site']),
+        'site': inputs['site'],
+        'portfolio_npv_m': _percentiles(block['portfolio_npv_m']),
+        'portfolio_irr_pct': _percentiles(block['portfolio_irr_pct']),
+        'prob_npv_negative': float(np.mean(block['portfolio_npv_m'] < 0)),
+        'site_npv_m': _percentiles(block['npv_m']),
+        'site_prob_npv_negative': np.mean(block['npv_m'] < 0, axis=0).tolist(),
+        'npv_draws_m': block['portfolio_npv_m'],
+        'runtime_s': time.perf_counter() - start,
+    }
+
+
+def sensitivity_tornado(portfolio_data: List[Dict], gas_price_mmbtu=(2.5, 5.0), capex_multiplier=(0.9, 1.3),
+                        discount_rate=(0.06, 0.10), horizon_years: int = 20) -> Dict:
+    """
+    One-at-a-time low / high swings of each driver around the base case,
+    evaluated as a single block; returns portfolio NPV per driver
+    """
+    inputs = portfolio_inputs(portfolio_data)
+    base = {'gas_price_mmbtu': inputs['base_gas_price_mmbtu'], 'capex_multiplier': 1.0, 'discount_rate': 0.08}
+    swings = {'gas_price_mmbtu': gas_price_mmbtu, 'capex_multiplier': capex_multiplier, 'discount_rate': discount_rate}
+    rows = [base] + [dict(base, **{key: value}) for key, pair in swings.items() for value in pair]
+    cases = {key: np.array([row[key] for row in rows]) for key in base}
+    npv = evaluate_cases(inputs, cases, horizon_years, metrics=('npv',))['portfolio_npv_m']
+    return {
+        'base_npv_m': float(npv[0]),
+        'drivers': [{'driver': key, 'low': pair[0], 'high': pair[1],
+                     'npv_low_m': float(npv[1 + 2 * i]), 'npv_high_m': float(npv[2 + 2 * i])}
+                    for i, (key, pair) in enumerate(swings.items())],
+    }
@@ -5,7 +5,6 @@ Generates executive summaries, financial analysis, and recommendations
 
 import os
 from typing import Dict, List, Optional
-import google.generativeai as genai
 
 class GeminiReportClient:
     """Client for generating AI-powered report content using Gemini 3 Flash"""
@@ -21,6 +20,8 @@ class GeminiReportClient:
         if not self.api_key:
             raise ValueError("Gemini API key not found. Set GEMINI_API_KEY environment variable.")
         
+        # SDK loads on first client, not when the reports page imports this module
+        import google.generativeai as genai
         genai.configure(api_key=self.api_key)
         
         # Try latest models in order of preference
@@ -1,188 +1,404 @@
 """
 High-Resolution Transient Simulation
-Second-level granularity for detailed power quality analysis
+Sub-second granularity for detailed power quality analysis
+
+The generator's first-order lag, the BESS response and the swing-equation
+frequency are linear filters (scipy.signal.lfilter) along the time axis,
+discretized exactly for the chosen step, so a batch of events - e.g. every
+hourly ramp in an 8760 dispatch - is simulated in one call at any resolution
+down to 10 ms with the same result, and calculate_power_quality_metrics
+returns nadir / RoCoF per event.
+
+Model (per event, per-unit on the event's base load):
+- Generators track the load through a first-order lag, starting from steady
+  state at the pre-event load
+- BESS covers the gap between load and generation through a fast lag, its
+  set-point limited to bess_mw
+- Swing equation with load damping:
+  df/dt = f0 / 2H * (P_imbalance / P_base - D * (f - f0) / f0)
+
+Usage:
+    data = generate_high_res_transient(200, 'step_change', resolution_s=0.01)
+    metrics = calculate_power_quality_metrics(data)
+
+    screening = screen_ramp_events(load_8760_mw, resolution_s=0.1)   # every hourly ramp
 """
 
 import numpy as np
+from scipy.linalg import expm
+from scipy.signal import lfilter, ss2tf
 from typing import Dict, Tuple
 
+F0 = 60.0                   # Hz
+INERTIA_H = 4.0             # s (typical 2-6 s)
+LOAD_DAMPING = 1.0          # % load change per % frequency change
+GEN_TIME_CONSTANT_S = 4.48  # ~5 s lag (tracks 20% of the remaining gap per second)
+BESS_TIME_CONSTANT_S = 0.2  # inverter response
+MIN_RESOLUTION_S = 0.01
+ROCOF_WINDOW_S = 0.5        # RoCoF measured over a 500 ms window
+RAMP_WINDOW_S = 1.0         # severity ramp measured as MW change over 1 s
+
+
+def _discretize(a: np.ndarray, b: np.ndarray, dt: float, rate: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact discretization of x' = a x + b u over one step of dt.
+
+    Returns (phi, hold, decay): x[n+1] = phi x[n] + hold u[n] for an input
+    held across the step, plus decay c[n] for an input c[n] * exp(-rate * t).
+    """
+    n, m = b.shape
+    augmented = np.zeros((n + 2 * m, n + 2 * m))
+    augmented[:n, :n] = a
+    augmented[:n, n:n + m] = b
+    augmented[:n, n + m:] = b
+    augmented[n + m:, n + m:] = -rate * np.eye(m)
+    blocks = expm(augmented * dt)
+    return blocks[:n, :n], blocks[:n, n:n + m], blocks[:n, n + m:]
+
+
+def simulate_transients(
+    load_mw: np.ndarray,
+    base_load_mw,
+    resolution_s: float = 1.0,
+    bess_mw: float = None,
+    inertia_h: float = INERTIA_H,
+    load_damping: float = LOAD_DAMPING,
+    gen_time_constant_s: float = GEN_TIME_CONSTANT_S,
+    bess_time_constant_s: float = BESS_TIME_CONSTANT_S,
+) -> Dict:
+    """
+    Simulate a batch of load transients.
+
+    Each load sample is held until the next one. The model is discretized
+    exactly, so every resolution samples the same trajectory: a 1 s run
+    reads the 10 ms run's values at whole seconds (only a step in which the
+    BESS reaches or leaves its limit is approximate).
+
+    Args:
+        load_mw: Load per sample, shape (n_samples,) or (n_events, n_samples)
+        base_load_mw: Per-unit base for the swing equation (scalar or per event)
+        resolution_s: Sample spacing in seconds (>= 0.01)
+        bess_mw: BESS power limit (None = unlimited, 0 = no BESS)
+        inertia_h, load_damping: Swing-equation inertia (s) and load damping
+        gen_time_constant_s, bess_time_constant_s: First-order response lags
+
+    Returns:
+        Dict of arrays shaped like load_mw: time, load_mw, bess_response_mw,
+        generator_response_mw, net_load_mw (generation + BESS - load),
+        frequency_hz, load_delta_mw_s
+    """
+    if resolution_s < MIN_RESOLUTION_S:
+        raise ValueError(f"resolution_s must be >= {MIN_RESOLUTION_S}")
+    dt = float(resolution_s)
+    load = np.atleast_2d(np.asarray(load_mw, dtype=float))
+    base = np.broadcast_to(np.asarray(base_load_mw, dtype=float), load.shape[:1])[:, None]
+    step = load - load[:, :1]  # deviation from the steady pre-event state
+
+    # Generator lag on its own (it does not see the BESS)
+    r_gen = np.exp(-dt / gen_time_constant_s)
+    gen_step = lfilter([0, 1 - r_gen], [1, -r_gen], step, axis=-1)
+
+    # BESS set-point is the load/generation gap, limited to bess_mw. Within a
+    # step the gap decays as exp(-t / gen_time_constant_s), so the part cut off
+    # by the limit is fitted as constant + c * exp(-t / gen_time_constant_s)
+    # through its values at both ends of the step (exact while it stays limited)
+    excess_const = excess_decay = None
+    if bess_mw is not None and bess_mw > 0:
+        gen_end = np.concatenate([gen_step[:, 1:], r_gen * gen_step[:, -1:] + (1 - r_gen) * step[:, -1:]], axis=1)
+        gap_start, gap_end = step - gen_step, step - gen_end
+        excess_start = gap_start - np.clip(gap_start, -bess_mw, bess_mw)
+        excess_end = gap_end - np.clip(gap_end, -bess_mw, bess_mw)
+        excess_decay = (excess_start - excess_end) / (1 - r_gen)
+        excess_const = excess_start - excess_decay
+
+    # States: generator, BESS, swing equation in MW (divided by the base below);
+    # inputs: load, set-point excess
+    k = F0 / (2 * inertia_h)
+    decay = load_damping / (2 * inertia_h)
+    tb = bess_time_constant_s if bess_mw != 0 else np.inf
+    a = np.array([[-1 / gen_time_constant_s, 0, 0], [-1 / tb, -1 / tb, 0], [k, k, -decay]])
+    b = np.array([[1 / gen_time_constant_s, 0], [1 / tb, -1 / tb], [-k, 0]])
+    phi, hold, decay_in = _discretize(a, b, dt, 1 / gen_time_constant_s)
+    outputs = np.array([[0, 1, 0], [0, 0, 1]])
+
+    def response(gain, signal):
+        num, den = ss2tf(phi, gain[:, None], outputs, np.zeros((2, 1)))
+        return np.stack([lfilter(row, den, signal, axis=-1) for row in num])
+
+    states = response(hold[:, 0], step)
+    if excess_const is not None:
+        states = states + response(hold[:, 1], excess_const) + response(decay_in[:, 1], excess_decay)
+    bess_step, swing = states
+
+    gen = load[:, :1] + gen_step
+    bess = bess_step if bess_mw != 0 else np.zeros_like(load)
+    imbalance = gen + bess - load
+    frequency = F0 + np.divide(swing, base, out=np.zeros_like(swing), where=base > 0)
+
+    squeeze = np.ndim(load_mw) == 1
+    out = {
+        'time': np.arange(load.shape[1]) * dt,
+        'load_mw': load,
+        'bess_response_mw': bess,
+        'generator_response_mw': gen,
+        'net_load_mw': imbalance,
+        'frequency_hz': frequency,
+        'load_delta_mw_s': np.diff(load, axis=-1, prepend=load[:, :1]) / dt,
+        'resolution_s': dt,
+    }
+    if squeeze:
+        out.update({key: value[0] for key, value in out.items() if isinstance(value, np.ndarray) and value.ndim == 2})
+    return out
+
 
 def generate_high_res_transient(
     base_load_mw: float,
     event_type: str = 'step_change',
     duration_seconds: int = 300,
-    event_magnitude_pct: float = 20
+    event_magnitude_pct: float = 20,
+    resolution_s: float = 1.0,
+    bess_mw: float = None,
 ) -> Dict:
     """
-    Generate high-resolution (1-second) transient simulation
-    
+    Generate high-resolution transient simulation
+
     Args:
         base_load_mw: Base load in MW
         event_type: 'step_change', 'ramp_up', 'ramp_down', or 'oscillation'
         duration_seconds: Total simulation duration (default 300s = 5 min)
         event_magnitude_pct: Size of transient event as % of base load
-    
+        resolution_s: Time step in seconds (default 1 s, down to 0.01 s)
+        bess_mw: BESS power limit (None = unlimited, 0 = no BESS)
+
     Returns:
-        Dict with time series data at 1-second resolution
+        Dict with time series data at the requested resolution
     """
-    
-    # Time array (1-second resolution)
-    time = np.arange(0, duration_seconds, 1)
+
+    # Time array
+    time = np.arange(0, duration_seconds, resolution_s)
     num_points = len(time)
-    
+    seconds = lambda s: int(round(s / resolution_s))
+
     # Initialize load profile
     load_profile = np.ones(num_points) * base_load_mw
-    
+
     # Event parameters
     event_mw = base_load_mw * (event_magnitude_pct / 100)
     event_start = int(num_points * 0.2)  # Start at 20% of timeline
-    
+
     if event_type == 'step_change':
-        # Sudden step up
-        step_duration = 60  # 60 seconds
-        load_profile[event_start:event_start+step_duration] += event_mw
-        
+        # Sudden step up for 60 seconds
+        load_profile[event_start:event_start + seconds(60)] += event_mw
+
     elif event_type == 'ramp_up':
-        # Gradual ramp over 60 seconds
-        ramp_duration = 60
-        ramp = np.linspace(0, event_mw, ramp_duration)
-        load_profile[event_start:event_start+ramp_duration] += ramp
-        # Hold
-        load_profile[event_start+ramp_duration:event_start+ramp_duration+60] += event_mw
-        
+        # Gradual ramp over 60 seconds, then hold
+        ramp_duration = seconds(60)
+        load_profile[event_start:event_start + ramp_duration] += np.linspace(0, event_mw, ramp_duration)
+        load_profile[event_start + ramp_duration:event_start + 2 * ramp_duration] += event_mw
+
     elif event_type == 'ramp_down':
         # Start high, ramp down
         load_profile[:event_start] += event_mw
-        ramp_duration = 60
-        ramp = np.linspace(event_mw, 0, ramp_duration)
-        load_profile[event_start:event_start+ramp_duration] += ramp
-        
+        ramp_duration = seconds(60)
+        load_profile[event_start:event_start + ramp_duration] += np.linspace(event_mw, 0, ramp_duration)
+
     elif event_type == 'oscillation':
         # Sinusoidal oscillation (load breathing)
         freq = 0.05  # 0.05 Hz = 20 second period
-        oscillation = event_mw * np.sin(2 * np.pi * freq * time)
-        load_profile += oscillation
-    
-    # Simulate BESS response (instant)
-    bess_response = np.zeros(num_points)
-    load_delta = np.diff(load_profile, prepend=load_profile[0])
-    
-    # BESS responds to changes > 1 MW/s
-    for i in range(num_points):
-        if abs(load_delta[i]) > 1.0:  # > 1 MW/s change
-            bess_response[i] = -load_delta[i]  # BESS counteracts the change
-    
-    # Generator response (slower, 5-second ramp)
-    gen_response = np.zeros(num_points)
-    for i in range(5, num_points):
-        # Generator tracks load with 5-second lag
-        gen_target = load_profile[i] - bess_response[i]
-        gen_response[i] = gen_response[i-1] + (gen_target - gen_response[i-1]) * 0.2
-    
-    # Calculate net load (what grid sees)
-    net_load = load_profile - bess_response - gen_response
-    
-    # Frequency deviation using Swing Equation (physics-based)
-    # df/dt = (f0 / 2H) * (P_imbalance / P_base)
-    # where H = inertia constant (seconds), f0 = nominal frequency
-    
-    # System parameters
-    f0 = 60.0  # Hz
-    H = 4.0    # Inertia constant (typical for grid-connected system = 2-6 seconds)
-    dt = 1.0   # Time step (1 second)
-    
-    # Initialize frequency array
-    frequency = np.zeros(num_points)
-    frequency[0] = f0
-    
-    # Guard against division by zero
-    if base_load_mw > 0:
-        # Integrate frequency deviation over time
-        for i in range(1, num_points):
-            # Power imbalance (MW)
-            p_imbalance = net_load[i] - base_load_mw
-            
-            # Rate of frequency change (Hz/s)
-            df_dt = (f0 / (2 * H)) * (p_imbalance / base_load_mw)
-            
-            # Integrate: f[i] = f[i-1] + df_dt * dt
-            frequency[i] = frequency[i-1] + df_dt * dt
-    else:
-        # If no base load, frequency stays constant
-        frequency[:] = f0
-    
-    # Clip to realistic bounds (± 0.5 Hz from nominal)
-    frequency = np.clip(frequency, 59.5, 60.5)
-    
-    return {
+        load_profile += event_mw * np.sin(2 * np.pi * freq * time)
+
+    result = simulate_transients(load_profile, base_load_mw, resolution_s, bess_mw=bess_mw)
+    result.update({
         'time': time,
-        'load_mw': load_profile,
-        'bess_response_mw': bess_response,
-        'generator_response_mw': gen_response,
-        'net_load_mw': net_load,
-        'frequency_hz': frequency,
-        'load_delta_mw_s': load_delta,
         'event_type': event_type,
-        'event_magnitude_mw': event_mw
+        'event_magnitude_mw': event_mw,
+    })
+    return result
+
+
+# =============================================================================
+# BATCH SCREENING
+# =============================================================================
+
+def find_ramp_events(load_mw, min_ramp_mw: float = 0.0, top_n: int = None) -> Dict:
+    """
+    Hourly load changes in a dispatch profile, largest first.
+
+    Returns arrays: hour (index of the hour the new load starts), before_mw, delta_mw.
+    """
+    load = np.asarray(load_mw, dtype=float)
+    delta = np.diff(load)
+    hours = np.nonzero(np.abs(delta) >= max(min_ramp_mw, 1e-9))[0]
+    hours = hours[np.argsort(-np.abs(delta[hours]), kind='stable')][:top_n]
+    return {'hour': hours + 1, 'before_mw': load[hours], 'delta_mw': delta[hours]}
+
+
+def ramp_event_profiles(
+    before_mw: np.ndarray,
+    delta_mw: np.ndarray,
+    resolution_s: float = 0.1,
+    window_s: float = 120,
+    ramp_duration_s: float = 0,
+    lead_s: float = 10,
+) -> np.ndarray:
+    """(n_events, n_samples) load profiles: steady at before_mw, then a step (or linear ramp) of delta_mw."""
+    t = np.arange(0, window_s, resolution_s) - lead_s
+    shape = np.clip(t / ramp_duration_s, 0, 1) if ramp_duration_s > 0 else (t >= 0).astype(float)
+    return np.asarray(before_mw, dtype=float)[:, None] + np.asarray(delta_mw, dtype=float)[:, None] * shape
+
+
+def screen_ramp_events(
+    load_mw,
+    resolution_s: float = 0.1,
+    window_s: float = 120,
+    ramp_duration_s: float = 0,
+    min_ramp_mw: float = 0.0,
+    top_n: int = None,
+    chunk_events: int = 512,
+    **model_kwargs,
+) -> Dict:
+    """
+    Simulate every hourly ramp of an 8760 dispatch as a transient event.
+
+    Each change in hourly load is applied as a step (or a ramp over
+    ramp_duration_s) from the previous hour's load, which is also the
+    per-unit base. Events are simulated in chunks of chunk_events; only the
+    per-event metrics are kept. model_kwargs go to simulate_transients
+    (bess_mw, inertia_h, ...).
+
+    Returns:
+        Dict with per-event arrays (hour, before_mw, delta_mw and the
+        calculate_power_quality_metrics fields), severity counts and the
+        worst nadir / RoCoF
+    """
+    events = find_ramp_events(load_mw, min_ramp_mw, top_n)
+    n = len(events['hour'])
+    metrics: Dict[str, list] = {}
+    for start in range(0, n, chunk_events):
+        sl = slice(start, start + chunk_events)
+        profiles = ramp_event_profiles(events['before_mw'][sl], events['delta_mw'][sl],
+                                       resolution_s, window_s, ramp_duration_s)
+        data = simulate_transients(profiles, events['before_mw'][sl], resolution_s, **model_kwargs)
+        for key, value in calculate_power_quality_metrics(data).items():
+            metrics.setdefault(key, []).append(np.atleast_1d(value))
+    per_event = {key: np.concatenate(parts) for key, parts in metrics.items()}
+
+    severity = per_event.get('transient_severity', np.array([], dtype=object))
+    return {
+        'n_events': n,
+        'resolution_s': resolution_s,
+        **events,
+        **per_event,
+        'severity_counts': {level: int(np.sum(severity == level))
+                            for level in ('Severe', 'Moderate', 'Minor', 'Negligible')},
+        'worst_nadir_hz': float(per_event['frequency_nadir_hz'].min()) if n else F0,
+        'worst_rocof_hz_s': float(per_event['rocof_hz_s'].max()) if n else 0.0,
     }
 
 
+# =============================================================================
+# POWER QUALITY METRICS
+# =============================================================================
+
+def _time_step(transient_data: Dict) -> float:
+    if 'resolution_s' in transient_data:
+        return float(transient_data['resolution_s'])
+    time = np.asarray(transient_data['time'])
+    return float(time[1] - time[0]) if len(time) > 1 else 1.0
+
+
 def calculate_power_quality_metrics(transient_data: Dict) -> Dict:
     """
     Calculate power quality metrics from high-res data
+
+    Works on one event (1-D series, scalar metrics) or a batch from
+    simulate_transients (2-D, one value per event).
     """
-    
-    frequency = transient_data['frequency_hz']
-    load_delta = transient_data['load_delta_mw_s']
-    bess_response = transient_data['bess_response_mw']
-    
+
+    frequency = np.asarray(transient_data['frequency_hz'])
+    load_delta = np.asarray(transient_data['load_delta_mw_s'])
+    bess_response = np.asarray(transient_data['bess_response_mw'])
+    dt = _time_step(transient_data)
+
+    # RoCoF over a sliding 500 ms window (at least one step)
+    window = max(1, int(round(ROCOF_WINDOW_S / dt)))
+    if frequency.shape[-1] > window:
+        rocof = np.max(np.abs(frequency[..., window:] - frequency[..., :-window]), axis=-1) / (window * dt)
+    else:
+        rocof = np.zeros(frequency.shape[:-1])
+
+    deviation = np.abs(frequency - F0)
     metrics = {
-        'max_frequency_deviation_hz': max(abs(frequency - 60.0)),
-        'max_ramp_rate_mw_s': np.max(np.abs(load_delta)),
-        'avg_ramp_rate_mw_s': np.mean(np.abs(load_delta)),
-        'bess_max_response_mw': np.max(np.abs(bess_response)),
-        'bess_total_energy_mwh': np.sum(np.abs(bess_response)) / 3600,  # Convert to MWh
-        'frequency_nadir_hz': np.min(frequency),
-        'frequency_zenith_hz': np.max(frequency),
+        'max_frequency_deviation_hz': np.max(deviation, axis=-1),
+        'max_ramp_rate_mw_s': np.max(np.abs(load_delta), axis=-1),
+        'avg_ramp_rate_mw_s': np.mean(np.abs(load_delta), axis=-1),
+        'bess_max_response_mw': np.max(np.abs(bess_response), axis=-1),
+        'bess_total_energy_mwh': np.sum(np.abs(bess_response), axis=-1) * dt / 3600,
+        'frequency_nadir_hz': np.min(frequency, axis=-1),
+        'frequency_zenith_hz': np.max(frequency, axis=-1),
+        'time_to_nadir_s': np.argmin(frequency, axis=-1) * dt,
+        'rocof_hz_s': rocof,
         'time_to_stabilize_s': calculate_stabilization_time(transient_data),
-        'transient_severity': classify_transient_severity(transient_data)
+        'transient_severity': classify_transient_severity(transient_data),
     }
-    
+
+    if frequency.ndim == 1:
+        metrics = {key: value.item() if isinstance(value, np.ndarray) else value for key, value in metrics.items()}
     return metrics
 
 
-def calculate_stabilization_time(transient_data: Dict) -> float:
+def calculate_stabilization_time(transient_data: Dict):
     """
     Calculate time for system to stabilize after transient
+
+    Seconds from the first excursion beyond 0.1 Hz until frequency is back
+    within 0.1 Hz for good (and for at least 10 s); 0 if it never leaves the
+    band, the rest of the window if it never settles.
     """
-    
-    frequency = transient_data['frequency_hz']
-    
-    # Find when frequency returns to within 0.1 Hz of nominal and stays there
+
+    frequency = np.asarray(transient_data['frequency_hz'])
+    dt = _time_step(transient_data)
     stable_threshold = 0.1  # Hz
-    stable_duration = 10  # Must be stable for 10 seconds
-    
-    for i in range(len(frequency) - stable_duration):
-        window = frequency[i:i+stable_duration]
-        if np.all(np.abs(window - 60.0) < stable_threshold):
-            return transient_data['time'][i]
-    
-    return transient_data['time'][-1]  # Didn't stabilize
+    stable_samples = int(round(10 / dt))  # Must be stable for 10 seconds
+
+    outside = np.abs(frequency - F0) >= stable_threshold
+    n = frequency.shape[-1]
+    any_out = outside.any(axis=-1)
+    first_out = np.argmax(outside, axis=-1)
+    settled_at = n - np.argmax(outside[..., ::-1], axis=-1)  # one past the last excursion
+    settled = n - settled_at >= stable_samples
+    result = np.where(any_out, np.where(settled, settled_at - first_out, n - first_out) * dt, 0.0)
+    return result.item() if result.ndim == 0 else result
+
+
+def _max_windowed_ramp(transient_data: Dict) -> np.ndarray:
+    """Largest load change over any RAMP_WINDOW_S window, in MW/s (independent of the resolution)."""
+    dt = _time_step(transient_data)
+    window = max(1, int(round(RAMP_WINDOW_S / dt)))
+    if 'load_mw' not in transient_data:
+        return np.max(np.abs(np.asarray(transient_data['load_delta_mw_s'])), axis=-1)
+    load = np.asarray(transient_data['load_mw'], dtype=float)
+    if load.shape[-1] <= window:
+        return np.abs(load[..., -1] - load[..., 0]) / (window * dt)
+    return np.max(np.abs(load[..., window:] - load[..., :-window]), axis=-1) / (window * dt)
 
 
-def classify_transient_severity(transient_data: Dict) -> str:
+def classify_transient_severity(transient_data: Dict):
     """
     Classify transient severity based on IEEE standards
+
+    The ramp criterion uses the load change over a 1 s window, so a step
+    rates the same at every simulation resolution.
     """
-    
-    max_freq_dev = max(abs(transient_data['frequency_hz'] - 60.0))
-    max_ramp = np.max(np.abs(transient_data['load_delta_mw_s']))
-    
-    if max_freq_dev > 0.5 or max_ramp > 50:
-        return "Severe"
-    elif max_freq_dev > 0.3 or max_ramp > 20:
-        return "Moderate"
-    elif max_freq_dev > 0.1 or max_ramp > 5:
-        return "Minor"
-    else:
-        return "Negligible"
+
+    max_freq_dev = np.max(np.abs(np.asarray(transient_data['frequency_hz']) - F0), axis=-1)
+    max_ramp = _max_windowed_ramp(transient_data)
+
+    severity = np.select(
+        [(max_freq_dev > 0.5) | (max_ramp > 50),
+         (max_freq_dev > 0.3) | (max_ramp > 20),
+         (max_freq_dev > 0.1) | (max_ramp > 5)],
+        ["Severe", "Moderate", "Minor"],
+        default="Negligible",
+    ).astype(object)
+    return severity.item() if severity.ndim == 0 else severity
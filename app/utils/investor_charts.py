@@ -127,3 +127,68 @@ def create_cash_flow_waterfall(site_data: Dict) -> go.Figure:
     )
     
     return fig
+
+
+def create_npv_distribution_chart(mc_result: Dict) -> go.Figure:
+    """Create histogram of portfolio NPV across Monte Carlo draws with P10/P50/P90 markers"""
+    
+    pct = mc_result['portfolio_npv_m']
+    
+    fig = go.Figure(data=[
+        go.Histogram(
+            x=mc_result['npv_draws_m'],
+            nbinsx=60,
+            marker_color='#3b82f6',
+            opacity=0.8
+        )
+    ])
+    
+    for label, color in (('p10', '#ef4444'), ('p50', '#10b981'), ('p90', '#ef4444')):
+        fig.add_vline(x=pct[label], line_dash="dash", line_color=color,
+                      annotation_text=f"{label.upper()}: ${pct[label]:,.0f}M")
+    
+    fig.update_layout(
+        title=f"Portfolio NPV Distribution ({mc_result['n_draws']:,} draws)",
+        xaxis_title="Portfolio NPV ($M)",
+        yaxis_title="Draws",
+        height=400,
+        showlegend=False
+    )
+    
+    return fig
+
+
+def create_tornado_chart(tornado: Dict) -> go.Figure:
+    """Create tornado chart of portfolio NPV swings per driver"""
+    
+    labels = {
+        'gas_price_mmbtu': lambda v: f"Gas ${v:.2f}/MMBtu",
+        'capex_multiplier': lambda v: f"CapEx x{v:.2f}",
+        'discount_rate': lambda v: f"Discount {v * 100:.0f}%",
+    }
+    base = tornado['base_npv_m']
+    drivers = sorted(tornado['drivers'], key=lambda d: abs(d['npv_high_m'] - d['npv_low_m']))
+    names = [d['driver'].replace('_', ' ').title() for d in drivers]
+    
+    fig = go.Figure()
+    for side, color in (('low', '#10b981'), ('high', '#ef4444')):
+        fig.add_trace(go.Bar(
+            y=names,
+            x=[d[f'npv_{side}_m'] - base for d in drivers],
+            base=base,
+            orientation='h',
+            name=side.title(),
+            marker_color=color,
+            text=[labels.get(d['driver'], str)(d[side]) for d in drivers],
+            textposition='auto'
+        ))
+    
+    fig.add_vline(x=base, line_color='gray', annotation_text=f"Base: ${base:,.0f}M")
+    fig.update_layout(
+        title="Portfolio NPV Sensitivity",
+        xaxis_title="Portfolio NPV ($M)",
+        barmode='overlay',
+        height=400
+    )
+    
+    return fig
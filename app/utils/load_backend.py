@@ -8,12 +8,8 @@ ARCHITECTURE: Facility Load is source of truth, IT load is derived (Facility / P
 import json
 from datetime import datetime
 from typing import Dict, Optional
-import gspread
 
-
-def get_google_sheets_client():
-    """Get authenticated Google Sheets client"""
-    return gspread.service_account(filename='credentials.json')
+from app.utils.sheets_pool import get_sheets_client
 
 
 def save_load_configuration(site_name: str, load_config: dict) -> bool:
@@ -50,7 +46,7 @@ def save_load_configuration(site_name: str, load_config: dict) -> bool:
         
         from config.settings import GOOGLE_SHEET_ID as SHEET_ID
         
-        client = get_google_sheets_client()
+        client = get_sheets_client('credentials.json')
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Load_Profiles")
         
@@ -249,7 +245,7 @@ def load_load_configuration(site_name: str) -> Dict:
     try:
         from config.settings import GOOGLE_SHEET_ID as SHEET_ID
         
-        client = get_google_sheets_client()
+        client = get_sheets_client('credentials.json')
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Load_Profiles")
         
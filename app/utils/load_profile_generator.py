@@ -7,6 +7,9 @@ Standalone functions for generating load profiles with flexibility breakdown.
 import numpy as np
 from typing import Dict, Optional
 
+from app.utils.profile_cache import cached_profile
+from app.utils.profile_engine import ProfileEngine
+
 
 def generate_load_profile_with_flexibility(
     peak_it_load_mw: float,
@@ -36,8 +39,6 @@ def generate_load_profile_with_flexibility(
     Returns:
         Dict with arrays for all load and flexibility components
     """
-    np.random.seed(seed)
-    
     # Default flexibility parameters (from research)
     default_flex = {
         'pre_training': 0.30,
@@ -59,23 +60,21 @@ def generate_load_profile_with_flexibility(
     profile = np.full(hours, base_load)
     
     if include_patterns:
-        for h in range(hours):
-            hour_of_day = h % 24
-            day_of_year = h // 24
-            
-            # Daily pattern: higher during 9am-10pm
-            if 9 <= hour_of_day <= 22:
-                daily_factor = 1.03
-            else:
-                daily_factor = 0.95
-            
-            # Seasonal pattern: ±5% (peak in summer)
-            seasonal_factor = 1.0 + 0.05 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
-            
-            # Random noise: ±2%
-            random_factor = 1.0 + np.random.uniform(-0.02, 0.02)
-            
-            profile[h] = base_load * daily_factor * seasonal_factor * random_factor
+        def build():
+            engine = ProfileEngine(seed, hours=hours)
+            return engine.build(
+                base_load,
+                factors=[
+                    # Daily pattern: higher during 9am-10pm
+                    engine.daily_window(9, 22, on=1.03, off=0.95),
+                    # Seasonal pattern: ±5% (peak in summer)
+                    engine.seasonal_sine(0.05, shift=80),
+                ],
+                # Random noise: ±2%
+                noise=engine.uniform(0.98, 1.02),
+            )
+        
+        profile = cached_profile('flexibility_load/v1', (float(base_load), hours, seed), build)
     
     # Clip to reasonable bounds
     profile = np.clip(profile, peak_facility_mw * 0.5, peak_facility_mw)
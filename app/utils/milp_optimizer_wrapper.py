@@ -5,76 +5,117 @@ MILP Optimizer Wrapper - DIAGNOSTIC VERSION
 This version has extensive error handling and logging to diagnose
 why the MILP optimization is failing.
 
-Replace app/utils/milp_optimizer_wrapper.py with this file.
+Importing this module is cheap and side-effect free: Pyomo, the MILP model
+and solver detection load on the first milp_status() call (made by
+optimize_with_milp) and are cached for the process. The old module-level
+flags (PYOMO_AVAILABLE, SOLVER_AVAILABLE, SOLVER_NAME, MILP_MODEL_AVAILABLE,
+IMPORT_ERRORS, bvNexusMILP_DR) still resolve, lazily, through milp_status().
+Run the module directly for the diagnostic banner.
 """
 
 import logging
 import traceback
+from functools import lru_cache
 from typing import Dict, List, Optional
 import sys
 
-# Set up detailed logging
-logging.basicConfig(level=logging.DEBUG)
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+from app.utils.scenario_runner import ScenarioRunner
+from app.utils.solve_cache import get_solve_cache, milp_build_key, milp_cache_key, model_version
+from app.utils.solve_profiler import SolveProfiler
+
 # ============================================================================
-# DIAGNOSTIC: Check imports
+# DIAGNOSTIC: Check imports (lazily, once per process)
 # ============================================================================
 
-IMPORT_ERRORS = []
-
-# Check numpy
-try:
-    import numpy as np
-    logger.info("✓ numpy imported successfully")
-except ImportError as e:
-    IMPORT_ERRORS.append(f"numpy: {e}")
-    logger.error(f"✗ numpy import failed: {e}")
-    np = None
-
-# Check pyomo
-try:
-    from pyomo.environ import SolverFactory
-    logger.info("✓ pyomo imported successfully")
-    PYOMO_AVAILABLE = True
-except ImportError as e:
-    IMPORT_ERRORS.append(f"pyomo: {e}")
-    logger.error(f"✗ pyomo import failed: {e}")
-    PYOMO_AVAILABLE = False
+_STATUS_NAMES = {
+    'PYOMO_AVAILABLE': 'pyomo_available',
+    'SOLVER_AVAILABLE': 'solver_available',
+    'SOLVER_NAME': 'solver_name',
+    'MILP_MODEL_AVAILABLE': 'milp_model_available',
+    'IMPORT_ERRORS': 'import_errors',
+    'bvNexusMILP_DR': 'model_class',
+}
 
-# Check solver availability
-SOLVER_AVAILABLE = None
-SOLVER_NAME = None
 
-if PYOMO_AVAILABLE:
+@lru_cache(maxsize=None)
+def milp_status() -> Dict:
+    """
+    Import Pyomo and the MILP model and detect a solver, once per process.
+    
+    Returns dict with pyomo_available, solver_available, solver_name,
+    milp_model_available, import_errors and model_class.
+    """
+    status = {
+        'pyomo_available': False,
+        'solver_available': None,
+        'solver_name': None,
+        'milp_model_available': False,
+        'import_errors': [],
+        'model_class': None,
+    }
+    
+    # Check pyomo
+    try:
+        import pyomo.environ  # noqa: F401
+        logger.info("✓ pyomo imported successfully")
+        status['pyomo_available'] = True
+    except ImportError as e:
+        status['import_errors'].append(f"pyomo: {e}")
+        logger.error(f"✗ pyomo import failed: {e}")
+    
+    # Check MILP model import
+    try:
+        from app.optimization.milp_model_dr import bvNexusMILP_DR, solver_available
+        logger.info("✓ bvNexusMILP_DR imported successfully")
+        status['milp_model_available'] = True
+        status['model_class'] = bvNexusMILP_DR
+    except ImportError as e:
+        status['import_errors'].append(f"milp_model_dr: {e}")
+        logger.error(f"✗ milp_model_dr import failed: {e}")
+        logger.error(f"  Full traceback: {traceback.format_exc()}")
+        return status
+    
+    # Check solver availability (cached per solver in milp_model_dr)
     for solver in ['cbc', 'glpk', 'gurobi']:
-        try:
-            opt = SolverFactory(solver)
-            if opt is not None and opt.available():
-                SOLVER_AVAILABLE = True
-                SOLVER_NAME = solver
-                logger.info(f"✓ Solver '{solver}' is available")
-                break
-            else:
-                logger.warning(f"✗ Solver '{solver}' not available")
-        except Exception as e:
-            logger.warning(f"✗ Solver '{solver}' check failed: {e}")
+        if solver_available(solver):
+            status['solver_available'] = True
+            status['solver_name'] = solver
+            logger.info(f"✓ Solver '{solver}' is available")
+            break
+        logger.warning(f"✗ Solver '{solver}' not available")
     
-    if not SOLVER_AVAILABLE:
-        logger.error("✗ No MILP solver found! Install glpk, cbc, or gurobi.")
+    if not status['solver_available']:
+        # scipy ships HiGHS; bvNexusMILP_DR solves with it in-process (no LP/solution files)
+        status['solver_available'] = True
+        status['solver_name'] = 'highs'
+        logger.warning("✗ No external MILP solver found (glpk, cbc, gurobi); using in-process HiGHS")
+    
+    return status
+
 
-# Check MILP model import
-MILP_MODEL_AVAILABLE = False
-bvNexusMILP_DR = None
+def __getattr__(name: str):
+    """Resolve the legacy module-level diagnostic flags on first access."""
+    if name in _STATUS_NAMES:
+        return milp_status()[_STATUS_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-try:
-    from app.optimization.milp_model_dr import bvNexusMILP_DR
-    logger.info("✓ bvNexusMILP_DR imported successfully")
-    MILP_MODEL_AVAILABLE = True
-except ImportError as e:
-    IMPORT_ERRORS.append(f"milp_model_dr: {e}")
-    logger.error(f"✗ milp_model_dr import failed: {e}")
-    logger.error(f"  Full traceback: {traceback.format_exc()}")
+
+def print_milp_status():
+    """Print the diagnostic banner."""
+    status = milp_status()
+    print("\n" + "="*60)
+    print("MILP OPTIMIZER DIAGNOSTIC STATUS")
+    print("="*60)
+    print(f"Pyomo available: {status['pyomo_available']}")
+    print(f"Solver available: {status['solver_available']} ({status['solver_name']})")
+    print(f"MILP model available: {status['milp_model_available']}")
+    if status['import_errors']:
+        print(f"Import errors: {status['import_errors']}")
+    print("="*60 + "\n")
 
 
 # ==============================================================================
@@ -202,45 +243,96 @@ def optimize_with_milp(
     solver: str = 'cbc',  # CBC is faster than GLPK
     time_limit: int = 300,
     scenario: Dict = None,
+    optimizer: 'bvNexusMILP_DR' = None,
+    use_cache: bool = True,
+    trace_path: str = None,
+    race: bool = False,
 ) -> Dict:
     """
     Run MILP optimization with extensive error handling.
+    
+    Pass an already-built `optimizer` (as run_milp_scenarios does) to re-use
+    its Pyomo model: only the mutable scenario Params are updated and the
+    solve warm-starts from the previous incumbent. A bvNexusMILP_Matrix
+    (sparse-matrix backend, solved with HiGHS) can be passed the same way.
+    
+    Formatted results are kept in the persistent solve cache (see
+    app.utils.solve_cache); identical inputs return the stored result
+    without solving. Pass use_cache=False to force a fresh solve.
+    
+    result['instrumentation'] holds wall time and peak RSS per pipeline
+    phase (input prep, each _build_* method, LP write, solver, extraction,
+    formatting), model size and MIP gap / node count; trace_path also
+    writes it as a Chrome trace (and counts the model size on the model when
+    the solver does not report it).
+    
+    race=True solves in-process with HiGHS under two configurations in
+    parallel processes and keeps the first to reach the target MIP gap.
     """
     
     logger.info("="*60)
     logger.info("MILP OPTIMIZATION - DIAGNOSTIC MODE")
     logger.info("="*60)
     
+    profiler = SolveProfiler()
+    
     # ========================================================================
     # STEP 1: Check prerequisites
     # ========================================================================
     
-    if IMPORT_ERRORS:
-        error_msg = f"Import errors: {', '.join(IMPORT_ERRORS)}"
+    status = milp_status()
+    bvNexusMILP_DR = status['model_class']
+    
+    if status['import_errors']:
+        error_msg = f"Import errors: {', '.join(status['import_errors'])}"
         logger.error(f"STEP 1 FAILED: {error_msg}")
         return _create_empty_result(error_msg)
     
-    if not PYOMO_AVAILABLE:
+    if not status['pyomo_available']:
         error_msg = "Pyomo not installed. Run: pip install pyomo"
         logger.error(f"STEP 1 FAILED: {error_msg}")
         return _create_empty_result(error_msg)
     
-    if not SOLVER_AVAILABLE:
+    if not status['solver_available']:
         error_msg = "No MILP solver found. Install glpk: brew install glpk (mac) or apt install glpk-utils (linux)"
         logger.error(f"STEP 1 FAILED: {error_msg}")
         return _create_empty_result(error_msg)
     
-    if not MILP_MODEL_AVAILABLE:
+    if not status['milp_model_available']:
         error_msg = "MILP model class not available. Check milp_model_dr.py for errors."
         logger.error(f"STEP 1 FAILED: {error_msg}")
         return _create_empty_result(error_msg)
     
     logger.info("✓ STEP 1: All prerequisites met")
     
+    # Fingerprint the inputs before any step below normalizes them
+    profiler.lap('cache_lookup')
+    cache_key = None
+    cache = get_solve_cache() if use_cache else None
+    if cache is not None:
+        try:
+            cache_key = milp_cache_key(
+                'milp/v1', site, constraints, load_profile_dr, years or list(range(2028, 2036)),
+                scenario, f"{solver}/race" if race else solver, time_limit, existing_equipment,
+                model_version(type(optimizer) if optimizer is not None else bvNexusMILP_DR,
+                              EQUIPMENT_PARAMS, GAS_PRICE, GRID_PRICE, GRID_LEAD_TIME,
+                              optimizer.cache_config() if optimizer is not None else {},
+                              sources=(__name__,)),
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"✓ Solve cache hit ({cache_key[:12]}) - skipping solve")
+                cached['instrumentation'] = dict(profiler.summary(), cache_hit=True)
+                return cached
+        except Exception as e:
+            logger.warning(f"Solve cache lookup failed, solving: {e}")
+            cache_key = None
+    
     # ========================================================================
     # STEP 2: Validate inputs
     # ========================================================================
     
+    profiler.lap('input_prep')
     try:
         if years is None:
             years = list(range(2028, 2036))  # Match load trajectory
@@ -339,8 +431,11 @@ def optimize_with_milp(
     # STEP 4: Build MILP model
     # ========================================================================
     
+    profiler.lap('build')
     try:
-        optimizer = bvNexusMILP_DR()
+        if optimizer is None:
+            optimizer = bvNexusMILP_DR()
+        optimizer.profiler = profiler
         
         workload_mix = load_profile_dr.get('workload_mix', {
             'pre_training': 0.30,
@@ -376,28 +471,51 @@ def optimize_with_milp(
             site = {}
         site['load_trajectory'] = load_profile_dr.get('load_trajectory', {})
         load_data['load_trajectory'] = load_profile_dr.get('load_trajectory', DEFAULT_LOAD_TRAJECTORY)
-
         
-        logger.info("  Building model...")
-        
-        optimizer.build(
-            site=site,
-            constraints=constraints,
-            load_data=load_data,
-            workload_mix=workload_mix,
-            years=years,
-            dr_config=dr_config,
-            existing_equipment=existing_equipment,
-            grid_config=grid_config,
-            use_representative_periods=True,
-        )
+        # A built model is only re-used when everything baked into its structure
+        # (load shape, years, workload mix, DR config, existing fleet, periods) matches
+        representative_periods = load_profile_dr.get('representative_periods')
+        build_key = milp_build_key(load_data, workload_mix, years, dr_config,
+                                   existing_equipment, representative_periods)
+        reuse_model = optimizer.is_built and optimizer.build_key == build_key
+        if optimizer.is_built and not reuse_model:
+            logger.info("  Build inputs changed since the model was built - rebuilding")
         
-        logger.info("✓ STEP 4: Model built successfully")
+        if reuse_model:
+            logger.info("  Re-using built model (updating scenario parameters)...")
+            optimizer.update_scenario(
+                constraints=constraints,
+                grid_config=grid_config,
+                load_trajectory=site['load_trajectory'],
+            )
+            logger.info("✓ STEP 4: Model parameters updated")
+        else:
+            logger.info("  Building model...")
+            
+            optimizer.build(
+                site=site,
+                constraints=constraints,
+                load_data=load_data,
+                workload_mix=workload_mix,
+                years=years,
+                dr_config=dr_config,
+                existing_equipment=existing_equipment,
+                grid_config=grid_config,
+                use_representative_periods=True,
+                # Optional override: 'fixed', a dict of select_representative_periods kwargs,
+                # or a RepresentativePeriods instance (default: 12 k-medoids days)
+                representative_periods=representative_periods,
+            )
+            optimizer.build_key = build_key
+            
+            logger.info("✓ STEP 4: Model built successfully")
         
     except Exception as e:
         error_msg = f"Model build failed: {e}"
         logger.error(f"STEP 4 FAILED: {error_msg}")
         logger.error(traceback.format_exc())
+        if optimizer is not None:
+            optimizer.profiler = None
         return _create_empty_result(error_msg)
     
     # ========================================================================
@@ -405,11 +523,14 @@ def optimize_with_milp(
     # STEP 5: Apply scenario constraints + load-following + lead times
     # ========================================================================
     
+    profiler.lap('scenario')
     try:
         scenario_name = scenario.get('Scenario_Name', 'Unknown') if scenario else 'Default'
         logger.info(f"  Applying constraints for scenario: {scenario_name}")
         
-        m = optimizer.model
+        # Availability is applied through the model's TECH_AVAIL Params (not by
+        # fixing variables) so the same model can be re-used across scenarios
+        availability = {tech: {y: True for y in years} for tech in optimizer.TECHNOLOGIES}
         
         # =====================
         # 5A: SCENARIO EQUIPMENT CONSTRAINTS
@@ -428,33 +549,18 @@ def optimize_with_milp(
                             return True
                 return False
             
-            if is_disabled('Recip_Enabled', 'Recip_Engines'):
-                logger.info("    🚫 RECIPS: Disabled by scenario")
-                for y in years:
-                    m.n_recip[y].fix(0)
-            
-            if is_disabled('Turbine_Enabled', 'Gas_Turbines'):
-                logger.info("    🚫 TURBINES: Disabled by scenario")
-                for y in years:
-                    m.n_turbine[y].fix(0)
-            
-            if is_disabled('Solar_Enabled', 'Solar_PV'):
-                logger.info("    🚫 SOLAR: Disabled by scenario")
-                for y in years:
-                    m.solar_mw[y].fix(0)
-            
-            if is_disabled('BESS_Enabled', 'BESS'):
-                logger.info("    🚫 BESS: Disabled by scenario")
-                for y in years:
-                    m.bess_mwh[y].fix(0)
-                    m.bess_mw[y].fix(0)
-            
-            if is_disabled('Grid_Enabled', 'Grid_Connection'):
-                logger.info("    🚫 GRID: Disabled by scenario (BTM mode)")
-                for y in years:
-                    m.grid_mw[y].fix(0)
-                    if hasattr(m, 'grid_active'):
-                        m.grid_active[y].fix(0)
+            scenario_flags = [
+                ('recip', 'Recip_Enabled', 'Recip_Engines', "    🚫 RECIPS: Disabled by scenario"),
+                ('turbine', 'Turbine_Enabled', 'Gas_Turbines', "    🚫 TURBINES: Disabled by scenario"),
+                ('solar', 'Solar_Enabled', 'Solar_PV', "    🚫 SOLAR: Disabled by scenario"),
+                ('bess', 'BESS_Enabled', 'BESS', "    🚫 BESS: Disabled by scenario"),
+                ('grid', 'Grid_Enabled', 'Grid_Connection', "    🚫 GRID: Disabled by scenario (BTM mode)"),
+            ]
+            for tech, primary_key, alt_key, message in scenario_flags:
+                if is_disabled(primary_key, alt_key):
+                    logger.info(message)
+                    for y in years:
+                        availability[tech][y] = False
         
         # =====================
         # 5B: LOAD-FOLLOWING CONSTRAINTS
@@ -466,15 +572,8 @@ def optimize_with_milp(
             load_y = trajectory.get(y, 0)
             if load_y == 0:
                 logger.info(f"    📉 Year {y}: Load=0 MW, fixing all equipment to 0")
-                m.n_recip[y].fix(0)
-                m.n_turbine[y].fix(0)
-                m.solar_mw[y].fix(0)
-                m.bess_mwh[y].fix(0)
-                m.bess_mw[y].fix(0)
-                if hasattr(m, 'grid_mw'):
-                    m.grid_mw[y].fix(0)
-                if hasattr(m, 'grid_active'):
-                    m.grid_active[y].fix(0)
+                for tech in availability:
+                    availability[tech][y] = False
         
         # =====================
         # 5C: LEAD TIME CONSTRAINTS
@@ -485,72 +584,68 @@ def optimize_with_milp(
         # Get grid lead time from scenario or default
         grid_lead = scenario.get('Grid_Timeline_Months', GRID_LEAD_TIME) if scenario else GRID_LEAD_TIME
         
+        lead_times = [
+            ('bess', EQUIPMENT_PARAMS['bess']['lead_time'], "BESS"),       # 12 months
+            ('solar', EQUIPMENT_PARAMS['solar']['lead_time'], "Solar"),    # 12 months
+            ('recip', EQUIPMENT_PARAMS['recip']['lead_time'], "Recips"),   # 18 months
+            ('turbine', EQUIPMENT_PARAMS['turbine']['lead_time'], "Turbines"),  # 24 months
+        ]
+        
         for y in years:
             # Calculate months from 2025 (current year), not from planning start
             months_from_start = (y - 2025) * 12
             
-            # BESS: 12 months
-            if months_from_start < EQUIPMENT_PARAMS['bess']['lead_time']:
-                if not m.bess_mwh[y].is_fixed():
-                    m.bess_mwh[y].fix(0)
-                    m.bess_mw[y].fix(0)
-                    if months_from_start == 0:
-                        logger.info(f"    ⏰ Year {y}: BESS not available (lead time)")
-            
-            # Solar: 12 months
-            if months_from_start < EQUIPMENT_PARAMS['solar']['lead_time']:
-                if not m.solar_mw[y].is_fixed():
-                    m.solar_mw[y].fix(0)
-                    if months_from_start == 0:
-                        logger.info(f"    ⏰ Year {y}: Solar not available (lead time)")
-            
-            # Recip: 18 months
-            if months_from_start < EQUIPMENT_PARAMS['recip']['lead_time']:
-                if not m.n_recip[y].is_fixed():
-                    m.n_recip[y].fix(0)
-                    if months_from_start == 0:
-                        logger.info(f"    ⏰ Year {y}: Recips not available (lead time)")
-            
-            # Turbine: 24 months
-            if months_from_start < EQUIPMENT_PARAMS['turbine']['lead_time']:
-                if not m.n_turbine[y].is_fixed():
-                    m.n_turbine[y].fix(0)
+            for tech, lead_time, label in lead_times:
+                if months_from_start < lead_time:
+                    availability[tech][y] = False
                     if months_from_start == 0:
-                        logger.info(f"    ⏰ Year {y}: Turbines not available (lead time)")
+                        logger.info(f"    ⏰ Year {y}: {label} not available (lead time)")
             
             # Grid: 60 months (default)
             if months_from_start < grid_lead:
-                if hasattr(m, 'grid_mw') and not m.grid_mw[y].is_fixed():
-                    m.grid_mw[y].fix(0)
-                if hasattr(m, 'grid_active') and not m.grid_active[y].is_fixed():
-                    m.grid_active[y].fix(0)
+                availability['grid'][y] = False
                 if months_from_start == 0:  # Only log once
                     logger.info(f"    ⏰ Grid not available until {start_year + grid_lead // 12}")
         
+        optimizer.update_scenario(tech_availability=availability)
+        
         logger.info("✓ STEP 5: All constraints applied")
         
     except Exception as e:
         error_msg = f"Scenario constraints failed: {e}"
         logger.error(f"STEP 5 FAILED: {error_msg}")
         logger.error(traceback.format_exc())
+        optimizer.profiler = None
         return _create_empty_result(error_msg)
     
     # ========================================================================
     # STEP 6: Solve model
     # ========================================================================
     
+    profiler.lap('solve')
     try:
-        use_solver = SOLVER_NAME or solver
+        use_solver = status['solver_name'] or solver
         logger.info(f"  Solving with {use_solver}...")
         
         solution = optimizer.solve(
             solver=use_solver,
             time_limit=time_limit,
-            verbose=False
+            verbose=False,
+            race=race,
         )
         
         logger.info(f"  Solver status: {solution.get('status', 'unknown')}")
         logger.info(f"  Termination: {solution.get('termination', 'unknown')}")
+        
+        # Model size as reported by the solver, else counted on the model (a
+        # pass over every constraint) when a trace was asked for
+        solver_stats = dict(solution.get('solver_stats', {}))
+        model_size = {k: int(solver_stats.pop(k)) for k in ('n_variables', 'n_constraints', 'n_nonzeros')
+                      if k in solver_stats}
+        if len(model_size) < 3 and trace_path:
+            with profiler.phase('model_size'):
+                model_size = optimizer.model_size()
+        profiler.record(model_size=model_size, solver=dict(solver_stats, name=use_solver))
         logger.info("✓ STEP 6: Model solved")
         
     except Exception as e:
@@ -558,17 +653,28 @@ def optimize_with_milp(
         logger.error(f"STEP 6 FAILED: {error_msg}")
         logger.error(traceback.format_exc())
         return _create_empty_result(error_msg)
+    finally:
+        optimizer.profiler = None  # only build and solve are profiled
     
     # ========================================================================
     # STEP 7: Format results
     # ========================================================================
     
+    profiler.lap('_format_solution_safe')
     try:
         result = _format_solution_safe(solution, years, constraints, load_data)
         logger.info(f"  LCOE: ${result['economics'].get('lcoe_mwh', 0):.2f}/MWh")
         logger.info(f"  Coverage: {result['power_coverage'].get('final_coverage_pct', 0):.1f}%")
         logger.info("✓ STEP 7: Results formatted")
         
+        result['instrumentation'] = profiler.summary()
+        result.setdefault('runtime_seconds', result['instrumentation']['total_s'])
+        _log_phase_times(profiler)
+        if trace_path:
+            logger.info(f"  Chrome trace: {profiler.write_chrome_trace(trace_path)}")
+        
+        if cache_key is not None:
+            cache.put(cache_key, result)
         return result
         
     except Exception as e:
@@ -578,6 +684,14 @@ def optimize_with_milp(
         return _create_empty_result(error_msg)
 
 
+def _log_phase_times(profiler: SolveProfiler):
+    """One log line per top-level phase, slowest first."""
+    top = [p for p in profiler.phases if p['depth'] == 0]
+    for p in sorted(top, key=lambda p: -p['wall_s']):
+        peak = f", peak RSS {p['peak_rss_mb']:.0f} MB" if p.get('peak_rss_mb') else ""
+        logger.info(f"  ⏱ {p['name']}: {p['wall_s']:.2f}s{peak}")
+
+
 def _format_solution_safe(solution: Dict, years: List[int], constraints: Dict, load_data: Dict) -> Dict:
     """
     Format MILP solution with COMPLETE economics calculation.
@@ -844,6 +958,9 @@ def _format_solution_safe(solution: Dict, years: List[int], constraints: Dict, l
             'total_dr_mw': 0,
         },
         
+        # Hourly (T x Y) NumPy arrays; lists only at the JSON boundary (data_io.json_default)
+        'dispatch': solution.get('dispatch', {}),
+        
         'metrics': {
             'nox_tpy': nox_tpy,
             'gas_mcf_day': avg_mcf,
@@ -863,8 +980,24 @@ def run_milp_scenarios(
     scenarios: List[Dict] = None,
     years: List[int] = None,
     solver: str = 'cbc',  # CBC is faster than GLPK
+    time_limit: int = 300,
+    max_workers: int = None,
+    scenario_timeout: float = None,
+    progress_callback=None,
+    runner: 'ScenarioRunner' = None,
 ) -> List[Dict]:
-    """Run multiple scenarios."""
+    """
+    Run multiple scenarios.
+    
+    Scenarios are solved in parallel worker processes (one per scenario, up
+    to the CPU count or `max_workers`), so the sweep takes roughly as long
+    as its slowest scenario. A scenario still running after
+    `scenario_timeout` seconds (default: time_limit plus two minutes for
+    model build) is terminated and reported as infeasible. Pass a
+    ScenarioRunner as `runner` to cancel() or poll progress() from another
+    thread. max_workers=1 solves serially in-process on one shared,
+    warm-started model instead.
+    """
     
     if years is None:
         years = list(range(2028, 2036))  # Match load trajectory
@@ -877,22 +1010,48 @@ def run_milp_scenarios(
     
     results = []
     
-    for scenario in scenarios:
-        logger.info(f"\n{'='*40}")
-        logger.info(f"SCENARIO: {scenario.get('Scenario_Name', 'Unknown')}")
-        logger.info(f"{'='*40}")
-        
-        result = optimize_with_milp(
-            site=site,
-            constraints=constraints,
-            load_profile_dr=load_profile_dr,
-            years=years,
-            scenario=scenario,
-            solver=solver,
-        )
+    if max_workers == 1:
+        # One model for the whole sweep: built on the first scenario, then only
+        # its mutable Params change (and each solve warm-starts from the last)
+        status = milp_status()
+        shared_optimizer = status['model_class']() if status['milp_model_available'] else None
         
-        result['scenario_name'] = scenario.get('Scenario_Name', 'Unknown')
-        results.append(result)
+        for scenario in scenarios:
+            logger.info(f"\n{'='*40}")
+            logger.info(f"SCENARIO: {scenario.get('Scenario_Name', 'Unknown')}")
+            logger.info(f"{'='*40}")
+            
+            result = optimize_with_milp(
+                site=site,
+                constraints=constraints,
+                load_profile_dr=load_profile_dr,
+                years=years,
+                scenario=scenario,
+                solver=solver,
+                time_limit=time_limit,
+                optimizer=shared_optimizer,
+            )
+            
+            result['scenario_name'] = scenario.get('Scenario_Name', 'Unknown')
+            results.append(result)
+    else:
+        runner = runner or ScenarioRunner(
+            max_workers=max_workers,
+            timeout=scenario_timeout or time_limit + 120,
+        )
+        names = [scenario.get('Scenario_Name', 'Unknown') for scenario in scenarios]
+        logger.info(f"Running {len(scenarios)} MILP scenarios in parallel")
+        results = runner.run(
+            optimize_with_milp,
+            [dict(site=site, constraints=constraints, load_profile_dr=load_profile_dr, years=years,
+                  scenario=scenario, solver=solver, time_limit=time_limit)
+             for scenario in scenarios],
+            names=names,
+            progress_callback=progress_callback,
+            error_result=lambda index, message: _create_empty_result(message),
+        )
+        for name, result in zip(names, results):
+            result['scenario_name'] = name
     
     # Sort by LCOE
     results.sort(key=lambda x: (
@@ -903,16 +1062,5 @@ def run_milp_scenarios(
     return results
 
 
-# ============================================================================
-# DIAGNOSTIC: Print status on import
-# ============================================================================
-
-print("\n" + "="*60)
-print("MILP OPTIMIZER DIAGNOSTIC STATUS")
-print("="*60)
-print(f"Pyomo available: {PYOMO_AVAILABLE}")
-print(f"Solver available: {SOLVER_AVAILABLE} ({SOLVER_NAME})")
-print(f"MILP model available: {MILP_MODEL_AVAILABLE}")
-if IMPORT_ERRORS:
-    print(f"Import errors: {IMPORT_ERRORS}")
-print("="*60 + "\n")
+if __name__ == "__main__":
+    print_milp_status()
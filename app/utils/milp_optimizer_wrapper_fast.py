@@ -15,6 +15,9 @@ import logging
 from typing import Dict, List
 import numpy as np
 
+from app.utils.solve_cache import get_solve_cache, milp_cache_key, model_version
+from app.utils.solve_profiler import SolveProfiler
+
 logger = logging.getLogger(__name__)
 
 # Import the STANDARD model (fast version had issues, speed comes from CBC + settings)
@@ -107,20 +110,41 @@ def optimize_with_milp(
     solver: str = 'cbc',  # CBC is faster than GLPK
     time_limit: int = 60,  # FAST: 60 seconds default
     scenario: Dict = None,
+    use_cache: bool = True,
+    trace_path: str = None,
 ) -> Dict:
     """
     Run MILP optimization (fast version).
     
-    Target solve time: 30-90 seconds
+    Target solve time: 30-90 seconds; repeated inputs are served from the
+    persistent solve cache unless use_cache=False. Per-phase timings land in
+    result['instrumentation'] (Chrome trace at trace_path if given).
     """
     
     if not MILP_AVAILABLE:
         return _empty_result("MILP model not available - check imports")
     
+    profiler = SolveProfiler()
     try:
+        profiler.lap('input_prep')
         # Defaults
         years = years or list(range(2026, 2036))
         
+        cache = get_solve_cache() if use_cache else None
+        cache_key = None
+        if cache is not None:
+            cache_key = milp_cache_key(
+                'milp_fast/v1', site, constraints, load_profile_dr, years, scenario, solver, time_limit,
+                existing_equipment,
+                model_version(bvNexusMILP_DR, EQUIPMENT_PARAMS, GAS_PRICE, GRID_PRICE, GRID_LEAD_TIME,
+                              sources=(__name__,)),
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Solve cache hit ({cache_key[:12]})")
+                cached['instrumentation'] = dict(profiler.summary(), cache_hit=True)
+                return cached
+        
         # Extract load params
         peak_mw = load_profile_dr.get('peak_it_mw', 160)
         pue = load_profile_dr.get('pue', 1.25)
@@ -142,7 +166,9 @@ def optimize_with_milp(
         
         # Build model
         logger.info("Building MILP model...")
+        profiler.lap('build')
         optimizer = bvNexusMILP_DR()
+        optimizer.profiler = profiler
         
         optimizer.build(
             site=site or {},
@@ -156,6 +182,7 @@ def optimize_with_milp(
         )
         
         # Apply scenario constraints
+        profiler.lap('scenario')
         if scenario:
             m = optimizer.model
             
@@ -185,10 +212,29 @@ def optimize_with_milp(
         
         # Solve
         logger.info(f"Solving (timeout: {time_limit}s)...")
+        profiler.lap('solve')
         solution = optimizer.solve(solver=solver, time_limit=time_limit, verbose=False)
+        optimizer.profiler = None
+        # Model size as reported by the solver; counting it on the model is a
+        # pass over every constraint, so only when a trace was asked for
+        solver_stats = dict(solution.get('solver_stats', {}))
+        model_size = {k: int(solver_stats.pop(k)) for k in ('n_variables', 'n_constraints', 'n_nonzeros')
+                      if k in solver_stats}
+        if len(model_size) < 3 and trace_path:
+            with profiler.phase('model_size'):
+                model_size = optimizer.model_size()
+        profiler.record(model_size=model_size, solver=dict(solver_stats, name=solver))
         
         # Format result
-        return _format_result(solution, years, constraints)
+        profiler.lap('_format_result')
+        result = _format_result(solution, years, constraints)
+        result['instrumentation'] = profiler.summary()
+        result.setdefault('runtime_seconds', result['instrumentation']['total_s'])
+        if trace_path:
+            profiler.write_chrome_trace(trace_path)
+        if cache_key is not None:
+            cache.put(cache_key, result)
+        return result
         
     except Exception as e:
         logger.error(f"MILP failed: {e}")
@@ -349,7 +349,10 @@ def run_all_scenarios(
     scenarios: List[Dict],
     grid_config: Dict = None,
     use_milp: bool = True,
-    load_profile_dr: Dict = None
+    load_profile_dr: Dict = None,
+    max_workers: int = None,
+    progress_callback=None,
+    runner=None,
 ) -> List[Dict]:
     """
     Run optimization for all scenarios using scipy optimizer OR new MILP
@@ -363,6 +366,10 @@ def run_all_scenarios(
         grid_config: Grid configuration (for scipy)
         use_milp: If True, use new MILP optimizer instead of scipy (RECOMMENDED)
         load_profile_dr: Load profile with DR (required if use_milp=True)
+        max_workers: Parallel MILP worker processes (default: one per
+            scenario, capped at the CPU count; 1 = serial on a shared model)
+        progress_callback: Called with ScenarioRunner.progress() snapshots
+        runner: Optional ScenarioRunner, e.g. to cancel() from the UI
     
     Returns:
         List of optimization results with constraint violations, RAM, and Transient data
@@ -391,19 +398,48 @@ def run_all_scenarios(
         import streamlit as st
         use_fast_milp = st.session_state.get('use_fast_milp', False)  # Default to accurate (regular model works)
         
+        milp_kwargs = {}
+        bvNexusMILP_DR = None
         if use_fast_milp:
             from app.utils.milp_optimizer_wrapper_fast import optimize_with_milp
             solver = 'cbc'  # Prefer CBC for fast mode
             time_limit = 60  # 60 seconds for fast mode
             mode_name = "Fast MILP (CBC)"
         else:
-            from app.utils.milp_optimizer_wrapper import optimize_with_milp
+            from app.utils.milp_optimizer_wrapper import optimize_with_milp, bvNexusMILP_DR
             solver = 'cbc'  # Use CBC for accurate mode (faster than GLPK)
             time_limit = 300  # 5 minutes for accurate mode
             mode_name = "Accurate MILP"
         
-        print(f"\n🚀 Running {len(scenarios)} scenarios with {mode_name}")
-        print(f"  Expected time: {len(scenarios) * time_limit} seconds (~{len(scenarios) * time_limit / 60:.1f} minutes)")
+        from app.utils.scenario_runner import ScenarioRunner, default_worker_count
+        workers = max_workers or default_worker_count(len(scenarios))
+        milp_years = list(range(2026, 2036))
+        
+        print(f"\n🚀 Running {len(scenarios)} scenarios with {mode_name} on {workers} worker(s)")
+        batches = -(-len(scenarios) // workers)
+        print(f"  Expected time: {batches * time_limit} seconds (~{batches * time_limit / 60:.1f} minutes)")
+        
+        milp_args = [
+            dict(site=site, constraints=constraints, load_profile_dr=load_profile_dr, years=milp_years,
+                 solver=solver, time_limit=time_limit, scenario=scenario)
+            for scenario in scenarios
+        ]
+        if workers == 1:
+            # Build the Pyomo model once; later scenarios only update its Params
+            if bvNexusMILP_DR is not None:
+                milp_kwargs['optimizer'] = bvNexusMILP_DR()
+            milp_outcomes = None
+        else:
+            # Solves run in parallel worker processes; formatting and the
+            # RAM / transient analyses below stay serial (they are cheap)
+            runner = runner or ScenarioRunner(max_workers=workers, timeout=time_limit + 120)
+            milp_outcomes = runner.run(
+                optimize_with_milp,
+                milp_args,
+                names=[s.get('Scenario_Name', 'Unknown') for s in scenarios],
+                progress_callback=progress_callback,
+                error_result=lambda index, message: RuntimeError(message),
+            )
         
         for idx, scenario in enumerate(scenarios):
             scenario_name = scenario.get('Scenario_Name', 'Unknown')
@@ -414,7 +450,7 @@ def run_all_scenarios(
                 print(f"\n{'='*60}")
                 print(f"MILP DIAGNOSTIC - Scenario: {scenario_name}")
                 print(f"{'='*60}")
-                print(f"Years: {list(range(2026, 2036))}")
+                print(f"Years: {milp_years}")
                 print(f"Solver: {solver}, Time limit: {time_limit}s")
                 print(f"\nConstraints:")
                 for key, val in constraints.items():
@@ -436,16 +472,13 @@ def run_all_scenarios(
                     print(f"  {key}: {scenario.get(key, 'NOT SET')}")
                 print(f"{'='*60}\n")
                 
-                # Run MILP optimization
-                milp_result = optimize_with_milp(
-                    site=site,
-                    constraints=constraints,
-                    load_profile_dr=load_profile_dr,
-                    years=list(range(2026, 2036)),
-                    solver=solver,
-                    time_limit=time_limit,
-                    scenario=scenario
-                )
+                # Run MILP optimization (or pick up the parallel run's result)
+                if milp_outcomes is None:
+                    milp_result = optimize_with_milp(**milp_args[idx], **milp_kwargs)
+                else:
+                    milp_result = milp_outcomes[idx]
+                    if isinstance(milp_result, Exception):
+                        raise milp_result
                 
                 # Format result to match existing structure
                 equipment_config = milp_result['equipment_config']
@@ -489,7 +522,8 @@ def run_all_scenarios(
             if result.get('feasible'):
                 try:
                     from app.pages_custom.page_08_ram import calculate_ram_metrics
-                    ram_metrics = calculate_ram_metrics(equipment_config)
+                    ram_metrics = calculate_ram_metrics(
+                        equipment_config, load_profile_dr.get('load_data', {}).get('total_load_mw'))
                     result['ram_analysis'] = ram_metrics
                 except Exception as e:
                     result['ram_analysis'] = {'error': str(e)}
@@ -497,7 +531,9 @@ def run_all_scenarios(
             # AUTO-RUN: Transient Analysis
             if result.get('feasible'):
                 try:
-                    from app.utils.highres_transient import generate_high_res_transient, calculate_power_quality_metrics
+                    from app.utils.highres_transient import (
+                        generate_high_res_transient, calculate_power_quality_metrics, screen_ramp_events
+                    )
                     
                     total_mw = site.get('Total_Facility_MW', 200)
                     transient_data = generate_high_res_transient(
@@ -513,6 +549,16 @@ def run_all_scenarios(
                         'pq_metrics': pq_metrics,
                         'transient_data': transient_data
                     }
+                    
+                    # Every hourly ramp of the 8760 load as a transient event
+                    load_8760 = load_profile_dr.get('load_data', {}).get('total_load_mw')
+                    if load_8760 is not None:
+                        bess_mw = sum(b.get('power_mw', 0) for b in equipment_config.get('bess', []))
+                        screening = screen_ramp_events(load_8760, resolution_s=0.1, window_s=60, bess_mw=bess_mw)
+                        result['transient_analysis']['ramp_screening'] = {
+                            key: screening[key] for key in
+                            ('n_events', 'severity_counts', 'worst_nadir_hz', 'worst_rocof_hz_s')
+                        }
                 except Exception as e:
                     result['transient_analysis'] = {'error': str(e)}
             
@@ -1,6 +1,8 @@
 """
 Full Optimization Engine with Multi-Objective Optimization and Pareto Frontier Analysis
 Uses scipy.optimize for constrained optimization with comprehensive constraint validation
+OptimizationEngine.optimize_pareto() returns the whole LCOE / timeline / emissions
+frontier from one NSGA-II run instead of one weighted-sum run per weight vector
 
 ⚠️ DEPRECATION WARNING ⚠️
 This optimizer is deprecated as of December 2024 and will be removed in a future release.
@@ -34,6 +36,9 @@ NEW CODE:
     feasible = result['feasible']
 """
 
+import multiprocessing
+from bisect import bisect_left, bisect_right
+
 import numpy as np
 from scipy.optimize import minimize, differential_evolution
 from typing import Dict, List, Tuple, Optional
@@ -273,6 +278,29 @@ class OptimizationEngine:
         
         return land_acres
     
+    def calculate_capex(self, config: Dict) -> float:
+        """Calculate total CAPEX in $ (after 30% ITC on BESS and solar)"""
+        total_capex = 0
+        
+        if 'recip_engines' in config:
+            for engine in config['recip_engines']:
+                total_capex += engine['capacity_mw'] * 1000 * engine['capex_per_kw']
+        
+        if 'gas_turbines' in config:
+            for turbine in config['gas_turbines']:
+                total_capex += turbine['capacity_mw'] * 1000 * turbine['capex_per_kw']
+        
+        if 'bess' in config:
+            for bess in config['bess']:
+                # Apply 30% ITC for BESS (Inflation Reduction Act)
+                total_capex += bess['energy_mwh'] * 1000 * bess['capex_per_kwh'] * 0.70
+        
+        if 'solar_mw_dc' in config:
+            # Apply 30% ITC for Solar (Inflation Reduction Act)
+            total_capex += config['solar_mw_dc'] * 1e6 * config['solar_capex_per_w'] * 0.70
+        
+        return total_capex
+    
     def calculate_firm_capacity(self, config: Dict) -> float:
         """Calculate firm capacity with N-1 reliability (MW)"""
         firm_mw = 0
@@ -371,26 +399,7 @@ class OptimizationEngine:
     def objective_lcoe(self, x: np.ndarray) -> float:
         """Calculate LCOE (Levelized Cost of Energy) in $/MWh"""
         config = self.decode_solution(x)
-        
-        # Calculate CAPEX
-        total_capex = 0
-        
-        if 'recip_engines' in config:
-            for engine in config['recip_engines']:
-                total_capex += engine['capacity_mw'] * 1000 * engine['capex_per_kw']
-        
-        if 'gas_turbines' in config:
-            for turbine in config['gas_turbines']:
-                total_capex += turbine['capacity_mw'] * 1000 * turbine['capex_per_kw']
-        
-        if 'bess' in config:
-            for bess in config['bess']:
-                # Apply 30% ITC for BESS (Inflation Reduction Act)
-                total_capex += bess['energy_mwh'] * 1000 * bess['capex_per_kwh'] * 0.70
-        
-        if 'solar_mw_dc' in config:
-            # Apply 30% ITC for Solar (Inflation Reduction Act)
-            total_capex += config['solar_mw_dc'] * 1e6 * config['solar_capex_per_w'] * 0.70
+        total_capex = self.calculate_capex(config)
         
         # Calculate annual O&M and fuel costs
         annual_opex = 0
@@ -549,16 +558,8 @@ class OptimizationEngine:
         
         return total_objective
     
-    def optimize(self, objective_weights: Dict[str, float] = None) -> Tuple[Dict, bool, List[str]]:
-        """
-        Run optimization to find optimal equipment configuration
-        
-        Returns:
-            (config, feasible, violations)
-        """
-        if objective_weights is None:
-            objective_weights = {'lcoe': 0.4, 'timeline': 0.3, 'emissions': 0.3}
-        
+    def _variable_bounds(self) -> Tuple[List[Tuple[float, float]], np.ndarray]:
+        """Decision variable bounds and starting point for the enabled equipment"""
         # Define decision variables bounds
         bounds = []
         x0 = []
@@ -591,6 +592,20 @@ class OptimizationEngine:
         
         x0 = np.array(x0)
         
+        return bounds, x0
+    
+    def optimize(self, objective_weights: Dict[str, float] = None) -> Tuple[Dict, bool, List[str]]:
+        """
+        Run optimization to find optimal equipment configuration
+        
+        Returns:
+            (config, feasible, violations)
+        """
+        if objective_weights is None:
+            objective_weights = {'lcoe': 0.4, 'timeline': 0.3, 'emissions': 0.3}
+        
+        bounds, x0 = self._variable_bounds()
+        
         # Define constraints for scipy
         constraints = [
             {'type': 'ineq', 'fun': self.constraint_nox_emissions},
@@ -679,6 +694,141 @@ class OptimizationEngine:
             all_feasible = False
         
         return all_feasible
+    
+    # Multi-objective (NSGA-II) optimization
+    
+    def _constraint_checks(self) -> List[Tuple]:
+        """(constraint function, normalizing scale) pairs; the function is >= 0 when feasible"""
+        return [
+            (self.constraint_nox_emissions, self.nox_limit_tpy),
+            (self.constraint_co_emissions, self.co_limit_tpy),
+            (self.constraint_gas_supply, self.gas_supply_mcf_day),
+            (self.constraint_land_area, self.available_land_acres),
+            (self.constraint_grid_capacity, self.grid_available_mw),
+            (self.constraint_n_minus_1_reliability, self.total_load_mw),
+            (self.constraint_min_capacity, self.total_load_mw),
+        ]
+    
+    def evaluate_objectives(self, x: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Evaluate one decision vector for the multi-objective search
+        
+        Returns:
+            ([lcoe, timeline, emissions], total normalized constraint violation; 0 = feasible)
+        """
+        objectives = np.array([self.objective_lcoe(x), self.objective_timeline(x), self.objective_emissions(x)])
+        violation = sum(max(0.0, -fn(x)) / max(abs(scale), 1e-9) for fn, scale in self._constraint_checks())
+        return objectives, violation
+    
+    def _evaluate_population(self, X: np.ndarray, mapper) -> Tuple[np.ndarray, np.ndarray]:
+        results = list(mapper(self.evaluate_objectives, list(X)))
+        return np.array([r[0] for r in results]), np.array([r[1] for r in results])
+    
+    def optimize_pareto(
+        self,
+        pop_size: int = 80,
+        generations: int = 100,
+        seed: int = 42,
+        workers=1,
+        include_dominated: bool = False,
+    ) -> List[Dict]:
+        """
+        Find the LCOE / timeline / emissions Pareto frontier in a single NSGA-II run
+        
+        Non-dominated sorting with crowding distance replaces the weighted sum, and
+        constraints use constrained domination (feasible beats infeasible, then the
+        smaller normalized violation), so no weights or penalties are needed.
+        
+        Args:
+            pop_size: Population size
+            generations: Number of generations
+            seed: Random seed (reproducible results)
+            workers: Parallel population evaluation; an int (-1 = all CPUs) or a
+                map-like callable, as in scipy's differential_evolution
+            include_dominated: Also return the dominated final-population members
+                (flagged is_pareto_optimal=False), e.g. for pareto_chart
+        
+        Returns:
+            Solution dicts sorted by LCOE, in calculate_pareto_frontier format plus
+            the pareto_chart metrics (lcoe_per_mwh, time_to_power_months, ...)
+        """
+        bounds, _ = self._variable_bounds()
+        lower, upper = np.array(bounds, dtype=float).T
+        rng = np.random.default_rng(seed)
+        
+        pool = None
+        if callable(workers):
+            mapper = workers
+        elif workers == 1 or multiprocessing.current_process().daemon:
+            mapper = map
+        else:
+            pool = multiprocessing.Pool(None if workers == -1 else workers)
+            mapper = pool.map
+        
+        try:
+            # A continuous size never lands exactly on 0, so a quarter of the initial
+            # values sit at their lower bound (technology switched off)
+            X = rng.uniform(lower, upper, (pop_size, len(bounds)))
+            X = np.where(rng.random(X.shape) < 0.25, lower, X)
+            F, V = self._evaluate_population(X, mapper)
+            for _ in range(generations):
+                rank, crowding = _constrained_rank_and_crowding(F, V)
+                parents = _binary_tournament(rng, rank, crowding, pop_size)
+                children = _polynomial_mutation(rng, _sbx_crossover(rng, X[parents], lower, upper), lower, upper)
+                F_children, V_children = self._evaluate_population(children, mapper)
+                
+                # Elitist (mu + lambda) survival by rank, then crowding distance
+                X = np.vstack([X, children])
+                F = np.vstack([F, F_children])
+                V = np.concatenate([V, V_children])
+                rank, crowding = _constrained_rank_and_crowding(F, V)
+                survivors = np.lexsort((-crowding, rank))[:pop_size]
+                X, F, V = X[survivors], F[survivors], V[survivors]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        
+        feasible = V <= 1e-9
+        if feasible.any():
+            frontier = np.zeros(len(X), dtype=bool)
+            frontier[np.flatnonzero(feasible)[pareto_front_mask(F[feasible])]] = True
+        else:
+            print("⚠️ No feasible configuration found; returning the least-violating member")
+            frontier = np.arange(len(X)) == np.argmin(V)
+        
+        # Integer decoding maps many members onto one configuration: keep one per objective vector
+        order = np.argsort(~frontier, kind='stable')
+        _, first = np.unique(np.round(F[order], 9), axis=0, return_index=True)
+        keep = np.zeros(len(X), dtype=bool)
+        keep[order[first]] = True
+        if not include_dominated:
+            keep &= frontier
+        
+        solutions = []
+        for i in np.flatnonzero(keep)[np.argsort(F[keep][:, 0], kind='stable')]:
+            config = self.decode_solution(X[i])
+            violations = []
+            self._check_all_constraints(X[i], violations)
+            lcoe, timeline, emissions = F[i]
+            solutions.append({
+                'name': f"Pareto {len(solutions) + 1}" if frontier[i] else f"Dominated {len(solutions) + 1}",
+                'x': X[i],
+                'config': config,
+                'lcoe': lcoe,
+                'timeline': timeline,
+                'emissions': emissions,
+                'feasible': bool(feasible[i]),
+                'violations': violations,
+                'pareto_optimal': bool(frontier[i]),
+                'is_pareto_optimal': bool(frontier[i]),
+                'lcoe_per_mwh': lcoe,
+                'time_to_power_months': timeline,
+                'emissions_tpy': emissions,
+                'capex_million': self.calculate_capex(config) / 1e6,
+            })
+        
+        return solutions
 
 
 def optimize_equipment_configuration(
@@ -708,6 +858,24 @@ def optimize_equipment_configuration(
     return config, feasible, violations
 
 
+def optimize_pareto_frontier(
+    scenario: Dict,
+    site: Dict,
+    equipment_data: Dict,
+    constraints: Dict,
+    grid_config: Dict,
+    **kwargs
+) -> List[Dict]:
+    """
+    Whole LCOE / timeline / emissions Pareto frontier from one multi-objective run
+    
+    Keyword arguments go to OptimizationEngine.optimize_pareto. The returned
+    solutions can be passed straight to components.charts.pareto_chart.
+    """
+    engine = OptimizationEngine(site, constraints, scenario, equipment_data, grid_config)
+    return engine.optimize_pareto(**kwargs)
+
+
 def calculate_pareto_frontier(solutions: List[Dict]) -> List[Dict]:
     """
     Calculate Pareto frontier from list of solutions
@@ -722,29 +890,153 @@ def calculate_pareto_frontier(solutions: List[Dict]) -> List[Dict]:
         'scenario': str
     }
     """
-    pareto_solutions = []
+    if not solutions:
+        return []
     
-    for i, sol_i in enumerate(solutions):
-        is_dominated = False
-        
-        for j, sol_j in enumerate(solutions):
-            if i == j:
-                continue
-            
-            # Check if sol_j dominates sol_i (better on ALL objectives)
-            if (sol_j['lcoe'] <= sol_i['lcoe'] and
-                sol_j['timeline'] <= sol_i['timeline'] and
-                sol_j['emissions'] <= sol_i['emissions'] and
-                (sol_j['lcoe'] < sol_i['lcoe'] or 
-                 sol_j['timeline'] < sol_i['timeline'] or 
-                 sol_j['emissions'] < sol_i['emissions'])):
-                is_dominated = True
-                break
-        
-        if not is_dominated:
-            sol_i['pareto_optimal'] = True
-            pareto_solutions.append(sol_i)
-        else:
-            sol_i['pareto_optimal'] = False
+    objectives = np.array([[s['lcoe'], s['timeline'], s['emissions']] for s in solutions], dtype=float)
+    mask = pareto_front_mask(objectives)
+    
+    pareto_solutions = []
+    for sol, optimal in zip(solutions, mask):
+        sol['pareto_optimal'] = bool(optimal)
+        if optimal:
+            pareto_solutions.append(sol)
     
     return pareto_solutions
+
+
+# =============================================================================
+# PARETO UTILITIES (minimization)
+# =============================================================================
+
+def pareto_front_mask(F: np.ndarray) -> np.ndarray:
+    """
+    Boolean mask of the non-dominated rows of F (n points x m objectives)
+    
+    Up to 3 objectives: sort lexicographically, then sweep while keeping the
+    kept points' (f2, f3) staircase in bisect-searched lists -- O(n log n)
+    comparisons instead of the O(n^2) pairwise check. Identical points do not
+    dominate each other (both are kept).
+    """
+    F = np.asarray(F, dtype=float)
+    if F.ndim == 1:
+        F = F[:, None]
+    n, m = F.shape
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    if m > 3:
+        return np.array([
+            not np.any(np.all(F <= F[i], axis=1) & np.any(F < F[i], axis=1)) for i in range(n)
+        ])
+    if m < 3:
+        F = np.hstack([F, np.zeros((n, 3 - m))])
+    
+    mask = np.zeros(n, dtype=bool)
+    stair_f2, stair_f3 = [], []  # f2 ascending, f3 strictly descending
+    previous = None
+    for i in np.lexsort((F[:, 2], F[:, 1], F[:, 0])):
+        _, f2, f3 = F[i]
+        if previous is not None and np.array_equal(F[i], F[previous]):
+            mask[i] = mask[previous]
+            continue
+        previous = i
+        
+        # Every kept point has f1 <= this f1; the one with the smallest f3 among
+        # those with f2 <= this f2 is the last staircase entry at or before f2
+        k = bisect_right(stair_f2, f2)
+        if k and stair_f3[k - 1] <= f3:
+            continue
+        mask[i] = True
+        
+        # Drop staircase entries the new point covers, then insert it
+        start = bisect_left(stair_f2, f2)
+        end = k
+        while end < len(stair_f2) and stair_f3[end] >= f3:
+            end += 1
+        stair_f2[start:end] = [f2]
+        stair_f3[start:end] = [f3]
+    
+    return mask
+
+
+def non_dominated_sort(F: np.ndarray) -> np.ndarray:
+    """Front index per row of F (0 = Pareto front), peeling fronts with pareto_front_mask"""
+    F = np.asarray(F, dtype=float)
+    ranks = np.zeros(len(F), dtype=int)
+    remaining = np.arange(len(F))
+    rank = 0
+    while remaining.size:
+        front = pareto_front_mask(F[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+    return ranks
+
+
+def crowding_distance(F: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of the points of one front (boundary points = inf)"""
+    F = np.asarray(F, dtype=float)
+    n, m = F.shape
+    distance = np.zeros(n)
+    if n <= 2:
+        return np.full(n, np.inf)
+    for j in range(m):
+        order = np.argsort(F[:, j], kind='stable')
+        values = F[order, j]
+        distance[order[[0, -1]]] = np.inf
+        span = values[-1] - values[0]
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
+def _constrained_rank_and_crowding(F: np.ndarray, V: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ranks under constrained domination (infeasible members ranked after every feasible front by violation)"""
+    rank = np.zeros(len(F), dtype=int)
+    crowding = np.full(len(F), np.inf)
+    feasible = np.flatnonzero(V <= 1e-9)
+    infeasible = np.flatnonzero(V > 1e-9)
+    
+    if feasible.size:
+        rank[feasible] = non_dominated_sort(F[feasible])
+        for r in np.unique(rank[feasible]):
+            front = feasible[rank[feasible] == r]
+            crowding[front] = crowding_distance(F[front])
+    offset = rank[feasible].max() + 1 if feasible.size else 0
+    rank[infeasible] = offset + np.argsort(np.argsort(V[infeasible], kind='stable'))
+    
+    return rank, crowding
+
+
+def _binary_tournament(rng: np.random.Generator, rank: np.ndarray, crowding: np.ndarray, n: int) -> np.ndarray:
+    """Parent indices: lower rank wins, then larger crowding distance"""
+    a, b = rng.integers(0, len(rank), (2, n))
+    a_wins = (rank[a] < rank[b]) | ((rank[a] == rank[b]) & (crowding[a] >= crowding[b]))
+    return np.where(a_wins, a, b)
+
+
+def _sbx_crossover(rng: np.random.Generator, parents: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                   eta: float = 15.0, probability: float = 0.9) -> np.ndarray:
+    """Simulated binary crossover of consecutive parent pairs"""
+    children = parents.copy()
+    p1, p2 = parents[0::2], parents[1::2]
+    pairs = min(len(p1), len(p2))
+    p1, p2 = p1[:pairs], p2[:pairs]
+    
+    u = rng.random(p1.shape)
+    beta = np.where(u <= 0.5, (2 * u) ** (1 / (eta + 1)), (1 / (2 * (1 - u))) ** (1 / (eta + 1)))
+    swap = (rng.random(p1.shape) < 0.5) & (rng.random((pairs, 1)) < probability)
+    c1 = np.where(swap, 0.5 * ((1 + beta) * p1 + (1 - beta) * p2), p1)
+    c2 = np.where(swap, 0.5 * ((1 - beta) * p1 + (1 + beta) * p2), p2)
+    children[0:2 * pairs:2], children[1:2 * pairs:2] = c1, c2
+    
+    return np.clip(children, lower, upper)
+
+
+def _polynomial_mutation(rng: np.random.Generator, X: np.ndarray, lower: np.ndarray, upper: np.ndarray,
+                         eta: float = 20.0) -> np.ndarray:
+    """Polynomial mutation, on average one variable per member"""
+    u = rng.random(X.shape)
+    delta = np.where(u < 0.5, (2 * u) ** (1 / (eta + 1)) - 1, 1 - (2 * (1 - u)) ** (1 / (eta + 1)))
+    mutate = rng.random(X.shape) < 1.0 / X.shape[1]
+    return np.clip(X + mutate * delta * (upper - lower), lower, upper)
@@ -156,10 +156,10 @@ def run_heuristic_optimization(site_data: Dict, problem_num: int, load_profile:
         from config.settings import CONSTRAINT_DEFAULTS, EQUIPMENT_DEFAULTS, ECONOMIC_DEFAULTS
         import json
         
-        # Connect to backend for v2.1.1
-        import gspread
+        # Connect to backend for v2.1.1 (shared, rate-limited client)
+        from app.utils.sheets_pool import get_sheets_client
         try:
-            gc = gspread.service_account(filename='credentials.json')
+            gc = get_sheets_client('credentials.json')
             from config.settings import GOOGLE_SHEET_ID
             spreadsheet_id = GOOGLE_SHEET_ID
         except Exception as e:
@@ -185,10 +185,9 @@ def run_heuristic_optimization(site_data: Dict, problem_num: int, load_profile:
             if needs_grid_params:
                 print(f"⚠️ Grid parameters MISSING for {site_name}")
             try:
-                import gspread
                 from config.settings import GOOGLE_SHEET_ID
-                gc_emergency = gspread.service_account(filename='credentials.json')
-                spreadsheet = gc_emergency.open_by_key(GOOGLE_SHEET_ID)
+                # Same pooled client and spreadsheet handle as the rest of the run
+                spreadsheet = get_sheets_client('credentials.json').open_by_key(GOOGLE_SHEET_ID)
                 profiles_ws = spreadsheet.worksheet("Load_Profiles")
                 profiles_data = profiles_ws.get_all_records()
                 
@@ -18,12 +18,16 @@ Reasons for deprecation:
 
 Replacement: app.optimization.milp_model_dr provides phased deployment with hard constraints,
 deterministic results, and 30-60 second solve times.
+
+optimize(method='milp') solves this optimizer's own problem exactly (HiGHS MILP,
+hard constraints, deterministic) in well under a second.
 """
 
 import numpy as np
-from scipy.optimize import differential_evolution
+from scipy.optimize import Bounds, LinearConstraint, differential_evolution, milp
 from typing import Dict, List, Tuple
 import copy
+import time
 
 
 class PhasedDeploymentOptimizer:
@@ -403,20 +407,153 @@ class PhasedDeploymentOptimizer:
         # Lower is better: -power + penalty + small_lcoe
         result = -total_power_delivered + total_penalty + (lcoe * 0.001)
         return result
-    
-    def optimize(self, seed_deployments: List[Dict] = None) -> Tuple[Dict, float, List[str]]:
+
+    # =========================================================================
+    # VECTORIZED OBJECTIVE (whole population per call)
+    # =========================================================================
+
+    def decode_population(self, X: np.ndarray) -> Dict[str, np.ndarray]:
         """
-        Run multi-year phased deployment optimization.
-        
+        Decode a population of decision vectors at once.
+
         Args:
-            seed_deployments: Optional list of deployment dicts from previous runs to seed the optimizer.
-                            This helps complex scenarios find at least the solutions of simpler ones.
-        
+            X: Population, shape (npop, nvars) in the decode_solution layout
+
         Returns:
-            deployment_schedule: Optimized equipment deployment by year
-            lcoe: Lifecycle LCOE ($/MWh)
-            violations: List of constraint violation messages
+            Same keys as decode_solution, each an (npop, num_years) array
+        """
+        X = np.maximum(np.atleast_2d(np.asarray(X, dtype=float)), 0)
+        added = X.reshape(len(X), 5, self.num_years)
+        cumulative = np.cumsum(added[:, :4], axis=2)
+
+        return {
+            'recip_mw': added[:, 0],
+            'turbine_mw': added[:, 1],
+            'bess_mwh': added[:, 2],
+            'solar_mw': added[:, 3],
+            'grid_mw': added[:, 4],
+            'cumulative_recip_mw': cumulative[:, 0],
+            'cumulative_turbine_mw': cumulative[:, 1],
+            'cumulative_bess_mwh': cumulative[:, 2],
+            'cumulative_solar_mw': cumulative[:, 3],
+        }
+
+    def _population_capacity_mw(self, population: Dict) -> np.ndarray:
+        """get_cumulative_capacity_mw for every member and year, shape (npop, num_years)."""
+        return (population['cumulative_recip_mw'] + population['cumulative_turbine_mw'] +
+                population['grid_mw'] + population['cumulative_solar_mw'] * 0.25)
+
+    def _target_load_mw(self) -> np.ndarray:
+        return np.array([self.load_trajectory.get(year, 0) for year in self.years], dtype=float)
+
+    def _population_npv(self, population: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """NPV of cost (CAPEX + OPEX) and of generation for a decoded population, each (npop,)."""
+        # CAPEX (deployed equipment in each year, with ITC for solar/BESS)
+        capex_discount = (1 + self.discount_rate) ** (np.array(self.years) - self.start_year)
+        capex = (
+            population['recip_mw'] * 1000 * 1650 +
+            population['turbine_mw'] * 1000 * 1300 +
+            population['bess_mwh'] * 1000 * 236 * 0.70 +
+            population['solar_mw'] * 1000000 * 0.95 * 0.70
+        )
+        npv_capex = (capex / capex_discount).sum(axis=1)
+
+        # OPEX and Generation (over 20-year life), final deployment year after the horizon
+        op_years = np.arange(self.project_life_years)
+        discount = (1 + self.discount_rate) ** op_years
+        fuel_escalation = (1 + self.fuel_escalation_rate) ** op_years
+        deployment_years = np.minimum(self.years[-1], self.start_year + op_years)
+        in_horizon = np.isin(deployment_years, self.years)
+        columns = np.clip(np.searchsorted(self.years, deployment_years), 0, self.num_years - 1)
+
+        def by_op_year(values):
+            return np.where(in_horizon, values[:, columns], 0.0)
+
+        recip_mw = by_op_year(population['cumulative_recip_mw'])
+        turbine_mw = by_op_year(population['cumulative_turbine_mw'])
+        solar_mw = by_op_year(population['cumulative_solar_mw'])
+        bess_mwh = by_op_year(population['cumulative_bess_mwh'])
+
+        recip_gen = recip_mw * 0.70 * 8760
+        turbine_gen = turbine_mw * 0.30 * 8760
+        solar_gen = solar_mw * 0.25 * 8760
+        total_gen = recip_gen + turbine_gen + solar_gen
+
+        total_opex = (
+            recip_mw * 1000 * 18.5 + recip_gen * 8.5 +
+            turbine_mw * 1000 * 12.5 + turbine_gen * 6.5 +
+            solar_mw * 1000 * 15 + solar_gen * 2.0 +
+            bess_mwh * 1000 * 8.0 +
+            recip_gen * 7.7 * 4.0 * fuel_escalation +
+            turbine_gen * 8.5 * 4.0 * fuel_escalation
+        )
+        npv_opex = (total_opex / discount).sum(axis=1)
+        npv_generation = (total_gen / discount).sum(axis=1)
+        return npv_capex + npv_opex, npv_generation
+
+    def population_lifecycle_lcoe(self, population: Dict) -> np.ndarray:
+        """calculate_lifecycle_lcoe for a decoded population, shape (npop,)."""
+        npv_cost, npv_generation = self._population_npv(population)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lcoe = np.where(npv_generation > 1, npv_cost / npv_generation, 999.0)
+
+        # Penalty for not meeting load trajectory ($10/MWh of unmet load)
+        target_load = self._target_load_mw()
+        total_generation_needed = (target_load * 8760).sum()
+        if total_generation_needed > 0:
+            gap_mw = np.maximum(target_load - self._population_capacity_mw(population), 0)
+            lcoe = lcoe + (gap_mw * 8760 * 10.0).sum(axis=1) / total_generation_needed
+
+        return lcoe
+
+    def _population_annual_limits(self, population: Dict) -> Dict[Tuple[str, float], np.ndarray]:
+        """NOx, CO, gas and land per year, keyed by (constraint key, default limit); each (npop, num_years)."""
+        recip_mw = population['cumulative_recip_mw']
+        turbine_mw = population['cumulative_turbine_mw']
+
+        recip_gen_mwh = recip_mw * 0.70 * 8760
+        turbine_gen_mwh = turbine_mw * 0.30 * 8760
+        return {
+            ('nox_tpy_annual', 100): (recip_gen_mwh * 0.17 + turbine_gen_mwh * 0.09) / 2000,
+            ('co_tpy_annual', 100): (recip_gen_mwh * 0.025 + turbine_gen_mwh * 0.014) / 2000,
+            ('gas_supply_mcf_day', 50000): (recip_mw * 7.7 / 1.037) * 24 + (turbine_mw * 8.5 / 1.037) * 24,
+            ('land_area_acres', 500): (recip_mw * 0.5 + turbine_mw * 0.3 +
+                                       population['cumulative_solar_mw'] * 5.0 +
+                                       population['cumulative_bess_mwh'] * 0.01),
+        }
+
+    def population_objective(self, X: np.ndarray) -> np.ndarray:
+        """
+        objective_function for a whole population as matrix operations.
+
+        Args:
+            X: Population, shape (npop, nvars)
+
+        Returns:
+            Objective values, shape (npop,)
         """
+        population = self.decode_population(X)
+
+        # Soft penalties, same 1% tolerance as the scalar objective
+        total_penalty = np.zeros(len(population['recip_mw']))
+        for (key, default), values in self._population_annual_limits(population).items():
+            limit = self.constraints.get(key, default)
+            excess = values - limit * 1.01
+            with np.errstate(divide='ignore', invalid='ignore'):
+                total_penalty += np.where(excess > 0, 1000 * (excess / limit), 0.0).sum(axis=1)
+
+        capacity = self._population_capacity_mw(population)
+        total_power_delivered = np.minimum(capacity, self._target_load_mw()).sum(axis=1)
+
+        lcoe = self.population_lifecycle_lcoe(population)
+        return -total_power_delivered + total_penalty + (lcoe * 0.001)
+
+    def _vectorized_objective(self, x: np.ndarray) -> np.ndarray:
+        """differential_evolution(vectorized=True) adapter: x has shape (nvars, npop)."""
+        return self.population_objective(np.asarray(x).T)
+
+    def _decision_bounds(self) -> List[Tuple[float, float]]:
+        """Per-variable (lower, upper) bounds from scenario flags and lead times."""
         # Decision variable bounds based on scenario settings AND lead times
         # Key insight: Don't penalize in objective - prevent via bounds!
         bounds = []
@@ -498,6 +635,94 @@ class PhasedDeploymentOptimizer:
         if grid_enabled and not grid_available_in_window:
             print(f"    ⚠️ Grid: NOT available in planning window (needs 96 months, ends 2031)")
         
+        return bounds
+
+    def _check_solution(self, deployment: Dict) -> List[str]:
+        """Report per-year capacity and emissions; return true constraint violations."""
+        # Check for violations and calculate power deficit
+        violations = []
+        total_power_deficit_mw_years = 0
+        
+        print(f"\n  🔍 Checking final solution constraints:")
+        
+        for year in self.years:
+            nox = self.calculate_annual_nox_tpy(deployment, year)
+            co = self.calculate_annual_co_tpy(deployment, year)
+            gas = self.calculate_annual_gas_mcf_day(deployment, year)
+            land = self.calculate_cumulative_land_acres(deployment, year)
+            capacity = self.get_cumulative_capacity_mw(deployment, year)
+            target_load = self.load_trajectory.get(year, 0)
+            
+            print(f"    {year}: Capacity={capacity:.1f} MW, Target={target_load:.1f} MW, NOx={nox:.1f} tpy, CO={co:.1f} tpy, Gas={gas:.0f} MCF/day")
+            
+            # Check hard constraints WITH SAME TOLERANCE AS OBJECTIVE FUNCTION (1%)
+            # This prevents reporting violations for solutions the optimizer considered feasible
+            nox_limit = self.constraints.get('nox_tpy_annual', 100)
+            co_limit = self.constraints.get('co_tpy_annual', 100)
+            gas_limit = self.constraints.get('gas_supply_mcf_day', 50000)
+            land_limit = self.constraints.get('land_area_acres', 500)
+            
+            if nox > nox_limit * 1.01:  # 1% tolerance
+                violations.append(f"{year}: NOx {nox:.1f} tpy exceeds limit of {nox_limit} tpy")
+            if co > co_limit * 1.01:  # 1% tolerance
+                violations.append(f"{year}: CO {co:.1f} tpy exceeds limit of {co_limit} tpy")
+            if gas > gas_limit * 1.01:  # 1% tolerance
+                violations.append(f"{year}: Gas {gas:.0f} MCF/day exceeds limit of {gas_limit} MCF/day")
+            if land > land_limit * 1.01:  # 1% tolerance
+                violations.append(f"{year}: Land {land:.1f} acres exceeds limit of {land_limit} acres")
+            
+            # Track power deficit for informational purposes (NOT A VIOLATION!)
+            if capacity < target_load:
+                deficit = target_load - capacity
+                total_power_deficit_mw_years += deficit
+        
+        # Report results
+        if violations:
+            print(f"  ❌ Found {len(violations)} TRUE constraint violations")
+            for v in violations:
+                print(f"      - {v}")
+        else:
+            print(f"  ✅ All constraints satisfied!")
+        
+        # Report power deficit separately (informational, not a failure)
+        if total_power_deficit_mw_years > 0:
+            print(f"  ℹ️ Power deficit: {total_power_deficit_mw_years:.1f} MW-years (constraints limit deliverable power)")
+            print(f"      This is ACCEPTABLE - optimizer maximized power within constraints")
+        
+        # Return ONLY true violations (power deficit is not a violation)
+        return violations
+
+    def optimize(self, seed_deployments: List[Dict] = None, vectorized: bool = True,
+                 method: str = 'de') -> Tuple[Dict, float, List[str]]:
+        """
+        Run multi-year phased deployment optimization.
+
+        Args:
+            seed_deployments: Optional list of deployment dicts from previous runs to seed the optimizer.
+                            This helps complex scenarios find at least the solutions of simpler ones.
+            vectorized: Evaluate each generation in one population_objective call
+                        (False = one objective_function call per member)
+            method: 'de' (differential evolution) or 'milp' (exact, see optimize_milp;
+                    seeds are not needed and ignored)
+
+        Returns:
+            deployment_schedule: Optimized equipment deployment by year
+            lcoe: Lifecycle LCOE ($/MWh)
+            violations: List of constraint violation messages
+        """
+        if method == 'milp':
+            return self.optimize_milp()
+        if method != 'de':
+            raise ValueError(f"Unknown method {method!r} (expected 'de' or 'milp')")
+        
+        # Check scenario flags (default to True if not specified)
+        recip_enabled = self.scenario.get('Recip_Enabled', True)
+        turbine_enabled = self.scenario.get('Turbine_Enabled', True)
+        bess_enabled = self.scenario.get('BESS_Enabled', True)
+        solar_enabled = self.scenario.get('Solar_Enabled', True)
+        grid_enabled = self.scenario.get('Grid_Enabled', True)
+        bounds = self._decision_bounds()
+        
         # Run optimization with increased iterations for better convergence
         # User feedback: "should be running many iterations to get optimal solution"
         num_vars = 5 * len(self.years)  # 5 equipment types × num years
@@ -582,28 +807,32 @@ class PhasedDeploymentOptimizer:
         init_pop.append(conservative)
         
         # Convert to numpy array if we have seeds
+        popsize = 30  # Large population for better exploration
         init_array = None
         if init_pop:
-            import numpy as np
-            # Pad with random population to reach popsize if needed
-            # But differential_evolution handles 'init' by using it as PART of the population
-            # We just need to make sure it's an array
+            # differential_evolution uses an 'init' array as the WHOLE population
+            # (at least 5 members), so pad the seeds with random members
             try:
+                n_random = popsize * num_vars - len(init_pop)
+                if n_random > 0:
+                    lower, upper = np.array(bounds, dtype=float).T
+                    init_pop.extend(np.random.default_rng(42).uniform(lower, upper, (n_random, num_vars)))
                 init_array = np.array(init_pop)
-                print(f"  🎯 Seeding optimizer with {len(init_pop)} proven solutions")
+                print(f"  🎯 Seeding optimizer with {len(init_array) - max(n_random, 0)} proven solutions")
             except:
                 print("  ⚠️ Could not convert seeds to array, using random init")
                 init_array = None
 
         # Run optimization with sufficient iterations for 50-variable problem
         result = differential_evolution(
-            func=self.objective_function,
+            func=self._vectorized_objective if vectorized else self.objective_function,
             bounds=bounds,
             maxiter=500,  # Sufficient for 50 variables (5 equipment × 10 years)
-            popsize=30,   # Large population for better exploration
+            popsize=popsize,
             tol=0.01,
             atol=0,
             workers=1,
+            vectorized=vectorized,
             updating='deferred',
             seed=42,
             init=init_array if init_array is not None else 'latinhypercube', # Use seeds if available
@@ -651,56 +880,103 @@ class PhasedDeploymentOptimizer:
         # Decode solution
         deployment = self.decode_solution(result.x)
         lcoe = self.calculate_lifecycle_lcoe(deployment)
+        violations = self._check_solution(deployment)
         
-        # Check for violations and calculate power deficit
-        violations = []
-        total_power_deficit_mw_years = 0
-        
-        print(f"\n  🔍 Checking final solution constraints:")
-        
-        for year in self.years:
-            nox = self.calculate_annual_nox_tpy(deployment, year)
-            co = self.calculate_annual_co_tpy(deployment, year)
-            gas = self.calculate_annual_gas_mcf_day(deployment, year)
-            land = self.calculate_cumulative_land_acres(deployment, year)
-            capacity = self.get_cumulative_capacity_mw(deployment, year)
-            target_load = self.load_trajectory.get(year, 0)
-            
-            print(f"    {year}: Capacity={capacity:.1f} MW, Target={target_load:.1f} MW, NOx={nox:.1f} tpy, CO={co:.1f} tpy, Gas={gas:.0f} MCF/day")
-            
-            # Check hard constraints WITH SAME TOLERANCE AS OBJECTIVE FUNCTION (1%)
-            # This prevents reporting violations for solutions the optimizer considered feasible
-            nox_limit = self.constraints.get('nox_tpy_annual', 100)
-            co_limit = self.constraints.get('co_tpy_annual', 100)
-            gas_limit = self.constraints.get('gas_supply_mcf_day', 50000)
-            land_limit = self.constraints.get('land_area_acres', 500)
-            
-            if nox > nox_limit * 1.01:  # 1% tolerance
-                violations.append(f"{year}: NOx {nox:.1f} tpy exceeds limit of {nox_limit} tpy")
-            if co > co_limit * 1.01:  # 1% tolerance
-                violations.append(f"{year}: CO {co:.1f} tpy exceeds limit of {co_limit} tpy")
-            if gas > gas_limit * 1.01:  # 1% tolerance
-                violations.append(f"{year}: Gas {gas:.0f} MCF/day exceeds limit of {gas_limit} MCF/day")
-            if land > land_limit * 1.01:  # 1% tolerance
-                violations.append(f"{year}: Land {land:.1f} acres exceeds limit of {land_limit} acres")
-            
-            # Track power deficit for informational purposes (NOT A VIOLATION!)
-            if capacity < target_load:
-                deficit = target_load - capacity
-                total_power_deficit_mw_years += deficit
-        
-        # Report results
-        if violations:
-            print(f"  ❌ Found {len(violations)} TRUE constraint violations")
-            for v in violations:
-                print(f"      - {v}")
+        return deployment, lcoe, violations
+
+    # =========================================================================
+    # EXACT MILP (alternative to differential evolution)
+    # =========================================================================
+
+    def optimize_milp(self, integer_units: bool = True, time_limit: float = 10.0) -> Tuple[Dict, float, List[str]]:
+        """
+        Solve the phased deployment problem exactly with HiGHS (scipy.optimize.milp).
+
+        Same problem as optimize(): maximize delivered MW-years (min(capacity, target)
+        per year) under lead-time bounds and the annual NOx/CO/gas/land limits, with
+        their 1% tolerance enforced as hard constraints; among the maximizers, minimize
+        lifecycle LCOE. Both stages are linear in the added capacity, so constraint rows
+        and NPV coefficients are read off the population_* formulas. LCOE is a ratio
+        (NPV cost / NPV generation) and is minimized by Dinkelbach iterations.
+
+        Args:
+            integer_units: Recips, turbines and BESS in whole units (4.7 MW, 35 MW, 10 MWh)
+            time_limit: HiGHS time limit per solve (seconds)
+
+        Returns:
+            Same as optimize()
+        """
+        start = time.perf_counter()
+        n = self.num_years
+        num_vars = 5 * n
+        bounds = np.array(self._decision_bounds(), dtype=float)
+        print(f"  📊 Starting MILP optimizer ({'integer units' if integer_units else 'continuous'})...")
+
+        # Variables: [units added per technology and year (5n) | delivered MW per year (n)]
+        unit = np.repeat([self.recip_unit_mw, self.turbine_unit_mw, self.bess_unit_mwh, 1.0, 1.0], n)
+        upper = bounds[:, 1] / unit
+        integrality = np.zeros(num_vars + n)
+        if integer_units:
+            upper[:3 * n] = np.floor(upper[:3 * n] + 1e-9)
+            integrality[:3 * n] = 1
+        col_bounds = Bounds(np.zeros(num_vars + n), np.concatenate([upper, self._target_load_mw()]))
+
+        # Column j of each linear map is the effect of one unit of variable j
+        basis = self.decode_population(np.diag(unit))
+        rows, row_hi = [], []
+        for (key, default), values in self._population_annual_limits(basis).items():
+            limit = self.constraints.get(key, default)
+            rows.append(np.hstack([values.T, np.zeros((n, n))]))
+            row_hi.append(np.full(n, max(limit * 1.01 - 1e-6, 0.0)))
+        # delivered <= capacity, and delivered <= target via its bounds: delivered = min(capacity, target)
+        rows.append(np.hstack([-self._population_capacity_mw(basis).T, np.eye(n)]))
+        row_hi.append(np.zeros(n))
+        base_constraints = [LinearConstraint(np.vstack(rows), -np.inf, np.concatenate(row_hi))]
+        npv_cost, npv_generation = (np.concatenate([v, np.zeros(n)]) for v in self._population_npv(basis))
+        delivered = np.concatenate([np.zeros(num_vars), np.ones(n)])
+
+        statuses = []
+
+        def solve(c, extra_constraints=()):
+            result = milp(c, constraints=base_constraints + list(extra_constraints), integrality=integrality,
+                          bounds=col_bounds, options={'time_limit': time_limit, 'mip_rel_gap': 1e-7, 'disp': False})
+            statuses.append(result.status)
+            return result if result.x is not None else None
+
+        # Stage 1: maximum deliverable MW-years (x = 0 is always feasible)
+        result = solve(-delivered)
+        x = result.x if result is not None else np.zeros(num_vars + n)
+        max_delivered = delivered @ x
+
+        # Stage 2: cheapest LCOE at that delivery (NPV generation > 1 avoids the 999 $/MWh branch)
+        keep = [LinearConstraint(delivered, max_delivered - 1e-6 * max(1.0, max_delivered), np.inf)]
+        generating = keep + [LinearConstraint(npv_generation, 2.0, np.inf)]
+        scaled_cost, scaled_generation = npv_cost / 1e6, npv_generation / 1e6
+        result = solve(scaled_cost, generating) or solve(scaled_cost, keep)
+        if result is not None:
+            x = result.x
+        iterations = 0
+        while npv_generation @ x > 1 and iterations < 30:
+            iterations += 1
+            ratio = (npv_cost @ x) / (npv_generation @ x)
+            result = solve(scaled_cost - ratio * scaled_generation, generating)
+            if result is None or result.fun >= -1e-9 * (scaled_cost @ x):
+                break
+            x = result.x
+
+        z = np.clip(x[:num_vars], 0, upper)
+        if integer_units:
+            z[:3 * n] = np.round(z[:3 * n])
+        elapsed = time.perf_counter() - start
+
+        if all(status == 0 for status in statuses):
+            print(f"  ✅ MILP optimum: {max_delivered:.1f} MW-years in {elapsed * 1000:.0f} ms "
+                  f"({len(statuses)} solves, {iterations} LCOE iterations)")
         else:
-            print(f"  ✅ All constraints satisfied!")
-        
-        # Report power deficit separately (informational, not a failure)
-        if total_power_deficit_mw_years > 0:
-            print(f"  ℹ️ Power deficit: {total_power_deficit_mw_years:.1f} MW-years (constraints limit deliverable power)")
-            print(f"      This is ACCEPTABLE - optimizer maximized power within constraints")
-        
-        # Return ONLY true violations (power deficit is not a violation)
+            print(f"  ⚠️ MILP time limit reached: best solution found, optimality not proven ({elapsed:.1f}s)")
+
+        deployment = self.decode_solution(z * unit)
+        lcoe = self.calculate_lifecycle_lcoe(deployment)
+        violations = self._check_solution(deployment)
+
         return deployment, lcoe, violations
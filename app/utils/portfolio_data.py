@@ -7,8 +7,8 @@ from typing import Dict, List, Optional
 from app.utils.site_backend import (
     load_all_sites, 
     load_site_stage_result,
+    get_results_repository,
     load_site_geojson,
-    get_google_sheets_client,
     SHEET_ID
 )
 import json
@@ -28,20 +28,20 @@ def load_all_site_results(bypass_cache: bool = False) -> List[Dict]:
     sites = load_all_sites(use_cache=not bypass_cache)
     site_results = []
     
-    for site in sites:
-        site_name = site.get('name') or site.get('site_name')
-        if not site_name:
+    repository = get_results_repository()
+    if bypass_cache:
+        repository.invalidate()
+    
+    # Latest complete stage of every site from one read of Optimization_Results
+    site_names = [site.get('name') or site.get('site_name') for site in sites]
+    latest_by_site = repository.latest_complete(name for name in site_names if name)
+    
+    for site, site_name in zip(sites, site_names):
+        if not site_name or site_name not in latest_by_site:
             continue
         
-        # Find latest complete stage
-        # NOTE: load_site_stage_result is cached but we cleared it in the UI
-        latest_result = None
-        for stage in ['detailed', 'preliminary', 'concept', 'screening']:
-            result = load_site_stage_result(site_name, stage)
-            if result and result.get('complete'):
-                latest_result = result
-                latest_result['stage'] = stage
-                break
+        stage, latest_result = latest_by_site[site_name]
+        latest_result['stage'] = stage
         
         if latest_result:
             site_results.append({
@@ -156,8 +156,10 @@ def get_site_optimization_history(site_name: str) -> List[Dict]:
     """
     history = []
     
-    for stage in ['screening', 'concept', 'preliminary', 'detailed']:
-        result = load_site_stage_result(site_name, stage)
+    stages = ['screening', 'concept', 'preliminary', 'detailed']
+    results = get_results_repository().get_many((site_name, stage) for stage in stages)
+    for stage in stages:
+        result = results[(site_name, stage)]
         if result and result.get('complete'):
             history.append({
                 'stage': stage,
@@ -45,7 +45,7 @@ def create_national_portfolio_map(sites_list: List[Dict], stage_filter: List[str
             continue
         
         # Get LCOE
-        result = load_site_stage_result(site.get('name', 'Unknown'), latest_stage)
+        result = load_site_stage_result(site.get('name', 'Unknown'), latest_stage, include_dispatch=False)
         lcoe = result.get('lcoe', 0) if result else 0
         
         if max_lcoe > 0 and lcoe > max_lcoe:  # Only filter if max_lcoe is set and lcoe exceeds it
@@ -131,7 +131,7 @@ def determine_latest_stage(site_name: str) -> str:
     from app.utils.site_backend import load_site_stage_result
     
     for stage in ['detailed', 'preliminary', 'concept', 'screening']:
-        result = load_site_stage_result(site_name, stage)
+        result = load_site_stage_result(site_name, stage, include_dispatch=False)
         if result and str(result.get('complete', '')).upper() == 'TRUE':
             return stage
     
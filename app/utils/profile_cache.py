@@ -0,0 +1,248 @@
+"""
+Content-Addressed Profile Cache
+Memoizes generated 8760 profiles and synthetic dispatch by a hash of their inputs
+
+Profiles are pure functions of their inputs (peak MW, PUE, workload mix,
+seed, ...), so each is stored under stable_key(namespace, *inputs):
+
+- memory tier: in-process LRU bounded by PROFILE_CACHE_MAX_MB
+- disk tier: one .npy file (or a directory of .npy files for a dict of
+  arrays) per key under PROFILE_CACHE_DIR, opened memory-mapped on a hit so
+  new processes and Streamlit restarts skip generation too
+
+Cached arrays are read-only; callers that modify a profile copy it first.
+Bump the namespace version (e.g. 'greenfield_load/v2') when a generator's
+formula changes so stale entries are never read.
+
+Usage:
+    from app.utils.profile_cache import cached_profile
+
+    load = cached_profile('greenfield_load/v1', (peak_mw, 42), lambda: build(peak_mw))
+    get_profile_cache().stats()      # {'hits': 3, 'disk_hits': 1, 'misses': 2, ...}
+"""
+
+import dataclasses
+import enum
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+CacheValue = Union[np.ndarray, Dict[str, np.ndarray]]
+
+
+# =============================================================================
+# KEYS
+# =============================================================================
+
+def _feed(h, value):
+    """Feed a canonical, type-tagged encoding of value into hash h."""
+    if isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        h.update(f"nd:{array.dtype.str}:{array.shape}:".encode())
+        h.update(array.tobytes())
+    elif isinstance(value, np.generic):
+        _feed(h, value.item())
+    elif isinstance(value, (bool, type(None))):
+        h.update(f"{type(value).__name__}:{value};".encode())
+    elif isinstance(value, int):
+        h.update(f"int:{value};".encode())
+    elif isinstance(value, float):
+        h.update(f"float:{value!r};".encode())
+    elif isinstance(value, str):
+        h.update(f"str:{len(value)}:{value};".encode())
+    elif isinstance(value, enum.Enum):
+        _feed(h, (type(value).__name__, value.value))
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        h.update(f"dc:{type(value).__name__}:".encode())
+        _feed(h, {f.name: getattr(value, f.name) for f in dataclasses.fields(value)})
+    elif isinstance(value, dict):
+        h.update(f"dict:{len(value)}:".encode())
+        for k in sorted(value, key=repr):
+            _feed(h, k)
+            _feed(h, value[k])
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}:{len(value)}:".encode())
+        for item in value:
+            _feed(h, item)
+    else:
+        h.update(f"repr:{value!r};".encode())
+
+
+def stable_key(namespace: str, *parts) -> str:
+    """Hex digest of namespace + parts, stable across processes and runs."""
+    h = hashlib.sha256()
+    _feed(h, namespace)
+    _feed(h, parts)
+    return h.hexdigest()
+
+
+def _nbytes(value: CacheValue) -> int:
+    if isinstance(value, dict):
+        return sum(v.nbytes for v in value.values())
+    return value.nbytes
+
+
+def _freeze(value: CacheValue) -> CacheValue:
+    """Read-only arrays so callers cannot corrupt the cached copy."""
+    arrays = value.values() if isinstance(value, dict) else [value]
+    for array in arrays:
+        array.flags.writeable = False
+    return value
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ProfileCache:
+    """Two-tier (memory LRU + memory-mapped .npy) cache of arrays by content key."""
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: 'OrderedDict[str, CacheValue]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> Dict:
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+        }
+
+    # Memory tier
+    def _remember(self, key: str, value: CacheValue):
+        size = _nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= _nbytes(self._entries.pop(key))
+            if size > self.max_bytes:
+                return
+            self._entries[key] = value
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= _nbytes(evicted)
+                self.evictions += 1
+
+    # Disk tier
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def _load(self, key: str) -> Optional[CacheValue]:
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            if path.with_suffix('.npy').is_file():
+                return np.load(path.with_suffix('.npy'), mmap_mode='r')
+            if path.is_dir():
+                return {f.stem: np.load(f, mmap_mode='r') for f in sorted(path.glob('*.npy'))}
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Profile cache entry {key[:12]} unreadable, regenerating: {e}")
+        return None
+
+    def _store(self, key: str, value: CacheValue):
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(dir=path.parent, prefix='.tmp-'))
+            try:
+                if isinstance(value, dict):
+                    for name, array in value.items():
+                        np.save(tmp / f"{name}.npy", np.asarray(array))
+                    os.replace(tmp, path)
+                else:
+                    np.save(tmp / 'value.npy', np.asarray(value))
+                    os.replace(tmp / 'value.npy', path.with_suffix('.npy'))
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+        except OSError as e:
+            # Another process may have written the same key first; either copy is valid
+            if not (path.is_dir() or path.with_suffix('.npy').is_file()):
+                print(f"⚠️ Profile cache could not write {key[:12]}: {e}")
+
+    # Public API
+    def get(self, key: str) -> Optional[CacheValue]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+        value = self._load(key)
+        if value is not None:
+            self.disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: CacheValue) -> CacheValue:
+        value = _freeze(value)
+        self._store(key, value)
+        self._remember(key, value)
+        return value
+
+    def get_or_compute(self, key: str, compute: Callable[[], CacheValue]) -> CacheValue:
+        value = self.get(key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+            value = self.put(key, compute())
+        return value
+
+    def clear(self, disk: bool = False):
+        """Drop the memory tier (and the disk tier if disk=True)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+        if disk and self.cache_dir is not None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_cache: Optional[ProfileCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure_profile_cache(max_mb: float = None, cache_dir=None) -> ProfileCache:
+    """Replace the shared cache (defaults from PROFILE_CACHE_MAX_MB / PROFILE_CACHE_DIR)."""
+    global _cache
+    if max_mb is None or cache_dir is None:
+        from config.settings import PROFILE_CACHE_DIR, PROFILE_CACHE_MAX_MB
+        max_mb = PROFILE_CACHE_MAX_MB if max_mb is None else max_mb
+        cache_dir = PROFILE_CACHE_DIR if cache_dir is None else cache_dir
+    with _cache_lock:
+        _cache = ProfileCache(int(max_mb * 1024 * 1024), cache_dir or None)
+    return _cache
+
+
+def get_profile_cache() -> ProfileCache:
+    """The process-wide profile cache."""
+    if _cache is None:
+        configure_profile_cache()
+    return _cache
+
+
+def cached_profile(namespace: str, parts, compute: Callable[[], CacheValue]) -> CacheValue:
+    """Read `compute()` through the shared cache under stable_key(namespace, *parts)."""
+    return get_profile_cache().get_or_compute(stable_key(namespace, *parts), compute)
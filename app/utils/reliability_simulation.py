@@ -0,0 +1,279 @@
+"""
+Sequential Monte Carlo Reliability
+Loss-of-load expectation (LOLE), expected unserved energy (EUE) and LOLP
+against the site's 8760 load, with BESS and grid in the mix
+
+Every recip, turbine, BESS block and grid tie alternates between up and
+down with exponential times to failure (MTBF) and repair (MTTR); each
+simulated year starts from the steady state. Outage intervals are sampled
+for all units and years at once and painted onto hourly capacity arrays.
+Storage is dispatched hour by hour only in the simulated years that have
+any hour where generation + grid + solar fall short of load. Blocks of
+simulated years run in parallel worker processes (app.utils.scenario_runner),
+each with its own independent random stream, so results depend only on the
+seed, not on the worker count.
+
+Only forced outages are modelled (no planned maintenance, no fuel
+curtailment); solar contributes only when an hourly profile is given.
+
+Usage:
+    from app.utils.reliability_simulation import simulate_reliability
+
+    mc = simulate_reliability(equipment_config, load_8760_mw, n_years=2000)
+    mc['lole_hours_per_year'], mc['lole_ci95'], mc['eue_mwh_per_year'], mc['lolp']
+"""
+
+import math
+import multiprocessing
+import time
+from typing import Dict, List
+
+import numpy as np
+
+HOURS = 8760
+
+# Forced-outage parameters per unit (hours); IEEE 493 / industry-typical
+UNIT_RELIABILITY = {
+    'recip': {'mtbf': 8760, 'mttr': 72},      # 1 year / 3 days
+    'turbine': {'mtbf': 17520, 'mttr': 168},  # 2 years / 1 week
+    'bess': {'mtbf': 43800, 'mttr': 24},      # 5 years / 1 day (per block)
+    'grid': {'mtbf': 4380, 'mttr': 4},        # 6 months / 4 hours (varies widely)
+}
+
+BESS_BLOCK_MW = 5.0          # BESS entries are split into independent blocks of this power
+BESS_ROUND_TRIP_EFF = 0.85   # applied on charge
+Z_95 = 1.959964
+
+
+# =============================================================================
+# UNIT GROUPS
+# =============================================================================
+
+def unit_groups(equipment_config: Dict, params: Dict = None, bess_block_mw: float = BESS_BLOCK_MW) -> List[Dict]:
+    """
+    Identical units grouped from an equipment_config (as in optimization results).
+
+    Each group: kind ('recip', 'turbine', 'bess', 'grid'), count, mw per unit,
+    mwh per unit (BESS blocks only), mtbf, mttr.
+    """
+    params = {**UNIT_RELIABILITY, **(params or {})}
+    groups: Dict[tuple, Dict] = {}
+
+    def add(kind, mw, mwh=0.0, count=1):
+        if mw <= 0 or count <= 0:
+            return
+        key = (kind, round(mw, 6), round(mwh, 6))
+        if key in groups:
+            groups[key]['count'] += count
+        else:
+            groups[key] = {'kind': kind, 'count': count, 'mw': float(mw), 'mwh': float(mwh),
+                           'mtbf': float(params[kind]['mtbf']), 'mttr': float(params[kind]['mttr'])}
+
+    for unit in equipment_config.get('recip_engines', []):
+        add('recip', unit.get('capacity_mw', 0))
+    for unit in equipment_config.get('gas_turbines', []):
+        add('turbine', unit.get('capacity_mw', 0))
+    for unit in equipment_config.get('bess', []):
+        power = unit.get('power_mw', 0)
+        if power > 0:
+            n_blocks = max(1, math.ceil(power / bess_block_mw - 1e-9))
+            add('bess', power / n_blocks, unit.get('energy_mwh', 0) / n_blocks, n_blocks)
+    add('grid', equipment_config.get('grid_import_mw', 0))
+    return list(groups.values())
+
+
+# =============================================================================
+# SIMULATION
+# =============================================================================
+
+def _outage_hours(rng, n_units: int, mtbf: float, mttr: float):
+    """Sample outage intervals for n_units unit-years: (unit index, first hour down, first hour back up)."""
+    up0 = rng.random(n_units) < mtbf / (mtbf + mttr)
+    cycles = int(np.ceil(HOURS / (mtbf + mttr) * 2)) + 4
+    while True:
+        ttf = rng.exponential(mtbf, (n_units, cycles))
+        ttr = rng.exponential(mttr, (n_units, cycles))
+        first = np.where(up0[:, None], ttf, ttr)
+        second = np.where(up0[:, None], ttr, ttf)
+        t = np.cumsum(np.stack([first, second], axis=2).reshape(n_units, 2 * cycles), axis=1)
+        if (t[:, -1] >= HOURS).all():
+            break
+        cycles *= 2
+
+    # Up at t=0: outages are [t0, t1), [t2, t3), ...  Down at t=0: [0, t0), [t1, t2), ...
+    ups, downs = t[:, 0::2], t[:, 1::2]
+    starts = np.where(up0[:, None], ups, np.hstack([np.zeros((n_units, 1)), downs[:, :-1]]))
+    ends = np.where(up0[:, None], downs, ups)
+    unit, k = np.nonzero(starts < HOURS)
+    return unit, np.floor(starts[unit, k]).astype(np.int64), np.minimum(np.floor(ends[unit, k]), HOURS).astype(np.int64)
+
+
+def _available(rng, groups: List[Dict], n_years: int, field: str) -> np.ndarray:
+    """(n_years, HOURS) capacity of `groups` that is up each hour (field: 'mw' or 'mwh')."""
+    installed = sum(g['count'] * g[field] for g in groups)
+    index, weight = [], []
+    for g in groups:
+        unit, start, end = _outage_hours(rng, n_years * g['count'], g['mtbf'], g['mttr'])
+        row = (unit // g['count']) * (HOURS + 1)
+        index += [row + start, row + end]
+        weight += [np.full(len(unit), g[field]), np.full(len(unit), -g[field])]
+    if not index:
+        return np.full((n_years, HOURS), float(installed))
+    lost = np.bincount(np.concatenate(index), weights=np.concatenate(weight), minlength=n_years * (HOURS + 1))
+    return installed - np.cumsum(lost.reshape(n_years, HOURS + 1), axis=1)[:, :HOURS]
+
+
+def _dispatch_storage(net: np.ndarray, power: np.ndarray, energy: np.ndarray, efficiency: float) -> np.ndarray:
+    """Hourly shortfall after BESS covers deficits (net = supply - load), charging from surplus."""
+    shortfall = np.zeros_like(net)
+    soc = np.ones(net.shape[0])  # state of charge as a fraction of the blocks that are up
+    deficit_hours = np.nonzero((net < 0).any(axis=0))[0]
+    h = deficit_hours[0] if len(deficit_hours) else net.shape[1]
+    while h < net.shape[1]:
+        e_cap = energy[:, h]
+        stored = soc * e_cap
+        need = np.maximum(-net[:, h], 0.0)
+        discharge = np.minimum(np.minimum(need, power[:, h]), stored)
+        charge = np.minimum(np.minimum(np.maximum(net[:, h], 0.0), power[:, h]), (e_cap - stored) / efficiency)
+        stored += charge * efficiency - discharge
+        shortfall[:, h] = need - discharge
+        soc = np.divide(stored, e_cap, out=soc, where=e_cap > 0)
+        h += 1
+        if soc.min() >= 1.0 - 1e-12:
+            # Every battery is full: nothing changes until the next deficit hour
+            later = deficit_hours[np.searchsorted(deficit_hours, h):]
+            h = later[0] if len(later) else net.shape[1]
+    return shortfall
+
+
+def simulate_chunk(
+    groups: List[Dict],
+    load_mw: np.ndarray,
+    n_years: int,
+    seed,
+    solar_mw: np.ndarray = None,
+    efficiency: float = BESS_ROUND_TRIP_EFF,
+) -> Dict:
+    """Simulate n_years independent years; per-year loss-of-load hours, unserved MWh and events."""
+    rng = np.random.default_rng(seed)
+    supply_groups = [g for g in groups if g['kind'] != 'bess']
+    bess_groups = [g for g in groups if g['kind'] == 'bess']
+
+    supply = _available(rng, supply_groups, n_years, 'mw')
+    if solar_mw is not None:
+        supply += solar_mw
+    net = supply - load_mw
+    deficit_years = np.nonzero((net < -1e-9).any(axis=1))[0]
+
+    shortfall = np.zeros((len(deficit_years), HOURS))
+    if len(deficit_years):
+        if bess_groups:
+            # Each BESS block keeps its power and energy in step: one outage sample, two paintings
+            bess_seed = int(rng.integers(2**63))
+            power = _available(np.random.default_rng(bess_seed), bess_groups, n_years, 'mw')[deficit_years]
+            energy = _available(np.random.default_rng(bess_seed), bess_groups, n_years, 'mwh')[deficit_years]
+            shortfall = _dispatch_storage(net[deficit_years], power, energy, efficiency)
+        else:
+            shortfall = np.maximum(-net[deficit_years], 0.0)
+
+    lost = shortfall > 1e-6
+    lol_hours = np.zeros(n_years)
+    eue = np.zeros(n_years)
+    events = np.zeros(n_years)
+    lol_hours[deficit_years] = lost.sum(axis=1)
+    eue[deficit_years] = np.where(lost, shortfall, 0.0).sum(axis=1)
+    events[deficit_years] = (lost[:, 0].astype(int) + (lost[:, 1:] & ~lost[:, :-1]).sum(axis=1))
+    return {'lol_hours': lol_hours, 'eue_mwh': eue, 'events': events}
+
+
+def _interval(samples: np.ndarray):
+    mean = float(samples.mean())
+    half = Z_95 * float(samples.std(ddof=1)) / math.sqrt(len(samples)) if len(samples) > 1 else 0.0
+    return mean, [max(mean - half, 0.0), mean + half]
+
+
+def simulate_reliability(
+    equipment_config: Dict,
+    load_mw,
+    n_years: int = None,
+    workers: int = None,
+    seed: int = 0,
+    solar_profile_mw=None,
+    params: Dict = None,
+    chunk_years: int = 250,
+) -> Dict:
+    """
+    Sequential Monte Carlo LOLE / EUE / LOLP for an equipment configuration.
+
+    Args:
+        equipment_config: recip_engines, gas_turbines, bess, grid_import_mw
+            (as in optimization results)
+        load_mw: Hourly facility load; the first 8760 hours are used
+        n_years: Simulated years (default RELIABILITY_MC_YEARS)
+        workers: Worker processes (default RELIABILITY_MC_WORKERS; 0 = one per CPU)
+        seed: Random seed; results do not depend on the worker count
+        solar_profile_mw: Optional hourly solar output (MW)
+        params: Per-kind overrides of UNIT_RELIABILITY, e.g. {'grid': {'mtbf': 2000, 'mttr': 8}}
+        chunk_years: Simulated years per task
+
+    Returns:
+        Dict with lole_hours_per_year, eue_mwh_per_year, lolp, lolf_events_per_year
+        (each with a 95% confidence interval), eue_ppm, annual-LOLE percentiles,
+        the simulated unit table and runtime
+    """
+    from config.settings import RELIABILITY_MC_WORKERS, RELIABILITY_MC_YEARS
+
+    load = np.asarray(load_mw, dtype=float)
+    if load.size < HOURS:
+        raise ValueError(f"Need an 8760-hour load profile, got {load.size} hours")
+    load = load[:HOURS]
+    solar = None if solar_profile_mw is None else np.asarray(solar_profile_mw, dtype=float)[:HOURS]
+    n_years = n_years or RELIABILITY_MC_YEARS
+    groups = unit_groups(equipment_config, params)
+
+    sizes = [min(chunk_years, n_years - start) for start in range(0, n_years, chunk_years)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    kwargs_list = [dict(groups=groups, load_mw=load, n_years=size, seed=s, solar_mw=solar)
+                   for size, s in zip(sizes, seeds)]
+
+    from app.utils.scenario_runner import ScenarioRunner, default_worker_count
+    workers = workers if workers is not None else RELIABILITY_MC_WORKERS
+    workers = min(workers or default_worker_count(len(sizes)), len(sizes))
+    start = time.perf_counter()
+    if workers > 1 and not multiprocessing.current_process().daemon:
+        chunks = ScenarioRunner(max_workers=workers, poll_interval=0.05).run(
+            simulate_chunk, kwargs_list, error_result=lambda index, message: RuntimeError(message))
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+    else:
+        workers = 1
+        chunks = [simulate_chunk(**kwargs) for kwargs in kwargs_list]
+    runtime = time.perf_counter() - start
+
+    lol_hours = np.concatenate([c['lol_hours'] for c in chunks])
+    eue = np.concatenate([c['eue_mwh'] for c in chunks])
+    events = np.concatenate([c['events'] for c in chunks])
+    lole, lole_ci = _interval(lol_hours)
+    eue_mean, eue_ci = _interval(eue)
+    lolf, lolf_ci = _interval(events)
+    annual_load = float(load.sum())
+
+    return {
+        'years_simulated': int(len(lol_hours)),
+        'lole_hours_per_year': lole,
+        'lole_ci95': lole_ci,
+        'eue_mwh_per_year': eue_mean,
+        'eue_ci95': eue_ci,
+        'eue_ppm': eue_mean / annual_load * 1e6 if annual_load > 0 else 0.0,
+        'lolp': lole / HOURS,
+        'lolp_ci95': [v / HOURS for v in lole_ci],
+        'lolf_events_per_year': lolf,
+        'lolf_ci95': lolf_ci,
+        'lole_percentiles': {f'p{p}': float(np.percentile(lol_hours, p)) for p in (50, 90, 99)},
+        'annual_load_mwh': annual_load,
+        'units': [{'Type': g['kind'], 'Count': g['count'], 'Unit MW': g['mw'], 'Unit MWh': g['mwh'],
+                   'MTBF (hrs)': g['mtbf'], 'MTTR (hrs)': g['mttr']} for g in groups],
+        'workers': workers,
+        'runtime_s': runtime,
+    }
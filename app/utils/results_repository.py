@@ -0,0 +1,211 @@
+"""
+Optimization Results Repository
+Indexed, cached read layer over the Optimization_Results tab
+
+The tab is fetched once per refresh and indexed by (site, stage, version), so
+looking up any number of site/stage results costs one API call instead of
+one full-tab download per lookup. JSON columns are parsed the first time a
+row is read, and hourly dispatch is loaded only for rows that ask for it.
+"""
+
+import copy
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# JSON column -> parsed field, as load_site_stage_result has always returned them
+JSON_COLUMNS = {
+    'equipment_json': 'equipment',
+    'constraints_json': 'constraints',
+    'dispatch_summary_json': 'dispatch_summary',
+    'capex_json': 'capex',
+    'equipment_details_json': 'equipment_details',
+    'equipment_by_year_json': 'equipment_by_year',
+}
+
+
+def parse_result_row(record: Dict) -> Dict:
+    """Sheet row -> result dict with JSON columns decoded and 'complete' as a bool."""
+    result = dict(record)
+    for column, field in JSON_COLUMNS.items():
+        raw = result.get(column)
+        try:
+            result[field] = json.loads(raw) if raw else {}
+        except (TypeError, ValueError):
+            logger.warning(f"Failed to parse {column} for {result.get('site_name')} - {result.get('stage')}")
+            result[field] = {}
+
+    # Convert string keys back to int years
+    try:
+        result['equipment_by_year'] = {int(year): data for year, data in result['equipment_by_year'].items()}
+    except (TypeError, ValueError, AttributeError):
+        result['equipment_by_year'] = {}
+
+    # Normalize 'complete' field - Google Sheets returns 'TRUE'/'FALSE' as strings
+    complete_val = result.get('complete', False)
+    if isinstance(complete_val, str):
+        result['complete'] = complete_val.upper() in ['TRUE', 'YES', '1']
+    else:
+        result['complete'] = bool(complete_val)
+    return result
+
+
+def _version(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 1
+
+
+class ResultsRepository:
+    """
+    In-memory (site, stage, version) index over the Optimization_Results rows.
+
+    Args:
+        fetch_records: Returns every row of the tab (worksheet.get_all_records)
+        load_dispatch: load_dispatch_data(site, stage, version), or None
+        ttl: Seconds before the next read refetches the tab
+        generation: Optional token source; a change of token also forces a
+            refetch (site_backend ties it to Streamlit's data cache)
+    """
+
+    def __init__(
+        self,
+        fetch_records: Callable[[], List[Dict]],
+        load_dispatch: Callable[[str, str, int], Dict] = None,
+        ttl: float = 60,
+        generation: Callable[[], object] = None,
+    ):
+        self.fetch_records = fetch_records
+        self.load_dispatch = load_dispatch
+        self.ttl = ttl
+        self.generation = generation
+        self._lock = threading.RLock()
+        self.invalidate()
+
+    # ==========================================================================
+    # CACHE
+    # ==========================================================================
+
+    def invalidate(self):
+        """Drop the cached tab; the next read refetches it."""
+        with self._lock:
+            self._records: Optional[List[Dict]] = None
+            self._index: Dict[Tuple[str, str], Dict[int, int]] = {}
+            self._parsed: Dict[int, Dict] = {}
+            self._dispatch: Dict[Tuple[str, str, int], Dict] = {}
+            self._fetched_at = None
+            self._token = None
+
+    def refresh(self):
+        """Fetch the tab now and rebuild the index."""
+        token = self.generation() if self.generation else None
+        records = self.fetch_records()
+        index = {}
+        for row, record in enumerate(records):
+            versions = index.setdefault((str(record.get('site_name')), str(record.get('stage'))), {})
+            # First row wins, matching the linear scans this replaces
+            versions.setdefault(_version(record.get('version', 1)), row)
+        with self._lock:
+            self._records = records
+            self._index = index
+            self._parsed = {}
+            self._dispatch = {}
+            self._fetched_at = time.monotonic()
+            self._token = token
+
+    def _ensure_fresh(self):
+        with self._lock:
+            stale = (
+                self._records is None
+                or (self.ttl is not None and time.monotonic() - self._fetched_at > self.ttl)
+                or (self.generation is not None and self.generation() != self._token)
+            )
+        if stale:
+            self.refresh()
+
+    # ==========================================================================
+    # LOOKUPS
+    # ==========================================================================
+
+    def _row(self, site_name: str, stage: str, version: int = None) -> Optional[int]:
+        versions = self._index.get((str(site_name), str(stage)))
+        if not versions:
+            return None
+        if version is None:
+            return min(versions.values())  # first matching row in sheet order
+        return versions.get(_version(version))
+
+    def row_number(self, site_name: str, stage: str, version: int = None) -> Optional[int]:
+        """1-based sheet row of a result (header is row 1), or None."""
+        self._ensure_fresh()
+        with self._lock:
+            row = self._row(site_name, stage, version)
+        return None if row is None else row + 2
+
+    def versions(self, site_name: str, stage: str) -> List[int]:
+        self._ensure_fresh()
+        with self._lock:
+            return sorted(self._index.get((str(site_name), str(stage)), {}))
+
+    def get(self, site_name: str, stage: str, version: int = None, include_dispatch: bool = True) -> Optional[Dict]:
+        """
+        One result, or None.
+
+        version=None returns the first row for the site/stage. The dict is a
+        deep copy (nested fields and dispatch included), so callers may modify it.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            row = self._row(site_name, stage, version)
+            if row is None:
+                return None
+            if row not in self._parsed:
+                self._parsed[row] = parse_result_row(self._records[row])
+            result = copy.deepcopy(self._parsed[row])
+
+        if include_dispatch and self.load_dispatch is not None:
+            key = (str(site_name), str(stage), _version(result.get('version', 1)))
+            with self._lock:
+                dispatch = self._dispatch.get(key)
+            if dispatch is None:
+                dispatch = self.load_dispatch(site_name, stage, key[2])
+                with self._lock:
+                    self._dispatch[key] = dispatch
+            result['dispatch_by_year'] = copy.deepcopy(dispatch)
+        return result
+
+    def get_many(
+        self,
+        keys: Iterable[Tuple[str, str]],
+        include_dispatch: bool = False,
+    ) -> Dict[Tuple[str, str], Optional[Dict]]:
+        """Bulk get() for (site, stage) pairs from one fetch of the tab."""
+        self._ensure_fresh()
+        return {
+            (site_name, stage): self.get(site_name, stage, include_dispatch=include_dispatch)
+            for site_name, stage in keys
+        }
+
+    def latest_complete(
+        self,
+        site_names: Iterable[str],
+        stages: Iterable[str] = ('detailed', 'preliminary', 'concept', 'screening'),
+    ) -> Dict[str, Tuple[str, Dict]]:
+        """{site: (stage, result)} for the first complete stage of each site, in `stages` order."""
+        stages = list(stages)
+        site_names = list(site_names)
+        results = self.get_many((site, stage) for site in site_names for stage in stages)
+        latest = {}
+        for site in site_names:
+            for stage in stages:
+                result = results[(site, stage)]
+                if result and result.get('complete'):
+                    latest[site] = (stage, result)
+                    break
+        return latest
@@ -0,0 +1,331 @@
+"""
+Parallel Scenario Runner
+========================
+
+Runs independent optimization scenarios in worker processes. Each scenario
+gets its own process, so a solve that hangs past its timeout (or a sweep the
+user cancels) is terminated outright - including any solver subprocess it
+is waiting on - instead of blocking the rest of the sweep.
+
+Results come back in the order the scenarios were given, whatever order they
+finish in; callers rank them afterwards exactly as they did serially.
+
+Usage:
+    from app.utils.scenario_runner import ScenarioRunner
+
+    runner = ScenarioRunner(max_workers=8, timeout=420)
+    results = runner.run(
+        optimize_with_milp,
+        [dict(common_kwargs, scenario=s) for s in scenarios],
+        names=[s['Scenario_Name'] for s in scenarios],
+        progress_callback=lambda p: print(f"{p['completed']}/{p['total']}"),
+    )
+
+    # Streamlit: start in the background, then poll on reruns
+    runner.start(optimize_with_milp, kwargs_list)
+    runner.progress()   # {'completed', 'total', 'scenarios': [...], ...}
+    runner.cancel()
+    runner.results()    # once runner.done
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import traceback
+from multiprocessing.connection import wait
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Scenario states reported by ScenarioRunner.progress()
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+
+FINISHED_STATES = (DONE, FAILED, TIMEOUT, CANCELLED)
+
+
+def _run_in_worker(fn: Callable, kwargs: Dict, conn) -> None:
+    """Worker process entry point: send ('ok', result) or ('error', traceback)."""
+    if hasattr(os, 'setsid'):
+        # Own process group, so terminating the worker also stops the solver it launched
+        os.setsid()
+    try:
+        payload = ('ok', fn(**kwargs))
+    except BaseException:
+        payload = ('error', traceback.format_exc())
+    try:
+        conn.send(payload)
+    finally:
+        conn.close()
+
+
+def default_worker_count(n_scenarios: int) -> int:
+    """One worker per scenario, capped at the machine's CPU count."""
+    return max(1, min(n_scenarios, os.cpu_count() or 1))
+
+
+class ScenarioRunner:
+    """
+    Process-pool runner for independent scenario solves.
+
+    `fn` and every kwargs dict must be picklable (module-level function,
+    plain data) because workers may be started with the 'spawn' method.
+    Failed, timed-out and cancelled scenarios are returned as
+    error_result(index, message) - None by default - so one bad scenario
+    never loses the others.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        timeout: float = None,
+        poll_interval: float = 0.25,
+        mp_context: str = None,
+    ):
+        """
+        Args:
+            max_workers: Concurrent worker processes (default: one per
+                scenario, capped at the CPU count)
+            timeout: Wall-clock seconds allowed per scenario, measured from
+                the moment its worker starts (None = no limit)
+            poll_interval: Seconds between progress checks / callbacks
+            mp_context: multiprocessing start method (default: platform default)
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._ctx = multiprocessing.get_context(mp_context)
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._status: List[Dict] = []
+        self._results: List = []
+        self._error: Optional[BaseException] = None
+        self._started_at = None
+
+    # ==========================================================================
+    # PUBLIC API
+    # ==========================================================================
+
+    def run(
+        self,
+        fn: Callable,
+        kwargs_list: List[Dict],
+        names: List[str] = None,
+        progress_callback: Callable[[Dict], None] = None,
+        error_result: Callable[[int, str], object] = None,
+        stop_when: Callable[[int, object], bool] = None,
+    ) -> List:
+        """
+        Run fn(**kwargs) for every kwargs dict and block until all finish.
+
+        Args:
+            fn: Module-level function solving one scenario
+            kwargs_list: Keyword arguments per scenario
+            names: Display names for progress reporting
+            progress_callback: Called with progress() from the calling
+                thread whenever a scenario changes state (and at least every
+                poll_interval seconds while scenarios run)
+            error_result: Builds the entry for a scenario that did not
+                finish: error_result(index, message)
+            stop_when: Cancel the remaining scenarios as soon as a finished
+                result satisfies stop_when(index, result) (solver races)
+
+        Returns:
+            One entry per scenario, in input order
+        """
+        error_result = error_result or (lambda index, message: None)
+        n = len(kwargs_list)
+        names = list(names) if names is not None else [f"Scenario {i + 1}" for i in range(n)]
+        max_workers = self.max_workers or default_worker_count(n)
+
+        with self._lock:
+            self._cancel.clear()
+            self._error = None
+            self._started_at = time.perf_counter()
+            self._results = [None] * n
+            self._status = [
+                {'name': name, 'state': PENDING, 'elapsed_s': 0.0, 'error': None}
+                for name in names
+            ]
+
+        pending = list(range(n))
+        running = {}  # index -> (process, connection, start time)
+
+        def report():
+            if progress_callback is not None:
+                progress_callback(self.progress())
+
+        try:
+            while pending or running:
+                if self._cancel.is_set():
+                    for index in list(running):
+                        self._stop(running.pop(index), index, CANCELLED, "Cancelled", error_result)
+                    for index in pending:
+                        self._finish(index, CANCELLED, "Cancelled", error_result(index, "Cancelled"), None)
+                    pending = []
+                    report()
+                    break
+
+                while pending and len(running) < max_workers:
+                    index = pending.pop(0)
+                    running[index] = self._launch(fn, kwargs_list[index], index)
+                    logger.info(f"Started {names[index]} ({len(running)}/{max_workers} workers busy)")
+                report()
+
+                ready = wait([conn for _, conn, _ in running.values()], timeout=self.poll_interval)
+                now = time.perf_counter()
+                for index in list(running):
+                    process, conn, started = running[index]
+                    if conn in ready:
+                        self._collect(running.pop(index), index, error_result)
+                        if (stop_when is not None and self._status[index]['state'] == DONE
+                                and stop_when(index, self._results[index])):
+                            logger.info(f"{names[index]} met the stop condition; cancelling the rest")
+                            self._cancel.set()
+                    elif self.timeout is not None and now - started > self.timeout:
+                        message = f"Timed out after {self.timeout:.0f}s"
+                        self._stop(running.pop(index), index, TIMEOUT, message, error_result)
+                    else:
+                        with self._lock:
+                            self._status[index]['elapsed_s'] = now - started
+        finally:
+            for index, task in running.items():
+                self._stop(task, index, CANCELLED, "Runner stopped", error_result)
+
+        report()
+        return list(self._results)
+
+    def start(self, fn: Callable, kwargs_list: List[Dict], **run_kwargs) -> 'ScenarioRunner':
+        """Run in a background thread; poll progress() / done, then call results()."""
+        if self._thread is not None and self._thread.is_alive():
+            raise RuntimeError("Runner is already running")
+        # Status must exist before start() returns so the first poll sees every scenario
+        names = run_kwargs.get('names') or [f"Scenario {i + 1}" for i in range(len(kwargs_list))]
+        with self._lock:
+            self._status = [{'name': name, 'state': PENDING, 'elapsed_s': 0.0, 'error': None}
+                            for name in names]
+            self._results = [None] * len(kwargs_list)
+
+        def target():
+            try:
+                self.run(fn, kwargs_list, **run_kwargs)
+            except BaseException as e:
+                logger.error(f"Scenario runner failed: {e}")
+                self._error = e
+
+        self._thread = threading.Thread(target=target, name='scenario-runner', daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Stop the sweep: running workers are terminated, pending ones skipped."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def done(self) -> bool:
+        """True once a start()-ed sweep has finished (or none was started)."""
+        return self._thread is None or not self._thread.is_alive()
+
+    def results(self, timeout: float = None) -> List:
+        """Results of a start()-ed sweep, in input order (waits for it to finish)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                raise TimeoutError("Scenarios still running")
+        if self._error is not None:
+            raise self._error
+        return list(self._results)
+
+    def progress(self) -> Dict:
+        """Thread-safe snapshot of the sweep, suitable for polling from a UI."""
+        with self._lock:
+            scenarios = [dict(s) for s in self._status]
+        completed = sum(s['state'] in FINISHED_STATES for s in scenarios)
+        return {
+            'completed': completed,
+            'total': len(scenarios),
+            'fraction': completed / len(scenarios) if scenarios else 1.0,
+            'running': [s['name'] for s in scenarios if s['state'] == RUNNING],
+            'cancelled': self._cancel.is_set(),
+            'elapsed_s': time.perf_counter() - self._started_at if self._started_at else 0.0,
+            'scenarios': scenarios,
+        }
+
+    # ==========================================================================
+    # WORKER MANAGEMENT
+    # ==========================================================================
+
+    def _launch(self, fn: Callable, kwargs: Dict, index: int):
+        recv_conn, send_conn = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(target=_run_in_worker, args=(fn, kwargs, send_conn), daemon=True)
+        process.start()
+        send_conn.close()  # Parent keeps only the read end, so a crashed worker reads as EOF
+        with self._lock:
+            self._status[index]['state'] = RUNNING
+        return process, recv_conn, time.perf_counter()
+
+    def _collect(self, task, index: int, error_result):
+        """Read a finished worker's payload."""
+        process, conn, started = task
+        try:
+            status, payload = conn.recv()
+        except EOFError:
+            process.join()
+            status, payload = 'error', f"Worker exited with code {process.exitcode} without a result"
+        finally:
+            conn.close()
+        process.join()
+
+        if status == 'ok':
+            self._finish(index, DONE, None, payload, started)
+        else:
+            logger.error(f"{self._status[index]['name']} failed:\n{payload}")
+            message = payload.strip().splitlines()[-1] if payload.strip() else "Worker failed"
+            self._finish(index, FAILED, message, error_result(index, message), started)
+
+    def _stop(self, task, index: int, state: str, message: str, error_result):
+        """Terminate a running worker (and its solver subprocess with it)."""
+        process, conn, started = task
+        self._signal(process, signal.SIGTERM)
+        process.join(5)
+        if process.is_alive():
+            self._signal(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+            process.join()
+        conn.close()
+        logger.warning(f"{self._status[index]['name']}: {message}")
+        self._finish(index, state, message, error_result(index, message), started)
+
+    @staticmethod
+    def _signal(process, sig):
+        """Signal the worker's whole process group where supported, else just the worker."""
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, sig)
+                return
+        except (ProcessLookupError, PermissionError):
+            pass
+        if sig == signal.SIGTERM:
+            process.terminate()
+        else:
+            process.kill()
+
+    def _finish(self, index: int, state: str, message: Optional[str], result, started: Optional[float]):
+        with self._lock:
+            self._results[index] = result
+            status = self._status[index]
+            status['state'] = state
+            status['error'] = message
+            if started is not None:
+                status['elapsed_s'] = time.perf_counter() - started
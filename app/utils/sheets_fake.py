@@ -0,0 +1,307 @@
+"""
+In-Memory Google Sheets Fake
+Offline stand-in for the subset of gspread the app uses
+
+FakeSheetsBackend holds spreadsheets as plain lists of rows and counts every
+call that would be a Sheets API request, so CI can benchmark API calls per
+page without network access or credentials. fail_next() injects 429 / 5xx
+errors to exercise retry handling.
+
+Usage:
+    from app.utils.sheets_fake import FakeSheetsBackend
+    from app.utils.sheets_pool import configure_sheets_pool
+
+    fake = FakeSheetsBackend()
+    fake.seed(SHEET_ID, 'Sites', [{'name': 'Phoenix', 'it_capacity_mw': 600}])
+    pool = configure_sheets_pool(backend='fake', fake=fake)
+    ...                              # run page / backend code
+    fake.calls                       # Counter({'get_all_records': 1, ...})
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List
+
+try:
+    from gspread.exceptions import SpreadsheetNotFound, WorksheetNotFound
+except ImportError:
+    class SpreadsheetNotFound(Exception):
+        pass
+
+    class WorksheetNotFound(Exception):
+        pass
+
+
+class FakeAPIError(Exception):
+    """Error shaped like gspread.exceptions.APIError (code + response.status_code)."""
+
+    class _Response:
+        def __init__(self, status_code: int):
+            self.status_code = status_code
+
+    def __init__(self, status_code: int, message: str = ''):
+        super().__init__(message or f"HTTP {status_code}")
+        self.code = status_code
+        self.response = self._Response(status_code)
+
+
+# =============================================================================
+# A1 NOTATION
+# =============================================================================
+
+_CELL = re.compile(r'^([A-Za-z]*)(\d*)$')
+
+
+def _col_number(letters: str) -> int:
+    n = 0
+    for ch in letters.upper():
+        n = n * 26 + ord(ch) - 64
+    return n
+
+
+def _col_letters(n: int) -> str:
+    letters = ''
+    while n:
+        n, rem = divmod(n - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def rowcol_to_a1(row: int, col: int) -> str:
+    """(2, 3) -> 'C2', like gspread.utils.rowcol_to_a1."""
+    return f"{_col_letters(col)}{row}"
+
+
+def _split_range(range_name: str):
+    """'Tab!A1:B2' -> ('Tab', 'A1:B2'); 'A1:B2' -> (None, 'A1:B2'); 'Tab' -> ('Tab', '')."""
+    if '!' in range_name:
+        title, cells = range_name.rsplit('!', 1)
+        return title.strip("'"), cells
+    if re.match(r'^[A-Za-z]{0,3}\d*(:[A-Za-z]{0,3}\d*)?$', range_name):
+        return None, range_name
+    return range_name.strip("'"), ''
+
+
+def _parse_cells(cells: str):
+    """A1 range -> (row0, col0, row1, col1), 1-based inclusive; None = open-ended."""
+    if not cells:
+        return 1, 1, None, None
+    start, _, end = cells.partition(':')
+    sc, sr = _CELL.match(start).groups()
+    if not end:
+        r, c = int(sr or 1), _col_number(sc) if sc else 1
+        return r, c, r, c
+    ec, er = _CELL.match(end).groups()
+    return (int(sr) if sr else 1, _col_number(sc) if sc else 1,
+            int(er) if er else None, _col_number(ec) if ec else None)
+
+
+def numericise(value):
+    """Like gspread's default numericise: numeric strings become int / float."""
+    if isinstance(value, str) and value.strip():
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                return value
+    return value
+
+
+# =============================================================================
+# FAKE OBJECTS
+# =============================================================================
+
+class FakeSheetsBackend:
+    """All fake spreadsheets plus the API call counter."""
+
+    def __init__(self, auto_create: bool = True):
+        self.spreadsheets: Dict[str, 'FakeSpreadsheet'] = {}
+        self.auto_create = auto_create
+        self.calls = Counter()
+        self._failures: List[int] = []
+
+    def client(self) -> 'FakeClient':
+        return FakeClient(self)
+
+    def seed(self, sheet_id: str, title: str, records: List[Dict], headers: List[str] = None):
+        """Create / replace a tab from records (headers default to the first record's keys)."""
+        spreadsheet = self.spreadsheets.setdefault(sheet_id, FakeSpreadsheet(self, sheet_id))
+        headers = headers or (list(records[0]) if records else [])
+        worksheet = FakeWorksheet(self, spreadsheet, title)
+        worksheet.rows = [list(headers)] + [[record.get(h, '') for h in headers] for record in records]
+        spreadsheet.tabs[title] = worksheet
+        return worksheet
+
+    def fail_next(self, n: int = 1, status_code: int = 429):
+        """Make the next n API calls fail with status_code."""
+        self._failures.extend([status_code] * n)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_calls(self):
+        self.calls.clear()
+
+    def _api(self, method: str):
+        self.calls[method] += 1
+        if self._failures:
+            raise FakeAPIError(self._failures.pop(0))
+
+
+class FakeClient:
+    def __init__(self, backend: FakeSheetsBackend):
+        self.backend = backend
+
+    def open_by_key(self, key: str) -> 'FakeSpreadsheet':
+        self.backend._api('open_by_key')
+        if key not in self.backend.spreadsheets:
+            if not self.backend.auto_create:
+                raise SpreadsheetNotFound(key)
+            self.backend.spreadsheets[key] = FakeSpreadsheet(self.backend, key)
+        return self.backend.spreadsheets[key]
+
+
+class FakeSpreadsheet:
+    def __init__(self, backend: FakeSheetsBackend, key: str):
+        self.backend = backend
+        self.id = key
+        self.title = key
+        self.tabs: Dict[str, 'FakeWorksheet'] = {}
+
+    def worksheet(self, title: str) -> 'FakeWorksheet':
+        self.backend._api('worksheet')
+        if title not in self.tabs:
+            raise WorksheetNotFound(title)
+        return self.tabs[title]
+
+    def worksheets(self) -> List['FakeWorksheet']:
+        self.backend._api('worksheets')
+        return list(self.tabs.values())
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, index: int = None) -> 'FakeWorksheet':
+        self.backend._api('add_worksheet')
+        self.tabs[title] = FakeWorksheet(self.backend, self, title)
+        return self.tabs[title]
+
+    def del_worksheet(self, worksheet: 'FakeWorksheet'):
+        self.backend._api('del_worksheet')
+        self.tabs.pop(worksheet.title, None)
+
+    def values_batch_get(self, ranges: List[str], params: Dict = None) -> Dict:
+        self.backend._api('values_batch_get')
+        value_ranges = []
+        for range_name in ranges:
+            title, cells = _split_range(range_name)
+            if title not in self.tabs:
+                raise FakeAPIError(400, f"Unable to parse range: {range_name}")
+            value_ranges.append({'range': range_name, 'values': self.tabs[title]._read(cells)})
+        return {'spreadsheetId': self.id, 'valueRanges': value_ranges}
+
+    def values_batch_update(self, body: Dict) -> Dict:
+        self.backend._api('values_batch_update')
+        for item in body.get('data', []):
+            title, cells = _split_range(item['range'])
+            if title not in self.tabs:
+                raise FakeAPIError(400, f"Unable to parse range: {item['range']}")
+            self.tabs[title]._write(cells, item['values'])
+        return {'spreadsheetId': self.id, 'totalUpdatedRanges': len(body.get('data', []))}
+
+
+class FakeWorksheet:
+    def __init__(self, backend: FakeSheetsBackend, spreadsheet: FakeSpreadsheet, title: str):
+        self.backend = backend
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows: List[List] = []
+
+    @property
+    def row_count(self) -> int:
+        return len(self.rows)
+
+    # Local helpers (no API call)
+    def _read(self, cells: str) -> List[List]:
+        r0, c0, r1, c1 = _parse_cells(cells)
+        rows = self.rows[r0 - 1:r1]
+        return [row[c0 - 1:c1] for row in rows]
+
+    def _write(self, cells: str, values: List[List]):
+        r0, c0, _, _ = _parse_cells(cells)
+        for i, values_row in enumerate(values):
+            row_index = r0 - 1 + i
+            while len(self.rows) <= row_index:
+                self.rows.append([])
+            row = self.rows[row_index]
+            needed = c0 - 1 + len(values_row)
+            row.extend([''] * (needed - len(row)))
+            row[c0 - 1:needed] = list(values_row)
+
+    # Reads
+    def get_all_values(self, *args, **kwargs) -> List[List]:
+        self.backend._api('get_all_values')
+        return [list(row) for row in self.rows]
+
+    def get_all_records(self, head: int = 1, numericise_ignore=None, **kwargs) -> List[Dict]:
+        self.backend._api('get_all_records')
+        if len(self.rows) < head:
+            return []
+        headers = self.rows[head - 1]
+        return [{h: numericise(row[i]) if i < len(row) else '' for i, h in enumerate(headers)}
+                for row in self.rows[head:]]
+
+    def get(self, range_name: str = None, **kwargs) -> List[List]:
+        self.backend._api('get')
+        return self._read(_split_range(range_name)[1] if range_name else '')
+
+    get_values = get
+
+    def row_values(self, row: int, **kwargs) -> List:
+        self.backend._api('row_values')
+        return list(self.rows[row - 1]) if row <= len(self.rows) else []
+
+    def col_values(self, col: int, **kwargs) -> List:
+        self.backend._api('col_values')
+        return [row[col - 1] if col <= len(row) else '' for row in self.rows]
+
+    # Writes
+    def update(self, *args, **kwargs):
+        """update(range_name, values) or update(values, range_name) (gspread 5 / 6 order)."""
+        self.backend._api('update')
+        args = list(args)
+        range_name = kwargs.pop('range_name', None)
+        values = kwargs.pop('values', None)
+        for arg in args:
+            if isinstance(arg, str) and range_name is None:
+                range_name = arg
+            elif values is None:
+                values = arg
+        if not isinstance(values, list) or (values and not isinstance(values[0], list)):
+            values = [[values]] if not isinstance(values, list) else [values]
+        self._write(_split_range(range_name or 'A1')[1], values)
+
+    def update_cell(self, row: int, col: int, value):
+        self.backend._api('update_cell')
+        self._write(rowcol_to_a1(row, col), [[value]])
+
+    def append_row(self, values: List, **kwargs):
+        self.backend._api('append_row')
+        self.rows.append(list(values))
+
+    def append_rows(self, values: List[List], **kwargs):
+        self.backend._api('append_rows')
+        self.rows.extend(list(row) for row in values)
+
+    def insert_row(self, values: List, index: int = 1, **kwargs):
+        self.backend._api('insert_row')
+        self.rows.insert(index - 1, list(values))
+
+    def delete_rows(self, start_index: int, end_index: int = None):
+        self.backend._api('delete_rows')
+        end_index = end_index or start_index
+        del self.rows[start_index - 1:end_index]
+
+    def clear(self):
+        self.backend._api('clear')
+        self.rows = []
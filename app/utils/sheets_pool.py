@@ -0,0 +1,407 @@
+"""
+Shared Google Sheets Client Pool
+Process-wide gspread client / spreadsheet / worksheet handles with quota control
+
+Every module used to authenticate and open_by_key the spreadsheet on each
+call. The pool authenticates once per credentials file, keeps spreadsheet
+and worksheet handles, and routes every API request through:
+
+- a token-bucket rate limiter per request kind (read / write), sized so no
+  60-second window exceeds the Sheets per-user quota
+- exponential backoff with jitter on 429 and 5xx responses (5xx only for
+  reads and idempotent writes; appends / inserts are retried on 429 alone)
+
+Handles returned by the pool are thin proxies, so existing code such as
+`client.open_by_key(SHEET_ID).worksheet('Sites').get_all_records()` keeps
+working unchanged. batch_get() / batch_update() read or write many ranges
+in a single request (the equipment library load and update_site() use them).
+
+Set SHEETS_BACKEND=fake (or configure_sheets_pool(backend='fake')) to run
+against the in-memory FakeSheetsBackend and count API calls offline.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from app.utils.sheets_fake import FakeSheetsBackend, WorksheetNotFound, numericise, rowcol_to_a1
+
+logger = logging.getLogger(__name__)
+
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+# Status codes worth retrying: quota exceeded and transient server errors
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+# gspread methods that issue an API request, by quota bucket
+READ_METHODS = {
+    'open_by_key', 'open', 'open_by_url', 'openall',
+    'worksheet', 'worksheets', 'fetch_sheet_metadata', 'values_get', 'values_batch_get',
+    'get_all_records', 'get_all_values', 'get', 'get_values', 'batch_get',
+    'row_values', 'col_values', 'cell', 'acell', 'find', 'findall', 'range',
+}
+WRITE_METHODS = {
+    'create', 'add_worksheet', 'del_worksheet', 'duplicate_sheet', 'batch_update',
+    'values_update', 'values_append', 'values_clear', 'values_batch_update',
+    'update', 'update_cell', 'update_acell', 'update_cells', 'update_title',
+    'append_row', 'append_rows', 'insert_row', 'insert_rows', 'insert_cols',
+    'delete_rows', 'delete_row', 'delete_columns', 'clear', 'batch_clear',
+    'resize', 'add_rows', 'add_cols', 'format', 'freeze',
+}
+
+# Writes that add, insert or remove by position. A 5xx can arrive after the
+# server applied the request, so retrying would duplicate rows or tabs; these
+# are only retried on 429, which the API returns before applying anything.
+NON_IDEMPOTENT_METHODS = {
+    'create', 'add_worksheet', 'duplicate_sheet', 'batch_update', 'values_append',
+    'append_row', 'append_rows', 'insert_row', 'insert_rows', 'insert_cols',
+    'delete_rows', 'delete_row', 'delete_columns', 'add_rows', 'add_cols',
+}
+QUOTA_STATUS = (429,)
+
+# Methods whose result is a worksheet (or list of worksheets) to wrap
+_WORKSHEET_RESULTS = {'worksheet', 'worksheets', 'add_worksheet', 'duplicate_sheet'}
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of a gspread APIError (or anything shaped like one)."""
+    response = getattr(exc, 'response', None)
+    code = getattr(response, 'status_code', None)
+    if code is None:
+        code = getattr(exc, 'code', None)
+    return code if isinstance(code, int) else None
+
+
+def _quote(title: str) -> str:
+    return "'" + title.replace("'", "''") + "'"
+
+
+def a1_range(title: str, row: int, col: int) -> str:
+    """Single-cell batch_update() key: ('Sites', 2, 3) -> "'Sites'!C2"."""
+    return f"{_quote(title)}!{rowcol_to_a1(row, col)}"
+
+
+def records_from_values(values: List[List]) -> List[Dict]:
+    """Header row + data rows -> list of dicts, numeric strings converted like get_all_records()."""
+    if not values:
+        return []
+    headers = values[0]
+    return [{h: numericise(row[i]) if i < len(row) else '' for i, h in enumerate(headers)} for row in values[1:]]
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """Thread-safe token bucket: `capacity` burst, refilled at `rate` tokens/s."""
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, quota: int, burst: int = 10, **kwargs) -> 'TokenBucket':
+        """Bucket that never exceeds `quota` requests in any 60 s window."""
+        burst = min(burst, quota)
+        return cls(rate=(quota - burst) / 60.0 if quota > burst else quota / 60.0, capacity=burst, **kwargs)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens, sleeping until available; returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= tokens - 1e-9:  # tolerance: refill after a sleep can round just short
+                    self.tokens = max(0.0, self.tokens - tokens)
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class SheetsPool:
+    """
+    Process-wide gspread handle pool with rate limiting and retries.
+
+    Args:
+        backend: 'google' (gspread service account) or 'fake'
+        reads_per_minute / writes_per_minute: Sheets per-user quota per kind
+        burst: Requests allowed back-to-back before the steady rate applies
+        max_retries: Retries on 429 / 5xx before the error is raised
+        base_delay / max_delay: Exponential backoff bounds in seconds
+        fake: FakeSheetsBackend to use with backend='fake'
+    """
+
+    def __init__(
+        self,
+        backend: str = 'google',
+        reads_per_minute: int = 60,
+        writes_per_minute: int = 60,
+        burst: int = 10,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 32.0,
+        fake: FakeSheetsBackend = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if backend not in ('google', 'fake'):
+            raise ValueError(f"Unknown Sheets backend '{backend}' (use 'google' or 'fake')")
+        self.backend = backend
+        self.fake = fake or (FakeSheetsBackend() if backend == 'fake' else None)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._sleep = sleep
+        self.buckets = {
+            'read': TokenBucket.per_minute(reads_per_minute, burst, sleep=sleep),
+            'write': TokenBucket.per_minute(writes_per_minute, burst, sleep=sleep),
+        }
+        self.stats = Counter()  # API requests issued, by method
+        self.retries = 0
+        self._lock = threading.RLock()
+        self._clients: Dict[str, '_PooledClient'] = {}
+        self._spreadsheets: Dict[str, '_PooledSpreadsheet'] = {}
+        self._worksheets: Dict[tuple, '_PooledWorksheet'] = {}
+
+    # --------------------------------------------------------------------------
+    # Handles
+    # --------------------------------------------------------------------------
+
+    def client(self, credentials_path: str = None) -> '_PooledClient':
+        """Authenticated client (one per credentials file for the process)."""
+        if self.backend == 'fake':
+            key = 'fake'
+        else:
+            if credentials_path is None:
+                from config.settings import GOOGLE_CREDENTIALS_PATH as credentials_path
+            key = str(Path(credentials_path).resolve())
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = _PooledClient(self, self._authorize(key))
+            return self._clients[key]
+
+    def _authorize(self, credentials_path: str):
+        if self.backend == 'fake':
+            return self.fake.client()
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+        except ImportError:
+            raise ImportError("gspread library not installed. Run: pip install gspread google-auth")
+        credentials = Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+        logger.info(f"Authenticated Google Sheets client ({Path(credentials_path).name})")
+        return gspread.authorize(credentials)
+
+    def spreadsheet(self, sheet_id: str = None, credentials_path: str = None) -> '_PooledSpreadsheet':
+        """Spreadsheet handle, opened once per process."""
+        if sheet_id is None:
+            from config.settings import GOOGLE_SHEET_ID as sheet_id
+        return self.client(credentials_path).open_by_key(sheet_id)
+
+    def worksheet(self, title: str, sheet_id: str = None, credentials_path: str = None) -> '_PooledWorksheet':
+        return self.spreadsheet(sheet_id, credentials_path).worksheet(title)
+
+    def invalidate(self, sheet_id: str = None):
+        """Forget cached spreadsheet / worksheet handles (all, or one spreadsheet's)."""
+        with self._lock:
+            if sheet_id is None:
+                self._spreadsheets.clear()
+                self._worksheets.clear()
+            else:
+                self._spreadsheets.pop(sheet_id, None)
+                for key in [k for k in self._worksheets if k[0] == sheet_id]:
+                    del self._worksheets[key]
+
+    # --------------------------------------------------------------------------
+    # Batch facade
+    # --------------------------------------------------------------------------
+
+    def batch_get(self, ranges: List[str], sheet_id: str = None, credentials_path: str = None) -> Dict[str, List[List]]:
+        """Values of many A1 ranges (e.g. "'Sites'!A1:Z") in one request: {range: rows}."""
+        if not ranges:
+            return {}
+        response = self.spreadsheet(sheet_id, credentials_path).values_batch_get(list(ranges))
+        return {range_name: value_range.get('values', [])
+                for range_name, value_range in zip(ranges, response.get('valueRanges', []))}
+
+    def batch_get_records(self, titles: List[str], sheet_id: str = None,
+                          credentials_path: str = None) -> Dict[str, List[Dict]]:
+        """Whole tabs as get_all_records()-style dicts, one request for all of them."""
+        values = self.batch_get([_quote(title) for title in titles], sheet_id, credentials_path)
+        return {title: records_from_values(values[_quote(title)]) for title in titles}
+
+    def batch_update(self, updates: Dict[str, List[List]], sheet_id: str = None, credentials_path: str = None,
+                     value_input_option: str = 'USER_ENTERED') -> Dict:
+        """Write many {A1 range: rows} blocks in one request."""
+        if not updates:
+            return {}
+        body = {
+            'valueInputOption': value_input_option,
+            'data': [{'range': range_name, 'values': values} for range_name, values in updates.items()],
+        }
+        return self.spreadsheet(sheet_id, credentials_path).values_batch_update(body)
+
+    # --------------------------------------------------------------------------
+    # Request execution
+    # --------------------------------------------------------------------------
+
+    def call(self, method: str, fn: Callable, *args, **kwargs):
+        """Run one API request under the rate limiter, retrying 429 / 5xx with backoff."""
+        kind = 'write' if method in WRITE_METHODS else 'read'
+        retryable = QUOTA_STATUS if method in NON_IDEMPOTENT_METHODS else RETRYABLE_STATUS
+        attempt = 0
+        while True:
+            self.buckets[kind].acquire()
+            with self._lock:
+                self.stats[method] += 1
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                status = _status_code(e)
+                if status not in retryable or attempt >= self.max_retries:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt) + random.uniform(0, self.base_delay)
+                attempt += 1
+                with self._lock:
+                    self.retries += 1
+                logger.warning(f"Sheets {method} returned {status}; retry {attempt}/{self.max_retries} "
+                               f"in {delay:.1f}s")
+                self._sleep(delay)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.stats.values())
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+            self.retries = 0
+
+
+class _Pooled:
+    """Proxy that routes API methods of a gspread object through the pool."""
+
+    def __init__(self, pool: SheetsPool, target):
+        self._pool = pool
+        self._target = target
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr) or name not in READ_METHODS and name not in WRITE_METHODS:
+            return attr
+
+        def method(*args, **kwargs):
+            return self._wrap(name, self._pool.call(name, attr, *args, **kwargs))
+
+        method.__name__ = name
+        return method
+
+    def _wrap(self, name, result):
+        return result
+
+    def __repr__(self):
+        return f"<pooled {self._target!r}>"
+
+
+class _PooledClient(_Pooled):
+    def open_by_key(self, key: str) -> '_PooledSpreadsheet':
+        pool = self._pool
+        with pool._lock:
+            if key in pool._spreadsheets:
+                return pool._spreadsheets[key]
+        spreadsheet = _PooledSpreadsheet(pool, pool.call('open_by_key', self._target.open_by_key, key), key)
+        with pool._lock:
+            return pool._spreadsheets.setdefault(key, spreadsheet)
+
+
+class _PooledSpreadsheet(_Pooled):
+    def __init__(self, pool: SheetsPool, target, key: str):
+        super().__init__(pool, target)
+        self._key = key
+
+    def worksheet(self, title: str) -> '_PooledWorksheet':
+        pool = self._pool
+        with pool._lock:
+            if (self._key, title) in pool._worksheets:
+                return pool._worksheets[(self._key, title)]
+        worksheet = self._wrap('worksheet', pool.call('worksheet', self._target.worksheet, title))
+        return worksheet
+
+    def del_worksheet(self, worksheet):
+        target = worksheet._target if isinstance(worksheet, _PooledWorksheet) else worksheet
+        result = self._pool.call('del_worksheet', self._target.del_worksheet, target)
+        with self._pool._lock:
+            self._pool._worksheets.pop((self._key, target.title), None)
+        return result
+
+    def _wrap(self, name, result):
+        if name not in _WORKSHEET_RESULTS:
+            return result
+        if isinstance(result, list):
+            return [self._cache(ws) for ws in result]
+        return self._cache(result)
+
+    def _cache(self, worksheet) -> '_PooledWorksheet':
+        with self._pool._lock:
+            return self._pool._worksheets.setdefault(
+                (self._key, worksheet.title), _PooledWorksheet(self._pool, worksheet)
+            )
+
+
+class _PooledWorksheet(_Pooled):
+    pass
+
+
+# =============================================================================
+# PROCESS-WIDE POOL
+# =============================================================================
+
+_pool: Optional[SheetsPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_sheets_pool() -> SheetsPool:
+    """The process-wide pool, configured from config.settings on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from config.settings import SHEETS_BACKEND, SHEETS_READS_PER_MINUTE, SHEETS_WRITES_PER_MINUTE
+            _pool = SheetsPool(
+                backend=SHEETS_BACKEND,
+                reads_per_minute=SHEETS_READS_PER_MINUTE,
+                writes_per_minute=SHEETS_WRITES_PER_MINUTE,
+            )
+        return _pool
+
+
+def configure_sheets_pool(**kwargs) -> SheetsPool:
+    """Replace the process-wide pool (e.g. backend='fake' in tests / CI)."""
+    global _pool
+    with _pool_lock:
+        _pool = SheetsPool(**kwargs)
+        return _pool
+
+
+def get_sheets_client(credentials_path: str = None):
+    """Shared authenticated client; drop-in for the old per-module get_google_sheets_client()."""
+    return get_sheets_pool().client(credentials_path)
@@ -7,14 +7,13 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 import streamlit as st
 import json
+import time
 from datetime import datetime
 
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
+from app.utils.data_io import json_default
+from app.utils.results_repository import ResultsRepository
+
+from app.utils.sheets_pool import a1_range, get_sheets_client, get_sheets_pool, WorksheetNotFound
 
 
 # Google Sheets Configuration
@@ -22,20 +21,6 @@ SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 CREDENTIALS_PATH = str(Path(__file__).parent.parent.parent / "credentials.json")
 
 
-def get_google_sheets_client():
-    """Get authenticated Google Sheets client"""
-    if not GSPREAD_AVAILABLE:
-        raise ImportError("gspread library not installed")
-    
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    
-    credentials = Credentials.from_service_account_file(CREDENTIALS_PATH, scopes=scopes)
-    return gspread.authorize(credentials)
-
-
 # =============================================================================
 # SITE MANAGEMENT
 # =============================================================================
@@ -48,13 +33,13 @@ def load_all_sites(use_cache: bool = True) -> List[Dict]:
         return st.session_state.sites_list
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Try to get Sites worksheet, create if doesn't exist
         try:
             worksheet = spreadsheet.worksheet("Sites")
-        except gspread.WorksheetNotFound:
+        except WorksheetNotFound:
             # Create Sites worksheet with headers
             worksheet = spreadsheet.add_worksheet(title="Sites", rows=100, cols=20)
             headers = [
@@ -123,7 +108,7 @@ def save_site(site_data: Dict) -> bool:
     """Save or update a site in Google Sheets"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Sites")
         
@@ -200,7 +185,7 @@ def delete_site(site_name: str) -> bool:
     """Delete a site and all associated data"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Delete from Sites
@@ -266,7 +251,7 @@ def update_site(site_name: str, updates: dict) -> bool:
         True if successful, False otherwise
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         sheet = spreadsheet.worksheet('Sites')
         
@@ -287,13 +272,15 @@ def update_site(site_name: str, updates: dict) -> bool:
         # Get header row to find column indices
         headers = sheet.row_values(1)
         
-        # Update each field
+        # Collect every field's cell, then write them in one request
+        cell_updates = {}
         for field_name, new_value in updates.items():
             if field_name in headers:
                 col_idx = headers.index(field_name) + 1  # +1 for 1-indexed
-                sheet.update_cell(site_row, col_idx, new_value)
+                cell_updates[a1_range('Sites', site_row, col_idx)] = [[new_value]]
             else:
                 print(f"Warning: Field '{field_name}' not found in sheet headers")
+        get_sheets_pool().batch_update(cell_updates, SHEET_ID, CREDENTIALS_PATH)
         
         print(f"Successfully updated site '{site_name}' with {len(updates)} field(s)")
         return True
@@ -364,13 +351,13 @@ def load_site_load_profile(site_name: str) -> Optional[Dict]:
     """Load load profile for a specific site"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Try to get Site_Loads worksheet
         try:
             worksheet = spreadsheet.worksheet("Load_Profiles")
-        except gspread.WorksheetNotFound:
+        except WorksheetNotFound:
             # Create Site_Loads worksheet
             worksheet = spreadsheet.add_worksheet(title="Load_Profiles", rows=100, cols=10)
             headers = [
@@ -402,7 +389,7 @@ def save_site_load_profile(site_name: str, load_data: Dict) -> bool:
     """Save load profile for a specific site"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Load_Profiles")
         
@@ -443,12 +430,12 @@ def load_site_optimization_stages(site_name: str) -> Dict:
     """Load all optimization stage data for a site"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         
         try:
             worksheet = spreadsheet.worksheet("Optimization_Results")
-        except gspread.WorksheetNotFound:
+        except WorksheetNotFound:
             # Create worksheet
             worksheet = spreadsheet.add_worksheet(title="Optimization_Results", rows=100, cols=16)
             headers = [
@@ -504,7 +491,7 @@ def save_site_stage_result(site_name: str, stage: str, result_data: Dict) -> boo
     """Save optimization result for a specific stage"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Optimization_Results")  # Updated sheet name
         
@@ -529,18 +516,18 @@ def save_site_stage_result(site_name: str, stage: str, result_data: Dict) -> boo
             result_data.get('complete', True),                      # C: complete
             result_data.get('lcoe'),                                # D: lcoe
             result_data.get('npv'),                                 # E: npv
-            json.dumps(result_data.get('equipment', {})),          # F: equipment_json
-            json.dumps(result_data.get('dispatch_summary', {})),   # G: dispatch_summary_json
+            json.dumps(result_data.get('equipment', {}), default=json_default),          # F: equipment_json
+            json.dumps(result_data.get('dispatch_summary', {}), default=json_default),   # G: dispatch_summary_json
             datetime.now().isoformat(),                             # H: completion_date
             result_data.get('notes', ''),                           # I: notes
             result_data.get('load_coverage_pct', 0),               # J: load_coverage_pct
-            json.dumps(result_data.get('constraints', {})),        # K: constraints_json
-            json.dumps(result_data.get('capex', {})),              # L: capex_json
+            json.dumps(result_data.get('constraints', {}), default=json_default),        # K: constraints_json
+            json.dumps(result_data.get('capex', {}), default=json_default),              # L: capex_json
             result_data.get('runtime_seconds', 0),                 # M: runtime_seconds
             result_data.get('run_timestamp', datetime.now().isoformat()),  # N: run_timestamp
             result_data.get('version', 1),                         # O: version
-            json.dumps(result_data.get('equipment_details', {})),  # P: equipment_details_json
-            json.dumps(result_data.get('equipment_by_year', {})),  # Q: equipment_by_year_json (NEW)
+            json.dumps(result_data.get('equipment_details', {}), default=json_default),  # P: equipment_details_json
+            json.dumps(result_data.get('equipment_by_year', {}), default=json_default),  # Q: equipment_by_year_json (NEW)
         ]
         
         if existing_row:
@@ -557,6 +544,7 @@ def save_site_stage_result(site_name: str, stage: str, result_data: Dict) -> boo
             from app.utils.dispatch_persistence import save_dispatch_data
             save_dispatch_data(site_name, stage, version, result_data['dispatch_by_year'])
         
+        get_results_repository().invalidate()
         return True
     except Exception as e:
         print(f"Error saving site stage result: {e}")
@@ -564,124 +552,55 @@ def save_site_stage_result(site_name: str, stage: str, result_data: Dict) -> boo
 
 
 
-@st.cache_data(ttl=60)  # Reduced to 1 minute to allow fresher data
-def load_site_stage_result(site_name: str, stage: str) -> Optional[Dict]:
+@st.cache_data(ttl=60)
+def _results_cache_generation() -> float:
+    """Token that changes when Streamlit's data cache is cleared or expires."""
+    return time.time()
+
+
+def _fetch_optimization_results() -> List[Dict]:
+    client = get_sheets_client(CREDENTIALS_PATH)
+    spreadsheet = client.open_by_key(SHEET_ID)
+    worksheet = spreadsheet.worksheet("Optimization_Results")
+    return worksheet.get_all_records()
+
+
+def _load_dispatch(site_name: str, stage: str, version: int) -> Dict:
+    from app.utils.dispatch_persistence import load_dispatch_data
+    return load_dispatch_data(site_name, stage, version)
+
+
+_results_repository = None
+
+
+def get_results_repository() -> ResultsRepository:
+    """
+    Shared Optimization_Results repository.
+    
+    Refetches the tab after 60 s, after save_site_stage_result /
+    update_site_stage_status, or when a page calls st.cache_data.clear().
+    """
+    global _results_repository
+    if _results_repository is None:
+        _results_repository = ResultsRepository(
+            fetch_records=_fetch_optimization_results,
+            load_dispatch=_load_dispatch,
+            ttl=60,
+            generation=_results_cache_generation,
+        )
+    return _results_repository
+
+
+def load_site_stage_result(site_name: str, stage: str, include_dispatch: bool = True) -> Optional[Dict]:
     """Load optimization result for a specific site and stage
     
-    Note: This function is cached to prevent Google Sheets API rate limiting.
-    Cache is cleared when generating reports to ensure fresh data.
+    Note: Served from the shared results repository, which downloads the
+    Optimization_Results tab once per refresh (see get_results_repository).
+    Set include_dispatch=False to skip the hourly dispatch data.
     """
     
     try:
-        client = get_google_sheets_client()
-        spreadsheet = client.open_by_key(SHEET_ID)
-        worksheet = spreadsheet.worksheet("Optimization_Results")
-        
-        stages = worksheet.get_all_records()
-        for stage_data in stages:
-            if stage_data.get('site_name') == site_name and stage_data.get('stage') == stage:
-                # Deserialize JSON fields from Google Sheets strings
-                print(f"DEBUG: Found {site_name} - {stage}")
-                print(f"DEBUG: equipment_json = {stage_data.get('equipment_json', 'MISSING')[:100]}")
-                result = dict(stage_data)
-                
-                # Parse JSON strings back to dicts
-                if 'equipment_json' in result and result['equipment_json']:
-                    try:
-                        result['equipment'] = json.loads(result['equipment_json'])
-                    except:
-                        result['equipment'] = {}
-                else:
-                    result['equipment'] = {}
-                
-                if 'constraints_json' in result and result['constraints_json']:
-                    try:
-                        result['constraints'] = json.loads(result['constraints_json'])
-                    except:
-                        result['constraints'] = {}
-                else:
-                    result['constraints'] = {}
-                if 'constraints_json' in result and result['constraints_json']:
-                    try:
-                        result['constraints'] = json.loads(result['constraints_json'])
-                    except:
-                        result['constraints'] = {}
-                else:
-                    result['constraints'] = {}
-                if 'constraints_json' in result and result['constraints_json']:
-                    try:
-                        result['constraints'] = json.loads(result['constraints_json'])
-                    except:
-                        result['constraints'] = {}
-                else:
-                    result['constraints'] = {}
-                if 'constraints_json' in result and result['constraints_json']:
-                    try:
-                        result['constraints'] = json.loads(result['constraints_json'])
-                    except:
-                        result['constraints'] = {}
-                else:
-                    result['constraints'] = {}
-                if 'constraints_json' in result and result['constraints_json']:
-                    try:
-                        result['constraints'] = json.loads(result['constraints_json'])
-                    except:
-                        result['constraints'] = {}
-                else:
-                    result['constraints'] = {}
-                
-                if 'dispatch_summary_json' in result and result['dispatch_summary_json']:
-                    try:
-                        result['dispatch_summary'] = json.loads(result['dispatch_summary_json'])
-                    except:
-                        result['dispatch_summary'] = {}
-                else:
-                    result['dispatch_summary'] = {}
-                
-                # NEW: Deserialize equipment_details
-                if 'equipment_details_json' in result and result['equipment_details_json']:
-                    try:
-                        result['equipment_details'] = json.loads(result['equipment_details_json'])
-                        print(f"DEBUG: Loaded equipment_details with {len(result['equipment_details'])} equipment types")
-                    except Exception as e:
-                        print(f"DEBUG: Failed to parse equipment_details: {e}")
-                        result['equipment_details'] = {}
-                else:
-                    result['equipment_details'] = {}
-                
-                # NEW: Deserialize equipment_by_year (phased deployment data)
-                if 'equipment_by_year_json' in result and result['equipment_by_year_json']:
-                    try:
-                        equipment_by_year_loaded = json.loads(result['equipment_by_year_json'])
-                        # Convert string keys back to int years
-                        result['equipment_by_year'] = {int(year): data for year, data in equipment_by_year_loaded.items()}
-                        print(f"DEBUG: Loaded equipment_by_year with {len(result['equipment_by_year'])} years")
-                    except Exception as e:
-                        print(f"DEBUG: Failed to parse equipment_by_year: {e}")
-                        result['equipment_by_year'] = {}
-                else:
-                    result['equipment_by_year'] = {}
-                
-                # Normalize 'complete' field - Google Sheets returns 'TRUE'/'FALSE' as strings
-                complete_val = result.get('complete', False)
-                if isinstance(complete_val, str):
-                    result['complete'] = complete_val.upper() in ['TRUE', 'YES', '1']
-                elif isinstance(complete_val, (int, float)):
-                    result['complete'] = bool(complete_val)
-                else:
-                    result['complete'] = bool(complete_val)
-                
-                # Load dispatch_by_year from separate Dispatch_Data tab
-                from app.utils.dispatch_persistence import load_dispatch_data
-                result['dispatch_by_year'] = load_dispatch_data(
-                    site_name, 
-                    stage, 
-                    result.get('version', 1)
-                )
-                
-                return result
-        
-        return None
+        return get_results_repository().get(site_name, stage, include_dispatch=include_dispatch)
     except Exception as e:
         print(f"Error loading site stage result: {e}")
         return None
@@ -690,7 +609,7 @@ def update_site_stage_status(site_name: str, stage: str, complete: bool) -> bool
     """Mark a stage as complete or incomplete"""
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet("Optimization_Results")
         
@@ -699,11 +618,13 @@ def update_site_stage_status(site_name: str, stage: str, complete: bool) -> bool
             if stage_data.get('site_name') == site_name and stage_data.get('stage') == stage:
                 row_num = idx + 2
                 worksheet.update(f'C{row_num}', [[complete]])
+                get_results_repository().invalidate()
                 return True
         
         # If stage doesn't exist, create it
         row_data = [site_name, stage, complete, None, None, '{}', '{}', datetime.now().isoformat(), '']
         worksheet.append_row(row_data)
+        get_results_repository().invalidate()
         return True
     except Exception as e:
         print(f"Error updating stage status: {e}")
@@ -737,7 +658,7 @@ def load_equipment_database() -> List[Dict]:
         List of equipment dictionaries
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         sheet = client.open_by_key(SHEET_ID).worksheet('Equipment')
         
         records = sheet.get_all_records()
@@ -806,7 +727,7 @@ def save_custom_equipment(equipment_data: Dict) -> bool:
         True if successful
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         sheet = client.open_by_key(SHEET_ID).worksheet('Equipment')
         
         # Mark as custom
@@ -852,7 +773,7 @@ def load_global_parameters() -> Dict:
         Dictionary of parameters {name: value}
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         sheet = client.open_by_key(SHEET_ID).worksheet('Global_Parameters')
         
         records = sheet.get_all_records()
@@ -907,7 +828,7 @@ def update_global_parameter(param_name: str, new_value: Any) -> bool:
         True if successful
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         sheet = client.open_by_key(SHEET_ID).worksheet('Global_Parameters')
         
         # Find the row
@@ -945,7 +866,7 @@ def save_stage_notes(site_name: str, stage: str, notes: str) -> bool:
         True if successful
     """
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client(CREDENTIALS_PATH)
         sheet = client.open_by_key(SHEET_ID).worksheet('Site_Optimization_Stages')
         
         # Find the row for this site/stage
@@ -6,26 +6,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any, List
 import streamlit as st
 
-try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
-
-
-def get_google_sheets_client(credentials_path: str):
-    """Get authenticated Google Sheets client"""
-    if not GSPREAD_AVAILABLE:
-        raise ImportError("gspread library not installed")
-    
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
-    
-    credentials = Credentials.from_service_account_file(credentials_path, scopes=scopes)
-    return gspread.authorize(credentials)
+from app.utils.sheets_pool import get_sheets_client
 
 
 def load_sites(
@@ -43,7 +24,7 @@ def load_sites(
         credentials_path = str(Path(__file__).parent.parent.parent / "credentials.json")
     
     try:
-        client = get_google_sheets_client(credentials_path)
+        client = get_sheets_client(credentials_path)
         spreadsheet = client.open_by_key(sheet_id)
         worksheet = spreadsheet.worksheet("Sites")
         sites = worksheet.get_all_records()
@@ -69,7 +50,7 @@ def load_site_constraints(
         credentials_path = str(Path(__file__).parent.parent.parent / "credentials.json")
     
     try:
-        client = get_google_sheets_client(credentials_path)
+        client = get_sheets_client(credentials_path)
         spreadsheet = client.open_by_key(sheet_id)
         worksheet = spreadsheet.worksheet("Site_Constraints")
         all_constraints = worksheet.get_all_records()
@@ -173,7 +154,7 @@ def load_scenario_templates(
         credentials_path = str(Path(__file__).parent.parent.parent / "credentials.json")
     
     try:
-        client = get_google_sheets_client(credentials_path)
+        client = get_sheets_client(credentials_path)
         spreadsheet = client.open_by_key(sheet_id)
         worksheet = spreadsheet.worksheet("Scenario_Templates")
         scenarios = worksheet.get_all_records()
@@ -200,7 +181,7 @@ def load_optimization_objectives(
         credentials_path = str(Path(__file__).parent.parent.parent / "credentials.json")
     
     try:
-        client = get_google_sheets_client(credentials_path)
+        client = get_sheets_client(credentials_path)
         spreadsheet = client.open_by_key(sheet_id)
         worksheet = spreadsheet.worksheet("Optimization_Objectives")
         all_objectives = worksheet.get_all_records()
@@ -0,0 +1,312 @@
+"""
+Persistent MILP Solve Cache
+Returns the formatted optimize_with_milp result for inputs that were already solved
+
+A CBC solve takes 60-300 s, and pages rerun it whenever Streamlit reruns or a
+scenario is reopened. Each formatted result is stored on local disk under a
+fingerprint of everything that determines it:
+
+- site, constraints, years, solver and time limit
+- the load profile, with its arrays hashed by value
+- the scenario's resolved technology flags and grid timeline (not its name)
+- the model version: a hash of the source of the model class and its bases,
+  of the modules every backend builds on (MODEL_SOURCES: representative
+  periods, in-process HiGHS) and of the calling wrapper's module (which
+  formats the result), plus the wrapper's equipment specs and prices and the
+  optimizer's cache_config() (e.g. the decomposition mode, window and step)
+
+Editing bvNexusMILP_DR (or the sparse / decomposed backends), the code they
+build on, the result formatting or the equipment specs therefore changes
+every key. Code outside these files is not tracked.
+Bump SOLVE_CACHE_VERSION or call get_solve_cache().clear() to invalidate
+explicitly. The disk tier is LRU-bounded by SOLVE_CACHE_MAX_MB; a hit
+refreshes the entry's mtime.
+
+Usage:
+    from app.utils.solve_cache import get_solve_cache, milp_cache_key
+
+    key = milp_cache_key('milp/v1', site=site, constraints=constraints, ...)
+    result = get_solve_cache().get(key)      # None on a miss
+    get_solve_cache().put(key, result)
+
+    # Re-use a built model only if its structural inputs are unchanged
+    if optimizer.is_built and optimizer.build_key == milp_build_key(load_data, ...):
+        optimizer.update_scenario(...)
+"""
+
+import hashlib
+import importlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.utils.profile_cache import stable_key
+
+
+# =============================================================================
+# FINGERPRINT
+# =============================================================================
+
+# (technology, primary scenario key, alternate key), as in the wrappers' is_disabled()
+SCENARIO_FLAGS = [
+    ('recip', 'Recip_Enabled', 'Recip_Engines'),
+    ('turbine', 'Turbine_Enabled', 'Gas_Turbines'),
+    ('solar', 'Solar_Enabled', 'Solar_PV'),
+    ('bess', 'BESS_Enabled', 'BESS'),
+    ('grid', 'Grid_Enabled', 'Grid_Connection'),
+]
+
+
+def _canonical(value):
+    """Normalize equal inputs to equal values: numeric lists become float arrays, ints become floats."""
+    if isinstance(value, dict):
+        return {_canonical(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return np.ascontiguousarray(value, dtype=float) if value.dtype.kind in 'biuf' else value
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, (int, float, np.number)) and not isinstance(v, bool) for v in value):
+            return np.asarray(value, dtype=float)
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.generic):
+        return _canonical(value.item())
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def canonical_scenario(scenario: Optional[Dict]) -> Dict:
+    """The parts of a scenario that change the solve: resolved technology flags and grid timeline."""
+    scenario = scenario or {}
+
+    def is_disabled(primary_key, alt_key):
+        for key in (primary_key, alt_key):
+            if key in scenario:
+                val = scenario[key]
+                if isinstance(val, str):
+                    if val.lower() in ('false', 'no', '0', 'disabled'):
+                        return True
+                elif val == False:
+                    return True
+        return False
+
+    canonical = {tech: not is_disabled(primary, alt) for tech, primary, alt in SCENARIO_FLAGS}
+    canonical['grid_timeline_months'] = _canonical(scenario.get('Grid_Timeline_Months'))
+    return canonical
+
+
+# Modules every MILP backend builds on, hashed into each model version
+MODEL_SOURCES = (
+    'app.optimization.representative_periods',
+    'app.optimization.highs_inprocess',
+)
+
+_source_hashes: Dict[str, str] = {}
+
+
+def _source_hash(path: str) -> str:
+    stat = os.stat(path)
+    cache_id = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+    if cache_id not in _source_hashes:
+        _source_hashes[cache_id] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    return _source_hashes[cache_id]
+
+
+def model_version(model_cls, *specs, sources=()) -> str:
+    """
+    Hash of the source of model_cls and its base classes, MODEL_SOURCES and the
+    modules named in sources (e.g. the wrapper that formats the result), plus
+    any equipment specs.
+    """
+    h = hashlib.sha256()
+    for cls in inspect.getmro(model_cls):
+        try:
+            path = inspect.getsourcefile(cls)
+        except TypeError:  # built-in (object)
+            continue
+        h.update(f"{cls.__qualname__}:{_source_hash(path)};".encode())
+    for name in (*MODEL_SOURCES, *sources):
+        h.update(f"{name}:{_source_hash(inspect.getsourcefile(importlib.import_module(name)))};".encode())
+    h.update(stable_key('specs', *[_canonical(spec) for spec in specs]).encode())
+    return h.hexdigest()
+
+
+def milp_cache_key(
+    namespace: str,
+    site: Dict,
+    constraints: Dict,
+    load_profile_dr: Dict,
+    years: List[int],
+    scenario: Dict,
+    solver: str,
+    time_limit: float,
+    existing_equipment: Dict = None,
+    model_version: str = '',
+) -> str:
+    """Fingerprint of one optimize_with_milp call (namespace separates the wrappers)."""
+    from config.settings import SOLVE_CACHE_VERSION
+
+    return stable_key(
+        namespace,
+        SOLVE_CACHE_VERSION,
+        model_version,
+        _canonical(site or {}),
+        _canonical(constraints or {}),
+        _canonical(load_profile_dr or {}),
+        _canonical(list(years)),
+        canonical_scenario(scenario),
+        solver,
+        _canonical(time_limit),
+        _canonical(existing_equipment or {}),
+    )
+
+
+def milp_build_key(
+    load_data: Dict,
+    workload_mix: Dict,
+    years: List[int],
+    dr_config: Dict = None,
+    existing_equipment: Dict = None,
+    representative_periods=None,
+) -> str:
+    """
+    Fingerprint of the inputs baked into a built MILP model's structure.
+
+    A built model can only be re-used through update_scenario() when this key
+    matches: constraints, grid config and the load trajectory are mutable
+    Params and are left out.
+    """
+    load_data = {k: v for k, v in (load_data or {}).items() if k != 'load_trajectory'}
+    return stable_key(
+        'milp/build',
+        _canonical(load_data),
+        _canonical(workload_mix or {}),
+        _canonical(list(years)),
+        _canonical(dr_config or {}),
+        _canonical(existing_equipment or {}),
+        representative_periods,
+    )
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class SolveCache:
+    """Disk cache of pickled result dicts by fingerprint, LRU-bounded by total size."""
+
+    def __init__(self, cache_dir, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def _entries(self) -> List[Path]:
+        return list(self.cache_dir.glob('*/*.pkl')) if self.cache_dir.is_dir() else []
+
+    def stats(self) -> Dict:
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(p.stat().st_size for p in entries),
+        }
+
+    def get(self, key: str) -> Optional[Dict]:
+        """A fresh copy of the cached result, or None."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+            os.utime(path)  # most recently used
+        except FileNotFoundError:
+            result = None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            print(f"⚠️ Solve cache entry {key[:12]} unreadable, re-solving: {e}")
+            result = None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def put(self, key: str, result: Dict):
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+        except (OSError, pickle.PicklingError, TypeError) as e:
+            print(f"⚠️ Solve cache could not store {key[:12]}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes."""
+        with self._lock:
+            entries = []
+            for p in self._entries():
+                try:
+                    stat = p.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                p.unlink(missing_ok=True)
+                total -= size
+                self.evictions += 1
+
+    def clear(self):
+        """Delete every cached result."""
+        with self._lock:
+            for p in self._entries():
+                p.unlink(missing_ok=True)
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_cache: Optional[SolveCache] = None
+_cache_lock = threading.Lock()
+
+
+def configure_solve_cache(max_mb: float = None, cache_dir=None) -> Optional[SolveCache]:
+    """Replace the shared cache (defaults from SOLVE_CACHE_MAX_MB / SOLVE_CACHE_DIR; "" disables it)."""
+    global _cache
+    if max_mb is None or cache_dir is None:
+        from config.settings import SOLVE_CACHE_DIR, SOLVE_CACHE_MAX_MB
+        max_mb = SOLVE_CACHE_MAX_MB if max_mb is None else max_mb
+        cache_dir = SOLVE_CACHE_DIR if cache_dir is None else cache_dir
+    with _cache_lock:
+        _cache = SolveCache(cache_dir, int(max_mb * 1024 * 1024)) if cache_dir else None
+    return _cache
+
+
+def get_solve_cache() -> Optional[SolveCache]:
+    """The process-wide solve cache (None when disabled)."""
+    if _cache is None:
+        configure_solve_cache()
+    return _cache
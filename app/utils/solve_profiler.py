@@ -0,0 +1,171 @@
+"""
+MILP Pipeline Instrumentation
+Wall time and peak RSS per phase, model size and solver statistics for one solve
+
+optimize_with_milp attaches a SolveProfiler to the model; the model times
+each _build_* method, the LP file write, the solver run and solution
+extraction under it, and the wrapper adds input prep, scenario setup and
+result formatting. The summary lands in result['instrumentation'] and can be
+exported as a Chrome trace (chrome://tracing or https://ui.perfetto.dev).
+
+Peak RSS is the high-water mark reached *during* each phase on Linux (the
+kernel counter is reset at phase start via /proc/self/clear_refs); elsewhere
+it is the process high-water mark at phase end.
+
+Usage:
+    profiler = SolveProfiler()
+    profiler.lap('input_prep')             # sequential steps; each lap ends the previous one
+    ...
+    with profiler.phase('build'):          # or an explicit block
+        ...
+    profiler.summary()                     # {'phases': [...], 'total_s': ...}
+    profiler.write_chrome_trace('solve.trace.json')
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_STATUS = '/proc/self/status'
+_CLEAR_REFS = '/proc/self/clear_refs'
+
+
+def _status_mb(field: str) -> Optional[float]:
+    try:
+        with open(_STATUS) as f:
+            match = re.search(rf'^{field}:\s+(\d+) kB', f.read(), re.MULTILINE)
+        return int(match.group(1)) / 1024 if match else None
+    except OSError:
+        return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size now (Linux only)."""
+    return _status_mb('VmRSS')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Resident set high-water mark (since the last reset on Linux)."""
+    peak = _status_mb('VmHWM')
+    if peak is None and resource is not None:
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak = maxrss / 1024 / 1024 if sys.platform == 'darwin' else maxrss / 1024
+    return peak
+
+
+def _reset_peak_rss() -> bool:
+    try:
+        with open(_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+class SolveProfiler:
+    """Nested phase timer with per-phase peak RSS and free-form solve statistics (single-threaded)."""
+
+    def __init__(self):
+        self.phases: List[Dict] = []
+        self.stats: Dict = {}
+        self._stack: List[Dict] = []
+        self._t0 = time.perf_counter()
+        self._epoch_us = time.time() * 1e6
+        self._lap = None
+
+    def _begin(self) -> Dict:
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak_rss_mb() or 0)
+        _reset_peak_rss()
+        entry = {'peak': 0.0, 'start': time.perf_counter(), 'depth': len(self._stack)}
+        self._stack.append(entry)
+        return entry
+
+    def _end(self, entry: Dict, name: str, args: Dict):
+        end = time.perf_counter()
+        peak = max(entry['peak'], peak_rss_mb() or 0)
+        self._stack.remove(entry)
+        if self._stack:
+            self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+        self.phases.append({
+            'name': name,
+            'depth': entry['depth'],
+            'start_s': entry['start'] - self._t0,
+            'wall_s': end - entry['start'],
+            'rss_mb': current_rss_mb(),
+            'peak_rss_mb': peak or None,
+            **args,
+        })
+
+    @contextmanager
+    def phase(self, name: str, **args):
+        """Time the enclosed block as `name`; nested phases are recorded with their depth."""
+        entry = self._begin()
+        try:
+            yield
+        finally:
+            self._end(entry, name, args)
+
+    def lap(self, name: str, **args):
+        """End the current lap (if any) and start phase `name`; for sequential pipeline steps."""
+        self.end_lap()
+        self._lap = (self._begin(), name, args)
+
+    def end_lap(self):
+        if self._lap is not None:
+            lap, self._lap = self._lap, None
+            self._end(*lap)
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """func timed as phase `name` on every call."""
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return timed
+
+    def record(self, **stats):
+        """Attach statistics (model size, MIP gap, node count, ...) to the summary."""
+        self.stats.update({k: v for k, v in stats.items() if v is not None})
+
+    def phase_times(self) -> Dict[str, float]:
+        """Total wall seconds per phase name."""
+        totals: Dict[str, float] = {}
+        for p in self.phases:
+            totals[p['name']] = totals.get(p['name'], 0.0) + p['wall_s']
+        return totals
+
+    def summary(self) -> Dict:
+        """JSON-ready dict: phases in start order, per-name totals and statistics (ends any open lap)."""
+        self.end_lap()
+        return {
+            'total_s': time.perf_counter() - self._t0,
+            'phases': sorted(self.phases, key=lambda p: p['start_s']),
+            'phase_times_s': self.phase_times(),
+            **self.stats,
+        }
+
+    def chrome_trace(self) -> Dict:
+        """Trace Event Format dict (one complete event per phase)."""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'optimize_with_milp'}}]
+        for p in sorted(self.phases, key=lambda p: p['start_s']):
+            args = {k: v for k, v in p.items() if k not in ('name', 'start_s', 'wall_s', 'depth')}
+            events.append({
+                'name': p['name'], 'cat': 'milp', 'ph': 'X', 'pid': pid, 'tid': 0,
+                'ts': self._epoch_us + p['start_s'] * 1e6, 'dur': p['wall_s'] * 1e6, 'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': self.stats}
+
+    def write_chrome_trace(self, path) -> str:
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f, default=str)
+        return str(path)
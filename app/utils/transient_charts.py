@@ -37,7 +37,7 @@ def create_transient_response_chart(transient_data: Dict, save_path: str = None)
     
     ax.set_xlabel('Time (s)', fontsize=12)
     ax.set_ylabel('Power (MW)', fontsize=12)
-    ax.set_title('Transient Response (1-second resolution)', fontsize=14, fontweight='bold')
+    ax.set_title(f"Transient Response ({transient_data.get('resolution_s', 1.0) * 1000:.0f} ms resolution)", fontsize=14, fontweight='bold')
     ax.legend(loc='upper right', fontsize=11)
     ax.grid(True, alpha=0.3)
     
@@ -116,7 +116,7 @@ def create_frequency_deviation_chart(transient_data: Dict, save_path: str = None
     ax.set_xlabel('Time (s)', fontsize=12)
     ax.set_ylabel('Frequency (Hz)', fontsize=12)
     ax.set_title('Frequency Deviation During Transient', fontsize=14, fontweight='bold')
-    ax.set_ylim(59.4, 60.6)
+    ax.set_ylim(min(59.4, np.min(frequency) - 0.1), max(60.6, np.max(frequency) + 0.1))
     ax.legend(loc='upper right', fontsize=10)
     ax.grid(True, alpha=0.3)
     
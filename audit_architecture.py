@@ -8,7 +8,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -19,7 +19,7 @@ def audit_all_sheets():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         all_sheets = []
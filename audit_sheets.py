@@ -8,7 +8,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 def audit_sheets():
     """Audit current Google Sheets structure"""
@@ -17,7 +17,7 @@ def audit_sheets():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key("1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so")
         
         sheets_info = []
@@ -98,7 +98,7 @@ def create_phase2_sheets():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key("1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so")
         
         existing_sheets = [ws.title for ws in spreadsheet.worksheets()]
@@ -179,7 +179,7 @@ def add_notes_column():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key("1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so")
         
         worksheet = spreadsheet.worksheet('Optimization_Results')
@@ -11,7 +11,7 @@ import json
 from datetime import datetime
 
 sys.path.append(str(Path(__file__).parent))
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -31,7 +31,7 @@ def backup_legacy_sheets():
     ]
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         for sheet_name in legacy_sheets:
@@ -65,7 +65,7 @@ def migrate_equipment_data():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Get current Equipment sheet data
@@ -157,7 +157,7 @@ def verify_site_constraints():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Check Sites sheet
@@ -213,7 +213,7 @@ def delete_legacy_sheets(confirmed=False):
     ]
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         for sheet_name in legacy_sheets:
@@ -239,7 +239,7 @@ def create_final_report():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         remaining_sheets = [ws.title for ws in spreadsheet.worksheets()]
@@ -10,10 +10,11 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from app.utils.site_backend import get_google_sheets_client, SHEET_ID
+from app.utils.sheets_pool import get_sheets_client
+from app.utils.site_backend import SHEET_ID
 
 try:
-    client = get_google_sheets_client()
+    client = get_sheets_client()
     spreadsheet = client.open_by_key(SHEET_ID)
     worksheet = spreadsheet.worksheet("Site_Optimization_Stages")
     
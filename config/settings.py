@@ -26,6 +26,36 @@ BACKEND = os.getenv("BACKEND", "local")
 # Google Sheets
 GOOGLE_CREDENTIALS_PATH = os.getenv("GOOGLE_CREDENTIALS_PATH", "credentials.json")
 GOOGLE_SHEET_ID = os.getenv("GOOGLE_SHEET_ID", "")
+# "google" or "fake" (in-memory, for offline tests / API call benchmarks)
+SHEETS_BACKEND = os.getenv("SHEETS_BACKEND", "google")
+# Sheets API per-user quota (requests per minute per kind)
+SHEETS_READS_PER_MINUTE = int(os.getenv("SHEETS_READS_PER_MINUTE", "60"))
+SHEETS_WRITES_PER_MINUTE = int(os.getenv("SHEETS_WRITES_PER_MINUTE", "60"))
+
+# Hourly dispatch results: "sheets_pointer" (columnar file per run + one pointer
+# row in the Dispatch_Index tab), "local" (columnar files only) or "sheets_rows"
+# (legacy one-row-per-hour Dispatch_Data tab)
+DISPATCH_BACKEND = os.getenv("DISPATCH_BACKEND", "sheets_pointer")
+DISPATCH_STORE_DIR = Path(os.getenv("DISPATCH_STORE_DIR", str(DATA_DIR / "dispatch")))
+
+# Generated 8760 profiles: in-process LRU budget and on-disk .npy tier
+# (set PROFILE_CACHE_DIR="" to keep the cache in memory only)
+PROFILE_CACHE_MAX_MB = float(os.getenv("PROFILE_CACHE_MAX_MB", "256"))
+PROFILE_CACHE_DIR = os.getenv("PROFILE_CACHE_DIR", str(DATA_DIR / "profile_cache"))
+
+# Formatted MILP results keyed on an input fingerprint (set SOLVE_CACHE_DIR=""
+# to disable; bump SOLVE_CACHE_VERSION to invalidate every stored result)
+SOLVE_CACHE_MAX_MB = float(os.getenv("SOLVE_CACHE_MAX_MB", "64"))
+SOLVE_CACHE_DIR = os.getenv("SOLVE_CACHE_DIR", str(DATA_DIR / "solve_cache"))
+SOLVE_CACHE_VERSION = os.getenv("SOLVE_CACHE_VERSION", "1")
+
+# Monte Carlo reliability (LOLE / EUE) on the RAM page: simulated years and
+# worker processes (0 = one per CPU)
+RELIABILITY_MC_YEARS = int(os.getenv("RELIABILITY_MC_YEARS", "2000"))
+RELIABILITY_MC_WORKERS = int(os.getenv("RELIABILITY_MC_WORKERS", "0"))
+
+# Portfolio financial Monte Carlo (gas price x capex x discount rate draws)
+FINANCIAL_MC_DRAWS = int(os.getenv("FINANCIAL_MC_DRAWS", "10000"))
 
 # SharePoint (future)
 SHAREPOINT_SITE = os.getenv("SHAREPOINT_SITE", "")
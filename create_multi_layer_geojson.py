@@ -9,7 +9,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path.cwd()))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -132,7 +132,7 @@ sites_data = {
 }
 
 def main():
-    client = get_google_sheets_client()
+    client = get_sheets_client()
     spreadsheet = client.open_by_key(SHEET_ID)
     sheet = spreadsheet.worksheet('Sites')
     
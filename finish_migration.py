@@ -7,7 +7,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 from datetime import datetime
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
@@ -19,7 +19,7 @@ def add_missing_columns():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         opt_sheet = spreadsheet.worksheet('Optimization_Results')
         
@@ -61,7 +61,7 @@ def update_sites_sheet():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet('Sites')
         
@@ -163,7 +163,7 @@ def verify_migration():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Check sheet names
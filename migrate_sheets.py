@@ -8,7 +8,7 @@ from pathlib import Path
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 import json
 from datetime import datetime
 
@@ -21,7 +21,7 @@ def backup_sheet_data():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         backup = {}
@@ -62,7 +62,7 @@ def rename_sheets():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         # Get list of current sheets
@@ -128,7 +128,7 @@ def update_sites_sheet():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         worksheet = spreadsheet.worksheet('Sites')
         
@@ -232,7 +232,7 @@ def verify_migration():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         
         required_sheets = ['Sites', 'Optimization_Results', 'Load_Profiles', 
@@ -0,0 +1,23 @@
+"""
+Shared inputs for the MILP and reliability test scripts.
+
+load_8760 is a 120 MW load with a 5% daily cycle; milp_inputs() returns
+fresh bvNexusMILP_DR.build() kwargs on it (3 years, 150 -> 300 MW), so a
+test can change its copy without affecting the others.
+"""
+import numpy as np
+
+load_8760 = 120 * (1 + 0.05 * np.sin(2 * np.pi * np.arange(8760) / 24))
+
+WORKLOAD_MIX = {'pre_training': 0.3, 'fine_tuning': 0.2, 'batch_inference': 0.3, 'realtime_inference': 0.2}
+
+
+def milp_inputs() -> dict:
+    """site, constraints, load_data, workload_mix and years for a small 3-year build."""
+    return dict(
+        site={'load_trajectory': {2029: 150, 2030: 300, 2031: 300}},
+        constraints={'NOx_Limit_tpy': 60, 'Gas_Supply_MCF_day': 30000},
+        load_data={'total_load_mw': load_8760, 'pue': 1.25},
+        workload_mix=dict(WORKLOAD_MIX),
+        years=[2029, 2030, 2031],
+    )
@@ -10,7 +10,7 @@ import json
 from datetime import datetime
 
 sys.path.append(str(Path(__file__).parent))
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -231,7 +231,7 @@ def backup_current_sites():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -261,7 +261,7 @@ def rebuild_sites_sheet():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -298,7 +298,7 @@ def verify_sites_sheet():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
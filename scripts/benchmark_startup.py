@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Startup import benchmark (python -X importtime)
+
+Each target runs in a fresh interpreter under -X importtime. Reports wall
+time (best of --repeat runs), total import time, the slowest modules and
+any heavy optional subsystem (Pyomo, plotting, maps, report/export
+libraries, the Gemini SDK) that got imported up front.
+
+Targets:
+    main        app/main.py as a bare script run: Streamlit executes the
+                whole script without a server, i.e. one first render of
+                the default (dashboard) page - time-to-first-render
+    <module>    any importable module, e.g. app.utils.milp_optimizer_wrapper
+
+Usage:
+    python scripts/benchmark_startup.py                        # main + key modules
+    python scripts/benchmark_startup.py app.optimization --top 20
+    python scripts/benchmark_startup.py --record               # append to data/benchmarks/startup.jsonl
+                                                               # and compare with the previous record
+    python scripts/benchmark_startup.py --json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_TARGETS = ['main', 'app.optimization', 'app.utils.milp_optimizer_wrapper']
+DEFAULT_RECORD = PROJECT_ROOT / 'data' / 'benchmarks' / 'startup.jsonl'
+
+# Optional subsystems that should load on first use, not at startup
+HEAVY_MODULES = (
+    'pyomo', 'highspy', 'plotly', 'folium', 'streamlit_folium', 'matplotlib',
+    'docx', 'openpyxl', 'google.generativeai', 'gspread',
+)
+
+_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)\s*$')
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Rows of -X importtime output: module, self_us, cumulative_us, depth (0 = imported by the target itself)."""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append({'module': module, 'self_us': int(self_us), 'cumulative_us': int(cumulative_us),
+                         'depth': (len(indent) - 1) // 2})
+    return rows
+
+
+def _command(target: str) -> List[str]:
+    if target == 'main':
+        return [sys.executable, '-X', 'importtime', str(PROJECT_ROOT / 'app' / 'main.py')]
+    return [sys.executable, '-X', 'importtime', '-c', f'import {target}']
+
+
+def measure(target: str, repeat: int = 3, top: int = 10) -> Dict:
+    """Run one target `repeat` times in fresh interpreters; wall time is the best run."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get('PYTHONPATH')])))
+    wall, proc = [], None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        proc = subprocess.run(_command(target), cwd=PROJECT_ROOT, env=env, capture_output=True, text=True)
+        wall.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            break
+
+    rows = parse_importtime(proc.stderr)
+    loaded = {row['module'] for row in rows}
+    return {
+        'target': target,
+        'ok': proc.returncode == 0,
+        'error': None if proc.returncode == 0 else (proc.stderr.strip().splitlines() or ['failed'])[-1],
+        'wall_s': min(wall),
+        'import_s': sum(row['cumulative_us'] for row in rows if row['depth'] == 0) / 1e6,
+        'modules': len(rows),
+        'heavy': [name for name in HEAVY_MODULES if name in loaded],
+        'slowest': [{'module': row['module'], 'cumulative_ms': row['cumulative_us'] / 1000}
+                    for row in sorted(rows, key=lambda r: -r['cumulative_us'])[:top]],
+    }
+
+
+def _previous(record_path: Path) -> Dict:
+    if not record_path.exists():
+        return {}
+    lines = record_path.read_text().strip().splitlines()
+    return json.loads(lines[-1]) if lines else {}
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('targets', nargs='*', default=DEFAULT_TARGETS)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--record', nargs='?', const=str(DEFAULT_RECORD), default=None,
+                        help=f"append results to a JSONL history (default {DEFAULT_RECORD.relative_to(PROJECT_ROOT)})")
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure(target, args.repeat, args.top) for target in args.targets]
+
+    previous = {}
+    if args.record:
+        record_path = Path(args.record)
+        previous = {r['target']: r for r in _previous(record_path).get('results', [])}
+        record_path.parent.mkdir(parents=True, exist_ok=True)
+        with record_path.open('a') as f:
+            f.write(json.dumps({'timestamp': datetime.now().isoformat(timespec='seconds'), 'commit': _commit(),
+                                'python': sys.version.split()[0], 'results': results}) + '\n')
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            print(f"\n{r['target']}")
+            if not r['ok']:
+                print(f"  FAILED: {r['error']}")
+                continue
+            delta = ''
+            if r['target'] in previous and previous[r['target']].get('ok'):
+                delta = f"  ({r['wall_s'] - previous[r['target']]['wall_s']:+.3f}s vs last record)"
+            print(f"  wall {r['wall_s']:.3f}s, imports {r['import_s']:.3f}s, {r['modules']} modules{delta}")
+            print(f"  heavy subsystems loaded: {', '.join(r['heavy']) or 'none'}")
+            for row in r['slowest']:
+                print(f"    {row['cumulative_ms']:9.1f} ms  {row['module']}")
+
+    return 0 if all(r['ok'] for r in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
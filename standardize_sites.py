@@ -9,7 +9,7 @@ import sys
 import json
 sys.path.append(str(Path(__file__).parent))
 
-from app.utils.site_backend import get_google_sheets_client
+from app.utils.sheets_pool import get_sheets_client
 
 SHEET_ID = "1a3AhvgtwyoNtxEVOJt82gwzLNt13c8uDttKHg1eB0so"
 
@@ -76,7 +76,7 @@ def standardize_site_names():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -113,7 +113,7 @@ def update_site_data():
     print("=" * 80)
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
@@ -248,7 +248,7 @@ def update_geojson_for_all_sites():
     }
     
     try:
-        client = get_google_sheets_client()
+        client = get_sheets_client()
         spreadsheet = client.open_by_key(SHEET_ID)
         sites_sheet = spreadsheet.worksheet('Sites')
         
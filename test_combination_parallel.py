@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Validate tiered, parallel CombinationOptimizer.optimize_all.
+
+Runs a three-combination search (two 1-tech, one 2-tech) in-process and
+across a two-worker pool: the ranked results must be identical, every
+combination must report its wall-clock time, the 2-tech tier must be seeded
+only with 1-tech feasible deployments, and time_limit must stop the search.
+"""
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils import combination_optimizer as combo_module
+from app.utils.combination_optimizer import SKIPPED, CombinationOptimizer
+from app.utils.scenario_runner import CANCELLED, DONE, TIMEOUT
+
+site = {'site_id': 'TEST', 'load_trajectory': {
+    2026: 0, 2027: 0, 2028: 50, 2029: 100, 2030: 150, 2031: 200,
+    2032: 200, 2033: 200, 2034: 200, 2035: 200,
+}}
+scenario = {'Scenario_Name': 'Firm only', 'Recip_Enabled': True, 'Turbine_Enabled': True,
+            'BESS_Enabled': False, 'Solar_Enabled': False, 'Grid_Enabled': False}
+constraints = {'nox_tpy_annual': 100, 'co_tpy_annual': 100, 'gas_supply_mcf_day': 50000, 'land_area_acres': 1000}
+
+optimizer = CombinationOptimizer(site, scenario, {}, constraints)
+names = [c['name'] for c in optimizer.generate_combinations()]
+assert names == ['Recips Only', 'Turbines Only', 'Recips + Turbines'], names
+
+# Record the seeds each combination receives (in-process run)
+seeds_seen = {}
+original = CombinationOptimizer.optimize_combination
+
+
+def recording(self, combo, seed_deployments=None):
+    seeds_seen[combo['name']] = len(seed_deployments or [])
+    return original(self, combo, seed_deployments=seed_deployments)
+
+
+CombinationOptimizer.optimize_combination = recording
+start = time.perf_counter()
+serial = optimizer.optimize_all(max_workers=1)
+serial_time = time.perf_counter() - start
+CombinationOptimizer.optimize_combination = original
+
+n_tier1_feasible = sum(r['feasible'] for r in serial if r['tier'] == 1)
+assert seeds_seen == {'Recips Only': 0, 'Turbines Only': 0, 'Recips + Turbines': n_tier1_feasible}, seeds_seen
+print(f"✅ Tier 2 seeded with the {n_tier1_feasible} feasible tier-1 deployments only")
+
+start = time.perf_counter()
+parallel = optimizer.optimize_all(max_workers=2)
+parallel_time = time.perf_counter() - start
+assert [r['combination_name'] for r in parallel] == [r['combination_name'] for r in serial]
+for a, b in zip(serial, parallel):
+    assert a['lcoe'] == b['lcoe'] and a['deployment'] == b['deployment'] and a['violations'] == b['violations']
+timings = optimizer.combination_timings
+assert [t['state'] for t in timings] == [DONE] * 3 and all(t['elapsed_s'] > 0 for t in timings)
+assert all(r['elapsed_s'] > 0 for r in parallel)
+print("   " + ", ".join(f"{t['name']} {t['elapsed_s']:.1f}s" for t in timings))
+print(f"✅ Parallel tiers match the in-process run (in-process {serial_time:.1f}s, 2 workers {parallel_time:.1f}s)")
+
+# Time limit: tier 1 is cut off, tier 2 never starts
+start = time.perf_counter()
+capped = optimizer.optimize_all(max_workers=2, time_limit=1.0)
+capped_time = time.perf_counter() - start
+states = {t['name']: t['state'] for t in optimizer.combination_timings}
+assert states['Recips + Turbines'] == SKIPPED
+assert {states['Recips Only'], states['Turbines Only']} <= {DONE, TIMEOUT, CANCELLED}
+print(f"✅ time_limit=1s stopped the search after {capped_time:.1f}s ({states})")
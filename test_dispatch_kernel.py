@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Validate and benchmark the split 8760 dispatch kernel.
+
+Checks that DispatchSimulator.run_dispatch (array stages + BESS SOC loop)
+is bit-identical to run_dispatch_reference (original hour-by-hour loop)
+across grid-first, thermal-first, solar/no-solar and BESS/no-BESS cases,
+checks run_dispatch_batch rows against single runs, then times both
+per 8760 year. Timings are reported, not asserted (the 20x target
+applies to the numba path).
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.optimization.greenfield_heuristic_v2 import GreenfieldHeuristicV2, HAS_NUMBA
+
+MIN_SPEEDUP = 20.0
+N_REPEATS = 5
+
+optimizer = GreenfieldHeuristicV2(
+    site={'name': 'Kernel Test'},
+    load_trajectory={2030: 600.0},
+    constraints={'grid_available_year': 2030, 'grid_capacity_mw': 300},
+)
+total_load, firm_load = optimizer._generate_load_profile(600.0)
+solar_profile = optimizer._generate_solar_profile(150.0)
+
+cases = {
+    'full_stack_grid': (
+        {'recip_mw': 300, 'turbine_mw': 200, 'solar_mw': 150, 'bess_mw': 60, 'bess_mwh': 240}, True, 300),
+    'short_thermal_bess_cycling': (
+        {'recip_mw': 250, 'turbine_mw': 100, 'solar_mw': 150, 'bess_mw': 80, 'bess_mwh': 320}, False, 0),
+    'no_bess': (
+        {'recip_mw': 400, 'turbine_mw': 100, 'solar_mw': 150, 'bess_mw': 0, 'bess_mwh': 0}, True, 200),
+    'no_solar': (
+        {'recip_mw': 500, 'turbine_mw': 50, 'solar_mw': 0, 'bess_mw': 40, 'bess_mwh': 160}, False, 0),
+    'grid_only': (
+        {'recip_mw': 0, 'turbine_mw': 0, 'solar_mw': 0, 'bess_mw': 20, 'bess_mwh': 80}, True, 700),
+}
+
+print("=" * 70)
+print("8760 DISPATCH KERNEL - EQUIVALENCE + BENCHMARK")
+print("=" * 70)
+
+failures = []
+for grid_price in (80.0, 20.0):  # thermal-first, then grid-first merit order
+    optimizer.dispatcher.grid_price = grid_price
+    for name, (config, grid_available, grid_cap) in cases.items():
+        args = (config, total_load, firm_load, solar_profile, grid_available, grid_cap)
+        fast = optimizer.dispatcher.run_dispatch(*args)
+        ref = optimizer.dispatcher.run_dispatch_reference(*args)
+
+        mismatched = [
+            col for col in ref.dispatch_df.columns
+            if not np.array_equal(fast.dispatch_df[col].values, ref.dispatch_df[col].values)
+        ]
+        scalars_equal = (
+            fast.energy_delivered_mwh == ref.energy_delivered_mwh
+            and fast.unserved_energy_mwh == ref.unserved_energy_mwh
+            and fast.generation_by_source == ref.generation_by_source
+            and fast.capacity_factors == ref.capacity_factors
+            and fast.max_ramp_mw_per_min == ref.max_ramp_mw_per_min
+            and fast.hours_with_unserved == ref.hours_with_unserved
+        )
+        label = f"{name} @ grid ${grid_price:.0f}/MWh"
+        if mismatched or not scalars_equal:
+            failures.append(label)
+            print(f"❌ {label}: mismatched columns {mismatched}, scalars_equal={scalars_equal}")
+        else:
+            print(f"✅ {label}: bit-identical")
+
+# Batched API: every case in one (scenario × hour) pass must match the single runs
+optimizer.dispatcher.grid_price = 80.0
+names = list(cases)
+n_cases = len(names)
+batch = optimizer.dispatcher.run_dispatch_batch(
+    [cases[n][0] for n in names],
+    np.tile(total_load, (n_cases, 1)),
+    np.tile(solar_profile, (n_cases, 1)),
+    firm_load_matrix=np.tile(firm_load, (n_cases, 1)),
+    grid_capacity_mw=[cases[n][2] if cases[n][1] else 0 for n in names],
+)
+for i, name in enumerate(names):
+    config, grid_available, grid_cap = cases[name]
+    single = optimizer.dispatcher.run_dispatch(
+        config, total_load, firm_load, solar_profile, grid_available, grid_cap
+    )
+    if batch.to_dataframe(i).equals(single.dispatch_df):
+        print(f"✅ batch row {i} ({name}): matches run_dispatch")
+    else:
+        failures.append(f"batch:{name}")
+        print(f"❌ batch row {i} ({name}): differs from run_dispatch")
+
+config, grid_available, grid_cap = cases['full_stack_grid']
+args = (config, total_load, firm_load, solar_profile, grid_available, grid_cap)
+optimizer.dispatcher.run_dispatch(*args)  # warm-up (numba JIT compile)
+
+t0 = time.perf_counter()
+for _ in range(N_REPEATS):
+    optimizer.dispatcher.run_dispatch_reference(*args)
+ref_time = (time.perf_counter() - t0) / N_REPEATS
+
+t0 = time.perf_counter()
+for _ in range(N_REPEATS):
+    optimizer.dispatcher.run_dispatch(*args)
+fast_time = (time.perf_counter() - t0) / N_REPEATS
+
+speedup = ref_time / fast_time
+print(f"\nReference loop: {ref_time * 1000:8.2f} ms / 8760 year")
+print(f"Split kernel:   {fast_time * 1000:8.2f} ms / 8760 year")
+print(f"Speedup:        {speedup:8.1f}x (target >= {MIN_SPEEDUP:.0f}x with numba)")
+
+assert not failures, f"Kernel diverged from reference: {failures}"
+if not HAS_NUMBA:
+    print("⚠️  numba not installed - SOC loop ran in pure-Python fallback mode")
+print("\n✅ Dispatch kernel validated")
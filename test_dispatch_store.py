@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Validate the columnar dispatch store.
+
+Round-trips a 10-year 8760 dispatch run through LocalDispatchStore, checks
+overwrite / multiple-run indexing, that site names differing only in
+punctuation get separate files, that concurrent writers keep every index
+entry, and confirms that saving and loading one run never opens the files
+of other runs.
+"""
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.dispatch_persistence import (
+    LocalDispatchStore, load_dispatch_data, save_dispatch_data,
+)
+
+COLUMNS = ['load_mw', 'recip_mw', 'turbine_mw', 'solar_mw', 'bess_mw', 'grid_mw', 'unserved_mw']
+
+
+def make_run(seed: int) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        year: {
+            'dispatch_data': dict({'hour': list(range(8760))},
+                                  **{col: (600 * rng.random(8760)).tolist() for col in COLUMNS}),
+            'columns': ['hour'] + COLUMNS,
+        }
+        for year in range(2026, 2036)
+    }
+
+
+def save_in_worker(args):
+    root, i = args
+    small = {2030: {'dispatch_data': {'load_mw': [float(i)] * 24}}}
+    return LocalDispatchStore(root).save(f"Site {i}", 'screening', 1, small) is not None
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp:
+        store = LocalDispatchStore(tmp)
+        run = make_run(0)
+
+        t0 = time.perf_counter()
+        assert save_dispatch_data('Phoenix AZ', 'screening', 1, run, store=store)
+        save_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        loaded = load_dispatch_data('Phoenix AZ', 'screening', 1, store=store)
+        load_s = time.perf_counter() - t0
+
+        assert sorted(loaded) == sorted(run)
+        for year in run:
+            for col in ['hour'] + COLUMNS:
+                np.testing.assert_allclose(loaded[year]['dispatch_data'][col], run[year]['dispatch_data'][col])
+        size_kb = store.path_for('Phoenix AZ', 'screening', 1).stat().st_size / 1024
+        print(f"87,600 hours: save {save_s:.2f}s, load {load_s:.2f}s, {size_kb:.0f} KB on disk")
+        print("✅ Round trip preserves every year and column")
+
+        # Overwrite the same key, add other runs
+        store.save('Phoenix AZ', 'screening', 1, make_run(1))
+        store.save('Phoenix AZ', 'concept', 1, make_run(2))
+        store.save('Austin/TX', 'screening', 2, make_run(3))
+        index = store.index()
+        assert len(index) == 3
+        assert index[store.key('Phoenix AZ', 'screening', 1)]['hours'] == 87600
+        assert index[store.key('Phoenix AZ', 'screening', 1)]['years'] == list(range(2026, 2036))
+        np.testing.assert_allclose(store.load('Phoenix AZ', 'screening', 1)[2030]['dispatch_data']['load_mw'],
+                                   make_run(1)[2030]['dispatch_data']['load_mw'])
+        print("✅ Re-saving a run replaces it; runs are indexed by site/stage/version")
+
+        # Other runs' files are never touched: corrupt them and save / load still work
+        for key in ['Phoenix AZ|concept|1', 'Austin/TX|screening|2']:
+            entry = index[key]
+            (Path(tmp) / entry['path']).write_bytes(b'not an npz')
+        store.save('Phoenix AZ', 'screening', 1, run)
+        assert store.load('Phoenix AZ', 'screening', 1)[2026]['dispatch_data']['recip_mw'][:3] == \
+            run[2026]['dispatch_data']['recip_mw'][:3]
+        print("✅ Save / load of one run reads only that run's file")
+
+        assert store.load('Nowhere', 'screening', 1) == {}
+        assert store.delete('Austin/TX', 'screening', 2) and len(store.index()) == 2
+        assert store.save('Empty', 'screening', 1, {}) is None
+        print("✅ Missing runs load empty; delete() removes file and index entry")
+
+        # Names that slug the same still get separate files
+        store.save('Phoenix/AZ', 'screening', 1, make_run(4))
+        assert store.path_for('Phoenix/AZ', 'screening', 1) != store.path_for('Phoenix AZ', 'screening', 1)
+        np.testing.assert_allclose(store.load('Phoenix AZ', 'screening', 1)[2026]['dispatch_data']['recip_mw'],
+                                   run[2026]['dispatch_data']['recip_mw'])
+        np.testing.assert_allclose(store.load('Phoenix/AZ', 'screening', 1)[2026]['dispatch_data']['recip_mw'],
+                                   make_run(4)[2026]['dispatch_data']['recip_mw'])
+        print("✅ 'Phoenix/AZ' and 'Phoenix AZ' are stored and loaded separately")
+
+        # Concurrent savers (ScenarioRunner workers) all land in the index
+        with multiprocessing.Pool(4) as pool:
+            assert all(pool.map(save_in_worker, [(tmp, i) for i in range(24)]))
+        index = store.index()
+        assert all(store.key(f"Site {i}", 'screening', 1) in index for i in range(24))
+        assert store.load('Site 7', 'screening', 1)[2030]['dispatch_data']['load_mw'] == [7.0] * 24
+        print("✅ 24 runs saved from 4 worker processes are all indexed")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Validate the vectorized portfolio cash-flow engine.
+
+Checks block NPV / IRR / payback against the per-site scalar functions and
+explicit loops, IRR edge cases (negative, no-root, bracketed fallback),
+that the gas price add-back reproduces calculate_npv at the base price,
+sensitivity grids and the tornado, and reports (without asserting) the
+time for 10k Monte Carlo draws x 50 sites, about a second.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils import financial_calculations as fc
+
+# Block functions against explicit loops on random cash flows
+rng = np.random.default_rng(3)
+flows = np.concatenate([-rng.uniform(50, 200, (400, 1)), rng.uniform(-5, 40, (400, 20))], axis=1)
+rates = rng.uniform(0.03, 0.15, 400)
+loop_npv = np.array([sum(cf / (1 + r) ** t for t, cf in enumerate(row)) for row, r in zip(flows, rates)])
+assert np.allclose(fc.npv_block(flows, rates), loop_npv, rtol=1e-12)
+irr = fc.irr_block(flows)
+finite = np.isfinite(irr)
+assert finite.mean() > 0.9
+assert np.allclose(fc.npv_block(flows[finite], irr[finite] / 100), 0, atol=1e-6)
+assert np.all(fc.npv_block(flows[~finite], 0.0) < 0)  # no IRR: never recovers the investment
+cumulative = np.cumsum(flows, axis=1)
+payback = fc.payback_block(flows)
+for row, cum, years in zip(flows, cumulative, payback):
+    hit = np.flatnonzero(cum >= 0)
+    expected = fc.PAYBACK_NEVER if not len(hit) else hit[0] - 1 + -cum[hit[0] - 1] / row[hit[0]]
+    assert np.isclose(years, expected)
+print(f"✅ Block NPV / IRR / payback match loops on {len(flows)} random cash-flow series")
+
+# IRR edge cases
+assert np.isclose(fc.irr_block(np.array([-100.0] + [10.0] * 20)), 7.754689530, atol=1e-6)
+assert np.isclose(fc.irr_block(np.array([-100.0, 50.0, 40.0])), -6.992647, atol=1e-5)
+assert np.isnan(fc.irr_block(np.array([-1.0, 60.0])))  # 5900% is outside the bracket
+assert np.isnan(fc.irr_block(np.array([-100.0, -1.0, -1.0])))
+assert np.isclose(fc.irr_block(np.array([-1.0, 9.0])), 800.0, atol=1e-6)  # far from the start, still in the bracket
+assert fc.irr_block(np.zeros((3, 4, 21))).shape == (3, 4)
+print("✅ IRR edge cases: level annuity, negative IRR, no root, bracket edge")
+
+# Scalar API unchanged
+capex, opex, lcoe, mw = 150.0, 4.5, 80.0, 100.0
+revenue = lcoe * mw * 8760 * 0.95 / 1e6
+expected_npv = -capex + sum((revenue - opex) / 1.08 ** t for t in range(1, 21))
+assert np.isclose(fc.calculate_npv(capex, opex, lcoe, mw), expected_npv, rtol=1e-12)
+irr_pct = fc.calculate_irr_improved(capex, opex, lcoe, mw)
+assert abs(fc.calculate_npv(capex, opex, lcoe, mw, discount_rate=irr_pct / 100)) < 1e-6
+assert np.isclose(fc.calculate_payback(capex, opex, lcoe, mw),
+                  fc.payback_block(fc.build_cash_flows(capex, revenue, opex)))
+assert fc.calculate_irr_newton([-100, -1, -1]) == 0.0
+print(f"✅ calculate_npv / calculate_irr_improved unchanged: NPV ${expected_npv:.1f}M, IRR {irr_pct:.2f}%")
+
+# Portfolio block: base case equals per-site calculate_npv, gas price moves NPV
+sites = [{'site': f"Site {i}", 'capacity_mw': 40 + 4 * i, 'capex_m': 90 + 5 * i,
+          'opex_annual_m': 2.5 + 0.1 * i, 'lcoe': 25 + 0.5 * i} for i in range(50)]
+inputs = fc.portfolio_inputs(sites)
+base_gas = inputs['base_gas_price_mmbtu']
+cases = fc.sensitivity_cases(gas_price_mmbtu=(base_gas, base_gas + 1), capex_multiplier=(1.0, 1.2),
+                             discount_rate=(0.08, 0.10))
+block = fc.evaluate_cases(inputs, cases)
+assert block['npv_m'].shape == block['irr_pct'].shape == block['payback_years'].shape == (8, 50)
+per_site = [fc.calculate_npv(s['capex_m'], s['opex_annual_m'], s['lcoe'], s['capacity_mw']) for s in sites]
+assert np.allclose(block['npv_m'][0], per_site, rtol=1e-12)
+assert np.isclose(block['portfolio_npv_m'][0], sum(per_site))
+fuel_cost_m = inputs['fuel_mmbtu'] / 1e6
+gas_up = cases['gas_price_mmbtu'] > base_gas
+annuity = sum(1 / 1.08 ** t for t in range(1, 21))
+assert np.allclose(block['npv_m'][gas_up & (cases['capex_multiplier'] == 1) & (cases['discount_rate'] == 0.08)][0],
+                   np.array(per_site) - fuel_cost_m * annuity)
+assert np.all(block['portfolio_irr_pct'] > 0) and block['portfolio_irr_pct'][0] == block['portfolio_irr_pct'].max()
+print("✅ Sites x cases block: base case equals calculate_npv per site; +$1/MMBtu costs the fuel annuity")
+
+tornado = fc.sensitivity_tornado(sites)
+assert np.isclose(tornado['base_npv_m'], sum(per_site))
+for driver in tornado['drivers']:
+    assert driver['npv_low_m'] > tornado['base_npv_m'] > driver['npv_high_m'], driver
+print("✅ Tornado: higher gas price, capex and discount rate each lower portfolio NPV")
+
+# Monte Carlo: 10k draws x 50 sites
+fc.monte_carlo_portfolio(sites, n_draws=100, seed=0)
+start = time.perf_counter()
+mc = fc.monte_carlo_portfolio(sites, n_draws=10_000, seed=0)
+elapsed = time.perf_counter() - start
+npv = mc['portfolio_npv_m']
+assert npv['p10'] < npv['p50'] < npv['p90'] and len(mc['npv_draws_m']) == 10_000
+assert len(mc['site_npv_m']['p50']) == 50 and 0 <= mc['prob_npv_negative'] <= 1
+assert fc.monte_carlo_portfolio(sites, n_draws=500, seed=5)['portfolio_npv_m'] == \
+    fc.monte_carlo_portfolio(sites, n_draws=500, seed=5)['portfolio_npv_m']
+print(f"✅ Monte Carlo 10,000 draws x 50 sites in {elapsed:.2f}s: NPV P10/P50/P90 "
+      f"${npv['p10']:,.0f}M / ${npv['p50']:,.0f}M / ${npv['p90']:,.0f}M, P(NPV<0) {mc['prob_npv_negative']:.1%}")
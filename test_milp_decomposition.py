@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Gap report for the year-decomposed MILP solve modes.
+
+Solves the 600 MW sample problem (sample_problem_600mw.py) and MILP versions
+of the five problem setups in test_all_5_problems.py monolithically, year by
+year (rolling horizon) and with Benders, and reports each decomposition's
+objective gap and solve time against the monolithic solve.
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.optimization.milp_decomposition import bvNexusMILP_Decomposed, decomposition_gap_report
+from sample_problem_600mw import generate_8760_profile, get_sample_problem
+
+sample = get_sample_problem()
+sample_load = generate_8760_profile(600)
+workload_mix = {'pre_training': 0.30, 'fine_tuning': 0.20, 'batch_inference': 0.30, 'realtime_inference': 0.20}
+
+# Shared test_all_5_problems.py parameters
+five_trajectory = {2025: 0, 2026: 0, 2027: 0, 2028: 195, 2029: 390, 2030: 585,
+                   2031: 780, 2032: 780, 2033: 780, 2034: 780, 2035: 780}
+five_constraints = {'NOx_Limit_tpy': 100, 'Gas_Supply_MCF_day': 50000, 'Available_Land_Acres': 300}
+five_common = dict(
+    site={'load_trajectory': five_trajectory},
+    load_data={'total_load_mw': generate_8760_profile(780), 'pue': 1.25},
+    workload_mix=workload_mix,
+    years=list(range(2025, 2036)),
+)
+
+PROBLEMS = {
+    '600 MW sample': dict(
+        site={'load_trajectory': sample['load_profile']['load_trajectory']},
+        constraints=sample['constraints'],
+        load_data={'total_load_mw': sample_load, 'pue': 1.4},
+        workload_mix=sample['load_profile']['workload_mix'],
+        years=sample['years'],
+        grid_config={'available_year': 2031, 'capex': 45_000_000},
+    ),
+    '1 Greenfield': dict(five_common, constraints=five_constraints,
+                         grid_config={'available_year': 2033}),
+    '2 Brownfield': dict(five_common, constraints=five_constraints,
+                         grid_config={'available_year': 2033},
+                         existing_equipment={'n_recip': 10, 'n_turbine': 1, 'bess_mwh': 0, 'solar_mw': 0}),
+    '3 Land Dev (no grid)': dict(five_common, constraints=dict(five_constraints, N_Minus_1_Required=False),
+                                 grid_config={'available_year': 2040}),
+    '4 Grid Services': dict(five_common, constraints=five_constraints,
+                            grid_config={'available_year': 2033},
+                            workload_mix={'pre_training': 0.40, 'fine_tuning': 0.25,
+                                          'batch_inference': 0.20, 'realtime_inference': 0.15},
+                            dr_config={'cooling_flex': 0.35, 'annual_curtailment_budget_pct': 0.02}),
+    '5 Bridge Power': dict(five_common, constraints=five_constraints,
+                           grid_config={'lead_time_months': 60}),
+}
+
+MODES = [
+    {'mode': 'rolling', 'window': 1, 'step': 1},
+    {'mode': 'rolling', 'window': 3, 'step': 2},
+    {'mode': 'benders'},
+]
+
+print("=" * 84)
+print("YEAR-DECOMPOSED MILP - GAP vs MONOLITHIC SOLVE")
+print("=" * 84)
+print(f"{'Problem':<22} {'Mode':<14} {'LCOE $/MWh':>12} {'Gap %':>8} {'Time s':>8} {'Speedup':>8}  Termination")
+
+reports = {}
+for name, build_kwargs in PROBLEMS.items():
+    rows = decomposition_gap_report(build_kwargs, modes=MODES, time_limit=300)
+    reports[name] = {row['label']: row for row in rows}
+    for row in rows:
+        print(f"{name:<22} {row['label']:<14} {row['objective_lcoe']:>12.2f} {row['gap_pct']:>+8.2f} "
+              f"{row['solve_time_s']:>8.1f} {row['speedup']:>7.1f}x  {row['termination']}")
+    print("-" * 84)
+
+# The monolithic solve stops at a 1% MIP gap, so decompositions can land slightly below it
+for name, rows in reports.items():
+    assert rows['benders']['gap_pct'] <= 1.0 + 100 * bvNexusMILP_Decomposed().benders_tolerance, (
+        f"{name}: Benders did not close the gap to the monolithic solve"
+    )
+    for label, row in rows.items():
+        assert row['gap_pct'] >= -1.5, f"{name}: {label} beats the monolithic optimum by more than its MIP gap"
+print("✅ Benders matches the monolithic optimum; rolling-horizon gaps reported above")
+
+# Stitched plans are feasible in the full-horizon problem
+for mode in MODES:
+    optimizer = bvNexusMILP_Decomposed(**mode)
+    optimizer.build(**PROBLEMS['600 MW sample'])
+    solution = optimizer.solve(time_limit=300, verbose=False)
+    lp, x = optimizer.lp, optimizer._x
+    ax = lp.A @ x
+    violation = max(np.max(lp.row_lo - ax, initial=0), np.max(ax - lp.row_hi, initial=0),
+                    np.max(lp.col_lb - x, initial=0))
+    assert violation < 1e-5, f"{mode}: stitched plan violates the full problem by {violation:g}"
+    years = sorted(solution['equipment'])
+    for prev, year in zip(years, years[1:]):
+        assert solution['equipment'][year]['n_recip'] >= solution['equipment'][prev]['n_recip']
+        assert solution['equipment'][year]['bess_mwh'] >= solution['equipment'][prev]['bess_mwh'] - 1e-6
+print("✅ Decomposed plans are feasible full-horizon solutions (capacity never decreases)")
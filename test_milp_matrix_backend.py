@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Validate and benchmark the sparse-matrix MILP backend.
+
+Checks that bvNexusMILP_Matrix assembles the same problem as the Pyomo
+bvNexusMILP_DR (row/column counts and LP-relaxation objective), that the
+MPS and LP writers round-trip through HiGHS when highspy is installed and
+keep rows without coefficients, then times model construction for both
+backends at 1008 and 8760 hours.
+"""
+import sys
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pyomo.environ import Constraint, TransformationFactory, Var
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from app.optimization.milp_model_dr import bvNexusMILP_DR
+from app.optimization.highs_inprocess import compile_model
+from app.optimization.milp_matrix_dr import SparseLP, _write_lp, bvNexusMILP_Matrix
+
+try:
+    import highspy
+    HAS_HIGHSPY = True
+except ImportError:
+    HAS_HIGHSPY = False
+
+np.random.seed(1)
+load_8760 = 120 * (1 + 0.05 * np.random.randn(8760))
+inputs = dict(
+    site={'load_trajectory': {2029: 150, 2030: 300, 2031: 0}},
+    constraints={'NOx_Limit_tpy': 60, 'Gas_Supply_MCF_day': 30000, 'CO2_Limit_tpy': 400000},
+    load_data={'total_load_mw': load_8760, 'pue': 1.25},
+    workload_mix={'pre_training': 0.3, 'fine_tuning': 0.2,
+                  'batch_inference': 0.3, 'realtime_inference': 0.2},
+    years=[2029, 2030, 2031],
+    grid_config={'available_year': 2030},
+)
+availability = {'solar': {2029: False}}
+
+
+def lp_relaxation(lp):
+    result = milp(lp.c, constraints=LinearConstraint(lp.A, lp.row_lo, lp.row_hi),
+                  bounds=Bounds(lp.col_lb, lp.col_ub))
+    return result.fun + lp.obj_offset
+
+
+print("=" * 70)
+print("SPARSE MATRIX MILP BACKEND - EQUIVALENCE + BUILD BENCHMARK")
+print("=" * 70)
+
+# ---------------------------------------------------------------------------
+# 1. Same problem as the Pyomo model
+# ---------------------------------------------------------------------------
+pyomo_model = bvNexusMILP_DR()
+pyomo_model.build(**inputs)
+pyomo_model.update_scenario(tech_availability=availability)
+n_rows = sum(1 for _ in pyomo_model.model.component_data_objects(Constraint, active=True))
+n_cols = sum(1 for _ in pyomo_model.model.component_data_objects(Var))
+
+matrix_model = bvNexusMILP_Matrix()
+matrix_model.build(**inputs)
+matrix_model.update_scenario(tech_availability=availability)
+lp = matrix_model.lp
+
+print(f"Pyomo:  {n_rows:,} rows, {n_cols:,} cols")
+print(f"Matrix: {lp.n_rows:,} rows, {lp.n_cols:,} cols, {lp.nnz:,} nnz")
+assert (lp.n_rows, lp.n_cols) == (n_rows, n_cols), "Problem dimensions differ"
+
+TransformationFactory('core.relax_integer_vars').apply_to(pyomo_model.model)
+pyomo_obj = lp_relaxation(compile_model(pyomo_model.model)[0])
+matrix_obj = lp_relaxation(lp)
+print(f"LP relaxation objective: Pyomo {pyomo_obj:.6f}, matrix {matrix_obj:.6f}")
+assert abs(pyomo_obj - matrix_obj) <= 1e-6 * abs(pyomo_obj), "LP relaxation objectives differ"
+print("✅ Matrix backend assembles the same problem as the Pyomo model")
+
+# ---------------------------------------------------------------------------
+# 2. MPS / LP writers
+# ---------------------------------------------------------------------------
+if HAS_HIGHSPY:
+    with tempfile.TemporaryDirectory() as tmp:
+        for ext in ('mps', 'lp'):
+            path = str(Path(tmp) / f'model.{ext}')
+            matrix_model.write(path)
+            h = highspy.Highs()
+            h.setOptionValue('output_flag', False)
+            h.readModel(path)
+            h.setOptionValue('solve_relaxation', True)
+            h.run()
+            file_obj = h.getInfo().objective_function_value
+            assert abs(file_obj - matrix_obj) <= 1e-6 * abs(matrix_obj), f"{ext} file objective differs"
+            print(f"✅ {ext.upper()} file round-trips through HiGHS ({file_obj:.6f})")
+else:
+    print("⚠️  highspy not installed - skipping MPS/LP round-trip")
+
+# A row with no coefficients is still written, so an infeasible 0 <= -1 stays infeasible
+empty_row = SparseLP(c=np.ones(1), A=sparse.csr_matrix((1, 1)), row_lo=np.array([0.0]), row_hi=np.array([-1.0]),
+                     col_lb=np.zeros(1), col_ub=np.ones(1), integrality=np.zeros(1, dtype=np.uint8),
+                     row_blocks={'empty': (0, (1,))}, col_blocks={'x': (0, (1,))})
+with tempfile.TemporaryDirectory() as tmp:
+    _write_lp(empty_row, str(Path(tmp) / 'empty.lp'))
+    assert ' empty_0: 0.0 <= 0 x_0 <= -1.0' in (Path(tmp) / 'empty.lp').read_text().splitlines()
+print("✅ LP writer keeps rows without coefficients")
+
+# ---------------------------------------------------------------------------
+# 3. Build-time benchmark
+# ---------------------------------------------------------------------------
+print(f"\n{'Hours':>6} {'Pyomo build':>13} {'Matrix build':>13} {'Speedup':>9}")
+for representative, hours in ((True, 1008), (False, 8760)):
+    # 'fixed' = the six legacy representative weeks (1008 hours)
+    kwargs = dict(inputs, use_representative_periods=representative, representative_periods='fixed')
+
+    t0 = time.perf_counter()
+    bvNexusMILP_DR().build(**kwargs)
+    pyomo_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    bvNexusMILP_Matrix().build(**kwargs)
+    matrix_time = time.perf_counter() - t0
+
+    print(f"{hours:>6} {pyomo_time:>12.2f}s {matrix_time:>12.3f}s {pyomo_time / matrix_time:>8.0f}x")
+
+print("\n✅ Sparse matrix MILP backend validated")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Side-by-side: PhasedDeploymentOptimizer differential evolution vs exact MILP.
+
+Uses the test_combo_optimizer.py case (BTM only, 600 MW by 2031, 1000 acres)
+and prints delivered MW-years, LCOE, violations and solve time per
+combination for DE, the continuous MILP and the integer-unit MILP. The
+continuous MILP solves the same problem DE searches, so it must deliver at
+least as much, score at least as well on objective_function, and solve in
+under a second.
+"""
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.combination_optimizer import CombinationOptimizer
+from app.utils.phased_optimizer import PhasedDeploymentOptimizer
+
+# Same configuration as test_combo_optimizer.py
+site = {
+    'site_id': 'TEST',
+    'load_trajectory': {
+        2026: 0, 2027: 0, 2028: 150, 2029: 300, 2030: 450, 2031: 600,
+        2032: 600, 2033: 600
+    }
+}
+scenario = {
+    'Scenario_Name': 'BTM Only',
+    'Recip_Enabled': True,
+    'Turbine_Enabled': True,
+    'BESS_Enabled': True,
+    'Solar_Enabled': True,
+    'Grid_Enabled': False,
+    'Grid_Timeline_Months': 0
+}
+constraints = {
+    'nox_tpy_annual': 100,
+    'co_tpy_annual': 100,
+    'gas_supply_mcf_day': 50000,
+    'land_area_acres': 1000
+}
+
+combos = {c['name']: c for c in CombinationOptimizer(site, scenario, {}, constraints).generate_combinations()}
+names = ['Recips Only', 'Recips + Solar', 'All BTM Technologies']
+assert set(names) <= set(combos), sorted(combos)
+
+
+def make_optimizer(combo):
+    combo_scenario = dict(scenario, Recip_Enabled=combo['recip'], Turbine_Enabled=combo['turbine'],
+                          BESS_Enabled=combo['bess'], Solar_Enabled=combo['solar'], Grid_Enabled=combo['grid'])
+    return PhasedDeploymentOptimizer(site, {}, constraints, site['load_trajectory'], combo_scenario)
+
+
+def delivered(optimizer, deployment):
+    return sum(min(optimizer.get_cumulative_capacity_mw(deployment, year), optimizer.load_trajectory.get(year, 0))
+               for year in optimizer.years)
+
+
+def objective(optimizer, deployment):
+    x = [deployment[key][year] for key in ('recip_mw', 'turbine_mw', 'bess_mwh', 'solar_mw', 'grid_mw')
+         for year in optimizer.years]
+    return optimizer.objective_function(x)
+
+
+solvers = {
+    'DE': lambda opt: opt.optimize(method='de'),
+    'MILP': lambda opt: opt.optimize_milp(integer_units=False),
+    'MILP (units)': lambda opt: opt.optimize_milp(integer_units=True),
+}
+
+print(f"{'Combination':<28} {'Solver':<13} {'MW-years':>9} {'LCOE $/MWh':>11} {'Objective':>10} {'Viol.':>6} {'Time':>8}")
+for name in names:
+    rows = {}
+    for solver, run in solvers.items():
+        optimizer = make_optimizer(combos[name])
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            deployment, lcoe, violations = run(optimizer)
+        elapsed = time.perf_counter() - start
+        rows[solver] = (delivered(optimizer, deployment), lcoe, objective(optimizer, deployment), violations, elapsed)
+        power, lcoe, obj, violations, elapsed = rows[solver]
+        print(f"{name:<28} {solver:<13} {power:>9.1f} {lcoe:>11.2f} {obj:>10.2f} {len(violations):>6} {elapsed:>7.2f}s")
+
+    de, exact, units = rows['DE'], rows['MILP'], rows['MILP (units)']
+    assert not exact[3] and not units[3], (exact[3], units[3])
+    assert exact[0] >= de[0] - 1e-6, (name, exact[0], de[0])
+    assert exact[2] <= de[2] + 1e-6, (name, exact[2], de[2])
+    assert units[0] <= exact[0] + 1e-6  # whole units can only deliver less
+    assert exact[4] < 1.0 and units[4] < 1.0, (exact[4], units[4])
+
+print("✅ MILP delivers at least as much as DE, with a better objective, in under a second")
+
+# Deterministic, and selectable through optimize() and CombinationOptimizer
+optimizer = make_optimizer(combos['Recips + Solar'])
+with contextlib.redirect_stdout(io.StringIO()):
+    first = optimizer.optimize(method='milp')
+    second = optimizer.optimize(method='milp')
+    result = CombinationOptimizer(site, scenario, {}, constraints, method='milp').optimize_combination(combos['Recips + Solar'])
+assert first == second and result[:3] == first
+print("✅ optimize(method='milp') is deterministic and reachable from CombinationOptimizer")
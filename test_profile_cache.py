@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Validate the content-addressed profile cache.
+
+Checks that keys are stable hashes of the inputs, that the memory tier holds
+its byte budget, that a fresh process-level cache is served memory-mapped
+from the disk tier, and that repeat calls of the cached generators never
+reach ProfileEngine.build.
+"""
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.profile_cache import ProfileCache, configure_profile_cache, get_profile_cache, stable_key
+from app.utils.profile_engine import ProfileEngine
+
+# Keys: stable, order-independent for dicts, sensitive to every value
+mix = {'pre_training': 40, 'fine_tuning': 60}
+assert stable_key('load/v1', 600.0, 1.25, mix, 42) == stable_key('load/v1', 600.0, 1.25, dict(reversed(mix.items())), 42)
+assert stable_key('load/v1', 600.0, 1.25, mix, 42) != stable_key('load/v1', 600.0, 1.25, mix, 43)
+assert stable_key('load/v1', 600.0) != stable_key('load/v2', 600.0)
+assert stable_key('x', 1) != stable_key('x', 1.0) != stable_key('x', '1')
+assert stable_key('x', np.arange(3)) != stable_key('x', np.arange(3.0))
+assert stable_key('x', np.float64(2.5)) == stable_key('x', 2.5)
+print("✅ Stable content keys")
+
+# Memory tier: LRU within the byte budget
+cache = ProfileCache(max_bytes=3 * 8760 * 8)
+for i in range(4):
+    cache.put(f"k{i}", np.full(8760, float(i)))
+assert cache.get('k0') is None and cache.get('k3')[0] == 3.0
+assert cache.bytes <= cache.max_bytes and cache.evictions == 1
+cache.get('k1')  # k1 becomes most recent, so k2 is evicted next
+cache.put('k4', np.zeros(8760))
+assert cache.get('k2') is None and cache.get('k1') is not None
+stored = cache.get('k4')
+try:
+    stored[0] = 1.0
+    raise AssertionError("cached arrays should be read-only")
+except ValueError:
+    pass
+print(f"✅ Memory LRU holds {cache.bytes / 1e6:.2f} MB budget ({cache.evictions} evictions)")
+
+# Disk tier: a new cache on the same directory serves memory-mapped entries
+with tempfile.TemporaryDirectory() as tmp:
+    first = ProfileCache(cache_dir=tmp)
+    calls = []
+    compute = lambda: calls.append(1) or {'load': np.arange(8760.0), 'firm': np.ones(8760)}
+    first.get_or_compute('abc123', compute)
+    first.get_or_compute('abc123', compute)
+    second = ProfileCache(cache_dir=tmp)
+    value = second.get_or_compute('abc123', compute)
+    assert len(calls) == 1
+    assert isinstance(value['load'], np.memmap) and value['load'][8759] == 8759.0
+    assert first.stats()['hits'] == 1 and second.stats()['disk_hits'] == 1
+    print("✅ Disk tier: second cache instance reads memory-mapped .npy files")
+
+# Cached generators: repeat calls never reach profile generation
+builds = {'n': 0}
+original_build = ProfileEngine.build
+
+
+def counting_build(self, *args, **kwargs):
+    builds['n'] += 1
+    return original_build(self, *args, **kwargs)
+
+
+ProfileEngine.build = counting_build
+
+from app.models.load_profile import FacilityLoadProfile
+from app.optimization.greenfield_heuristic_v2 import GreenfieldHeuristicV2
+from app.utils.load_profile_generator import generate_load_profile_with_flexibility
+
+with tempfile.TemporaryDirectory() as tmp:
+    configure_profile_cache(max_mb=64, cache_dir=tmp)
+    heuristic = GreenfieldHeuristicV2.__new__(GreenfieldHeuristicV2)
+    heuristic.load_profile_data, heuristic.firm_load_factor = {}, 0.8
+    facility = FacilityLoadProfile(peak_it_load_mw=300)
+
+    def page_load():
+        for peak in (200.0, 250.0, 300.0):
+            heuristic._generate_load_profile(peak)
+        for capacity in (0.5, 1.0, 50.0):
+            heuristic._generate_solar_profile(capacity)
+        facility.generate_flexibility_profiles()
+        generate_load_profile_with_flexibility(300, 1.25, 0.75, {'pre_training': 100})
+
+    page_load()
+    first_builds = builds['n']
+    for _ in range(5):
+        page_load()
+    assert builds['n'] == first_builds == 6, builds
+    print(f"   First load: {first_builds} profile builds; 5 repeat loads: {builds['n'] - first_builds}")
+
+    # A changed input is a different profile
+    replace(facility, pue=1.3).generate_flexibility_profiles()
+    assert builds['n'] == first_builds + 1
+
+    # A new process (fresh memory tier) reads the disk tier instead of generating
+    configure_profile_cache(max_mb=64, cache_dir=tmp)
+    page_load()
+    assert builds['n'] == first_builds + 1
+    stats = get_profile_cache().stats()
+    assert stats['misses'] == 0 and stats['disk_hits'] == 6, stats
+    print(f"✅ Repeat page loads touch no profile generation ({stats})")
+
+ProfileEngine.build = original_build
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Validate the vectorized 8760 profile engine.
+
+Checks the calendar shapes against the hour-by-hour formulas they replace,
+that seeded Generators give reproducible, independent streams without
+touching global random state, that ported callers keep their output shapes
+and bounds, and benchmarks a 100 sites x 15 years block against the old
+per-hour loop.
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.profile_engine import HOURS_PER_YEAR, ProfileEngine
+
+
+def legacy_loop(base_load, rng):
+    """Hour-by-hour profile as generate_load_profile_with_flexibility built it."""
+    profile = np.zeros(HOURS_PER_YEAR)
+    for h in range(HOURS_PER_YEAR):
+        hour_of_day = h % 24
+        day_of_year = h // 24
+        daily_factor = 1.03 if 9 <= hour_of_day <= 22 else 0.95
+        seasonal_factor = 1.0 + 0.05 * np.sin(2 * np.pi * (day_of_year - 80) / 365)
+        random_factor = 1.0 + rng.uniform(-0.02, 0.02)
+        profile[h] = base_load * daily_factor * seasonal_factor * random_factor
+    return profile
+
+
+engine = ProfileEngine(seed=0)
+hod = np.arange(HOURS_PER_YEAR) % 24
+doy = np.arange(HOURS_PER_YEAR) // 24
+
+# Calendar shapes match the scalar formulas
+assert np.array_equal(engine.daily_window(9, 22, on=1.03, off=0.95), np.where((hod >= 9) & (hod <= 22), 1.03, 0.95))
+assert np.allclose(engine.seasonal_sine(0.05), 1.0 + 0.05 * np.sin(2 * np.pi * (doy - 80) / 365))
+assert np.allclose(engine.daily_sine(0.01, shift=12), 1.0 + 0.01 * np.sin((hod - 12) * np.pi / 12))
+assert np.array_equal(engine.weekend(0.97), np.where((doy % 7) >= 5, 0.97, 1.0))
+solar = engine.solar_day('sine')
+assert solar[hod < 6].max() == 0 and solar[hod > 18].max() == 0
+assert np.allclose(solar[12], 1.0)
+print("✅ Calendar shapes match the per-hour formulas")
+
+# Noise-free build equals the legacy loop with the noise removed
+deterministic = engine.build(450.0, [engine.daily_window(9, 22, on=1.03, off=0.95), engine.seasonal_sine(0.05)])
+loop = legacy_loop(450.0, type('NoNoise', (), {'uniform': staticmethod(lambda a, b: 0.0)}))
+assert np.allclose(deterministic, loop)
+print("✅ Vectorized build equals the hour loop")
+
+# Seeded streams: reproducible, successive draws differ, global state untouched
+np.random.seed(123)
+random.seed(123)
+expected_np, expected_py = np.random.random(), random.random()
+np.random.seed(123)
+random.seed(123)
+a = ProfileEngine(seed=7).uniform(0.98, 1.02, shape=(3,))
+b = ProfileEngine(seed=7).uniform(0.98, 1.02, shape=(3,))
+assert np.array_equal(a, b) and not np.array_equal(a[0], a[1])
+assert np.random.random() == expected_np and random.random() == expected_py
+shared = np.random.default_rng(5)
+assert ProfileEngine(shared).rng is shared
+print("✅ Seeded Generator streams are reproducible and leave global RNG state alone")
+
+# Ported callers keep shapes, types and bounds
+from app.models.load_profile import FacilityLoadProfile
+from app.optimization.greenfield_heuristic_v2 import GreenfieldHeuristicV2
+from app.utils.bvnexus_load_module import WorkloadMix, get_load_profile_multipliers
+from app.utils.load_profile_generator import generate_load_profile_with_flexibility
+
+facility = FacilityLoadProfile(peak_it_load_mw=400, pue=1.25, load_factor=0.8)
+profile = facility.generate_8760_profile()
+assert profile.shape == (8760,)
+assert profile.min() >= facility.peak_facility_load_mw * 0.5 and profile.max() <= facility.peak_facility_load_mw
+assert np.array_equal(profile, facility.generate_8760_profile())
+
+flex = generate_load_profile_with_flexibility(400, 1.25, 0.8, {'pre_training': 100}, hours=24 * 30)
+assert flex['total_load_mw'].shape == (720,)
+
+multipliers = get_load_profile_multipliers(WorkloadMix(pre_training=0.4, fine_tuning=0.2, batch_inference=0.2, realtime_inference=0.2))
+assert isinstance(multipliers, list) and len(multipliers) == 8760
+assert 0.5 <= min(multipliers) and max(multipliers) <= 1.0
+
+heuristic = GreenfieldHeuristicV2.__new__(GreenfieldHeuristicV2)
+heuristic.load_profile_data, heuristic.firm_load_factor = {}, 0.8
+total, firm = heuristic._generate_load_profile(200)
+solar_mw = heuristic._generate_solar_profile(100)
+assert total.shape == solar_mw.shape == (8760,) and total.max() <= 200
+assert np.allclose(firm, total * 0.8)
+assert solar_mw[hod < 6].max() == 0 and 0 < solar_mw.max() <= 90
+print("✅ Ported callers keep output shapes and bounds")
+
+# Benchmark: 100 sites x 15 years as one block vs the per-hour loop
+n_sites, n_years = 100, 15
+peaks = np.linspace(100, 1000, n_sites)
+growth = 1.0 + 0.05 * np.arange(n_years)
+
+start = time.perf_counter()
+engine = ProfileEngine(seed=42)
+block = engine.build(
+    peaks[:, None] * growth[None, :] * 0.8,
+    factors=[engine.daily_window(9, 22, on=1.03, off=0.95), engine.seasonal_sine(0.05)],
+    noise=engine.uniform(0.98, 1.02, shape=(n_sites, n_years)),
+    clip=(0.5 * peaks[:, None] * growth, peaks[:, None] * growth),
+)
+vector_time = time.perf_counter() - start
+assert block.shape == (n_sites, n_years, 8760)
+assert np.all(block <= (peaks[:, None] * growth)[..., None] + 1e-9)
+
+sample = 5
+rng = np.random.default_rng(0)
+start = time.perf_counter()
+for _ in range(sample):
+    legacy_loop(480.0, rng)
+loop_time = (time.perf_counter() - start) / sample * n_sites * n_years
+
+print(f"   {n_sites} sites x {n_years} years: vectorized {vector_time:.2f}s, "
+      f"hour loop ~{loop_time:.0f}s (extrapolated) -> {loop_time / vector_time:.0f}x")
+print("✅ Profile engine benchmark")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Validate the Optimization_Results repository.
+
+Feeds ResultsRepository a fake 50-site tab and counts "API calls": a full
+portfolio load (4 stages x 50 sites) must fetch the tab once, JSON columns
+must only be parsed for rows that are read, and invalidate() / the
+generation token must force a refetch.
+"""
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import app.utils.results_repository as repo_module
+from app.utils.results_repository import ResultsRepository
+
+STAGES = ['detailed', 'preliminary', 'concept', 'screening']
+calls = {'fetch': 0, 'dispatch': 0, 'parse': 0}
+
+
+def fake_records():
+    calls['fetch'] += 1
+    rows = []
+    for i in range(50):
+        for stage in ['screening', 'concept'] if i % 2 else ['screening']:
+            rows.append({
+                'site_name': f"Site {i}", 'stage': stage, 'version': 1,
+                'complete': 'TRUE', 'lcoe': 70 + i,
+                'equipment_json': json.dumps({'n_recip': i}),
+                'constraints_json': '', 'dispatch_summary_json': '{}',
+                'capex_json': json.dumps({'total': i * 1e6}),
+                'equipment_details_json': 'not json',
+                'equipment_by_year_json': json.dumps({'2030': {'n_recip': i}}),
+            })
+    rows.append(dict(rows[0], version=2, lcoe=1.0))  # later version of Site 0 screening
+    return rows
+
+
+def fake_dispatch(site_name, stage, version):
+    calls['dispatch'] += 1
+    return {2030: {'dispatch_data': {'load_mw': [1.0]}}}
+
+
+original_parse = repo_module.parse_result_row
+
+
+def counting_parse(record):
+    calls['parse'] += 1
+    return original_parse(record)
+
+
+repo_module.parse_result_row = counting_parse
+
+generation = {'token': 0}
+repo = ResultsRepository(fake_records, load_dispatch=fake_dispatch, ttl=None,
+                         generation=lambda: generation['token'])
+
+# Portfolio load: 50 sites x 4 stages from one fetch, no dispatch reads
+latest = repo.latest_complete([f"Site {i}" for i in range(50)], STAGES)
+assert calls == {'fetch': 1, 'dispatch': 0, 'parse': 75}, calls
+assert latest['Site 1'][0] == 'concept' and latest['Site 2'][0] == 'screening'
+print(f"✅ 200 site/stage lookups: {calls['fetch']} fetch, {calls['parse']} rows parsed")
+
+# Parsed fields match the old load_site_stage_result layout
+result = repo.get('Site 3', 'concept')
+assert calls['fetch'] == 1 and calls['dispatch'] == 1
+assert result['complete'] is True
+assert result['equipment'] == {'n_recip': 3} and result['constraints'] == {}
+assert result['capex'] == {'total': 3e6} and result['equipment_details'] == {}
+assert result['equipment_by_year'] == {2030: {'n_recip': 3}}
+assert result['dispatch_by_year'][2030]['dispatch_data']['load_mw'] == [1.0]
+result['equipment']['n_recip'] = 999
+result['equipment_by_year'][2030]['n_recip'] = 999
+result['dispatch_by_year'][2030]['dispatch_data']['load_mw'].append(2.0)
+again = repo.get('Site 3', 'concept')
+assert calls['dispatch'] == 1, "dispatch should be cached per run"
+assert again['equipment'] == {'n_recip': 3} and again['equipment_by_year'] == {2030: {'n_recip': 3}}
+assert again['dispatch_by_year'][2030]['dispatch_data']['load_mw'] == [1.0]
+print("✅ JSON columns parsed on first access; dispatch loaded once per run; callers get deep copies")
+
+# Versions: default is the first row (as the old linear scan), explicit version by key
+assert repo.get('Site 0', 'screening', include_dispatch=False)['lcoe'] == 70
+assert repo.get('Site 0', 'screening', version=2, include_dispatch=False)['lcoe'] == 1.0
+assert repo.versions('Site 0', 'screening') == [1, 2]
+assert repo.row_number('Site 0', 'screening', 2) == 77
+assert repo.get('Site 99', 'screening') is None
+print("✅ (site, stage, version) index")
+
+# Copies are independent of the cache
+result['lcoe'] = -1
+assert repo.get('Site 3', 'concept', include_dispatch=False)['lcoe'] == 73
+
+# Invalidation: explicit, and via the generation token
+repo.invalidate()
+repo.get_many([('Site 1', 'screening'), ('Site 2', 'screening')])
+assert calls['fetch'] == 2
+generation['token'] += 1
+repo.get('Site 1', 'screening', include_dispatch=False)
+assert calls['fetch'] == 3
+repo.get('Site 1', 'screening', include_dispatch=False)
+assert calls['fetch'] == 3
+print("✅ invalidate() and generation changes refetch the tab once")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Validate the parallel scenario runner.
+
+Uses short sleep "solves" in place of MILP runs to check that results keep
+their input order, that five scenarios finish in about the time of the
+slowest one, and that per-scenario timeouts, worker errors and cancellation
+are reported without losing the other scenarios.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.scenario_runner import ScenarioRunner, DONE, FAILED, TIMEOUT, CANCELLED
+
+
+def fake_solve(name: str, seconds: float, fail: bool = False) -> dict:
+    time.sleep(seconds)
+    if fail:
+        raise ValueError(f"{name} is infeasible")
+    return {'scenario_name': name, 'solve_s': seconds}
+
+
+if __name__ == '__main__':
+    durations = [1.0, 2.0, 0.5, 1.5, 0.2]
+    kwargs_list = [{'name': f"S{i}", 'seconds': s} for i, s in enumerate(durations)]
+
+    # Order and wall time
+    snapshots = []
+    t0 = time.perf_counter()
+    results = ScenarioRunner(max_workers=5).run(fake_solve, kwargs_list, progress_callback=snapshots.append)
+    wall = time.perf_counter() - t0
+    print(f"5 scenarios (serial {sum(durations):.1f}s, slowest {max(durations):.1f}s): {wall:.2f}s")
+    assert [r['scenario_name'] for r in results] == [k['name'] for k in kwargs_list]
+    assert wall < max(durations) + 1.5, "Scenarios did not run in parallel"
+    assert snapshots[-1]['completed'] == 5 and snapshots[-1]['fraction'] == 1.0
+    assert any(0 < s['completed'] < 5 for s in snapshots), "No intermediate progress reported"
+    print("✅ Results in input order; wall time ~ slowest scenario")
+
+    # Worker cap
+    t0 = time.perf_counter()
+    ScenarioRunner(max_workers=2).run(fake_solve, [{'name': 'a', 'seconds': 1.0}] * 4)
+    assert time.perf_counter() - t0 >= 2.0, "max_workers not respected"
+    print("✅ max_workers caps concurrency")
+
+    # Errors and timeouts
+    runner = ScenarioRunner(timeout=1.0)
+    results = runner.run(
+        fake_solve,
+        [{'name': 'ok', 'seconds': 0.1},
+         {'name': 'bad', 'seconds': 0.1, 'fail': True},
+         {'name': 'slow', 'seconds': 30}],
+        names=['ok', 'bad', 'slow'],
+        error_result=lambda index, message: {'error': message},
+    )
+    states = [s['state'] for s in runner.progress()['scenarios']]
+    assert states == [DONE, FAILED, TIMEOUT], states
+    assert results[0]['scenario_name'] == 'ok'
+    assert 'infeasible' in results[1]['error']
+    assert 'Timed out' in results[2]['error']
+    print("✅ Failed and timed-out scenarios reported in place")
+
+    # Background run + cancellation
+    runner = ScenarioRunner(max_workers=2).start(fake_solve, [{'name': f"c{i}", 'seconds': 30} for i in range(4)])
+    time.sleep(0.5)
+    assert runner.progress()['total'] == 4 and not runner.done
+    t0 = time.perf_counter()
+    threading.Timer(0.2, runner.cancel).start()
+    results = runner.results(timeout=15)
+    elapsed = time.perf_counter() - t0
+    assert results == [None] * 4
+    assert all(s['state'] == CANCELLED for s in runner.progress()['scenarios'])
+    print(f"✅ cancel() terminates running workers and skips pending ones ({elapsed:.1f}s for 30 s workers)")
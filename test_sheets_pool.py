@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Validate the shared Sheets client pool against the in-memory fake.
+
+Checks that spreadsheet / worksheet handles are opened once per process,
+that batch_get / batch_update cover many ranges in one request, that 429s
+and 5xx are retried with backoff (appends on 429 only), and that the token
+bucket holds the per-minute quota. Ends with an API-call benchmark of
+backend functions run against FakeSheetsBackend (no network, no
+credentials).
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.utils.sheets_fake import FakeAPIError, FakeSheetsBackend
+from app.utils.sheets_pool import TokenBucket, a1_range, configure_sheets_pool, get_sheets_client
+
+SHEET_ID = 'test-sheet'
+sleeps = []
+
+fake = FakeSheetsBackend()
+fake.seed(SHEET_ID, 'Sites', [{'name': f"Site {i}", 'it_capacity_mw': 100 + i} for i in range(50)])
+fake.seed(SHEET_ID, 'Load_Profiles', [{'site_name': 'Site 0', 'pue': 1.25, 'growth_steps_json': '[]'}])
+# Generous quota so the only sleeps recorded are retry backoffs
+pool = configure_sheets_pool(backend='fake', fake=fake, reads_per_minute=6000, writes_per_minute=6000,
+                             burst=1000, sleep=sleeps.append)
+
+# Handles are shared: repeated open_by_key / worksheet cost nothing
+for _ in range(20):
+    records = get_sheets_client('credentials.json').open_by_key(SHEET_ID).worksheet('Sites').get_all_records()
+assert len(records) == 50 and records[3]['it_capacity_mw'] == 103
+assert fake.calls['open_by_key'] == 1 and fake.calls['worksheet'] == 1
+assert fake.calls['get_all_records'] == 20
+assert pool.total_calls == fake.total_calls
+print(f"✅ 20 reads: {fake.calls['open_by_key']} open_by_key, {fake.calls['worksheet']} worksheet lookup")
+
+# Batch facade: two tabs in one request, two ranges written in one request
+fake.reset_calls()
+tabs = pool.batch_get_records(['Sites', 'Load_Profiles'], SHEET_ID)
+assert len(tabs['Sites']) == 50 and tabs['Load_Profiles'][0]['site_name'] == 'Site 0'
+pool.batch_update({"'Sites'!B2": [[999]], "'Load_Profiles'!B2:C2": [[1.3, '[]']]}, SHEET_ID)
+assert fake.calls == {'values_batch_get': 1, 'values_batch_update': 1}, fake.calls
+assert pool.worksheet('Sites', SHEET_ID).get_all_records()[0]['it_capacity_mw'] == 999
+
+# Batched records convert numeric strings like get_all_records()
+pool.batch_update({a1_range('Sites', 3, 2): [['101.5']], a1_range('Sites', 4, 2): [['102']]}, SHEET_ID)
+tabs = pool.batch_get_records(['Sites'], SHEET_ID)
+assert tabs['Sites'][1]['it_capacity_mw'] == 101.5 and tabs['Sites'][2]['it_capacity_mw'] == 102
+assert tabs['Sites'] == pool.worksheet('Sites', SHEET_ID).get_all_records()
+print("✅ batch_get_records / batch_update: one request each")
+
+# 429 / 503 retried with exponential backoff; other errors raised at once
+fake.fail_next(3, 429)
+fake.fail_next(1, 503)
+assert len(pool.worksheet('Sites', SHEET_ID).get_all_records()) == 50
+assert pool.retries == 4 and len(sleeps) == 4
+assert all(b > a for a, b in zip(sleeps, sleeps[1:])), sleeps
+fake.fail_next(1, 400)
+try:
+    pool.worksheet('Sites', SHEET_ID).get_all_values()
+    raise AssertionError("400 should not be retried")
+except FakeAPIError as e:
+    assert e.code == 400 and pool.retries == 4
+print(f"✅ 429/503 retried with backoff {[round(s, 1) for s in sleeps]}s; 400 raised")
+
+# Appends are not retried on 5xx (the server may have applied them), only on 429
+sites = pool.worksheet('Sites', SHEET_ID)
+n_rows = len(sites.get_all_values())
+fake.fail_next(1, 503)
+try:
+    sites.append_row(['Site X'])
+    raise AssertionError("append_row should not be retried on 503")
+except FakeAPIError as e:
+    assert e.code == 503 and pool.retries == 4
+fake.fail_next(1, 429)
+sites.append_row(['Site X'])
+assert pool.retries == 5 and len(sites.get_all_values()) == n_rows + 1
+print("✅ append_row: 503 raised without retry, 429 retried once")
+
+# Token bucket: never more than the quota in any 60 s window
+clock = {'t': 0.0}
+bucket = TokenBucket.per_minute(60, burst=10, clock=lambda: clock['t'],
+                                sleep=lambda s: clock.__setitem__('t', clock['t'] + s))
+times = []
+for _ in range(200):
+    bucket.acquire()
+    times.append(clock['t'])
+worst = max(sum(1 for t in times if start <= t < start + 60) for start in times)
+assert worst <= 60, worst
+assert times[9] == 0.0 and times[10] > 0.0
+print(f"✅ Token bucket: burst 10, at most {worst} requests in any 60 s window")
+
+# API-call benchmark of backend code on the fake
+from app.utils.dispatch_persistence import SheetsPointerDispatchStore
+import app.utils.load_backend as load_backend
+import config.settings as settings
+
+settings.GOOGLE_SHEET_ID = SHEET_ID
+dispatch = {2030: {'dispatch_data': {'hour': list(range(8760)), 'load_mw': [600.0] * 8760}}}
+with tempfile.TemporaryDirectory() as tmp:
+    store = SheetsPointerDispatchStore(tmp)
+    fake.reset_calls()
+    for version in (1, 2, 1):
+        store.save('Site 0', 'screening', version, dispatch)
+    save_calls = fake.total_calls
+fake.reset_calls()
+for _ in range(10):
+    load_backend.load_load_configuration('Site 0')
+load_calls = fake.total_calls
+print(f"   3 dispatch saves: {save_calls} API calls; 10 load-config reads: {load_calls} API calls")
+assert save_calls == 3 * 2 + 3  # pointer scan + write per save; tab lookup, creation, header once
+assert load_calls == 10 + 1  # one get_all_records per read; worksheet handle looked up once
+print("✅ Backend functions run offline against the fake")
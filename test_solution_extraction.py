@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk array extraction of bvNexusMILP_DR solutions.
+
+Loads known values onto every variable of the 1008-hour (legacy weeks) and
+full 8760-hour models, then compares _extract_solution against the previous
+extraction (objective re-evaluated, per-index value(m.var[t, y]) lookups):
+the metrics must be identical, hourly dispatch must come back as dense
+(T x Y) arrays matching every index; both extraction times are reported.
+Also checks the sparse backend returns dispatch in the same layout
+and that results serialize to JSON.
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pyomo.environ import Var, value
+from pyomo.opt import SolverResults, SolverStatus, TerminationCondition
+
+from app.optimization.milp_matrix_dr import bvNexusMILP_Matrix
+from app.optimization.milp_model_dr import bvNexusMILP_DR
+from app.utils.data_io import json_default
+from milp_fixtures import load_8760, milp_inputs
+
+inputs = milp_inputs()
+
+results = SolverResults()
+results.solver.status = SolverStatus.ok
+results.solver.termination_condition = TerminationCondition.optimal
+
+
+def legacy_extract(optimizer):
+    """Reference: the previous per-index extraction, plus hourly dispatch as lists."""
+    m = optimizer.model
+    hour_weight = optimizer.periods.hour_weights
+    objective = value(m.obj)
+
+    def annual(var, y):
+        return float(np.dot(hour_weight, [value(var[t, y]) for t in m.T]))
+
+    out = {}
+    for y in m.Y:
+        out[y] = {
+            'n_recip': int(value(m.n_recip[y])),
+            'bess_mw': value(m.bess_mw[y]),
+            'unserved': annual(m.unserved, y),
+            'recip_gen': annual(m.gen_recip, y),
+            'turbine_gen': annual(m.gen_turbine, y),
+            'dr_total': sum(value(m.dr_capacity[dr, y]) for dr in m.DR),
+            'dispatch': {name: [value(getattr(m, name)[t, y]) for t in m.T] for name in optimizer.DISPATCH_VARS},
+        }
+    return objective, out
+
+
+print(f"{'Hours':>6} {'Build':>8} {'Previous':>10} {'Arrays':>8} {'Speedup':>8}")
+for label, kwargs in (('1008', {'representative_periods': 'fixed'}),
+                      ('8760', {'use_representative_periods': False})):
+    optimizer = bvNexusMILP_DR()
+    start = time.perf_counter()
+    optimizer.build(**inputs, **kwargs)
+    build_time = time.perf_counter() - start
+    m = optimizer.model
+    assert len(m.T) == int(label), len(m.T)
+
+    rng = np.random.default_rng(0)
+    for var in m.component_objects(Var):
+        integer = var.name in ('n_recip', 'n_turbine', 'grid_active')
+        for v in var.values():
+            v.set_value(float(rng.integers(0, 2)) if integer else float(rng.random() * 50), skip_validation=True)
+
+    start = time.perf_counter()
+    objective, reference = legacy_extract(optimizer)
+    legacy_time = time.perf_counter() - start
+    results.problem.upper_bound = objective  # as the solver reports its incumbent
+    start = time.perf_counter()
+    solution = optimizer._extract_solution(results)
+    bulk_time = time.perf_counter() - start
+
+    assert np.isclose(solution['objective_lcoe'], objective, rtol=1e-12)
+    dispatch = solution['dispatch']
+    for i, y in enumerate(optimizer.years):
+        ref = reference[y]
+        eq, cov = solution['equipment'][y], solution['power_coverage'][y]
+        assert eq['n_recip'] == ref['n_recip'] and eq['bess_mw'] == ref['bess_mw']
+        assert np.isclose(cov['unserved_mwh'], ref['unserved'], rtol=1e-12)
+        assert np.isclose(solution['dr'][y]['total_dr_mw'], ref['dr_total'], rtol=1e-12)
+        nox = (ref['recip_gen'] * optimizer.EQUIPMENT['recip']['heat_rate_btu_kwh'] * optimizer.EQUIPMENT['recip']['nox_rate_lb_mmbtu']
+               + ref['turbine_gen'] * optimizer.EQUIPMENT['turbine']['heat_rate_btu_kwh'] * optimizer.EQUIPMENT['turbine']['nox_rate_lb_mmbtu']) / 2_000_000
+        assert np.isclose(solution['emissions'][y]['nox_tpy'], nox, rtol=1e-12)
+        for name in optimizer.DISPATCH_VARS:
+            assert dispatch[name].shape == (len(m.T), len(optimizer.years))
+            assert np.array_equal(dispatch[name][:, i], ref['dispatch'][name]), (name, y)
+    print(f"{label:>6} {build_time:>7.1f}s {legacy_time:>9.3f}s {bulk_time:>7.3f}s {legacy_time / bulk_time:>7.1f}x")
+
+print("✅ Array extraction matches per-index value() lookups at 1008 and 8760 hours")
+
+# Sparse backend: dispatch in the same (T x Y) layout; JSON only at the boundary
+matrix_model = bvNexusMILP_Matrix()
+matrix_model.build(**inputs)
+matrix_solution = matrix_model.solve(verbose=False)
+matrix_dispatch = matrix_solution['dispatch']
+assert set(bvNexusMILP_DR.DISPATCH_VARS) <= set(matrix_dispatch)
+assert matrix_dispatch['gen_recip'].shape == (matrix_model.periods.n_hours, len(inputs['years']))
+annual_unserved = matrix_dispatch['hour_weights'] @ matrix_dispatch['unserved']
+for i, y in enumerate(inputs['years']):
+    assert np.isclose(annual_unserved[i], matrix_solution['power_coverage'][y]['unserved_mwh'])
+payload = json.loads(json.dumps(matrix_solution, default=json_default))
+assert payload['dispatch']['gen_recip'] == matrix_dispatch['gen_recip'].tolist()
+print("✅ Sparse backend returns the same (T x Y) dispatch arrays; json_default converts them at the boundary")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Validate the persistent MILP solve cache.
+
+Checks that the input fingerprint ignores representation (int vs float,
+list vs array, scenario name, flag spelling) but changes with every input,
+the model source and the equipment specs; that the disk tier holds its size
+cap with LRU eviction and survives a new cache instance; and that a repeat
+optimize_with_milp call returns the stored result without solving.
+"""
+import copy
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.optimization.milp_decomposition import bvNexusMILP_Decomposed
+from app.optimization.milp_matrix_dr import bvNexusMILP_Matrix
+from app.optimization.milp_model_dr import bvNexusMILP_DR
+from app.utils import milp_optimizer_wrapper as wrapper
+from app.utils import solve_cache as solve_cache_module
+from app.utils.solve_cache import MODEL_SOURCES, SolveCache, configure_solve_cache, milp_cache_key, model_version
+from milp_fixtures import load_8760, milp_inputs
+
+build_inputs = milp_inputs()
+inputs = dict(
+    site=build_inputs['site'],
+    constraints=build_inputs['constraints'],
+    load_profile_dr={'peak_it_mw': 160, 'pue': 1.25, 'load_data': build_inputs['load_data']},
+    years=build_inputs['years'],
+    scenario={'Scenario_Name': 'All Technologies', 'Recip_Enabled': True, 'Grid_Enabled': 'False',
+              'Grid_Timeline_Months': 36},
+    solver='cbc',
+    time_limit=60,
+)
+version = model_version(bvNexusMILP_DR, wrapper.EQUIPMENT_PARAMS, wrapper.GAS_PRICE)
+
+
+def key(**overrides):
+    args = dict(copy.deepcopy(inputs), **overrides)
+    return milp_cache_key('milp/v1', model_version=version, **args)
+
+
+# Fingerprint: representation-independent, input-sensitive
+base = key()
+assert base == key()
+equivalent = copy.deepcopy(inputs)
+equivalent['site'] = {'load_trajectory': {2029: 150.0, 2030: 300.0, 2031: 300.0}}
+equivalent['load_profile_dr']['load_data']['total_load_mw'] = load_8760.tolist()
+equivalent['scenario'] = {'Scenario_Name': 'Renamed', 'Grid_Connection': False, 'Grid_Timeline_Months': 36.0}
+equivalent['time_limit'] = 60.0
+assert milp_cache_key('milp/v1', model_version=version, **equivalent) == base
+print("✅ Equivalent inputs share a key (int/float, list/array, scenario name and flag spelling)")
+
+changed = {
+    'constraints': dict(inputs['constraints'], NOx_Limit_tpy=61),
+    'years': [2029, 2030],
+    'scenario': dict(inputs['scenario'], Grid_Timeline_Months=24),
+    'solver': 'glpk',
+    'time_limit': 120,
+}
+keys = {base} | {key(**{name: value}) for name, value in changed.items()}
+load = copy.deepcopy(inputs['load_profile_dr'])
+load['load_data']['total_load_mw'] = load_8760 * 1.001
+keys |= {key(load_profile_dr=load), key(existing_equipment={'n_recip': 2})}
+keys.add(milp_cache_key('milp_fast/v1', model_version=version, **copy.deepcopy(inputs)))
+specs = copy.deepcopy(wrapper.EQUIPMENT_PARAMS)
+specs['recip']['capex'] += 1
+keys |= {milp_cache_key('milp/v1', model_version=v, **copy.deepcopy(inputs))
+         for v in (model_version(bvNexusMILP_DR, specs, wrapper.GAS_PRICE),
+                   model_version(bvNexusMILP_Matrix, wrapper.EQUIPMENT_PARAMS, wrapper.GAS_PRICE))}
+assert len(keys) == 11, len(keys)
+print("✅ Every input, the wrapper namespace, the equipment specs and the model class change the key")
+
+# Editing the model source invalidates (new file content, new version)
+with tempfile.TemporaryDirectory() as tmp:
+    module_path = Path(tmp) / 'fake_model.py'
+    module_path.write_text("class Model:\n    pass\n")
+    sys.path.insert(0, tmp)
+    import fake_model
+    before = model_version(fake_model.Model)
+    time.sleep(0.01)
+    module_path.write_text("class Model:\n    scale = 2\n")
+    assert model_version(fake_model.Model) != before
+    # ... and the wrapper module passed as a source (result formatting)
+    (Path(tmp) / 'fake_wrapper.py').write_text("def format_result(solution):\n    return solution\n")
+    before = model_version(fake_model.Model, sources=('fake_wrapper',))
+    assert before != model_version(fake_model.Model)
+    time.sleep(0.01)
+    (Path(tmp) / 'fake_wrapper.py').write_text("def format_result(solution):\n    return dict(solution)\n")
+    assert model_version(fake_model.Model, sources=('fake_wrapper',)) != before
+    sys.path.remove(tmp)
+assert {'app.optimization.representative_periods', 'app.optimization.highs_inprocess'} <= set(MODEL_SOURCES)
+print("✅ Model version follows the model's, its dependencies' and the wrapper's source files")
+
+# Disk tier: LRU within the size cap, shared across instances
+with tempfile.TemporaryDirectory() as tmp:
+    result = {'feasible': True, 'profile': np.arange(1000.0)}
+    entry_bytes = len(pickle.dumps(result, protocol=5))
+    cache = SolveCache(tmp, max_bytes=int(3.5 * entry_bytes))
+    for i in range(3):
+        cache.put(f"{i:02d}key", dict(result, i=i))
+        time.sleep(0.01)
+    assert cache.get('00key')['i'] == 0  # 00 becomes most recent, so 01 is evicted next
+    time.sleep(0.01)
+    cache.put('03key', dict(result, i=3))
+    assert cache.get('01key') is None and cache.evictions == 1
+    assert {k: cache.get(k)['i'] for k in ('00key', '02key', '03key')} == {'00key': 0, '02key': 2, '03key': 3}
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    fresh = SolveCache(tmp)
+    assert np.array_equal(fresh.get('03key')['profile'], result['profile'])
+    (Path(tmp) / '02' / '02key.pkl').write_bytes(b'corrupt')
+    assert fresh.get('02key') is None
+    fresh.clear()
+    assert fresh.get('00key') is None and fresh.stats()['entries'] == 0
+print("✅ Disk tier: LRU eviction within the cap, shared across instances, corrupt entries re-solve, clear()")
+
+# End to end: the sparse-matrix backend solves with scipy's HiGHS, so no Pyomo solver is needed
+with tempfile.TemporaryDirectory() as tmp:
+    cache = configure_solve_cache(max_mb=16, cache_dir=tmp)
+    wrapper.SOLVER_AVAILABLE = True
+    run = dict(copy.deepcopy(inputs), solver='highs')
+
+    start = time.perf_counter()
+    first = wrapper.optimize_with_milp(optimizer=bvNexusMILP_Matrix(), **copy.deepcopy(run))
+    solve_time = time.perf_counter() - start
+    assert first['feasible'] is not None and cache.stats()['entries'] == 1, first.get('violations')
+
+    start = time.perf_counter()
+    second = wrapper.optimize_with_milp(optimizer=bvNexusMILP_Matrix(), **copy.deepcopy(run))
+    hit_time = time.perf_counter() - start
+    assert cache.hits == 1 and second['economics'] == first['economics']
+    assert second['equipment_config'] == first['equipment_config']
+
+    wrapper.optimize_with_milp(optimizer=bvNexusMILP_Matrix(), use_cache=False, **copy.deepcopy(run))
+    assert cache.hits == 1
+
+    # Optimizer configuration is part of the key: each decomposition setup solves once
+    for config in ({'mode': 'monolithic'}, {'mode': 'rolling'}, {'mode': 'rolling', 'window': 2},
+                   {'mode': 'rolling'}):
+        wrapper.optimize_with_milp(optimizer=bvNexusMILP_Decomposed(**config), **copy.deepcopy(run))
+    assert cache.hits == 2 and cache.stats()['entries'] == 4
+    print(f"   solve {solve_time:.2f}s, cache hit {hit_time * 1000:.1f} ms")
+    solve_cache_module._cache = None
+print("✅ optimize_with_milp returns the stored result for repeat inputs; use_cache=False re-solves; "
+      "decomposition mode / window are part of the key")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Validate MILP pipeline instrumentation.
+
+Checks SolveProfiler nesting, laps and per-phase peak RSS, that the Pyomo
+model times every _build_* method and reports the same model size as the
+sparse-matrix backend, that optimize_with_milp attaches phase timings,
+model size, MIP gap and node count to its result and writes a Chrome trace,
+that a cached appsi solver is not re-wrapped on every profiled solve, and
+that error paths detach the profiler.
+"""
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.optimization.milp_matrix_dr import bvNexusMILP_Matrix
+from app.optimization.milp_model_dr import bvNexusMILP_DR
+from app.utils import milp_optimizer_wrapper as wrapper
+from app.utils.solve_profiler import SolveProfiler, peak_rss_mb
+from milp_fixtures import load_8760, milp_inputs
+
+# Profiler: laps, nesting, per-phase peak memory
+profiler = SolveProfiler()
+profiler.lap('first')
+with profiler.phase('allocate'):
+    block = np.ones(200 * 1024 * 1024 // 8)
+    del block
+with profiler.phase('small'):
+    small = np.ones(1000)
+profiler.lap('second')
+summary = profiler.summary()
+phases = {p['name']: p for p in summary['phases']}
+assert [p['name'] for p in summary['phases']] == ['first', 'allocate', 'small', 'second']
+assert phases['allocate']['depth'] == 1 and phases['second']['depth'] == 0
+assert phases['first']['wall_s'] >= phases['allocate']['wall_s'] + phases['small']['wall_s']
+assert phases['first']['peak_rss_mb'] >= phases['allocate']['peak_rss_mb']  # a child's peak is its parent's too
+if Path('/proc/self/clear_refs').exists():
+    assert phases['allocate']['peak_rss_mb'] - phases['small']['peak_rss_mb'] > 150, phases
+print(f"✅ Nested phases and laps; peak RSS allocate {phases['allocate']['peak_rss_mb']:.0f} MB "
+      f"vs small {phases['small']['peak_rss_mb']:.0f} MB")
+
+# Pyomo model: one phase per _build_* method, same size as the matrix backend
+inputs = milp_inputs()
+pyomo_model = bvNexusMILP_DR()
+pyomo_model.profiler = SolveProfiler()
+pyomo_model.build(**inputs)
+build_phases = [p['name'] for p in pyomo_model.profiler.summary()['phases']]
+expected = sorted(name for name in dir(bvNexusMILP_DR) if name.startswith('_build_'))
+assert sorted(build_phases) == expected, build_phases
+matrix_model = bvNexusMILP_Matrix()
+matrix_model.build(**inputs)
+assert pyomo_model.model_size() == matrix_model.model_size(), (pyomo_model.model_size(), matrix_model.model_size())
+slowest = max(pyomo_model.profiler.summary()['phases'], key=lambda p: p['wall_s'])
+print(f"✅ {len(build_phases)} _build_* phases timed (slowest {slowest['name']} {slowest['wall_s']:.2f}s); "
+      f"model size {pyomo_model.model_size()} matches the matrix backend")
+
+# optimize_with_milp: instrumentation on the result and a Chrome trace
+# (the sparse backend solves with scipy's HiGHS, so no Pyomo solver is needed)
+wrapper.SOLVER_AVAILABLE = True
+with tempfile.TemporaryDirectory() as tmp:
+    trace_path = Path(tmp) / 'solve.trace.json'
+    result = wrapper.optimize_with_milp(
+        site={}, constraints=inputs['constraints'],
+        load_profile_dr={'load_data': {'total_load_mw': load_8760, 'pue': 1.25},
+                         'load_trajectory': inputs['site']['load_trajectory']},
+        years=inputs['years'], solver='highs', optimizer=bvNexusMILP_Matrix(),
+        use_cache=False, trace_path=str(trace_path),
+    )
+    instrumentation = result['instrumentation']
+    names = [p['name'] for p in instrumentation['phases']]
+    for name in ('input_prep', 'build', '_assemble', 'scenario', 'solve', 'solver', '_extract_solution',
+                 '_format_solution_safe'):
+        assert name in names, (name, names)
+    top_level = sum(p['wall_s'] for p in instrumentation['phases'] if p['depth'] == 0)
+    assert top_level <= instrumentation['total_s'] + 1e-6 and result['runtime_seconds'] == instrumentation['total_s']
+    assert set(instrumentation['model_size']) == {'n_variables', 'n_constraints', 'n_nonzeros'}
+    assert {'mip_gap', 'node_count', 'solver_time_s'} <= set(instrumentation['solver'])
+    trace = json.loads(trace_path.read_text())
+    events = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    assert [e['name'] for e in events] == names and all(e['dur'] >= 0 for e in events)
+    assert trace['otherData']['model_size'] == instrumentation['model_size']
+
+for p in instrumentation['phases']:
+    print(f"   {'  ' * p['depth']}{p['name']:<26} {p['wall_s']:7.3f}s  peak {p['peak_rss_mb']:.0f} MB")
+print(f"   {instrumentation['model_size']}, gap {instrumentation['solver']['mip_gap']:.4f}, "
+      f"{instrumentation['solver']['node_count']:.0f} nodes")
+print("✅ optimize_with_milp reports phases, model size, MIP gap and nodes, and writes a Chrome trace")
+
+# A persistent (appsi) solver kept on the model is profiled per solve, not re-wrapped each time
+class PersistentSolver:
+    def __init__(self):
+        self.config = type('Config', (), {})()
+        self.calls = 0
+
+    def warm_start_capable(self):
+        return False
+
+    def _apply_solver(self):
+        self.calls += 1
+
+    def solve(self, model, **kwargs):
+        self._apply_solver()
+        return kwargs
+
+
+stub = PersistentSolver()
+pyomo_model._solvers['appsi_stub'] = stub
+profilers = [SolveProfiler(), SolveProfiler()]
+for solve_profiler in profilers:
+    pyomo_model.profiler = solve_profiler
+    pyomo_model._solve_with_factory('appsi_stub', 10, False, False, 0.01)
+pyomo_model.profiler = None
+pyomo_model._solve_with_factory('appsi_stub', 10, False, False, 0.01)
+assert stub.calls == 3 and '_apply_solver' not in vars(stub)
+assert [[p['name'] for p in prof.phases] for prof in profilers] == [['solver'], ['solver']]
+print("✅ Cached appsi solver: one 'solver' phase per profiled solve, original methods restored")
+
+# A failed run leaves no profiler on a caller's optimizer
+failing = bvNexusMILP_Matrix()
+result = wrapper.optimize_with_milp(
+    site={}, constraints=inputs['constraints'],
+    load_profile_dr={'load_data': {'total_load_mw': load_8760, 'pue': 1.25},
+                     'load_trajectory': inputs['site']['load_trajectory']},
+    years=inputs['years'], solver='highs', optimizer=failing, use_cache=False,
+    scenario={'Grid_Timeline_Months': 'soon'},  # fails applying scenario constraints
+)
+assert not result['feasible'] and failing.is_built and failing.profiler is None
+print("✅ Error paths detach the profiler from the optimizer")
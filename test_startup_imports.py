@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Validate the lazy import graph.
+
+Checks that importing the optimization package, the MILP wrapper and the
+Gemini client loads no heavy optional subsystem and prints nothing, that
+the lazily exported names still resolve (including the wrapper's legacy
+diagnostic flags), that solver detection runs once, and that the
+-X importtime benchmark parses and flags eager imports.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / 'scripts'))
+
+from benchmark_startup import HEAVY_MODULES, measure, parse_importtime
+
+# Fresh interpreter: importing is quiet and loads nothing heavy
+probe = (
+    "import sys\n"
+    "import app.optimization, app.utils.milp_optimizer_wrapper, app.utils.gemini_client\n"
+    f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+)
+proc = subprocess.run([sys.executable, '-c', probe], cwd=PROJECT_ROOT, capture_output=True, text=True)
+assert proc.returncode == 0, proc.stderr
+assert proc.stdout.strip() == '[]', proc.stdout
+assert 'DIAGNOSTIC' not in proc.stdout + proc.stderr and 'pyomo imported' not in proc.stderr
+print("✅ app.optimization, milp_optimizer_wrapper and gemini_client import without Pyomo / SDKs, silently")
+
+# Lazy names still resolve
+import app.optimization as optimization
+from app.optimization import GreenFieldHeuristic, GreenfieldHeuristicV2, bvNexusMILP_DR
+assert GreenFieldHeuristic is GreenfieldHeuristicV2
+assert optimization.GreenFieldHeuristic_Legacy.__name__ == 'GreenFieldHeuristic'
+assert set(optimization.__all__) <= set(dir(optimization))
+for name in optimization.__all__:
+    getattr(optimization, name)
+try:
+    optimization.not_a_name
+    raise AssertionError("unknown attribute resolved")
+except AttributeError:
+    pass
+print(f"✅ All {len(optimization.__all__)} app.optimization exports resolve on first access")
+
+import app.utils.milp_optimizer_wrapper as wrapper
+from app.optimization import milp_model_dr
+status = wrapper.milp_status()
+assert wrapper.milp_status() is status  # probed once per process
+assert wrapper.bvNexusMILP_DR is bvNexusMILP_DR and wrapper.MILP_MODEL_AVAILABLE and wrapper.PYOMO_AVAILABLE
+assert wrapper.SOLVER_AVAILABLE and wrapper.SOLVER_NAME in ('cbc', 'glpk', 'gurobi', 'highs')
+assert wrapper.IMPORT_ERRORS == [] and {'cbc', 'glpk', 'gurobi'} <= set(milp_model_dr._SOLVER_AVAILABLE)
+from app.utils.milp_optimizer_wrapper import bvNexusMILP_DR as legacy_import  # multi_scenario's import
+assert legacy_import is bvNexusMILP_DR
+print(f"✅ Wrapper flags resolve lazily and solver detection is cached (solver: {wrapper.SOLVER_NAME})")
+
+# Benchmark: parser and eager-import detection
+sample = (
+    "import time: self [us] | cumulative | imported package\n"
+    "import time:       120 |        120 |   _io\n"
+    "import time:      2000 |       5000 |     pyomo.core\n"
+    "import time:       300 |       5300 | app.thing\n"
+)
+rows = parse_importtime(sample)
+assert [(r['module'], r['depth']) for r in rows] == [('_io', 1), ('pyomo.core', 2), ('app.thing', 0)]
+lazy = measure('app.optimization', repeat=1)
+eager = measure('app.optimization.milp_model_dr', repeat=1)
+assert lazy['ok'] and lazy['heavy'] == [] and eager['ok'] and 'pyomo' in eager['heavy']
+print(f"✅ Import benchmark: app.optimization {lazy['import_s'] * 1000:.0f} ms (nothing heavy) vs "
+      f"milp_model_dr {eager['import_s'] * 1000:.0f} ms ({', '.join(eager['heavy'])})")